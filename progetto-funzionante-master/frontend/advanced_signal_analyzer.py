@@ -12,10 +12,15 @@ from dataclasses import dataclass
 from enum import Enum
 import pandas as pd
 import numpy as np
-import httpx
 import json
 from decimal import Decimal
 
+from oanda_api_client import OANDAClient, CandleFrame, PriceComponent
+from candle_store import candle_store
+from app.services.async_http_client import get_oanda_analyzer_client
+from volume_profile import build_volume_profile
+from smart_money_patterns import swing_points, fair_value_gaps, order_blocks, liquidity_zones
+
 logger = logging.getLogger(__name__)
 
 # Import sentiment analysis
@@ -129,6 +134,13 @@ class AdvancedSignalAnalysis:
 class AdvancedSignalAnalyzer:
     """Advanced signal analyzer with multi-timeframe, smart money analysis, and sentiment integration"""
     
+    # Candles each analysis stage reads, as {timeframe: count}
+    DATA_REQUIREMENTS: Dict[str, Dict[TimeFrame, int]] = {
+        "multi_timeframe": {TimeFrame.M1: 200, TimeFrame.M5: 200, TimeFrame.M15: 200, TimeFrame.M30: 200},
+        "volume_profile": {TimeFrame.H1: 100},
+        "smart_money": {TimeFrame.M1: 200, TimeFrame.M5: 100}
+    }
+    
     def __init__(self, oanda_api_key: str, news_api_key: Optional[str] = None, gemini_api_key: Optional[str] = None):
         self.oanda_api_key = oanda_api_key
         self.news_api_key = news_api_key
@@ -146,6 +158,10 @@ class AdvancedSignalAnalyzer:
             self.sentiment_aggregator = None
         self.base_url = "https://api-fxpractice.oanda.com/v3"
         
+        # Volume profile: price levels and how bar volume is spread over them ("touch" or "uniform")
+        self.volume_profile_bins = 50
+        self.volume_profile_distribution = "touch"
+        
     async def analyze_symbol(self, symbol: str, primary_timeframe: TimeFrame = TimeFrame.H1) -> AdvancedSignalAnalysis:
         """
         Perform comprehensive analysis of a trading symbol with fallback for indices
@@ -158,9 +174,12 @@ class AdvancedSignalAnalyzer:
             if is_index:
                 logger.info(f"Index detected: {symbol} - will use enhanced analysis with fallback")
             
+            # Download every timeframe the stages need once, concurrently
+            market_data = await self._fetch_market_data(symbol, self._build_data_plan())
+            
             # Get multi-timeframe data (with fallback only for HTTP 422 on indices)
             try:
-                mtf_analysis = await self._analyze_multi_timeframe(symbol)
+                mtf_analysis = await self._analyze_multi_timeframe(symbol, market_data)
             except Exception as e:
                 # Only use fallback for indices AND only for specific errors (not auth issues)
                 if is_index and self._should_use_fallback(e):
@@ -173,7 +192,7 @@ class AdvancedSignalAnalyzer:
             
             # Perform volume analysis with fallback
             try:
-                volume_profile = await self._analyze_volume_profile(symbol)
+                volume_profile = await self._analyze_volume_profile(symbol, market_data)
             except Exception as e:
                 if is_index:
                     logger.warning(f"Volume analysis failed for {symbol}, using fallback")
@@ -182,7 +201,7 @@ class AdvancedSignalAnalyzer:
                     raise e
             
             # Detect smart money activity
-            smart_money_signals = await self._detect_smart_money_activity(symbol, mtf_analysis)
+            smart_money_signals = await self._detect_smart_money_activity(symbol, mtf_analysis, market_data)
             
             # Get economic events
             economic_events = await self._get_economic_events(symbol)
@@ -235,19 +254,56 @@ class AdvancedSignalAnalyzer:
             logger.error(f"Error in advanced analysis for {symbol}: {e}")
             raise
     
-    async def _analyze_multi_timeframe(self, symbol: str) -> MultiTimeframeAnalysis:
+    def _build_data_plan(self, stages: Optional[List[str]] = None) -> Dict[TimeFrame, int]:
+        """Union of the stages' candle requirements at the deepest count per timeframe"""
+        plan: Dict[TimeFrame, int] = {}
+        for stage in stages or self.DATA_REQUIREMENTS:
+            for tf, count in self.DATA_REQUIREMENTS[stage].items():
+                plan[tf] = max(plan.get(tf, 0), count)
+        return plan
+    
+    async def _fetch_market_data(self, symbol: str, plan: Dict[TimeFrame, int]) -> Dict[TimeFrame, Optional[pd.DataFrame]]:
+        """Fetch every timeframe in the plan concurrently"""
+        frames = await asyncio.gather(*(
+            self._get_oanda_candles(symbol, tf, count=count) for tf, count in plan.items()
+        ))
+        return dict(zip(plan, frames))
+    
+    async def _get_stage_data(
+        self,
+        symbol: str,
+        stage: str,
+        market_data: Optional[Dict[TimeFrame, Optional[pd.DataFrame]]] = None
+    ) -> Dict[TimeFrame, Optional[pd.DataFrame]]:
+        """
+        Candles for one analysis stage, trimmed to the counts it asks for
+        
+        Frames are copied because stages add indicator columns to them.
+        """
+        requirements = self.DATA_REQUIREMENTS[stage]
+        if market_data is None:
+            market_data = await self._fetch_market_data(symbol, self._build_data_plan([stage]))
+        
+        stage_data = {}
+        for tf, count in requirements.items():
+            df = market_data.get(tf)
+            stage_data[tf] = df.iloc[-count:].copy() if df is not None else None
+        return stage_data
+    
+    async def _analyze_multi_timeframe(
+        self,
+        symbol: str,
+        market_data: Optional[Dict[TimeFrame, Optional[pd.DataFrame]]] = None
+    ) -> MultiTimeframeAnalysis:
         """Analyze multiple timeframes for trend confluence"""
         timeframes_data = {}
         key_levels = []
         
         # Intraday timeframes for scalping/day trading (M1, M5, M15, M30)
-        timeframes = [TimeFrame.M1, TimeFrame.M5, TimeFrame.M15, TimeFrame.M30]
+        stage_data = await self._get_stage_data(symbol, "multi_timeframe", market_data)
         
-        for tf in timeframes:
+        for tf, df in stage_data.items():
             try:
-                # Get OHLC data for timeframe
-                df = await self._get_oanda_candles(symbol, tf, count=200)
-                
                 if df is not None and len(df) > 50:
                     analysis = self._analyze_timeframe_structure(df, tf)
                     timeframes_data[tf] = analysis
@@ -282,55 +338,60 @@ class AdvancedSignalAnalyzer:
         )
     
     async def _get_oanda_candles(self, symbol: str, timeframe: TimeFrame, count: int = 100) -> Optional[pd.DataFrame]:
-        """Get candlestick data from OANDA API"""
+        """Get completed candlesticks from OANDA API (incremental via the candle store)"""
         try:
             # Convert symbol to OANDA format (e.g., EURUSD -> EUR_USD)
             oanda_instrument = symbol[:3] + "_" + symbol[3:] if len(symbol) == 6 else symbol
             
-            params = {
-                "count": count,
-                "granularity": timeframe.value
-            }
+            async def fetcher(fetch_count: int, from_time: Optional[datetime]) -> CandleFrame:
+                return await self._fetch_oanda_candles(oanda_instrument, timeframe, fetch_count, from_time)
             
-            headers = {
-                "Authorization": f"Bearer {self.oanda_api_key}",
-                "Accept-Datetime-Format": "RFC3339"
-            }
+            key = (oanda_instrument, timeframe.value, PriceComponent.MID.value)
+            candles = await candle_store.fetch(key, count, fetcher)
+            candles = candles[candles.complete]
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/instruments/{oanda_instrument}/candles",
-                    params=params,
-                    headers=headers,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if "candles" in data and data["candles"]:
-                        # Convert to DataFrame
-                        candles = []
-                        for candle in data["candles"]:
-                            if candle["complete"]:
-                                candles.append({
-                                    "time": pd.to_datetime(candle["time"]),
-                                    "open": float(candle["mid"]["o"]),
-                                    "high": float(candle["mid"]["h"]),
-                                    "low": float(candle["mid"]["l"]),
-                                    "close": float(candle["mid"]["c"]),
-                                    "volume": int(candle["volume"])
-                                })
-                        
-                        df = pd.DataFrame(candles)
-                        df.set_index("time", inplace=True)
-                        return df
+            if len(candles):
+                # Convert to DataFrame straight from the columns
+                return candles.to_dataframe()
                         
         except Exception as e:
             logger.warning(f"Error fetching OANDA data for {symbol} {timeframe}: {e}")
             
         return None
     
+    async def _fetch_oanda_candles(
+        self,
+        oanda_instrument: str,
+        timeframe: TimeFrame,
+        count: int,
+        from_time: Optional[datetime] = None
+    ) -> CandleFrame:
+        """Download raw candlesticks from OANDA API, optionally starting at from_time"""
+        params = {
+            "count": count,
+            "granularity": timeframe.value
+        }
+        if from_time is not None:
+            params["from"] = OANDAClient._format_time(from_time)
+        
+        headers = {
+            "Authorization": f"Bearer {self.oanda_api_key}",
+            "Accept-Datetime-Format": "RFC3339"
+        }
+        
+        # Shared pooled client keeps connections alive across requests and symbols
+        client = get_oanda_analyzer_client().client
+        response = await client.get(
+            f"{self.base_url}/instruments/{oanda_instrument}/candles",
+            params=params,
+            headers=headers,
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        return CandleFrame.from_oanda_response(data.get("candles", []), "mid")
+    
     def _analyze_timeframe_structure(self, df: pd.DataFrame, timeframe: TimeFrame) -> Dict[str, Any]:
         """Analyze market structure for a specific timeframe"""
         try:
@@ -408,19 +469,9 @@ class AdvancedSignalAnalyzer:
     
     def _find_swing_points(self, series: pd.Series, point_type: str = "high", window: int = 5) -> List[Tuple[datetime, float]]:
         """Find swing highs/lows in price series"""
-        swing_points = []
-        
         try:
-            if point_type == "high":
-                for i in range(window, len(series) - window):
-                    if series.iloc[i] == series.iloc[i-window:i+window+1].max():
-                        swing_points.append((series.index[i], series.iloc[i]))
-            else:  # low
-                for i in range(window, len(series) - window):
-                    if series.iloc[i] == series.iloc[i-window:i+window+1].min():
-                        swing_points.append((series.index[i], series.iloc[i]))
-                        
-            return swing_points[-10:]  # Return last 10 swing points
+            indices = np.flatnonzero(swing_points(series.to_numpy(), point_type, window))[-10:]
+            return [(series.index[i], series.iloc[i]) for i in indices]  # Return last 10 swing points
             
         except Exception as e:
             logger.error(f"Error finding swing points: {e}")
@@ -566,44 +617,27 @@ class AdvancedSignalAnalyzer:
             logger.error(f"Error detecting smart money activity: {e}")
             return SmartMoneyActivity.NEUTRAL
     
-    async def _analyze_volume_profile(self, symbol: str) -> VolumeProfile:
+    async def _analyze_volume_profile(
+        self,
+        symbol: str,
+        market_data: Optional[Dict[TimeFrame, Optional[pd.DataFrame]]] = None
+    ) -> VolumeProfile:
         """Analyze volume profile and order flow (simplified version)"""
         try:
             # Get recent data for volume analysis
-            df = await self._get_oanda_candles(symbol, TimeFrame.H1, count=100)
+            df = (await self._get_stage_data(symbol, "volume_profile", market_data))[TimeFrame.H1]
             
             if df is None or len(df) == 0:
                 return self._create_default_volume_profile()
             
-            # Calculate volume by price levels (simplified)
-            price_levels = np.linspace(df['low'].min(), df['high'].max(), 50)
-            volume_by_price = {}
-            
-            for i, level in enumerate(price_levels):
-                # Find candles that traded at this level
-                volume_at_level = 0
-                for idx in df.index:
-                    if df.loc[idx, 'low'] <= level <= df.loc[idx, 'high']:
-                        volume_at_level += df.loc[idx, 'volume']
-                volume_by_price[level] = volume_at_level
-            
-            # Find Point of Control (highest volume price)
-            poc = max(volume_by_price.keys(), key=lambda k: volume_by_price[k])
-            
-            # Calculate Value Area (70% of volume around POC)
-            sorted_levels = sorted(volume_by_price.items(), key=lambda x: x[1], reverse=True)
-            total_volume = sum(volume_by_price.values())
-            value_area_volume = 0
-            value_area_levels = []
-            
-            for price, volume in sorted_levels:
-                value_area_levels.append(price)
-                value_area_volume += volume
-                if value_area_volume >= total_volume * 0.7:
-                    break
-            
-            val = min(value_area_levels)  # Value Area Low
-            vah = max(value_area_levels)  # Value Area High
+            # Calculate volume by price levels
+            profile = build_volume_profile(
+                df['low'].to_numpy(),
+                df['high'].to_numpy(),
+                df['volume'].to_numpy(),
+                bins=self.volume_profile_bins,
+                distribution=self.volume_profile_distribution
+            )
             
             # Estimate buying vs selling volume (simplified)
             total_vol = df['volume'].sum()
@@ -612,10 +646,10 @@ class AdvancedSignalAnalyzer:
             order_flow_imbalance = (buying_volume - selling_volume) / total_vol
             
             return VolumeProfile(
-                poc=poc,
-                val=val,
-                vah=vah,
-                volume_by_price=volume_by_price,
+                poc=profile.poc,
+                val=profile.val,
+                vah=profile.vah,
+                volume_by_price=profile.volume_by_price,
                 total_volume=total_vol,
                 buying_volume=buying_volume,
                 selling_volume=selling_volume,
@@ -639,7 +673,12 @@ class AdvancedSignalAnalyzer:
             order_flow_imbalance=0.2
         )
     
-    async def _detect_smart_money_activity(self, symbol: str, mtf_analysis: MultiTimeframeAnalysis) -> Dict[str, Any]:
+    async def _detect_smart_money_activity(
+        self,
+        symbol: str,
+        mtf_analysis: MultiTimeframeAnalysis,
+        market_data: Optional[Dict[TimeFrame, Optional[pd.DataFrame]]] = None
+    ) -> Dict[str, Any]:
         """Detect intraday smart money activity patterns"""
         
         # Get M1 and M5 data for smart money analysis
@@ -647,8 +686,9 @@ class AdvancedSignalAnalyzer:
         m5_data = None
         
         try:
-            m1_data = await self._get_oanda_candles(symbol, TimeFrame.M1, count=200)
-            m5_data = await self._get_oanda_candles(symbol, TimeFrame.M5, count=100)
+            stage_data = await self._get_stage_data(symbol, "smart_money", market_data)
+            m1_data = stage_data[TimeFrame.M1]
+            m5_data = stage_data[TimeFrame.M5]
         except Exception as e:
             logger.warning(f"Could not get intraday data for smart money analysis: {e}")
         
@@ -676,63 +716,50 @@ class AdvancedSignalAnalyzer:
         try:
             if m5_data is not None and len(m5_data) > 20:
                 # Find zones with high volume and price rejection
-                for i in range(10, len(m5_data) - 10):
+                mask, relative_volume = liquidity_zones(
+                    m5_data['open'], m5_data['high'], m5_data['low'], m5_data['close'], m5_data['volume']
+                )
+                
+                for i in np.flatnonzero(mask)[-5:]:  # Keep last 5 zones
                     current_candle = m5_data.iloc[i]
-                    prev_candles = m5_data.iloc[i-10:i]
-                    next_candles = m5_data.iloc[i+1:i+11]
-                    
-                    # High volume rejection candle
-                    if (current_candle['volume'] > prev_candles['volume'].mean() * 1.5 and
-                        abs(current_candle['close'] - current_candle['open']) < 
-                        (current_candle['high'] - current_candle['low']) * 0.3):
-                        
-                        zone = {
-                            "price": current_candle['high'] if current_candle['close'] < current_candle['open'] else current_candle['low'],
-                            "type": "liquidity_grab" if current_candle['close'] < current_candle['open'] else "liquidity_build",
-                            "strength": min(100, (current_candle['volume'] / prev_candles['volume'].mean()) * 20),
-                            "time": current_candle.name.isoformat()
-                        }
-                        zones.append(zone)
+                    bearish = current_candle['close'] < current_candle['open']
+                    zone = {
+                        "price": current_candle['high'] if bearish else current_candle['low'],
+                        "type": "liquidity_grab" if bearish else "liquidity_build",
+                        "strength": min(100, relative_volume[i] * 20),
+                        "time": current_candle.name.isoformat()
+                    }
+                    zones.append(zone)
                         
         except Exception as e:
             logger.error(f"Error identifying liquidity zones: {e}")
             
-        return zones[-5:]  # Return last 5 zones
+        return zones
     
     def _identify_order_blocks(self, m5_data: Optional[pd.DataFrame]) -> List[Dict[str, Any]]:
         """Identify institutional order blocks"""
-        order_blocks = []
+        order_blocks_found = []
         
         try:
             if m5_data is not None and len(m5_data) > 30:
                 # Look for strong moves followed by consolidation
-                for i in range(20, len(m5_data) - 10):
+                mask = order_blocks(m5_data['open'], m5_data['high'], m5_data['low'], m5_data['close'])
+                
+                for i in np.flatnonzero(mask)[-3:]:  # Keep last 3 order blocks
                     current_candle = m5_data.iloc[i]
-                    prev_candles = m5_data.iloc[i-20:i]
-                    next_candles = m5_data.iloc[i+1:i+11]
-                    
-                    # Strong bullish move followed by consolidation
-                    strong_move = (current_candle['close'] > current_candle['open'] and
-                                 (current_candle['close'] - current_candle['open']) > 
-                                 prev_candles['close'].std() * 2)
-                    
-                    consolidation = (next_candles['high'].max() - next_candles['low'].min()) < \
-                                  (current_candle['high'] - current_candle['low']) * 0.5
-                    
-                    if strong_move and consolidation:
-                        order_block = {
-                            "high": current_candle['high'],
-                            "low": current_candle['low'],
-                            "type": "bullish_order_block",
-                            "strength": 80.0,
-                            "time": current_candle.name.isoformat()
-                        }
-                        order_blocks.append(order_block)
+                    order_block = {
+                        "high": current_candle['high'],
+                        "low": current_candle['low'],
+                        "type": "bullish_order_block",
+                        "strength": 80.0,
+                        "time": current_candle.name.isoformat()
+                    }
+                    order_blocks_found.append(order_block)
                         
         except Exception as e:
             logger.error(f"Error identifying order blocks: {e}")
             
-        return order_blocks[-3:]  # Return last 3 order blocks
+        return order_blocks_found
     
     def _identify_fair_value_gaps(self, m1_data: Optional[pd.DataFrame]) -> List[Dict[str, Any]]:
         """Identify fair value gaps (FVGs) in price action"""
@@ -740,37 +767,35 @@ class AdvancedSignalAnalyzer:
         
         try:
             if m1_data is not None and len(m1_data) > 3:
-                for i in range(1, len(m1_data) - 1):
-                    prev_candle = m1_data.iloc[i-1]
-                    current_candle = m1_data.iloc[i]
-                    next_candle = m1_data.iloc[i+1]
-                    
-                    # Bullish FVG: prev high < next low
-                    if prev_candle['high'] < next_candle['low']:
+                highs = m1_data['high'].to_numpy()
+                lows = m1_data['low'].to_numpy()
+                bullish, bearish = fair_value_gaps(highs, lows)
+                
+                for i in np.flatnonzero(bullish | bearish)[-10:]:  # Keep last 10 FVGs
+                    if bullish[i]:
+                        # Bullish FVG: prev high < next low
                         fvg = {
-                            "gap_high": next_candle['low'],
-                            "gap_low": prev_candle['high'],
+                            "gap_high": lows[i + 1],
+                            "gap_low": highs[i - 1],
                             "type": "bullish_fvg",
                             "strength": 75.0,
-                            "time": current_candle.name.isoformat()
+                            "time": m1_data.index[i].isoformat()
                         }
-                        fvgs.append(fvg)
-                    
-                    # Bearish FVG: prev low > next high  
-                    elif prev_candle['low'] > next_candle['high']:
+                    else:
+                        # Bearish FVG: prev low > next high
                         fvg = {
-                            "gap_high": prev_candle['low'],
-                            "gap_low": next_candle['high'], 
+                            "gap_high": lows[i - 1],
+                            "gap_low": highs[i + 1],
                             "type": "bearish_fvg",
                             "strength": 75.0,
-                            "time": current_candle.name.isoformat()
+                            "time": m1_data.index[i].isoformat()
                         }
-                        fvgs.append(fvg)
+                    fvgs.append(fvg)
                         
         except Exception as e:
             logger.error(f"Error identifying fair value gaps: {e}")
             
-        return fvgs[-10:]  # Return last 10 FVGs
+        return fvgs
     
     def _identify_institutional_levels(self, key_levels: List[PriceLevel]) -> List[Dict[str, Any]]:
         """Identify key institutional levels from price levels"""
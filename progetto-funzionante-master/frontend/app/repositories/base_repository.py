@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, List, Optional, Any, Dict
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, insert
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
@@ -132,18 +132,26 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         return []
 
     def bulk_create(self, objects: List[CreateSchemaType]) -> List[ModelType]:
-        """Create multiple records in bulk."""
-        db_objects = []
-        for obj_in in objects:
-            obj_in_data = obj_in.dict() if hasattr(obj_in, 'dict') else obj_in
-            db_obj = self.model(**obj_in_data)
-            db_objects.append(db_obj)
-
-        self.db.add_all(db_objects)
+        """
+        Create multiple records in bulk.
+
+        All rows go out as one multi-row INSERT ... RETURNING (batched
+        executemany where the driver lacks RETURNING) inside one transaction.
+        """
+        if not objects:
+            return []
+
+        rows = [obj_in.dict() if hasattr(obj_in, 'dict') else obj_in for obj_in in objects]
+        # Keys are generated in VALUES order within the statement; ordering by key
+        # restores input order without sort_by_parameter_order, which makes SQLite
+        # fall back to one INSERT per row
+        db_objects = sorted(self.db.scalars(insert(self.model).returning(self.model), rows), key=lambda obj: obj.id)
+        ids = [db_obj.id for db_obj in db_objects]
         self.db.commit()
 
-        for db_obj in db_objects:
-            self.db.refresh(db_obj)
+        if self.db.expire_on_commit:
+            # Reload the expired rows with one SELECT instead of a refresh per object
+            self.db.query(self.model).filter(self.model.id.in_(ids)).all()
 
         return db_objects
 
@@ -59,6 +59,33 @@ class SignalRepository(BaseRepository[Signal, SignalCreate, dict]):
             Signal.is_active == True
         ).order_by(desc(Signal.created_at)).limit(limit).all()
 
+    def get_signals_by_symbols(self, symbols: List[str], limit: int = 10) -> Dict[str, List[Signal]]:
+        """Get the latest signals for several symbols in one query, at most limit per symbol."""
+        ranked = self.db.query(
+            Signal.id,
+            func.row_number().over(
+                partition_by=Signal.symbol,
+                order_by=desc(Signal.created_at)
+            ).label("rank")
+        ).filter(
+            Signal.symbol.in_(symbols),
+            Signal.is_active == True
+        ).subquery()
+
+        signals = self.db.query(Signal).options(
+            joinedload(Signal.creator),
+            selectinload(Signal.executions)
+        ).join(
+            ranked, Signal.id == ranked.c.id
+        ).filter(
+            ranked.c.rank <= limit
+        ).order_by(desc(Signal.created_at)).all()
+
+        by_symbol: Dict[str, List[Signal]] = {symbol: [] for symbol in symbols}
+        for signal in signals:
+            by_symbol[signal.symbol].append(signal)
+        return by_symbol
+
     def get_signals_by_symbol_paginated(
         self,
         symbol: str,
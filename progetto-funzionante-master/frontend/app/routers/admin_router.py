@@ -32,7 +32,7 @@ async def generate_signals_manually(
     """Generate signals manually using OANDA API (admin only)"""
     try:
         # Check OANDA availability
-        health_check = oanda_service.check_oanda_health()
+        health_check = await oanda_service.check_oanda_health()
         if not health_check.get("available", False):
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -54,25 +54,21 @@ async def generate_signals_manually(
         generated_signals = []
         errors = []
 
-        for symbol in default_symbols:
-            try:
-                signal = oanda_service.generate_signal(symbol, current_user.id)
-                if signal:
-                    generated_signals.append({
-                        "symbol": symbol,
-                        "signal_id": signal.id,
-                        "signal_type": signal.signal_type.value,
-                        "entry_price": signal.entry_price,
-                        "reliability": signal.reliability,
-                        "created_at": signal.created_at
-                    })
-                    logger.info(f"Generated signal for {symbol}: {signal.id}")
-                else:
-                    errors.append(f"No signal generated for {symbol}")
-            except Exception as e:
-                error_msg = f"Error generating signal for {symbol}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(error_msg)
+        # All symbols are analysed concurrently on the shared engine
+        signals = await oanda_service.batch_generate_signals(default_symbols, current_user.id)
+        for symbol, signal in signals.items():
+            if signal:
+                generated_signals.append({
+                    "symbol": symbol,
+                    "signal_id": signal.id,
+                    "signal_type": signal.signal_type.value,
+                    "entry_price": signal.entry_price,
+                    "reliability": signal.reliability,
+                    "created_at": signal.created_at
+                })
+                logger.info(f"Generated signal for {symbol}: {signal.id}")
+            else:
+                errors.append(f"No signal generated for {symbol}")
 
         return {
             "message": f"Signal generation completed. Generated {len(generated_signals)} signals.",
@@ -238,7 +234,7 @@ async def reset_database_complete(
 
 
 @router.get("/dashboard")
-def get_admin_dashboard(
+async def get_admin_dashboard(
     current_user: User = Depends(get_admin_user_dependency),
     signal_service: SignalService = Depends(get_signal_service),
     user_service: UserService = Depends(get_user_service),
@@ -247,7 +243,7 @@ def get_admin_dashboard(
     """Get comprehensive admin dashboard data"""
     try:
         # Get system statistics
-        signal_stats = signal_service.get_signal_statistics()
+        signal_stats = await signal_service.get_signal_statistics()
         user_stats = {
             "total_users": user_service.get_user_count(),
             "active_users": user_service.get_active_user_count(),
@@ -256,10 +252,10 @@ def get_admin_dashboard(
         }
 
         # Get OANDA status
-        oanda_health = oanda_service.check_oanda_health()
+        oanda_health = await oanda_service.check_oanda_health()
 
         # Get recent signals
-        recent_signals = signal_service.get_latest_signals(20)
+        recent_signals = await signal_service.get_latest_signals(20)
 
         # Get recent signals count
         recent_24h = signal_service.get_recent_signals_count(24)
@@ -300,7 +296,7 @@ def get_admin_dashboard(
 
 
 @router.get("/system-health")
-def get_system_health(
+async def get_system_health(
     current_user: User = Depends(get_admin_user_dependency),
     oanda_service: OANDAService = Depends(get_oanda_service),
     db: Session = Depends(get_db)
@@ -315,7 +311,7 @@ def get_system_health(
             db_status = {"status": "unhealthy", "message": f"Database error: {str(e)}"}
 
         # Check OANDA API
-        oanda_health = oanda_service.check_oanda_health()
+        oanda_health = await oanda_service.check_oanda_health()
 
         # Overall system status
         overall_healthy = (
@@ -44,13 +44,13 @@ def api_info():
 
 
 @router.get("/signals/latest", response_model=List[SignalOut])
-def get_latest_api_signals(
+async def get_latest_api_signals(
     limit: int = Query(10, ge=1, le=100),
     signal_service: SignalService = Depends(get_signal_service)
 ):
     """Get latest active signals via API"""
     try:
-        signals = signal_service.get_latest_signals(limit)
+        signals = await signal_service.get_latest_signals(limit)
         return [SignalOut.from_orm(signal) for signal in signals]
     except Exception as e:
         logger.error(f"Error fetching latest signals via API: {e}")
@@ -61,7 +61,7 @@ def get_latest_api_signals(
 
 
 @router.post("/signals/generate/{symbol}")
-def generate_signal_for_symbol(
+async def generate_signal_for_symbol(
     symbol: str,
     current_user: User = Depends(get_current_active_user_dependency),
     oanda_service: OANDAService = Depends(get_oanda_service)
@@ -72,7 +72,7 @@ def generate_signal_for_symbol(
         normalized_symbol = symbol.upper().replace("/", "")
 
         # Check OANDA health
-        health_check = oanda_service.check_oanda_health()
+        health_check = await oanda_service.check_oanda_health()
         if not health_check.get("available", False):
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -80,7 +80,7 @@ def generate_signal_for_symbol(
             )
 
         # Generate signal
-        signal = oanda_service.generate_signal(normalized_symbol, current_user.id)
+        signal = await oanda_service.generate_signal(normalized_symbol, current_user.id)
 
         if not signal:
             return {
@@ -131,7 +131,7 @@ async def generate_signals_if_needed(
             }
 
         # Check OANDA availability
-        health_check = oanda_service.check_oanda_health()
+        health_check = await oanda_service.check_oanda_health()
         if not health_check.get("available", False):
             return {
                 "message": "OANDA API not available, cannot generate signals",
@@ -158,18 +158,18 @@ async def generate_signals_if_needed(
         generated_signals = []
         errors = []
 
-        for symbol in major_symbols:
-            try:
-                signal = oanda_service.generate_signal(symbol, system_user.id)
-                if signal:
-                    generated_signals.append({
-                        "symbol": symbol,
-                        "signal_id": signal.id,
-                        "signal_type": signal.signal_type.value,
-                        "reliability": signal.reliability
-                    })
-            except Exception as e:
-                errors.append(f"Error generating {symbol}: {str(e)}")
+        # All symbols are analysed concurrently on the shared engine
+        signals = await oanda_service.batch_generate_signals(major_symbols, system_user.id)
+        for symbol, signal in signals.items():
+            if signal:
+                generated_signals.append({
+                    "symbol": symbol,
+                    "signal_id": signal.id,
+                    "signal_type": signal.signal_type.value,
+                    "reliability": signal.reliability
+                })
+            else:
+                errors.append(f"No signal generated for {symbol}")
 
         return {
             "message": f"Generated {len(generated_signals)} new signals",
@@ -191,13 +191,13 @@ async def generate_signals_if_needed(
 
 
 @router.get("/landing/stats")
-def get_landing_stats(
+async def get_landing_stats(
     signal_service: SignalService = Depends(get_signal_service),
     user_service: UserService = Depends(get_user_service)
 ):
     """Get statistics for landing page"""
     try:
-        signal_stats = signal_service.get_signal_statistics()
+        signal_stats = await signal_service.get_signal_statistics()
         user_count = user_service.get_active_user_count()
         recent_signals = signal_service.get_recent_signals_count(24)
 
@@ -225,13 +225,13 @@ def get_landing_stats(
 
 
 @router.get("/landing/recent-signals")
-def get_recent_signals_for_landing(
+async def get_recent_signals_for_landing(
     limit: int = Query(5, ge=1, le=20),
     signal_service: SignalService = Depends(get_signal_service)
 ):
     """Get recent signals for landing page display"""
     try:
-        signals = signal_service.get_latest_signals(limit)
+        signals = await signal_service.get_latest_signals(limit)
 
         return {
             "signals": [
@@ -314,12 +314,12 @@ def calculate_position_size(
 
 
 @router.get("/oanda/health")
-def get_oanda_health(
+async def get_oanda_health(
     oanda_service: OANDAService = Depends(get_oanda_service)
 ):
     """Check OANDA API health and connectivity"""
     try:
-        return oanda_service.check_oanda_health()
+        return await oanda_service.check_oanda_health()
     except Exception as e:
         logger.error(f"Error checking OANDA health: {e}")
         return {
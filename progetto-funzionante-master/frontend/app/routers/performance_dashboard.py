@@ -14,7 +14,8 @@ import psutil
 import json
 
 from app.core.async_database import database_manager
-from app.services.async_http_client import HttpClientMetrics
+from app.services.async_http_client import http_clients, get_all_http_client_metrics
+from oanda_api_client import get_rate_limit_metrics, oanda_client_registry
 from app.services.async_file_service import file_service
 from app.services.async_task_scheduler import task_scheduler
 from app.services.async_logging_service import logging_service
@@ -495,7 +496,8 @@ async def clear_performance_metrics() -> Dict[str, Any]:
         performance_metrics = PerformanceMetrics()
 
         # Clear service-specific metrics
-        HttpClientMetrics.clear_global_metrics()
+        for client in http_clients.values():
+            client.reset_metrics()
 
         return {
             "timestamp": datetime.utcnow().isoformat(),
@@ -548,19 +550,12 @@ async def _get_database_metrics() -> Dict[str, Any]:
 async def _get_http_client_metrics() -> Dict[str, Any]:
     """Get HTTP client performance metrics"""
     try:
-        metrics = HttpClientMetrics.get_global_metrics()
+        metrics = get_all_http_client_metrics()
 
         return {
-            "total_requests": metrics["total_requests"],
-            "successful_requests": metrics["successful_requests"],
-            "failed_requests": metrics["failed_requests"],
-            "success_rate": metrics["success_rate"],
-            "average_response_time_ms": metrics["average_response_time_ms"],
-            "min_response_time_ms": metrics["min_response_time_ms"],
-            "max_response_time_ms": metrics["max_response_time_ms"],
-            "active_connections": metrics["active_connections"],
-            "connection_pool_size": metrics["connection_pool_size"],
-            "circuit_breaker_trips": metrics.get("circuit_breaker_trips", 0),
+            **metrics,
+            "oanda_pools": oanda_client_registry.get_metrics(),
+            "oanda_rate_limits": get_rate_limit_metrics(),
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
@@ -19,7 +19,7 @@ router = APIRouter(
 
 
 @router.get("/latest", response_model=List[SignalOut])
-def get_latest_signals(
+async def get_latest_signals(
     limit: int = Query(10, ge=1, le=100, description="Maximum number of signals to return"),
     signal_service: SignalService = Depends(get_signal_service),
     current_user: Optional[User] = Depends(get_optional_user_dependency)
@@ -38,7 +38,7 @@ def get_latest_signals(
         HTTPException: If signal fetching fails
     """
     try:
-        signals = signal_service.get_latest_signals(limit)
+        signals = await signal_service.get_latest_signals(limit)
         return [SignalOut.from_orm(signal) for signal in signals]
     except Exception as e:
         raise HTTPException(
@@ -48,7 +48,7 @@ def get_latest_signals(
 
 
 @router.get("/top", response_model=TopSignalsResponse)
-def get_top_signals(
+async def get_top_signals(
     limit: int = Query(10, ge=1, le=50, description="Maximum number of top signals to return"),
     signal_service: SignalService = Depends(get_signal_service)
 ) -> TopSignalsResponse:
@@ -65,7 +65,7 @@ def get_top_signals(
         HTTPException: If signal fetching fails
     """
     try:
-        return signal_service.get_top_signals(limit)
+        return await signal_service.get_top_signals(limit)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -74,7 +74,7 @@ def get_top_signals(
 
 
 @router.get("/", response_model=List[SignalOut])
-def get_signals(
+async def get_signals(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     symbol: Optional[str] = Query(None),
@@ -86,7 +86,7 @@ def get_signals(
     """Get signals with filtering options"""
     try:
         if symbol:
-            signals = signal_service.get_signals_by_symbol(symbol, limit)
+            signals = await signal_service.get_signals_by_symbol(symbol, limit)
         elif signal_type:
             signals = signal_service.get_signals_by_type(signal_type, limit)
         elif risk_level:
@@ -127,14 +127,14 @@ def create_signal(
 
 
 @router.get("/by-symbol/{symbol}", response_model=List[SignalOut])
-def get_signals_by_symbol(
+async def get_signals_by_symbol(
     symbol: str,
     limit: int = Query(10, ge=1, le=100),
     signal_service: SignalService = Depends(get_signal_service)
 ):
     """Get signals for a specific trading symbol"""
     try:
-        signals = signal_service.get_signals_by_symbol(symbol.upper(), limit)
+        signals = await signal_service.get_signals_by_symbol(symbol.upper(), limit)
         return [SignalOut.from_orm(signal) for signal in signals]
     except Exception as e:
         raise HTTPException(
@@ -143,6 +143,27 @@ def get_signals_by_symbol(
         )
 
 
+@router.get("/by-symbols", response_model=Dict[str, List[SignalOut]])
+async def get_signals_by_symbols(
+    symbols: str = Query(..., description="Comma-separated trading symbols"),
+    limit: int = Query(10, ge=1, le=100),
+    signal_service: SignalService = Depends(get_signal_service)
+):
+    """Get signals for several symbols at once, e.g. for a per-symbol dashboard"""
+    try:
+        symbol_list = list(dict.fromkeys(s.strip().upper() for s in symbols.split(",") if s.strip()))
+        signals_by_symbol = await signal_service.get_signals_for_symbols(symbol_list, limit)
+        return {
+            symbol: [SignalOut.from_orm(signal) for signal in signals]
+            for symbol, signals in signals_by_symbol.items()
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching signals for {symbols}: {str(e)}"
+        )
+
+
 @router.get("/search", response_model=List[SignalOut])
 def search_signals(
     q: str = Query(..., min_length=2),
@@ -212,12 +233,12 @@ def get_my_signals(
 
 
 @router.get("/statistics", response_model=Dict[str, Any])
-def get_signal_statistics(
+async def get_signal_statistics(
     signal_service: SignalService = Depends(get_signal_service)
 ):
     """Get overall signal statistics"""
     try:
-        return signal_service.get_signal_statistics()
+        return await signal_service.get_signal_statistics()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
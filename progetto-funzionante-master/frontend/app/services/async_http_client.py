@@ -71,6 +71,13 @@ class HttpClientMetrics:
     average_response_time: float = 0.0
     last_response_time: float = 0.0
 
+    # Transport level, counted from httpcore trace events for every request
+    # sent through the pooled client, including direct use of `client`
+    transport_requests: int = 0
+    http2_requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate percentage"""
@@ -85,6 +92,14 @@ class HttpClientMetrics:
             return 0.0
         return (self.failed_requests / self.total_requests) * 100
 
+    @property
+    def connection_reuse_rate(self) -> float:
+        """Percentage of requests sent on an already open connection"""
+        if self.transport_requests == 0:
+            return 0.0
+        reused = max(self.transport_requests - self.connections_opened, 0)
+        return (reused / self.transport_requests) * 100
+
 class AsyncCircuitBreaker:
     """Circuit breaker implementation for async HTTP calls"""
 
@@ -174,7 +189,7 @@ class AsyncHttpClient:
 
         # Configure httpx client with connection pooling
         self.client = httpx.AsyncClient(
-            base_url=base_url,
+            base_url=base_url or "",
             limits=httpx.Limits(
                 max_connections=max_connections,
                 max_keepalive_connections=max_keepalive_connections,
@@ -187,7 +202,8 @@ class AsyncHttpClient:
                 pool=self.timeout_config.pool_timeout
             ),
             follow_redirects=True,
-            http2=True
+            http2=True,
+            event_hooks={"request": [self._attach_trace]}
         )
 
         # Initialize circuit breakers for different services
@@ -200,6 +216,23 @@ class AsyncHttpClient:
             self.circuit_breakers[service] = AsyncCircuitBreaker(self.circuit_breaker_config)
         return self.circuit_breakers[service]
 
+    async def _attach_trace(self, request: httpx.Request):
+        """Request hook adding the connection trace callback"""
+        if self.enable_metrics:
+            request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]):
+        """Count new connections, TLS handshakes and requests from httpcore trace events"""
+        if event_name == "connection.connect_tcp.complete":
+            self.metrics.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            self.metrics.tls_handshakes += 1
+        elif event_name == "http11.send_request_headers.started":
+            self.metrics.transport_requests += 1
+        elif event_name == "http2.send_request_headers.started":
+            self.metrics.transport_requests += 1
+            self.metrics.http2_requests += 1
+
     def _update_metrics(self, success: bool, response_time: float, is_timeout: bool = False):
         """Update client metrics"""
         if not self.enable_metrics:
@@ -441,6 +474,13 @@ class AsyncHttpClient:
             "average_response_time": round(self.metrics.average_response_time * 1000, 2),  # Convert to ms
             "last_response_time": round(self.metrics.last_response_time * 1000, 2),
             "circuit_breaker_trips": self.metrics.circuit_breaker_trips,
+            "connections": {
+                "transport_requests": self.metrics.transport_requests,
+                "http2_requests": self.metrics.http2_requests,
+                "connections_opened": self.metrics.connections_opened,
+                "tls_handshakes": self.metrics.tls_handshakes,
+                "connection_reuse_rate": round(self.metrics.connection_reuse_rate, 2)
+            },
             "circuit_breakers": {
                 name: cb.get_state()
                 for name, cb in self.circuit_breakers.items()
@@ -480,6 +520,37 @@ def get_http_client(service_name: str = "default", **kwargs) -> AsyncHttpClient:
         http_clients[service_name] = AsyncHttpClient(**kwargs)
     return http_clients[service_name]
 
+def get_oanda_analyzer_client() -> AsyncHttpClient:
+    """Get the pooled keep-alive client used by AdvancedSignalAnalyzer for OANDA candles"""
+    return get_http_client(
+        "oanda_analyzer",
+        timeout_config=TimeoutConfig(connect_timeout=10.0, read_timeout=10.0, write_timeout=10.0),
+        max_connections=20,
+        max_keepalive_connections=10
+    )
+
+def get_all_http_client_metrics() -> Dict[str, Any]:
+    """Get metrics for every registered HTTP client plus connection totals"""
+    clients = {name: client.get_metrics() for name, client in http_clients.items()}
+    totals = HttpClientMetrics()
+    for client in http_clients.values():
+        for name in ("total_requests", "successful_requests", "failed_requests", "transport_requests",
+                     "http2_requests", "connections_opened", "tls_handshakes"):
+            setattr(totals, name, getattr(totals, name) + getattr(client.metrics, name))
+
+    return {
+        "total_requests": totals.total_requests,
+        "successful_requests": totals.successful_requests,
+        "failed_requests": totals.failed_requests,
+        "success_rate": round(totals.success_rate, 2),
+        "transport_requests": totals.transport_requests,
+        "http2_requests": totals.http2_requests,
+        "connections_opened": totals.connections_opened,
+        "tls_handshakes": totals.tls_handshakes,
+        "connection_reuse_rate": round(totals.connection_reuse_rate, 2),
+        "clients": clients
+    }
+
 # Initialize function
 async def init_http_clients():
     """Initialize HTTP clients for external services"""
@@ -488,7 +559,7 @@ async def init_http_clients():
         oanda_client = get_http_client(
             "oanda",
             base_url=settings.OANDA_API_URL,
-            timeout_config=TimeoutConfig(connect=15.0, read=60.0),
+            timeout_config=TimeoutConfig(connect_timeout=15.0, read_timeout=60.0),
             retry_config=RetryConfig(max_attempts=5, base_delay=2.0),
             circuit_breaker_config=CircuitBreakerConfig(
                 failure_threshold=10,
@@ -499,7 +570,7 @@ async def init_http_clients():
         # Initialize general API client
         api_client = get_http_client(
             "api",
-            timeout_config=TimeoutConfig(connect=10.0, read=30.0),
+            timeout_config=TimeoutConfig(connect_timeout=10.0, read_timeout=30.0),
             retry_config=RetryConfig(max_attempts=3),
             circuit_breaker_config=CircuitBreakerConfig(
                 failure_threshold=5,
@@ -507,6 +578,9 @@ async def init_http_clients():
             )
         )
 
+        # Shared pooled client for advanced analysis candle downloads
+        get_oanda_analyzer_client()
+
         logger.info("HTTP clients initialized successfully")
         return True
     except Exception as e:
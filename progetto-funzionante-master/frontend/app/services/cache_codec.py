@@ -0,0 +1,212 @@
+"""
+Cache Value Codecs
+Binary serialization for CacheService values with optional compression.
+
+Every encoded value starts with a header byte recording how it was written:
+
+    header = (compression << 3) | codec
+
+All header values are below 0x20. Entries written before the codec layer
+existed are JSON text (which starts with a printable character) or a latin1
+pickle stored as UTF-8 (which starts with 0xC2), so they still decode.
+"""
+
+import json
+import logging
+import pickle
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Codec ids (low 3 bits of the header)
+CODEC_MSGPACK = 1
+CODEC_JSON = 2
+CODEC_PICKLE = 3
+
+# Compression ids (next 2 bits of the header)
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+
+CODECS = {"msgpack": CODEC_MSGPACK, "json": CODEC_JSON, "pickle": CODEC_PICKLE}
+COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "lz4": COMPRESSION_LZ4}
+
+# msgpack extension types for values JSON would have turned into strings
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_DECIMAL = 3
+_EXT_TUPLE = 4
+_EXT_SET = 5
+
+
+class CodecError(ValueError):
+    """Raised when a cached value cannot be decoded"""
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Encode types msgpack does not support natively as extension types"""
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+    if type(value) is tuple:
+        return msgpack.ExtType(_EXT_TUPLE, _packb(list(value)))
+    if type(value) in (set, frozenset):
+        return msgpack.ExtType(_EXT_SET, _packb(list(value)))
+    # Anything else (including subclasses of builtins) is left to pickle
+    raise TypeError(f"Cannot msgpack {type(value).__name__}")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == _EXT_DECIMAL:
+        return Decimal(data.decode())
+    if code == _EXT_TUPLE:
+        return tuple(_unpackb(data))
+    if code == _EXT_SET:
+        return set(_unpackb(data))
+    return msgpack.ExtType(code, data)
+
+
+def _packb(value: Any) -> bytes:
+    # strict_types sends tuples and builtin subclasses (e.g. str enums) to the default hook
+    return msgpack.packb(value, default=_msgpack_default, strict_types=True, use_bin_type=True)
+
+
+def _unpackb(data: bytes) -> Any:
+    return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+
+
+class CacheCodec:
+    """
+    Encodes cache values to bytes and back
+
+    Values the configured codec cannot represent exactly are written with
+    pickle instead, so types are never silently converted.
+    """
+
+    def __init__(self, codec: str = "msgpack", compression: str = "zlib", compression_threshold: int = 1024):
+        """
+        Initialize codec
+
+        Args:
+            codec: "msgpack", "json" or "pickle"; msgpack falls back to json if not installed
+            compression: "none", "zlib" or "lz4"; lz4 falls back to zlib if not installed
+            compression_threshold: Payloads at least this many bytes are compressed
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unknown cache codec: {codec}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        if codec == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed, cache values will be stored as JSON")
+            codec = "json"
+        if compression == "lz4" and not LZ4_AVAILABLE:
+            logger.warning("lz4 not installed, cache values will be compressed with zlib")
+            compression = "zlib"
+
+        self.codec = CODECS[codec]
+        self.compression = COMPRESSIONS[compression]
+        self.compression_threshold = compression_threshold
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize value to header byte + payload"""
+        codec = self.codec
+        try:
+            if codec == CODEC_MSGPACK:
+                payload = _packb(value)
+            elif codec == CODEC_JSON:
+                payload = json.dumps(value, separators=(",", ":")).encode()
+            else:
+                payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (TypeError, ValueError, OverflowError):
+            codec = CODEC_PICKLE
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        compression = COMPRESSION_NONE
+        if self.compression != COMPRESSION_NONE and len(payload) >= self.compression_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                payload, compression = compressed, self.compression
+
+        return bytes(((compression << 3) | codec,)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize bytes written by encode() or by the legacy text format"""
+        if not data:
+            raise CodecError("Empty cache value")
+        if isinstance(data, str):
+            data = data.encode()
+
+        header = data[0]
+        if header >= 0x20:
+            return self._decode_legacy(data)
+
+        codec, compression = header & 0x07, header >> 3
+        payload = memoryview(data)[1:]
+        try:
+            if compression == COMPRESSION_ZLIB:
+                payload = zlib.decompress(payload)
+            elif compression == COMPRESSION_LZ4:
+                if not LZ4_AVAILABLE:
+                    raise CodecError("Cache value is lz4-compressed but lz4 is not installed")
+                payload = lz4.frame.decompress(payload)
+            elif compression != COMPRESSION_NONE:
+                raise CodecError(f"Unknown cache compression id: {compression}")
+
+            if codec == CODEC_MSGPACK:
+                if not MSGPACK_AVAILABLE:
+                    raise CodecError("Cache value is msgpack but msgpack is not installed")
+                return _unpackb(payload)
+            if codec == CODEC_JSON:
+                return json.loads(bytes(payload))
+            if codec == CODEC_PICKLE:
+                return pickle.loads(payload)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Corrupt cache value: {e}") from e
+
+        raise CodecError(f"Unknown cache codec id: {codec}")
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == COMPRESSION_LZ4:
+            return lz4.frame.compress(payload)
+        return zlib.compress(payload, 1)  # favour speed, signal payloads compress well anyway
+
+    @staticmethod
+    def _decode_legacy(data: bytes) -> Any:
+        """Decode entries stored as JSON text or latin1 pickle text"""
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise CodecError(f"Unrecognised cache value: {e}") from e
+
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            try:
+                return pickle.loads(text.encode("latin1"))
+            except Exception as e:
+                raise CodecError(f"Unrecognised cache value: {e}") from e
@@ -6,25 +6,38 @@ Implements comprehensive caching strategies for frequently accessed data with:
 - Cache key generation and management
 - Cache invalidation strategies
 - Performance metrics and monitoring
+- In-process L1 tier kept coherent across workers via Redis pub/sub
 - Fallback mechanisms
 """
 
 import json
-import pickle
 import logging
 import hashlib
+import math
+import random
 import time
-from typing import Any, Optional, List, Dict, Union, AsyncContextManager
+import uuid
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Iterable, Optional, List, Dict, Sequence, Tuple, Union, AsyncContextManager
 from datetime import datetime, timedelta
 import asyncio
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-import redis
+import redis.asyncio as redis
 
 from config.settings import settings
+from app.services.cache_codec import CacheCodec, CodecError
+from app.services.l1_cache import L1Cache, MISSING
 
 logger = logging.getLogger(__name__)
 
+# Marks values stored by get_or_load with their logical expiry
+ENVELOPE_MARKER = "__cache_envelope__"
+
+# Invalidation tags used by the high-level helpers
+SIGNALS_TAG = "signals"
+MARKET_DATA_TAG = "market_data"
+
 
 @dataclass
 class CacheMetrics:
@@ -36,6 +49,21 @@ class CacheMetrics:
     average_response_time: float = 0.0
     last_health_check: Optional[datetime] = None
 
+    # Per-tier lookups; a get that misses L1 and hits Redis counts in both
+    l1_hits: int = 0
+    l1_misses: int = 0
+    redis_hits: int = 0
+    redis_misses: int = 0
+    invalidations_published: int = 0
+    invalidations_received: int = 0
+    tag_invalidations: int = 0
+
+    # get_or_load
+    loads: int = 0
+    coalesced_loads: int = 0
+    stale_served: int = 0
+    early_refreshes: int = 0
+
     @property
     def hit_rate(self) -> float:
         """Calculate cache hit rate"""
@@ -50,6 +78,14 @@ class CacheMetrics:
             return 0.0
         return (self.errors / self.total_operations) * 100
 
+    def tier_hit_rate(self, tier: str) -> float:
+        """Calculate hit rate for a single tier ('l1' or 'redis')"""
+        hits = getattr(self, f"{tier}_hits")
+        lookups = hits + getattr(self, f"{tier}_misses")
+        if lookups == 0:
+            return 0.0
+        return (hits / lookups) * 100
+
 
 @dataclass
 class CacheConfig:
@@ -65,6 +101,16 @@ class CacheConfig:
     fallback_enabled: bool = True
     metrics_enabled: bool = True
 
+    # L1 in-process tier
+    l1_max_bytes: int = 64 * 1024 * 1024
+    l1_max_entries: int = 10000
+    l1_max_ttl: int = 300  # bounds staleness if an invalidation message is lost
+
+    # Value serialization (see cache_codec)
+    codec: str = "msgpack"
+    compression: str = "zlib"
+    compression_threshold: int = 1024
+
 
 class CacheService:
     """
@@ -73,7 +119,11 @@ class CacheService:
     - TTL support with automatic expiration
     - Cache key generation and management
     - Performance metrics and monitoring
-    - Fallback mechanisms for graceful degradation
+    - L1 in-process tier in front of Redis, which is also the fallback
+      for graceful degradation when Redis is unavailable
+
+    Writes and deletes are broadcast on a Redis pub/sub channel so every
+    worker drops its L1 copy of the affected keys.
     """
 
     def __init__(self, config: CacheConfig = None):
@@ -81,10 +131,27 @@ class CacheService:
         self.redis: Optional[redis.Redis] = None
         self._connection_pool: Optional[redis.ConnectionPool] = None
         self._metrics = CacheMetrics()
-        self._fallback_cache: Dict[str, Any] = {}
+        self._l1 = L1Cache(max_bytes=self.config.l1_max_bytes, max_entries=self.config.l1_max_entries)
+        self._codec = CacheCodec(
+            codec=self.config.codec,
+            compression=self.config.compression,
+            compression_threshold=self.config.compression_threshold
+        )
         self._connection_healthy = False
         self._fallback_enabled = self.config.fallback_enabled
 
+        # L1 invalidation across workers
+        self._instance_id = uuid.uuid4().hex
+        self._invalidation_channel = f"{settings.cache.cache_prefix}cache:invalidate"
+        self._invalidation_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Known tag generations as (version, monotonic time read)
+        self._tag_versions: Dict[str, Tuple[int, float]] = {}
+
+        # In-flight get_or_load computations by key (single-flight)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
     async def connect(self) -> bool:
         """
         Initialize Redis connection with connection pooling and health monitoring
@@ -98,7 +165,7 @@ class CacheService:
                 self.config.redis_url,
                 max_connections=self.config.max_connections,
                 encoding=self.config.encoding,
-                decode_responses=True,
+                decode_responses=False,  # values are binary, see cache_codec
                 socket_timeout=self.config.timeout,
                 socket_connect_timeout=self.config.timeout,
                 retry_on_timeout=self.config.retry_on_timeout
@@ -109,6 +176,7 @@ class CacheService:
             # Test connection and health
             if await self._ping():
                 self._connection_healthy = True
+                self._start_invalidation_listener()
                 logger.info("Redis cache service connected successfully")
                 return True
             else:
@@ -133,13 +201,103 @@ class CacheService:
 
     async def disconnect(self):
         """Close Redis connection and cleanup"""
+        listener, self._invalidation_task = self._invalidation_task, None
+        if listener:
+            listener.cancel()
+            # redis-py can swallow a cancellation inside get_message, so don't wait on it forever;
+            # the listener also stops by itself once it is no longer the active one
+            await asyncio.wait({listener}, timeout=self.config.timeout)
         if self.redis:
             await self.redis.close()
         if self._connection_pool:
             await self._connection_pool.disconnect()
-        self._fallback_cache.clear()
+        self._l1.clear()
+        self._tag_versions.clear()
         logger.info("Cache service disconnected")
 
+    def _start_invalidation_listener(self) -> None:
+        """Start the background task applying other workers' invalidations"""
+        self._loop = asyncio.get_running_loop()
+        if self._invalidation_task is None or self._invalidation_task.done():
+            self._invalidation_task = asyncio.create_task(self._listen_for_invalidations())
+
+    async def _listen_for_invalidations(self) -> None:
+        """Subscribe to the invalidation channel and drop matching L1 entries"""
+        this_task = asyncio.current_task()
+        while self._invalidation_task is this_task:
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(self._invalidation_channel)
+                while self._invalidation_task is this_task:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Messages may have been missed while disconnected
+                logger.warning(f"Cache invalidation listener error, clearing L1: {e}")
+                self._l1.clear()
+                self._tag_versions.clear()
+                await asyncio.sleep(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    def _apply_invalidation(self, data: Union[str, bytes]) -> int:
+        """Apply an invalidation message published by another worker"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {data!r}")
+            return 0
+
+        if message.get("origin") == self._instance_id:
+            return 0
+
+        if self.config.metrics_enabled:
+            self._metrics.invalidations_received += 1
+
+        # Re-read bumped tag generations from Redis on next use
+        for tag in message.get("tags", []):
+            self._tag_versions.pop(tag, None)
+
+        removed = sum(self._l1.delete(key) for key in message.get("keys", []))
+        pattern = message.get("pattern")
+        if pattern:
+            removed += self._l1.delete_where(lambda key: fnmatchcase(key, pattern))
+        return removed
+
+    def _invalidation_message(
+        self,
+        keys: Optional[List[str]] = None,
+        pattern: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> str:
+        """Build the pub/sub payload telling other workers to drop L1 entries"""
+        if self.config.metrics_enabled:
+            self._metrics.invalidations_published += 1
+        message: Dict[str, Any] = {"origin": self._instance_id}
+        if keys:
+            message["keys"] = keys
+        if pattern:
+            message["pattern"] = pattern
+        if tags:
+            message["tags"] = tags
+        return json.dumps(message)
+
+    def _l1_ttl(self, ttl: Optional[float]) -> Optional[float]:
+        """L1 lifetime: the entry TTL, capped while other workers may write the key"""
+        if not self._connection_healthy:
+            return ttl
+        if ttl is None:
+            return self.config.l1_max_ttl
+        return min(ttl, self.config.l1_max_ttl)
+
     def _generate_cache_key(self, prefix: str, *args, **kwargs) -> str:
         """
         Generate consistent cache key from arguments with application prefixes
@@ -160,6 +318,13 @@ class CacheService:
         key_hash = hashlib.md5(key_data.encode()).hexdigest()
         return f"{app_prefix}{prefix}:{key_hash}"
 
+    def _update_tier_metrics(self, tier: str, hit: bool) -> None:
+        """Count a lookup against a single cache tier"""
+        if not self.config.metrics_enabled:
+            return
+        counter = f"{tier}_hits" if hit else f"{tier}_misses"
+        setattr(self._metrics, counter, getattr(self._metrics, counter) + 1)
+
     def _update_metrics(self, hit: bool = False, miss: bool = False, error: bool = False, response_time: float = 0) -> None:
         """Update cache performance metrics"""
         if not self.config.metrics_enabled:
@@ -184,48 +349,53 @@ class CacheService:
                 weight * response_time
             )
 
-    async def get(self, key: str, default: Any = None) -> Any:
+    async def get(self, key: str, default: Any = None, tags: Optional[Sequence[str]] = None) -> Any:
         """
         Get value from cache with fallback support and metrics
 
         Args:
             key: Cache key
             default: Default value to return if cache miss
+            tags: Invalidation tags the value was stored under
 
         Returns:
             Cached value or default if not found
         """
+        if tags:
+            key = await self._tagged_key(key, tags)
         start_time = time.time()
-        response_time = 0
+
+        # L1 first - no network round-trip
+        l1_value = self._l1.get(key)
+        self._update_tier_metrics("l1", l1_value is not MISSING)
+        if l1_value is not MISSING:
+            self._update_metrics(hit=True, response_time=time.time() - start_time)
+            logger.debug(f"Cache hit (L1) for key: {key}")
+            return l1_value
 
         try:
-            # Try Redis first if connection is healthy
+            # Then Redis if connection is healthy
             if self._connection_healthy and self.redis:
-                cached_data = await self.redis.get(key)
-                response_time = time.time() - start_time
-
-                if cached_data:
-                    # Try JSON first (for simple data), fall back to pickle
-                    try:
-                        decoded_value = json.loads(cached_data)
-                        self._update_metrics(hit=True, response_time=response_time)
+                # Value and remaining TTL in one round-trip so L1 never outlives Redis
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    cached_data, ttl_ms = await pipe.execute()
+
+                if cached_data is not None:
+                    decoded_value = self._decode(key, cached_data)
+                    if decoded_value is not MISSING:
+                        self._update_tier_metrics("redis", True)
+                        self._l1.set(
+                            key, decoded_value,
+                            ttl=self._l1_ttl(ttl_ms / 1000 if ttl_ms > 0 else None),
+                            size=len(cached_data)
+                        )
+                        self._update_metrics(hit=True, response_time=time.time() - start_time)
                         logger.debug(f"Cache hit for key: {key}")
                         return decoded_value
-                    except json.JSONDecodeError:
-                        try:
-                            decoded_value = pickle.loads(cached_data.encode('latin1'))
-                            self._update_metrics(hit=True, response_time=response_time)
-                            logger.debug(f"Cache hit (pickle) for key: {key}")
-                            return decoded_value
-                        except Exception as e:
-                            logger.warning(f"Failed to decode cached data for key {key}: {e}")
-
-            # Check fallback cache
-            if key in self._fallback_cache:
-                fallback_value = self._fallback_cache[key]
-                self._update_metrics(hit=True, response_time=time.time() - start_time)
-                logger.debug(f"Cache hit (fallback) for key: {key}")
-                return fallback_value
+
+                self._update_tier_metrics("redis", False)
 
             self._update_metrics(miss=True, response_time=time.time() - start_time)
             logger.debug(f"Cache miss for key: {key}")
@@ -234,11 +404,17 @@ class CacheService:
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             self._update_metrics(error=True, response_time=time.time() - start_time)
+            return default
 
-            # Try fallback cache
-            return self._fallback_cache.get(key, default)
+    def _decode(self, key: str, cached_data: bytes) -> Any:
+        """Decode a stored value, returning MISSING if it cannot be read"""
+        try:
+            return self._codec.decode(cached_data)
+        except CodecError as e:
+            logger.warning(f"Failed to decode cached data for key {key}: {e}")
+            return MISSING
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Sequence[str]] = None) -> bool:
         """
         Set value in cache with TTL support and fallback
 
@@ -246,33 +422,29 @@ class CacheService:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (uses default if None)
+            tags: Invalidation tags; invalidate_tag on any of them hides the value
 
         Returns:
             bool: True if successful, False otherwise
         """
+        if tags:
+            key = await self._tagged_key(key, tags)
         start_time = time.time()
         ttl = ttl or self.config.default_ttl
 
         try:
             # Serialize value for storage
-            try:
-                serialized_value = json.dumps(value, default=str)
-            except (TypeError, ValueError):
-                serialized_value = pickle.dumps(value).decode('latin1')
+            serialized_value = self._codec.encode(value)
 
-            # Set in Redis if connection is healthy
+            # Set in Redis if connection is healthy, telling other workers to drop their L1 copy
             if self._connection_healthy and self.redis:
-                await self.redis.setex(key, ttl, serialized_value)
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.setex(key, ttl, serialized_value)
+                    pipe.publish(self._invalidation_channel, self._invalidation_message(keys=[key]))
+                    await pipe.execute()
 
-            # Always update fallback cache for reliability
-            self._fallback_cache[key] = value
-
-            # Limit fallback cache size (keep most recent 1000 items)
-            if len(self._fallback_cache) > 1000:
-                # Remove oldest 20% of items
-                items_to_remove = len(self._fallback_cache) - 800
-                for fallback_key in list(self._fallback_cache.keys())[:items_to_remove]:
-                    self._fallback_cache.pop(fallback_key, None)
+            # Always update L1, which is also the fallback when Redis is down
+            self._l1.set(key, value, ttl=self._l1_ttl(ttl), size=len(serialized_value))
 
             self._update_metrics(response_time=time.time() - start_time)
             logger.debug(f"Cache set for key: {key}, TTL: {ttl}s")
@@ -282,24 +454,28 @@ class CacheService:
             logger.error(f"Cache set error for key {key}: {e}")
             self._update_metrics(error=True, response_time=time.time() - start_time)
 
-            # Always try to set in fallback cache
-            self._fallback_cache[key] = value
+            # Always try to set in L1
+            self._l1.set(key, value, ttl=ttl)
             return False
 
-    async def delete(self, key: str) -> bool:
-        """Delete key from cache with fallback support"""
+    async def delete(self, key: str, tags: Optional[Sequence[str]] = None) -> bool:
+        """Delete key (stored under tags, if given) from cache with fallback support"""
+        if tags:
+            key = await self._tagged_key(key, tags)
         start_time = time.time()
 
         try:
             # Delete from Redis if connection is healthy
             deleted = False
             if self._connection_healthy and self.redis:
-                result = await self.redis.delete(key)
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.delete(key)
+                    pipe.publish(self._invalidation_channel, self._invalidation_message(keys=[key]))
+                    result, _ = await pipe.execute()
                 deleted = result > 0
 
-            # Delete from fallback cache
-            if key in self._fallback_cache:
-                self._fallback_cache.pop(key, None)
+            # Delete from L1
+            if self._l1.delete(key):
                 deleted = True
 
             self._update_metrics(response_time=time.time() - start_time)
@@ -310,28 +486,192 @@ class CacheService:
             logger.error(f"Cache delete error for key {key}: {e}")
             self._update_metrics(error=True, response_time=time.time() - start_time)
 
-            # Try to delete from fallback cache
-            if key in self._fallback_cache:
-                self._fallback_cache.pop(key, None)
-                return True
+            # Try to delete from L1
+            return self._l1.delete(key)
+
+    async def get_many(
+        self,
+        keys: List[str],
+        default: Any = None,
+        tags: Optional[Union[Sequence[str], Dict[str, Sequence[str]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get several values, reading L1 per key and all L1 misses from Redis in one round-trip
+
+        Args:
+            keys: Cache keys
+            default: Value for keys that are not cached
+            tags: Invalidation tags for every key, or tags by key
+
+        Returns:
+            Dict: Value (or default) for every requested key, in request order
+        """
+        if tags:
+            tagged = await self._tagged_keys(keys, tags)
+            values = await self.get_many(list(tagged.values()), default)
+            return {key: values[tagged[key]] for key in keys}
+
+        start_time = time.time()
+        results: Dict[str, Any] = {}
+        pending: List[str] = []
+
+        for key in dict.fromkeys(keys):
+            l1_value = self._l1.get(key)
+            self._update_tier_metrics("l1", l1_value is not MISSING)
+            if l1_value is not MISSING:
+                results[key] = l1_value
+            else:
+                pending.append(key)
+
+        hits = len(results)
+        try:
+            if pending and self._connection_healthy and self.redis:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key in pending:
+                        pipe.get(key)
+                        pipe.pttl(key)
+                    replies = await pipe.execute()
+
+                for key, cached_data, ttl_ms in zip(pending, replies[::2], replies[1::2]):
+                    decoded_value = MISSING
+                    if cached_data is not None:
+                        decoded_value = self._decode(key, cached_data)
+                    self._update_tier_metrics("redis", decoded_value is not MISSING)
+                    if decoded_value is not MISSING:
+                        self._l1.set(
+                            key, decoded_value,
+                            ttl=self._l1_ttl(ttl_ms / 1000 if ttl_ms > 0 else None),
+                            size=len(cached_data)
+                        )
+                        results[key] = decoded_value
+                        hits += 1
+
+        except Exception as e:
+            logger.error(f"Cache get_many error for {len(pending)} keys: {e}")
+            self._update_metrics(error=True, response_time=time.time() - start_time)
+
+        response_time = time.time() - start_time
+        for key in keys:
+            if key not in results:
+                results[key] = default
+        for i in range(len(results)):
+            self._update_metrics(hit=i < hits, miss=i >= hits, response_time=response_time)
+
+        logger.debug(f"Cache get_many: {hits}/{len(results)} hits")
+        return {key: results[key] for key in keys}
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Union[Sequence[str], Dict[str, Sequence[str]]]] = None
+    ) -> bool:
+        """
+        Set several values with the same TTL in one Redis round-trip
+
+        Args:
+            mapping: Values by cache key
+            ttl: Time to live in seconds (uses default if None)
+            tags: Invalidation tags for every key, or tags by key
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not mapping:
+            return True
+        if tags:
+            tagged = await self._tagged_keys(list(mapping), tags)
+            return await self.set_many({tagged[key]: value for key, value in mapping.items()}, ttl)
+
+        start_time = time.time()
+        ttl = ttl or self.config.default_ttl
+
+        try:
+            serialized = {key: self._codec.encode(value) for key, value in mapping.items()}
+
+            # One invalidation message covers every key written
+            if self._connection_healthy and self.redis:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key, serialized_value in serialized.items():
+                        pipe.setex(key, ttl, serialized_value)
+                    pipe.publish(self._invalidation_channel, self._invalidation_message(keys=list(serialized)))
+                    await pipe.execute()
+
+            for key, value in mapping.items():
+                self._l1.set(key, value, ttl=self._l1_ttl(ttl), size=len(serialized[key]))
+
+            self._update_metrics(response_time=time.time() - start_time)
+            logger.debug(f"Cache set_many for {len(mapping)} keys, TTL: {ttl}s")
+            return True
+
+        except Exception as e:
+            logger.error(f"Cache set_many error for {len(mapping)} keys: {e}")
+            self._update_metrics(error=True, response_time=time.time() - start_time)
+
+            for key, value in mapping.items():
+                self._l1.set(key, value, ttl=ttl)
             return False
 
+    async def delete_many(
+        self,
+        keys: List[str],
+        tags: Optional[Union[Sequence[str], Dict[str, Sequence[str]]]] = None
+    ) -> int:
+        """
+        Delete several keys in one Redis round-trip
+
+        Returns:
+            int: Number of keys that were stored in Redis or L1
+        """
+        if not keys:
+            return 0
+        if tags:
+            keys = list((await self._tagged_keys(keys, tags)).values())
+
+        start_time = time.time()
+        keys = list(dict.fromkeys(keys))
+        deleted = set()
+
+        try:
+            if self._connection_healthy and self.redis:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.delete(key)
+                    pipe.publish(self._invalidation_channel, self._invalidation_message(keys=keys))
+                    replies = await pipe.execute()
+                deleted.update(key for key, result in zip(keys, replies) if result > 0)
+
+            self._update_metrics(response_time=time.time() - start_time)
+
+        except Exception as e:
+            logger.error(f"Cache delete_many error for {len(keys)} keys: {e}")
+            self._update_metrics(error=True, response_time=time.time() - start_time)
+
+        deleted.update(key for key in keys if self._l1.delete(key))
+        logger.debug(f"Cache delete_many: {len(deleted)}/{len(keys)} keys deleted")
+        return len(deleted)
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache"""
+        if key in self._l1:
+            return True
         try:
             if self._connection_healthy and self.redis:
                 return await self.redis.exists(key) > 0
-            return key in self._fallback_cache
+            return False
         except Exception as e:
             logger.error(f"Cache exists error for key {key}: {e}")
-            return key in self._fallback_cache
+            return False
 
     async def ttl(self, key: str) -> int:
         """Get TTL for key in seconds (-1 if no TTL, -2 if key doesn't exist)"""
         try:
             if self._connection_healthy and self.redis:
                 return await self.redis.ttl(key)
-            return -1  # Unknown TTL for fallback cache
+            if key not in self._l1:
+                return -2
+            remaining = self._l1.remaining_ttl(key)
+            return -1 if remaining is None else int(remaining)
         except Exception as e:
             logger.error(f"Cache TTL error for key {key}: {e}")
             return -1
@@ -340,16 +680,156 @@ class CacheService:
         """Set expiration for existing key"""
         try:
             if self._connection_healthy and self.redis:
-                return await self.redis.expire(key, ttl)
-            return False  # No expiration in fallback cache
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.expire(key, ttl)
+                    pipe.publish(self._invalidation_channel, self._invalidation_message(keys=[key]))
+                    updated, _ = await pipe.execute()
+                # Re-read with the new TTL on next get
+                self._l1.delete(key)
+                return updated
+            return False  # Only Redis entries can be re-expired
         except Exception as e:
             logger.error(f"Cache expire error for key {key}: {e}")
             return False
 
+    def _tag_key(self, tag: str) -> str:
+        """Redis key holding the generation counter of a tag"""
+        return f"{settings.cache.cache_prefix}tag:{tag}"
+
+    async def _get_tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """
+        Current generation of each tag
+
+        Generations are kept in-process and re-read from Redis (one MGET for
+        all unknown tags) when missing or older than l1_max_ttl, which bounds
+        staleness the same way as for L1 entries if a broadcast is lost.
+        """
+        now = time.monotonic()
+        versions: Dict[str, int] = {}
+        unknown: List[str] = []
+
+        for tag in dict.fromkeys(tags):
+            known = self._tag_versions.get(tag)
+            if known is not None and (not self._connection_healthy or now - known[1] < self.config.l1_max_ttl):
+                versions[tag] = known[0]
+            else:
+                unknown.append(tag)
+
+        if unknown:
+            remote: List[Optional[bytes]] = [None] * len(unknown)
+            fetched = False
+            if self._connection_healthy and self.redis:
+                try:
+                    remote = await self.redis.mget([self._tag_key(tag) for tag in unknown])
+                    fetched = True
+                except Exception as e:
+                    logger.warning(f"Failed to read cache tag generations {unknown}: {e}")
+
+            for tag, value in zip(unknown, remote):
+                # Never go backwards, e.g. after bumping a tag while Redis was down
+                local = self._tag_versions.get(tag, (0, 0.0))[0]
+                versions[tag] = max(int(value) if value is not None else 0, local)
+                if fetched or not self._connection_healthy:
+                    self._tag_versions[tag] = (versions[tag], now)
+
+        return versions
+
+    async def _tagged_key(self, key: str, tags: Sequence[str]) -> str:
+        """Physical key for key under the current generation of its tags"""
+        versions = await self._get_tag_versions(tags)
+        return f"{key}:v" + ".".join(str(versions[tag]) for tag in tags)
+
+    async def _tagged_keys(
+        self,
+        keys: List[str],
+        tags: Union[Sequence[str], Dict[str, Sequence[str]]]
+    ) -> Dict[str, str]:
+        """Physical key by key, resolving every tag involved in one lookup"""
+        tags_by_key = tags if isinstance(tags, dict) else {key: tags for key in keys}
+        versions = await self._get_tag_versions(tag for key in keys for tag in tags_by_key.get(key, ()))
+        return {
+            key: f"{key}:v" + ".".join(str(versions[tag]) for tag in tags_by_key[key]) if tags_by_key.get(key) else key
+            for key in keys
+        }
+
+    def _bump_local_tag(self, tag: str) -> int:
+        """Move the in-process generation of tag past every version this worker has used"""
+        if self.config.metrics_enabled:
+            self._metrics.tag_invalidations += 1
+        known = self._tag_versions.get(tag)
+        if known is None and self._connection_healthy:
+            # Unknown here, so the next use reads the (incremented) generation from Redis
+            return 0
+        version = (known[0] if known else 0) + 1
+        self._tag_versions[tag] = (version, time.monotonic())
+        return version
+
+    async def _incr_tag(self, tag: str) -> Optional[int]:
+        """INCR the tag generation in Redis and tell other workers, returning the new generation"""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(self._tag_key(tag))
+                pipe.publish(self._invalidation_channel, self._invalidation_message(tags=[tag]))
+                version, _ = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache tag invalidation error for {tag}: {e}")
+            return None
+
+        local = self._tag_versions.get(tag, (0, 0.0))[0]
+        self._tag_versions[tag] = (max(version, local), time.monotonic())
+        return version
+
+    async def invalidate_tag(self, tag: str) -> int:
+        """
+        Invalidate every entry stored under tag with a single INCR
+
+        Entries are not deleted: their keys embed the old generation, so they
+        become unreachable in Redis and L1 alike and expire with their TTL.
+
+        Args:
+            tag: Invalidation tag (e.g. 'signals')
+
+        Returns:
+            int: New generation of the tag
+        """
+        start_time = time.time()
+
+        # Bump locally first so this worker never reads the old generation again
+        version = self._bump_local_tag(tag)
+        if self._connection_healthy and self.redis:
+            remote = await self._incr_tag(tag)
+            if remote is None:
+                self._update_metrics(error=True, response_time=time.time() - start_time)
+                return version
+            version = max(version, remote)
+
+        self._update_metrics(response_time=time.time() - start_time)
+        logger.debug(f"Invalidated cache tag {tag}, generation {version}")
+        return version
+
+    def invalidate_tag_nowait(self, tag: str) -> None:
+        """
+        Invalidate a tag from synchronous code
+
+        The in-process generation is bumped immediately, so this worker stops
+        serving the old entries before returning. The Redis INCR and broadcast
+        to other workers are scheduled on the event loop the service runs on,
+        which also works from threadpool-run sync endpoints.
+        """
+        self._bump_local_tag(tag)
+
+        loop = self._loop
+        if not (self._connection_healthy and self.redis) or loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._incr_tag(tag), loop)
+
     async def invalidate_pattern(self, pattern: str) -> int:
         """
         Invalidate all keys matching pattern with fallback support
 
+        This walks the whole keyspace with SCAN; prefer invalidate_tag for
+        entries stored with tags.
+
         Args:
             pattern: Redis pattern (e.g., 'signals:*')
 
@@ -371,14 +851,14 @@ class CacheService:
                     count = await self.redis.delete(*keys)
                     logger.info(f"Invalidated {count} Redis keys matching pattern: {pattern}")
 
-            # Invalidate from fallback cache
-            fallback_keys = [k for k in self._fallback_cache.keys() if pattern.replace("*", "") in k]
-            for key in fallback_keys:
-                self._fallback_cache.pop(key, None)
+                await self.redis.publish(self._invalidation_channel, self._invalidation_message(pattern=pattern))
 
-            if fallback_keys:
-                logger.info(f"Invalidated {len(fallback_keys)} fallback cache keys matching pattern: {pattern}")
-                count += len(fallback_keys)
+            # Invalidate from L1
+            l1_count = self._l1.delete_where(lambda key: fnmatchcase(key, pattern))
+            if l1_count:
+                logger.info(f"Invalidated {l1_count} L1 cache keys matching pattern: {pattern}")
+                if not self._connection_healthy:
+                    count += l1_count
 
             self._update_metrics(response_time=time.time() - start_time)
             return count
@@ -387,12 +867,8 @@ class CacheService:
             logger.error(f"Cache invalidate pattern error for {pattern}: {e}")
             self._update_metrics(error=True, response_time=time.time() - start_time)
 
-            # Try to invalidate from fallback cache only
-            fallback_keys = [k for k in self._fallback_cache.keys() if pattern.replace("*", "") in k]
-            for key in fallback_keys:
-                self._fallback_cache.pop(key, None)
-
-            return len(fallback_keys)
+            # Try to invalidate from L1 only
+            return self._l1.delete_where(lambda key: fnmatchcase(key, pattern))
 
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -408,7 +884,7 @@ class CacheService:
             "connection_healthy": self._connection_healthy,
             "fallback_enabled": self._fallback_enabled,
             "pool_size": self.config.max_connections,
-            "fallback_cache_size": len(self._fallback_cache),
+            "fallback_cache_size": len(self._l1),
             "metrics_enabled": self.config.metrics_enabled,
             "timestamp": datetime.utcnow().isoformat()
         }
@@ -421,7 +897,24 @@ class CacheService:
                 "hits": self._metrics.hits,
                 "misses": self._metrics.misses,
                 "errors": self._metrics.errors,
-                "average_response_time_ms": round(self._metrics.average_response_time * 1000, 2)
+                "average_response_time_ms": round(self._metrics.average_response_time * 1000, 2),
+                "tiers": {
+                    "l1": {
+                        **self._l1.get_stats(),
+                        "hits": self._metrics.l1_hits,
+                        "misses": self._metrics.l1_misses,
+                        "hit_rate": round(self._metrics.tier_hit_rate("l1"), 2)
+                    },
+                    "redis": {
+                        "hits": self._metrics.redis_hits,
+                        "misses": self._metrics.redis_misses,
+                        "hit_rate": round(self._metrics.tier_hit_rate("redis"), 2)
+                    }
+                },
+                "invalidations_published": self._metrics.invalidations_published,
+                "invalidations_received": self._metrics.invalidations_received,
+                "tag_invalidations": self._metrics.tag_invalidations,
+                "tags_tracked": len(self._tag_versions)
             }
 
         # Test Redis connection
@@ -476,6 +969,113 @@ class CacheService:
             logger.error(f"Redis connection error: {e}")
             raise
 
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: int = 0,
+        early_refresh_beta: float = 0.0,
+        tags: Optional[Sequence[str]] = None
+    ) -> Any:
+        """
+        Get a value, computing it with loader on a miss
+
+        Concurrent misses for the same key share one loader call. Values are
+        stored with their logical expiry and load time so that:
+        - for `stale_ttl` seconds after expiry the stale value is served while a
+          single background refresh runs (stale-while-revalidate)
+        - with `early_refresh_beta` > 0, requests shortly before expiry refresh
+          early with a probability growing as expiry nears and with the load
+          time (XFetch), spreading refreshes out instead of all at the TTL
+
+        Args:
+            key: Cache key
+            loader: Coroutine function returning the value (None is not cached)
+            ttl: Freshness in seconds (uses default if None)
+            stale_ttl: Seconds a stale value may still be served
+            early_refresh_beta: Early refresh aggressiveness, 0 disables it
+            tags: Invalidation tags to store the value under
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        ttl = ttl or self.config.default_ttl
+        if tags:
+            # A load racing an invalidation stores under the old generation, where nobody looks
+            key = await self._tagged_key(key, tags)
+        entry = await self.get(key)
+
+        if self._is_envelope(entry):
+            now = time.time()
+            if now >= entry["expires"]:
+                # Only reachable within the stale window, since Redis drops it after
+                if self.config.metrics_enabled:
+                    self._metrics.stale_served += 1
+                self._start_load(key, loader, ttl, stale_ttl)
+            elif self._should_refresh_early(entry, now, early_refresh_beta):
+                if self.config.metrics_enabled:
+                    self._metrics.early_refreshes += 1
+                self._start_load(key, loader, ttl, stale_ttl)
+            return entry["value"]
+
+        if entry is not None:
+            # Written by a plain set(), serve as-is until it expires
+            return entry
+
+        return await asyncio.shield(self._start_load(key, loader, ttl, stale_ttl))
+
+    @staticmethod
+    def _is_envelope(entry: Any) -> bool:
+        return isinstance(entry, dict) and entry.get(ENVELOPE_MARKER) == 1
+
+    @classmethod
+    def _unwrap(cls, entry: Any) -> Any:
+        """Value of a get_or_load envelope, or the entry itself"""
+        return entry["value"] if cls._is_envelope(entry) else entry
+
+    @staticmethod
+    def _should_refresh_early(entry: Dict[str, Any], now: float, beta: float) -> bool:
+        """XFetch: refresh if now - delta * beta * ln(rand) reaches the expiry"""
+        if beta <= 0:
+            return False
+        return now - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expires"]
+
+    def _start_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int, stale_ttl: int) -> asyncio.Task:
+        """Return the in-flight load for key, starting one if there is none"""
+        task = self._inflight.get(key)
+        if task is not None:
+            if self.config.metrics_enabled:
+                self._metrics.coalesced_loads += 1
+            return task
+
+        task = asyncio.create_task(self._load(key, loader, ttl, stale_ttl))
+        self._inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+            # Retrieve the exception so background refresh failures are logged, not warned about
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.warning(f"Cache load failed for key {key}: {finished.exception()}")
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int, stale_ttl: int) -> Any:
+        """Run loader and store its result with logical expiry and load time"""
+        if self.config.metrics_enabled:
+            self._metrics.loads += 1
+
+        start_time = time.time()
+        value = await loader()
+        delta = time.time() - start_time
+
+        if value is not None:
+            envelope = {ENVELOPE_MARKER: 1, "value": value, "expires": time.time() + ttl, "delta": delta}
+            await self.set(key, envelope, ttl + stale_ttl)
+        return value
+
     # High-level caching methods for specific use cases with configuration-based TTLs
 
     async def cache_signals(self, key_suffix: str, signals: List[Dict], ttl: Optional[int] = None) -> bool:
@@ -487,13 +1087,57 @@ class CacheService:
             signals: List of signal dictionaries
             ttl: Cache TTL in seconds (uses config default if None)
         """
-        cache_key = f"{settings.cache.cache_prefix + "signals:"}{key_suffix}"
-        return await self.set(cache_key, signals, ttl or settings.cache.cache_ttl_medium)
+        cache_key = f"{settings.cache.cache_prefix}signals:{key_suffix}"
+        return await self.set(cache_key, signals, ttl or settings.cache.cache_ttl_medium, tags=[SIGNALS_TAG])
 
     async def get_cached_signals(self, key_suffix: str) -> Optional[List[Dict]]:
         """Get cached signals data"""
-        cache_key = f"{settings.cache.cache_prefix + "signals:"}{key_suffix}"
-        return await self.get(cache_key)
+        cache_key = f"{settings.cache.cache_prefix}signals:{key_suffix}"
+        return self._unwrap(await self.get(cache_key, tags=[SIGNALS_TAG]))
+
+    async def cache_signals_many(self, signals_by_suffix: Dict[str, List[Dict]], ttl: Optional[int] = None) -> bool:
+        """
+        Cache several signals queries in one round-trip
+
+        Args:
+            signals_by_suffix: Signal dictionaries by query identifier
+            ttl: Cache TTL in seconds (uses config default if None)
+        """
+        return await self.set_many(
+            {f"{settings.cache.cache_prefix}signals:{suffix}": signals for suffix, signals in signals_by_suffix.items()},
+            ttl or settings.cache.cache_ttl_medium,
+            tags=[SIGNALS_TAG]
+        )
+
+    async def get_cached_signals_many(self, key_suffixes: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Get several cached signals queries in one round-trip, None for misses"""
+        prefix = f"{settings.cache.cache_prefix}signals:"
+        cached = await self.get_many([prefix + suffix for suffix in key_suffixes], tags=[SIGNALS_TAG])
+        return {suffix: self._unwrap(cached[prefix + suffix]) for suffix in key_suffixes}
+
+    async def get_or_load_signals(
+        self,
+        key_suffix: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: int = 0,
+        early_refresh_beta: float = 0.0
+    ) -> Any:
+        """
+        Get signals data, loading it once for all concurrent callers on a miss
+
+        Args:
+            key_suffix: Unique identifier for the signals query
+            loader: Coroutine function returning the data to cache
+            ttl: Cache TTL in seconds (uses config default if None)
+            stale_ttl: Seconds stale data may be served while refreshing
+            early_refresh_beta: Probabilistic early refresh factor (0 disables)
+        """
+        cache_key = f"{settings.cache.cache_prefix}signals:{key_suffix}"
+        return await self.get_or_load(
+            cache_key, loader, ttl or settings.cache.cache_ttl_medium, stale_ttl, early_refresh_beta,
+            tags=[SIGNALS_TAG]
+        )
 
     async def cache_user_data(self, user_id: Union[int, str], user_data: Dict, ttl: Optional[int] = None) -> bool:
         """
@@ -504,14 +1148,21 @@ class CacheService:
             user_data: User data dictionary
             ttl: Cache TTL in seconds (uses config default if None)
         """
-        cache_key = f"{settings.cache.cache_prefix + "users:"}{user_id}"
+        cache_key = f"{settings.cache.cache_prefix}users:{user_id}"
         return await self.set(cache_key, user_data, ttl or settings.cache.cache_ttl_long)
 
     async def get_cached_user_data(self, user_id: Union[int, str]) -> Optional[Dict]:
         """Get cached user data"""
-        cache_key = f"{settings.cache.cache_prefix + "users:"}{user_id}"
+        cache_key = f"{settings.cache.cache_prefix}users:{user_id}"
         return await self.get(cache_key)
 
+    async def cache_user_data_many(self, users: Dict[Union[int, str], Dict], ttl: Optional[int] = None) -> bool:
+        """Cache several users' data in one round-trip"""
+        return await self.set_many(
+            {f"{settings.cache.cache_prefix}users:{user_id}": data for user_id, data in users.items()},
+            ttl or settings.cache.cache_ttl_long
+        )
+
     async def cache_market_data(self, symbol: str, timeframe: str, data: Dict, ttl: Optional[int] = None) -> bool:
         """
         Cache market data with configurable TTL
@@ -522,13 +1173,41 @@ class CacheService:
             data: Market data dictionary
             ttl: Cache TTL in seconds (uses config default if None)
         """
-        cache_key = f"{settings.cache.cache_prefix + "market_data:"}{symbol}:{timeframe}"
-        return await self.set(cache_key, data, ttl or settings.cache.cache_ttl_short)
+        cache_key = f"{settings.cache.cache_prefix}market_data:{symbol}:{timeframe}"
+        return await self.set(cache_key, data, ttl or settings.cache.cache_ttl_short, tags=self._market_data_tags(symbol, timeframe))
+
+    @staticmethod
+    def _market_data_tags(symbol: str, timeframe: str) -> List[str]:
+        """Market data can be invalidated as a whole, per symbol or per timeframe"""
+        return [MARKET_DATA_TAG, f"{MARKET_DATA_TAG}:{symbol}", f"{MARKET_DATA_TAG}:timeframe:{timeframe}"]
 
     async def get_cached_market_data(self, symbol: str, timeframe: str) -> Optional[Dict]:
         """Get cached market data"""
-        cache_key = f"{settings.cache.cache_prefix + "market_data:"}{symbol}:{timeframe}"
-        return await self.get(cache_key)
+        cache_key = f"{settings.cache.cache_prefix}market_data:{symbol}:{timeframe}"
+        return await self.get(cache_key, tags=self._market_data_tags(symbol, timeframe))
+
+    async def cache_market_data_many(self, data: Dict[Tuple[str, str], Dict], ttl: Optional[int] = None) -> bool:
+        """
+        Cache market data for several symbol/timeframe pairs in one round-trip
+
+        Args:
+            data: Market data dictionaries by (symbol, timeframe)
+            ttl: Cache TTL in seconds (uses config default if None)
+        """
+        keys = {pair: f"{settings.cache.cache_prefix}market_data:{pair[0]}:{pair[1]}" for pair in data}
+        return await self.set_many(
+            {keys[pair]: market_data for pair, market_data in data.items()},
+            ttl or settings.cache.cache_ttl_short,
+            tags={key: self._market_data_tags(*pair) for pair, key in keys.items()}
+        )
+
+    async def get_cached_market_data_many(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict]]:
+        """Get cached market data for several (symbol, timeframe) pairs in one round-trip"""
+        keys = {pair: f"{settings.cache.cache_prefix}market_data:{pair[0]}:{pair[1]}" for pair in pairs}
+        cached = await self.get_many(
+            list(keys.values()), tags={key: self._market_data_tags(*pair) for pair, key in keys.items()}
+        )
+        return {pair: cached[key] for pair, key in keys.items()}
 
     async def cache_api_response(self, endpoint: str, params: Dict, data: Any, ttl: Optional[int] = None) -> bool:
         """
@@ -541,13 +1220,13 @@ class CacheService:
             ttl: Cache TTL in seconds (uses config default if None)
         """
         param_hash = hashlib.md5(str(sorted(params.items())).encode()).hexdigest()
-        cache_key = f"{settings.cache.cache_prefix + "api:"}{endpoint}:{param_hash}"
+        cache_key = f"{settings.cache.cache_prefix}api:{endpoint}:{param_hash}"
         return await self.set(cache_key, data, ttl or settings.cache.cache_ttl_medium)
 
     async def get_cached_api_response(self, endpoint: str, params: Dict) -> Optional[Any]:
         """Get cached API response"""
         param_hash = hashlib.md5(str(sorted(params.items())).encode()).hexdigest()
-        cache_key = f"{settings.cache.cache_prefix + "api:"}{endpoint}:{param_hash}"
+        cache_key = f"{settings.cache.cache_prefix}api:{endpoint}:{param_hash}"
         return await self.get(cache_key)
 
     async def cache_signal_statistics(self, stats: Dict, ttl: Optional[int] = None) -> bool:
@@ -558,13 +1237,13 @@ class CacheService:
             stats: Statistics dictionary
             ttl: Cache TTL in seconds (uses config default if None)
         """
-        cache_key = f"{settings.cache.cache_prefix + "signals:"}statistics"
-        return await self.set(cache_key, stats, ttl or settings.cache.cache_ttl_medium)
+        cache_key = f"{settings.cache.cache_prefix}signals:statistics"
+        return await self.set(cache_key, stats, ttl or settings.cache.cache_ttl_medium, tags=[SIGNALS_TAG])
 
     async def get_cached_signal_statistics(self) -> Optional[Dict]:
         """Get cached signal statistics"""
-        cache_key = f"{settings.cache.cache_prefix + "signals:"}statistics"
-        return await self.get(cache_key)
+        cache_key = f"{settings.cache.cache_prefix}signals:statistics"
+        return self._unwrap(await self.get(cache_key, tags=[SIGNALS_TAG]))
 
     async def cache_user_session(self, session_id: str, session_data: Dict, ttl: Optional[int] = None) -> bool:
         """
@@ -575,17 +1254,24 @@ class CacheService:
             session_data: Session data dictionary
             ttl: Cache TTL in seconds (uses config default if None)
         """
-        cache_key = f"{settings.cache.cache_prefix + "users:"}session:{session_id}"
+        cache_key = f"{settings.cache.cache_prefix}users:session:{session_id}"
         return await self.set(cache_key, session_data, ttl or settings.cache.cache_ttl_very_long)
 
     async def get_cached_user_session(self, session_id: str) -> Optional[Dict]:
         """Get cached user session data"""
-        cache_key = f"{settings.cache.cache_prefix + "users:"}session:{session_id}"
+        cache_key = f"{settings.cache.cache_prefix}users:session:{session_id}"
         return await self.get(cache_key)
 
+    async def cache_user_sessions_many(self, sessions: Dict[str, Dict], ttl: Optional[int] = None) -> bool:
+        """Cache several user sessions in one round-trip"""
+        return await self.set_many(
+            {f"{settings.cache.cache_prefix}users:session:{session_id}": data for session_id, data in sessions.items()},
+            ttl or settings.cache.cache_ttl_very_long
+        )
+
     async def invalidate_user_cache(self, user_id: Union[int, str]) -> bool:
         """Invalidate all cache entries for a specific user"""
-        pattern = f"{settings.cache.cache_prefix + "users:"}*{user_id}*"
+        pattern = f"{settings.cache.cache_prefix}users:*{user_id}*"
         deleted_count = await self.invalidate_pattern(pattern)
         logger.info(f"Invalidated {deleted_count} cache entries for user {user_id}")
         return deleted_count > 0
@@ -597,11 +1283,12 @@ class CacheService:
         Args:
             pattern: Specific pattern to invalidate (all signals if None)
         """
-        if pattern:
-            full_pattern = f"{settings.cache.cache_prefix + "signals:"}{pattern}"
-        else:
-            full_pattern = f"{settings.cache.cache_prefix + "signals:"}*"
+        if not pattern:
+            version = await self.invalidate_tag(SIGNALS_TAG)
+            logger.info(f"Invalidated signals cache (generation {version})")
+            return True
 
+        full_pattern = f"{settings.cache.cache_prefix}signals:{pattern}"
         deleted_count = await self.invalidate_pattern(full_pattern)
         logger.info(f"Invalidated {deleted_count} signals cache entries")
         return deleted_count > 0
@@ -614,16 +1301,19 @@ class CacheService:
             symbol: Specific symbol to invalidate (all if None)
             timeframe: Specific timeframe to invalidate (all if None)
         """
-        pattern_parts = [settings.cache.cache_prefix + "market_data:"]
-        if symbol:
-            pattern_parts.append(symbol)
-        if timeframe:
-            pattern_parts.append(timeframe)
+        if symbol and timeframe:
+            cache_key = f"{settings.cache.cache_prefix}market_data:{symbol}:{timeframe}"
+            return await self.delete(cache_key, tags=self._market_data_tags(symbol, timeframe))
 
-        pattern = "*".join(pattern_parts) + "*"
-        deleted_count = await self.invalidate_pattern(pattern)
-        logger.info(f"Invalidated {deleted_count} market data cache entries")
-        return deleted_count > 0
+        if symbol:
+            tag = f"{MARKET_DATA_TAG}:{symbol}"
+        elif timeframe:
+            tag = f"{MARKET_DATA_TAG}:timeframe:{timeframe}"
+        else:
+            tag = MARKET_DATA_TAG
+        version = await self.invalidate_tag(tag)
+        logger.info(f"Invalidated market data cache for {symbol or timeframe or 'all symbols'} (generation {version})")
+        return True
 
     async def invalidate_api_cache(self, endpoint: Optional[str] = None) -> bool:
         """
@@ -633,9 +1323,9 @@ class CacheService:
             endpoint: Specific endpoint to invalidate (all if None)
         """
         if endpoint:
-            pattern = f"{settings.cache.cache_prefix + "api:"}{endpoint}*"
+            pattern = f"{settings.cache.cache_prefix}api:{endpoint}*"
         else:
-            pattern = f"{settings.cache.cache_prefix + "api:"}*"
+            pattern = f"{settings.cache.cache_prefix}api:*"
 
         deleted_count = await self.invalidate_pattern(pattern)
         logger.info(f"Invalidated {deleted_count} API cache entries")
@@ -690,16 +1380,21 @@ class CacheService:
 
     # Decorator for automatic caching with advanced features
 def cache_result(cache_service: CacheService, key_prefix: str, ttl: Optional[int] = None,
-                ignore_args: Optional[List[int]] = None, use_params_for_key: bool = True):
+                ignore_args: Optional[List[int]] = None, use_params_for_key: bool = True,
+                stale_ttl: int = 0, early_refresh_beta: float = 0.0):
     """
     Advanced decorator to automatically cache function results
 
+    Concurrent calls that miss on the same key share a single execution.
+
     Args:
         cache_service: CacheService instance
         key_prefix: Cache key prefix
         ttl: Cache TTL in seconds (uses service default if None)
         ignore_args: List of argument indices to ignore in key generation
         use_params_for_key: Whether to include parameters in cache key generation
+        stale_ttl: Seconds a stale result may be served while it is recomputed
+        early_refresh_beta: Probabilistic early refresh factor (0 disables)
     """
     def decorator(func):
         async def wrapper(*args, **kwargs):
@@ -714,20 +1409,10 @@ def cache_result(cache_service: CacheService, key_prefix: str, ttl: Optional[int
             else:
                 cache_key = cache_service._generate_cache_key(key_prefix, *cache_args, **cache_kwargs)
 
-            # Try to get from cache first
-            cached_result = await cache_service.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for {key_prefix}: {cache_key}")
-                return cached_result
-
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            if result is not None:
-                success = await cache_service.set(cache_key, result, ttl)
-                if success:
-                    logger.debug(f"Cache miss, stored result for {key_prefix}: {cache_key}")
-
-            return result
+            # Get from cache, executing the function once per miss
+            return await cache_service.get_or_load(
+                cache_key, lambda: func(*args, **kwargs), ttl, stale_ttl, early_refresh_beta
+            )
         return wrapper
     return decorator
 
@@ -246,19 +246,20 @@ async def warm_user_data_strategy() -> int:
         if not active_users:
             return 0
 
-        processed_count = 0
+        # Collect everything first so the cache is written in one round-trip
+        profiles: Dict[Any, Dict] = {}
+        sessions: Dict[str, Dict] = {}
         for user in active_users:
             try:
                 # Warm user profile
                 user_data = await user_service.get_user_by_id(user.id)
                 if user_data:
-                    await cache_service.cache_user_data(user.id, user_data.dict())
-                    processed_count += 1
+                    profiles[user.id] = user_data.dict()
 
                 # Warm user session data if available
                 session_data = await user_service.get_user_session_data(user.id)
                 if session_data:
-                    await cache_service.cache_user_session(f"user_{user.id}", session_data)
+                    sessions[f"user_{user.id}"] = session_data
 
                 # Small delay to avoid overwhelming the system
                 await asyncio.sleep(0.01)
@@ -266,8 +267,11 @@ async def warm_user_data_strategy() -> int:
             except Exception as e:
                 logger.warning(f"Failed to warm cache for user {user.id}: {e}")
 
-        logger.info(f"Warmed user data cache for {processed_count} users")
-        return processed_count
+        await cache_service.cache_user_data_many(profiles)
+        await cache_service.cache_user_sessions_many(sessions)
+
+        logger.info(f"Warmed user data cache for {len(profiles)} users")
+        return len(profiles)
 
     except Exception as e:
         logger.error(f"Error in user data warming strategy: {e}")
@@ -288,8 +292,9 @@ async def warm_signals_data_strategy() -> int:
         # Import here to avoid circular dependencies
         from app.services.signal_service import signal_service
 
-        # Get latest signals for each symbol
+        # Get latest signals for each symbol, then cache them all in one round-trip
         processed_count = 0
+        signals_by_suffix: Dict[str, List[Dict]] = {}
         for symbol in settings.DEFAULT_SYMBOLS:
             try:
                 # Get latest signals for this symbol
@@ -298,9 +303,7 @@ async def warm_signals_data_strategy() -> int:
                 )
 
                 if latest_signals:
-                    # Cache signals data
-                    signals_data = [signal.dict() for signal in latest_signals]
-                    await cache_service.cache_signals(f"latest_{symbol}", signals_data)
+                    signals_by_suffix[f"latest_{symbol}"] = [signal.dict() for signal in latest_signals]
                     processed_count += len(latest_signals)
 
                 # Small delay to avoid overwhelming the system
@@ -309,6 +312,8 @@ async def warm_signals_data_strategy() -> int:
             except Exception as e:
                 logger.warning(f"Failed to warm cache for symbol {symbol}: {e}")
 
+        await cache_service.cache_signals_many(signals_by_suffix)
+
         logger.info(f"Warmed signals data cache for {processed_count} signals")
         return processed_count
 
@@ -331,29 +336,29 @@ async def warm_market_data_strategy() -> int:
         # Import here to avoid circular dependencies
         from app.services.oanda_service import oanda_service
 
-        processed_count = 0
         timeframes = ['M1', 'M5', 'M15', 'H1', 'H4', 'D1']
+        market_data_by_pair: Dict[tuple, Dict] = {}
 
-        # Warm market data for each symbol and timeframe
+        # The current price is the same for every timeframe, so fetch it once per symbol
         for symbol in settings.DEFAULT_SYMBOLS[:5]:  # Limit to top 5 symbols for performance
-            for timeframe in timeframes:
-                try:
-                    # Get current market data
-                    market_data = await oanda_service.get_current_price(symbol)
+            try:
+                market_data = await oanda_service.get_current_price(symbol)
 
-                    if market_data:
-                        # Cache market data with short TTL
-                        await cache_service.cache_market_data(symbol, timeframe, market_data)
-                        processed_count += 1
+                if market_data:
+                    for timeframe in timeframes:
+                        market_data_by_pair[(symbol, timeframe)] = market_data
 
-                    # Small delay to avoid API rate limits
-                    await asyncio.sleep(0.1)
+                # Small delay to avoid API rate limits
+                await asyncio.sleep(0.1)
 
-                except Exception as e:
-                    logger.warning(f"Failed to warm market cache for {symbol}/{timeframe}: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to warm market cache for {symbol}: {e}")
 
-        logger.info(f"Warmed market data cache for {processed_count} items")
-        return processed_count
+        # Cache market data with short TTL in one round-trip
+        await cache_service.cache_market_data_many(market_data_by_pair)
+
+        logger.info(f"Warmed market data cache for {len(market_data_by_pair)} items")
+        return len(market_data_by_pair)
 
     except Exception as e:
         logger.error(f"Error in market data warming strategy: {e}")
@@ -0,0 +1,186 @@
+"""
+In-Process L1 Cache Tier
+Byte-size-bounded LRU cache with per-entry expiry that sits in front of Redis
+in CacheService, so hot keys are served without a network round-trip.
+"""
+
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Returned by get() on a miss, since None is a cacheable value
+MISSING = object()
+
+
+@dataclass
+class L1Stats:
+    """L1 tier counters"""
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class _Entry:
+    """Cached value with its absolute expiry and accounted size"""
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: Optional[float], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class L1Cache:
+    """
+    LRU cache bounded by total bytes and entry count, with per-entry TTL
+
+    Expired entries are dropped lazily when read and are the first to go when
+    space is needed, since they stop being refreshed in the LRU order.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize L1 cache
+
+        Args:
+            max_bytes: Upper bound on the summed entry sizes
+            max_entries: Upper bound on the number of entries
+            clock: Monotonic time source in seconds
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self.stats = L1Stats()
+
+    def get(self, key: str) -> Any:
+        """
+        Get a live value and mark it most recently used
+
+        Returns:
+            Cached value, or MISSING if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+
+        if entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, size: Optional[int] = None) -> bool:
+        """
+        Store a value, evicting least recently used entries to stay within bounds
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until expiry (no expiry if None)
+            size: Accounted size in bytes, e.g. the serialized length
+
+        Returns:
+            bool: False if the value is larger than the whole cache
+        """
+        if size is None:
+            size = sys.getsizeof(value)
+
+        self._remove(key)
+        if size > self.max_bytes or (ttl is not None and ttl <= 0):
+            return False
+
+        expires_at = self._clock() + ttl if ttl is not None else None
+        self._entries[key] = _Entry(value, expires_at, size)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.stats.evictions += 1
+
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Remove a key, returning True if it was stored"""
+        if self._remove(key):
+            self.stats.invalidations += 1
+            return True
+        return False
+
+    def delete_where(self, predicate: Callable[[str], bool]) -> int:
+        """Remove every key matching predicate, returning the number removed"""
+        matching = [key for key in self._entries if predicate(key)]
+        for key in matching:
+            self._remove(key)
+        self.stats.invalidations += len(matching)
+        return len(matching)
+
+    def remaining_ttl(self, key: str) -> Optional[float]:
+        """Seconds until key expires, None if it has no expiry or is not stored"""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at is None:
+            return None
+        return max(entry.expires_at - self._clock(), 0.0)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    def keys(self) -> List[str]:
+        """Stored keys, least recently used first (may include expired ones)"""
+        return list(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and (entry.expires_at is None or entry.expires_at > self._clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get L1 statistics"""
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate": round(self.stats.hits / lookups * 100, 2) if lookups else 0.0,
+            "expirations": self.stats.expirations,
+            "evictions": self.stats.evictions,
+            "invalidations": self.stats.invalidations
+        }
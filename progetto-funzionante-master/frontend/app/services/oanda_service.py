@@ -7,17 +7,70 @@ import asyncio
 from models import User, Signal, OANDAConnection, SignalTypeEnum
 from app.repositories.signal_repository import SignalRepository
 from app.services.cache_service import cache_service
+from app.services.signal_writer import signal_writer
+from config.settings import settings
 
 # OANDA imports
 try:
     from oanda_signal_engine import OANDASignalEngine, SignalType as OANDASignalType, RiskLevel, create_signal_engine
-    from oanda_api_client import OANDAClient, OANDAAPIError, create_oanda_client
+    from oanda_api_client import OANDAClient, OANDAAPIError, oanda_client_registry
     OANDA_AVAILABLE = True
 except ImportError:
     OANDA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# One signal engine per process, shared by every request-scoped OANDAService
+_shared_engine: Optional["OANDASignalEngine"] = None
+_shared_engine_lock: Optional[asyncio.Lock] = None
+
+
+async def get_shared_signal_engine() -> Optional["OANDASignalEngine"]:
+    """
+    Get the process-wide OANDA signal engine, creating it on first use.
+
+    The engine keeps its HTTP session, candle store and indicator state across
+    requests instead of rebuilding them for every OANDAService.
+
+    Returns:
+        Shared signal engine or None if OANDA is unavailable or not configured
+    """
+    global _shared_engine, _shared_engine_lock
+
+    if not OANDA_AVAILABLE:
+        return None
+    if _shared_engine is not None:
+        return _shared_engine
+
+    if _shared_engine_lock is None:
+        _shared_engine_lock = asyncio.Lock()
+
+    async with _shared_engine_lock:
+        if _shared_engine is None:
+            try:
+                oanda = settings.oanda
+                _shared_engine = await create_signal_engine(
+                    oanda.oanda_api_key,
+                    oanda.oanda_account_id,
+                    oanda.oanda_environment,
+                    settings.ai.gemini_api_key or None
+                )
+            except Exception as e:
+                logger.error(f"Failed to create OANDA signal engine: {e}")
+                return None
+
+    return _shared_engine
+
+
+async def close_shared_signal_engine() -> None:
+    """Close the shared signal engine and its OANDA client."""
+    global _shared_engine
+
+    engine, _shared_engine = _shared_engine, None
+    if engine is not None:
+        await engine.__aexit__(None, None, None)
+        logger.info("Shared OANDA signal engine closed")
+
 
 class OANDAService:
     """Service for OANDA trading integration."""
@@ -30,35 +83,24 @@ class OANDAService:
 
     @property
     def oanda_client(self) -> Optional[OANDAClient]:
-        """Get or create OANDA client."""
+        """Get the process-wide OANDA client opened at startup."""
         if not OANDA_AVAILABLE:
             return None
 
         if self._oanda_client is None:
-            try:
-                self._oanda_client = create_oanda_client()
-            except Exception as e:
-                logger.error(f"Failed to create OANDA client: {e}")
-                return None
+            self._oanda_client = oanda_client_registry.find_client(
+                settings.oanda.oanda_account_id, settings.oanda.oanda_environment
+            )
 
         return self._oanda_client
 
-    @property
-    def signal_engine(self) -> Optional[OANDASignalEngine]:
-        """Get or create OANDA signal engine."""
-        if not OANDA_AVAILABLE:
-            return None
-
+    async def get_signal_engine(self) -> Optional[OANDASignalEngine]:
+        """Get the OANDA signal engine shared across requests."""
         if self._signal_engine is None:
-            try:
-                self._signal_engine = create_signal_engine()
-            except Exception as e:
-                logger.error(f"Failed to create OANDA signal engine: {e}")
-                return None
-
+            self._signal_engine = await get_shared_signal_engine()
         return self._signal_engine
 
-    def check_oanda_health(self) -> Dict[str, Any]:
+    async def check_oanda_health(self) -> Dict[str, Any]:
         """Check OANDA API health and connectivity."""
         if not OANDA_AVAILABLE:
             return {
@@ -67,23 +109,26 @@ class OANDAService:
                 "error": "OANDA modules not imported"
             }
 
-        if not self.oanda_client:
+        engine = await self.get_signal_engine()
+        if not engine:
             return {
                 "available": False,
-                "status": "Failed to create OANDA client",
-                "error": "Client initialization failed"
+                "status": "Failed to create OANDA signal engine",
+                "error": "Engine initialization failed"
             }
 
         try:
             # Test connection by getting account info
-            account_info = self.oanda_client.get_account_summary()
+            if not await engine.health_check():
+                raise OANDAAPIError("OANDA health check failed")
+            account_info = await engine.oanda_client.get_account_info()
             return {
                 "available": True,
                 "status": "Connected",
                 "account_id": account_info.get("id"),
                 "currency": account_info.get("currency"),
                 "balance": account_info.get("balance"),
-                "environment": self.oanda_client.environment
+                "environment": engine.environment
             }
         except Exception as e:
             return {
@@ -92,7 +137,7 @@ class OANDAService:
                 "error": str(e)
             }
 
-    def generate_signal(self, symbol: str, user_id: int) -> Optional[Signal]:
+    async def generate_signal(self, symbol: str, user_id: int) -> Optional[Signal]:
         """
         Generate a trading signal for a specific symbol.
 
@@ -103,74 +148,93 @@ class OANDAService:
         Returns:
             Generated signal or None if failed
         """
-        if not OANDA_AVAILABLE or not self.signal_engine:
+        engine = await self.get_signal_engine()
+        if not engine:
             logger.error("OANDA signal engine not available")
             return None
 
         try:
-            # Generate signal using OANDA engine
-            oanda_signal = self.signal_engine.generate_signal(symbol)
-
-            if not oanda_signal:
-                logger.warning(f"No signal generated for {symbol}")
-                return None
-
-            # Convert OANDA signal to database signal
-            signal_type = self._convert_signal_type(oanda_signal.signal_type)
-
-            # Create signal in database
-            signal_data = {
-                "symbol": symbol,
-                "signal_type": signal_type,
-                "entry_price": oanda_signal.entry_price,
-                "stop_loss": oanda_signal.stop_loss,
-                "take_profit": oanda_signal.take_profit,
-                "reliability": oanda_signal.confidence_score * 100,  # Convert to percentage
-                "ai_analysis": oanda_signal.ai_commentary,
-                "confidence_score": oanda_signal.confidence_score,
-                "risk_level": oanda_signal.risk_level.value,
-                "source": "OANDA_AI",
-                "timeframe": oanda_signal.timeframe or "H1",
-                "risk_reward_ratio": oanda_signal.risk_reward_ratio,
-                "position_size_suggestion": oanda_signal.position_size,
-                "spread": getattr(oanda_signal, 'spread', 0.0),
-                "volatility": getattr(oanda_signal, 'volatility', 0.0),
-                "technical_score": getattr(oanda_signal, 'technical_score', 0.0),
-                "rsi": getattr(oanda_signal, 'rsi', None),
-                "macd_signal": getattr(oanda_signal, 'macd_signal', None),
-                "market_session": getattr(oanda_signal, 'market_session', None),
-                "creator_id": user_id,
-                "is_public": True,
-                "is_active": True,
-                "created_at": datetime.utcnow()
-            }
-
-            signal = self.signal_repository.create(signal_data)
-            logger.info(f"Generated OANDA signal for {symbol}: {signal.id}")
-            return signal
-
+            oanda_signal = await engine.generate_signal(symbol)
         except Exception as e:
             logger.error(f"Failed to generate signal for {symbol}: {e}")
             return None
 
-    def batch_generate_signals(self, symbols: List[str], user_id: int) -> List[Signal]:
+        if not oanda_signal:
+            logger.warning(f"No signal generated for {symbol}")
+            return None
+
+        signals = await self._persist_signals([self._signal_data(symbol, oanda_signal, user_id)])
+        return signals[0] if signals else None
+
+    async def batch_generate_signals(self, symbols: List[str], user_id: int) -> Dict[str, Optional[Signal]]:
         """
-        Generate signals for multiple symbols.
+        Generate signals for multiple symbols concurrently.
+
+        The engine analyses the symbols in parallel (bounded by its batch
+        concurrency), so a sweep takes about as long as its slowest symbol.
+        All rows are then handed to the batched signal writer together.
 
         Args:
             symbols: List of trading symbols
             user_id: ID of user requesting the signals
 
         Returns:
-            List of generated signals
+            Generated signal (or None) for every requested symbol, in input order
         """
-        signals = []
-        for symbol in symbols:
-            signal = self.generate_signal(symbol, user_id)
-            if signal:
-                signals.append(signal)
+        results: Dict[str, Optional[Signal]] = {symbol: None for symbol in symbols}
+        engine = await self.get_signal_engine()
+        if not engine:
+            logger.error("OANDA signal engine not available")
+            return results
 
-        return signals
+        generated = []
+        try:
+            async for symbol, oanda_signal in engine.iter_signals_batch(symbols):
+                if oanda_signal:
+                    generated.append((symbol, oanda_signal))
+                else:
+                    logger.warning(f"No signal generated for {symbol}")
+        except Exception as e:
+            logger.error(f"Batch signal generation failed: {e}")
+
+        if generated:
+            rows = [self._signal_data(symbol, oanda_signal, user_id) for symbol, oanda_signal in generated]
+            for (symbol, _), signal in zip(generated, await self._persist_signals(rows)):
+                results[symbol] = signal
+
+        return results
+
+    async def _persist_signals(self, rows: List[Dict[str, Any]]) -> List[Optional[Signal]]:
+        """Hand signal rows to the batched writer and wait for the stored signals."""
+        return await signal_writer.submit_many(rows)
+
+    def _signal_data(self, symbol: str, oanda_signal: Any, user_id: int) -> Dict[str, Any]:
+        """Convert an engine TradingSignal into Signal column values."""
+        return {
+            "symbol": symbol,
+            "signal_type": self._convert_signal_type(oanda_signal.signal_type),
+            "entry_price": oanda_signal.entry_price,
+            "stop_loss": oanda_signal.stop_loss,
+            "take_profit": oanda_signal.take_profit,
+            "reliability": oanda_signal.confidence_score * 100,  # Convert to percentage
+            "ai_analysis": oanda_signal.ai_analysis,
+            "confidence_score": oanda_signal.confidence_score,
+            "risk_level": oanda_signal.risk_level.value,
+            "source": "OANDA_AI",
+            "timeframe": oanda_signal.timeframe or "H1",
+            "risk_reward_ratio": oanda_signal.risk_reward_ratio,
+            "position_size_suggestion": oanda_signal.position_size,
+            "spread": getattr(oanda_signal, 'spread', 0.0),
+            "volatility": getattr(oanda_signal, 'volatility', 0.0),
+            "technical_score": getattr(oanda_signal, 'technical_score', 0.0),
+            "rsi": getattr(oanda_signal, 'rsi', None),
+            "macd_signal": getattr(oanda_signal, 'macd_signal', None),
+            "market_session": getattr(oanda_signal, 'market_session', None),
+            "creator_id": user_id,
+            "is_public": True,
+            "is_active": True,
+            "created_at": datetime.utcnow()
+        }
 
     def get_market_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
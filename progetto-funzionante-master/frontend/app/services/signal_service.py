@@ -1,12 +1,14 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
+import asyncio
 import logging
 
+from database import SessionLocal
 from models import Signal, User, SignalStatusEnum, SignalTypeEnum
 from schemas import SignalCreate, SignalOut, TopSignalsResponse
 from app.repositories.signal_repository import SignalRepository
-from app.services.cache_service import cache_service
+from app.services.cache_service import cache_service, SIGNALS_TAG
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +16,36 @@ logger = logging.getLogger(__name__)
 class SignalService:
     """Service for signal operations with caching support."""
 
-    def __init__(self, db: Session):
+    # Hot read paths (landing page, /signals/latest, /signals/top) serve stale
+    # data for this long while one request refreshes it, and refresh early
+    # with probability rising towards expiry
+    STALE_TTL = 60
+    EARLY_REFRESH_BETA = 1.0
+
+    def __init__(self, db: Session, session_factory: Callable[[], Session] = SessionLocal):
         self.db = db
         self.signal_repository = SignalRepository(db)
+        self.session_factory = session_factory  # Sessions for cache loaders, see _load_from_database
         self.cache_enabled = True  # Enable/disable caching
 
+    async def _load_from_database(self, query: Callable[[SignalRepository], Any]) -> Any:
+        """
+        Run a cache loader's query on its own session in a worker thread.
+
+        Cache loads run as tasks that can outlive the request that started them
+        (stale-while-revalidate, early refresh, coalesced misses), by which time the
+        request-scoped session is closed. The query must return plain data, not
+        ORM objects bound to the session.
+        """
+        def run() -> Any:
+            db = self.session_factory()
+            try:
+                return query(SignalRepository(db))
+            finally:
+                db.close()
+
+        return await asyncio.to_thread(run)
+
     def create_signal(self, signal_create: SignalCreate, creator_id: int) -> Signal:
         """
         Create a new trading signal.
@@ -43,31 +70,29 @@ class SignalService:
 
         # Invalidate relevant caches when new signal is created
         if self.cache_enabled:
-            # Note: Cache invalidation should be done async in production
-            # For now, we skip cache invalidation in sync methods to avoid deployment issues
-            logger.debug("Cache invalidation skipped in sync method - should be done async")
+            # One generation bump hides every cached signals query; no key scan needed
+            cache_service.invalidate_tag_nowait(SIGNALS_TAG)
 
         return signal
 
     async def get_latest_signals(self, limit: int = 10) -> List[Signal]:
         """Get latest active signals with caching."""
-        if self.cache_enabled:
-            cache_key = f"latest_{limit}"
-            cached_signals = await cache_service.get_cached_signals(cache_key)
-            if cached_signals:
-                logger.debug(f"Cache hit for latest signals (limit={limit})")
-                return [Signal(**signal_data) for signal_data in cached_signals]
-
-        # Get from database
-        signals = self.signal_repository.get_latest_signals(limit)
-
-        # Cache the results (5 minute TTL for latest signals)
-        if self.cache_enabled and signals:
-            signals_data = [self._signal_to_dict(signal) for signal in signals]
-            await cache_service.cache_signals(f"latest_{limit}", signals_data, ttl=300)
-            logger.debug(f"Cached latest signals (limit={limit})")
-
-        return signals
+        if not self.cache_enabled:
+            return self.signal_repository.get_latest_signals(limit)
+
+        async def load_latest_signals() -> Optional[List[Dict[str, Any]]]:
+            signals = await self._load_from_database(
+                lambda repository: [self._signal_to_dict(signal) for signal in repository.get_latest_signals(limit)]
+            )
+            logger.debug(f"Loaded latest signals from database (limit={limit})")
+            return signals or None
+
+        # 5 minute TTL for latest signals
+        cached_signals = await cache_service.get_or_load_signals(
+            f"latest_{limit}", load_latest_signals, ttl=300,
+            stale_ttl=self.STALE_TTL, early_refresh_beta=self.EARLY_REFRESH_BETA
+        )
+        return self._signals_from_cache(cached_signals)
 
     async def get_signals_by_symbol(self, symbol: str, limit: int = 10) -> List[Signal]:
         """Get signals for a specific trading symbol with caching."""
@@ -89,6 +114,44 @@ class SignalService:
 
         return signals
 
+    async def get_signals_for_symbols(self, symbols: List[str], limit: int = 10) -> Dict[str, List[Signal]]:
+        """
+        Get signals for several symbols, reading and filling the cache in one round-trip each
+
+        Args:
+            symbols: Trading symbols
+            limit: Maximum number of signals per symbol
+
+        Returns:
+            Dict[str, List[Signal]]: Signals by symbol, in request order
+        """
+        suffixes = {symbol: f"symbol_{symbol}_{limit}" for symbol in symbols}
+        cached = await cache_service.get_cached_signals_many(list(suffixes.values())) if self.cache_enabled else {}
+
+        missed = [symbol for symbol, suffix in suffixes.items() if not cached.get(suffix)]
+        loaded: Dict[str, List[Dict[str, Any]]] = {}
+        if missed:
+            # One query for every missed symbol, off the event loop
+            loaded = await self._load_from_database(lambda repository: {
+                symbol: [self._signal_to_dict(signal) for signal in signals]
+                for symbol, signals in repository.get_signals_by_symbols(missed, limit).items()
+            })
+
+        results: Dict[str, List[Signal]] = {}
+        to_cache: Dict[str, List[Dict[str, Any]]] = {}
+        for symbol, suffix in suffixes.items():
+            signals_data = cached.get(suffix) or loaded.get(symbol)
+            results[symbol] = self._signals_from_cache(signals_data)
+            if symbol in loaded and signals_data:
+                to_cache[suffix] = signals_data
+
+        # Same 10 minute TTL as get_signals_by_symbol, so both share entries
+        if self.cache_enabled and to_cache:
+            await cache_service.cache_signals_many(to_cache, ttl=600)
+            logger.debug(f"Cached signals for {len(to_cache)} symbols (limit={limit})")
+
+        return results
+
     def get_user_signals(self, user_id: int, limit: int = 100) -> List[Signal]:
         """Get signals created by a specific user."""
         return self.signal_repository.get_signals_by_user(user_id, limit)
@@ -104,27 +167,21 @@ class SignalService:
         Returns:
             TopSignalsResponse with signals and statistics
         """
-        # Try to get cached statistics first
-        stats = None
-        if self.cache_enabled:
-            stats = await cache_service.get_cached_signal_statistics()
-
-        if not stats:
-            stats = self.signal_repository.get_signal_statistics()
-            if self.cache_enabled:
-                await cache_service.cache_signal_statistics(stats, ttl=600)  # 10 minute TTL
+        stats = await self.get_signal_statistics()
 
         # Get top signals with caching
         if self.cache_enabled:
-            cache_key = f"top_{limit}"
-            cached_signals = await cache_service.get_cached_signals(cache_key)
-            if cached_signals:
-                signals = [Signal(**signal_data) for signal_data in cached_signals]
-            else:
-                signals = self.signal_repository.get_top_signals(limit)
-                if signals:
-                    signals_data = [self._signal_to_dict(signal) for signal in signals]
-                    await cache_service.cache_signals(f"top_{limit}", signals_data, ttl=600)
+            async def load_top_signals() -> Optional[List[Dict[str, Any]]]:
+                signals = await self._load_from_database(
+                    lambda repository: [self._signal_to_dict(signal) for signal in repository.get_top_signals(limit)]
+                )
+                return signals or None
+
+            cached_signals = await cache_service.get_or_load_signals(
+                f"top_{limit}", load_top_signals, ttl=600,
+                stale_ttl=self.STALE_TTL, early_refresh_beta=self.EARLY_REFRESH_BETA
+            )
+            signals = self._signals_from_cache(cached_signals)
         else:
             signals = self.signal_repository.get_top_signals(limit)
 
@@ -178,9 +235,8 @@ class SignalService:
 
         # Invalidate relevant caches
         if self.cache_enabled and updated_signal:
-            # Note: Cache invalidation should be done async in production
-            # For now, we skip cache invalidation in sync methods to avoid deployment issues
-            logger.debug("Cache invalidation skipped in sync method - should be done async")
+            # One generation bump hides every cached signals query; no key scan needed
+            cache_service.invalidate_tag_nowait(SIGNALS_TAG)
 
         return updated_signal
 
@@ -208,9 +264,8 @@ class SignalService:
 
         # Invalidate relevant caches
         if self.cache_enabled and updated_signal:
-            # Note: Cache invalidation should be done async in production
-            # For now, we skip cache invalidation in sync methods to avoid deployment issues
-            logger.debug("Cache invalidation skipped in sync method - should be done async")
+            # One generation bump hides every cached signals query; no key scan needed
+            cache_service.invalidate_tag_nowait(SIGNALS_TAG)
 
         return updated_signal
 
@@ -243,29 +298,25 @@ class SignalService:
 
         # Invalidate relevant caches
         if self.cache_enabled and updated_signal:
-            # Note: Cache invalidation should be done async in production
-            # For now, we skip cache invalidation in sync methods to avoid deployment issues
-            logger.debug("Cache invalidation skipped in sync method - should be done async")
+            # One generation bump hides every cached signals query; no key scan needed
+            cache_service.invalidate_tag_nowait(SIGNALS_TAG)
 
         return updated_signal
 
     async def get_signal_statistics(self) -> Dict[str, Any]:
         """Get overall signal statistics with caching."""
-        if self.cache_enabled:
-            cached_stats = await cache_service.get_cached_signal_statistics()
-            if cached_stats:
-                logger.debug("Cache hit for signal statistics")
-                return cached_stats
+        if not self.cache_enabled:
+            return self.signal_repository.get_signal_statistics()
 
-        # Get from database
-        stats = self.signal_repository.get_signal_statistics()
-
-        # Cache the results (10 minute TTL)
-        if self.cache_enabled:
-            await cache_service.cache_signal_statistics(stats, ttl=600)
-            logger.debug("Cached signal statistics")
+        async def load_statistics() -> Dict[str, Any]:
+            logger.debug("Loaded signal statistics from database")
+            return await self._load_from_database(lambda repository: repository.get_signal_statistics())
 
-        return stats
+        # 10 minute TTL
+        return await cache_service.get_or_load_signals(
+            "statistics", load_statistics, ttl=600,
+            stale_ttl=self.STALE_TTL, early_refresh_beta=self.EARLY_REFRESH_BETA
+        )
 
     def search_signals(self, search_term: str, limit: int = 100) -> List[Signal]:
         """Search signals by symbol or content."""
@@ -363,6 +414,11 @@ class SignalService:
             "overall_stats": stats
         }
 
+    @staticmethod
+    def _signals_from_cache(signals_data: Optional[List[Dict[str, Any]]]) -> List[Signal]:
+        """Rebuild Signal objects from cached dictionaries."""
+        return [Signal(**signal_data) for signal_data in signals_data or []]
+
     def _signal_to_dict(self, signal: Signal) -> Dict[str, Any]:
         """Convert Signal object to dictionary for caching."""
         return {
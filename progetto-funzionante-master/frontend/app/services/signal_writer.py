@@ -0,0 +1,257 @@
+"""
+Batched Signal Persistence Writer
+Buffers Signal rows produced by generation sweeps and stores each batch with
+one multi-row INSERT ... RETURNING in a single transaction.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from models import Signal
+from app.repositories.signal_repository import SignalRepository
+from app.services.cache_service import cache_service, SIGNALS_TAG
+
+logger = logging.getLogger(__name__)
+
+# Queue entry: the row to insert and the future its stored Signal is delivered on
+_PendingRow = Tuple[Dict[str, Any], asyncio.Future]
+
+
+@dataclass
+class SignalWriterMetrics:
+    """Signal writer performance metrics"""
+    rows_submitted: int = 0
+    rows_written: int = 0
+    rows_failed: int = 0
+    batches_flushed: int = 0
+    size_flushes: int = 0
+    time_flushes: int = 0
+    fallback_batches: int = 0
+    total_flush_time: float = 0.0
+    peak_queue_depth: int = 0
+
+
+class SignalWriter:
+    """
+    Async batched writer for generated signals:
+    - Rows are buffered and flushed when ``max_batch_size`` rows are waiting
+      or ``flush_interval`` seconds after the first row of a batch arrived
+    - Each flush is one transaction on a dedicated writer thread, so the event
+      loop never waits on the database
+    - The buffer holds at most ``max_pending`` rows; submitters wait for room
+      when the database falls behind
+    - If a batch is rejected, its rows are retried one by one so a single bad
+      row does not lose the rest of the sweep
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[..., Session]] = None,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.05,
+        max_pending: int = 1000
+    ):
+        self._session_factory = session_factory
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(self.max_batch_size, max_pending)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="signal-writer")
+        self.metrics = SignalWriterMetrics()
+
+    @property
+    def session_factory(self) -> Callable[..., Session]:
+        """Session factory used by the writer thread (the application SessionLocal by default)."""
+        if self._session_factory is None:
+            from database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory
+
+    async def start(self):
+        """Start the background flush loop."""
+        task = self._writer_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            logger.info("Signal writer started")
+
+    async def stop(self):
+        """Flush buffered rows and stop the flush loop."""
+        task = self._writer_task
+        if task is None or task.done():
+            return
+
+        # The sentinel queues behind every row already submitted
+        await self._queue.put(None)
+        await task
+        self._writer_task = None
+        logger.info("Signal writer stopped")
+
+    async def submit(self, row: Dict[str, Any]) -> Optional[Signal]:
+        """
+        Queue one Signal row and wait until its batch is stored.
+
+        Args:
+            row: Signal column values
+
+        Returns:
+            Stored Signal, or None if the row could not be inserted
+        """
+        return (await self.submit_many([row]))[0]
+
+    async def submit_many(self, rows: List[Dict[str, Any]]) -> List[Optional[Signal]]:
+        """
+        Queue Signal rows and wait until they are stored.
+
+        Rows submitted together share batches, so a sweep of N signals costs
+        one transaction for every ``max_batch_size`` rows.
+
+        Args:
+            rows: Signal column values
+
+        Returns:
+            Stored Signal (or None) for every row, in input order
+        """
+        if not rows:
+            return []
+
+        await self.start()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for row in rows:
+            future = loop.create_future()
+            # Blocks while the buffer is full - this is the back-pressure point
+            await self._queue.put((row, future))
+            futures.append(future)
+
+        self.metrics.rows_submitted += len(rows)
+        self.metrics.peak_queue_depth = max(self.metrics.peak_queue_depth, self._queue.qsize())
+        return list(await asyncio.gather(*futures))
+
+    async def _writer_loop(self):
+        """Collect rows into batches and flush them."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            batch: List[_PendingRow] = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            if len(batch) >= self.max_batch_size:
+                self.metrics.size_flushes += 1
+            else:
+                self.metrics.time_flushes += 1
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[_PendingRow]):
+        """Store one batch on the writer thread and resolve its futures."""
+        rows = [row for row, _ in batch]
+        start_time = time.time()
+        try:
+            signals = await asyncio.get_running_loop().run_in_executor(self._executor, self._insert_batch, rows)
+        except Exception as e:
+            logger.error(f"Signal batch of {len(rows)} rows failed: {e}")
+            signals = [None] * len(rows)
+
+        self.metrics.batches_flushed += 1
+        self.metrics.total_flush_time += time.time() - start_time
+        stored = sum(signal is not None for signal in signals)
+        self.metrics.rows_written += stored
+        self.metrics.rows_failed += len(rows) - stored
+
+        for (_, future), signal in zip(batch, signals):
+            if not future.done():
+                future.set_result(signal)
+
+        if stored:
+            await cache_service.invalidate_tag(SIGNALS_TAG)
+
+    def _insert_batch(self, rows: List[Dict[str, Any]]) -> List[Optional[Signal]]:
+        """Insert a batch in one transaction; runs on the writer thread."""
+        # Keep the stored values loaded so callers can read them after the session closes
+        session = self.session_factory(expire_on_commit=False)
+        try:
+            repository = SignalRepository(session)
+            try:
+                return repository.bulk_create(rows)
+            except Exception as e:
+                session.rollback()
+                if len(rows) == 1:
+                    logger.error(f"Failed to store signal for {rows[0].get('symbol')}: {e}")
+                    return [None]
+                logger.warning(f"Signal batch of {len(rows)} rows rejected, retrying row by row: {e}")
+
+            self.metrics.fallback_batches += 1
+            signals: List[Optional[Signal]] = []
+            for row in rows:
+                try:
+                    signals.extend(repository.bulk_create([row]))
+                    # Detach stored rows so a later rollback cannot expire them
+                    session.expunge_all()
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"Failed to store signal for {row.get('symbol')}: {e}")
+                    signals.append(None)
+            return signals
+        finally:
+            session.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get signal writer metrics"""
+        batches = max(1, self.metrics.batches_flushed)
+        return {
+            "rows_submitted": self.metrics.rows_submitted,
+            "rows_written": self.metrics.rows_written,
+            "rows_failed": self.metrics.rows_failed,
+            "batches_flushed": self.metrics.batches_flushed,
+            "size_flushes": self.metrics.size_flushes,
+            "time_flushes": self.metrics.time_flushes,
+            "fallback_batches": self.metrics.fallback_batches,
+            "average_batch_size": (self.metrics.rows_written + self.metrics.rows_failed) / batches,
+            "average_flush_time": self.metrics.total_flush_time / batches,
+            "pending_rows": self._queue.qsize() if self._queue else 0,
+            "peak_queue_depth": self.metrics.peak_queue_depth,
+            "max_batch_size": self.max_batch_size,
+            "max_pending": self.max_pending
+        }
+
+
+# Global signal writer instance
+signal_writer = SignalWriter()
+
+
+# Cleanup function
+async def cleanup_signal_writer():
+    """Flush pending signals and stop the writer"""
+    try:
+        await signal_writer.stop()
+        logger.info("Signal writer cleaned up successfully")
+    except Exception as e:
+        logger.error(f"Failed to cleanup signal writer: {e}")
@@ -305,17 +305,20 @@ class CacheWarmer:
         Returns:
             Dict: Warmup results
         """
+        loaded: Dict[Union[int, str], Dict] = {}
         warmup_functions = []
         for user_id in user_ids:
             async def get_user_data(uid=user_id):
                 data = await data_provider(uid)
                 if data:
-                    await cache_service.cache_user_data(uid, data)
+                    loaded[uid] = data
                 return data
 
             warmup_functions.append(get_user_data)
 
-        return await cache_service.warm_cache(warmup_functions)
+        results = await cache_service.warm_cache(warmup_functions)
+        await cache_service.cache_user_data_many(loaded)
+        return results
 
     @staticmethod
     async def warm_signals_data(symbols: List[str], data_provider: Callable) -> Dict[str, Any]:
@@ -329,17 +332,20 @@ class CacheWarmer:
         Returns:
             Dict: Warmup results
         """
+        loaded: Dict[str, List[Dict]] = {}
         warmup_functions = []
         for symbol in symbols:
             async def get_symbol_data(sym=symbol):
                 data = await data_provider(sym)
                 if data:
-                    await cache_service.cache_signals(f"latest_{sym}", data)
+                    loaded[f"latest_{sym}"] = data
                 return data
 
             warmup_functions.append(get_symbol_data)
 
-        return await cache_service.warm_cache(warmup_functions)
+        results = await cache_service.warm_cache(warmup_functions)
+        await cache_service.cache_signals_many(loaded)
+        return results
 
     @staticmethod
     async def warm_market_data(symbols: List[str], timeframes: List[str], data_provider: Callable) -> Dict[str, Any]:
@@ -354,18 +360,21 @@ class CacheWarmer:
         Returns:
             Dict: Warmup results
         """
+        loaded: Dict[tuple, Dict] = {}
         warmup_functions = []
         for symbol in symbols:
             for timeframe in timeframes:
                 async def get_market_data(sym=symbol, tf=timeframe):
                     data = await data_provider(sym, tf)
                     if data:
-                        await cache_service.cache_market_data(sym, tf, data)
+                        loaded[(sym, tf)] = data
                     return data
 
                 warmup_functions.append(get_market_data)
 
-        return await cache_service.warm_cache(warmup_functions)
+        results = await cache_service.warm_cache(warmup_functions)
+        await cache_service.cache_market_data_many(loaded)
+        return results
 
 
 def create_cache_manager() -> CacheService:
@@ -0,0 +1,186 @@
+"""
+Incremental Candle Store
+Keeps completed OANDA candles in memory and only downloads bars newer than the
+last stored one, using the candles endpoint `from` parameter.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Any
+from datetime import datetime
+
+from oanda_api_client import OANDAClient, CandleFrame, Granularity, PriceComponent
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# (instrument, granularity, price component)
+CandleKey = Tuple[str, str, str]
+
+# fetcher(count, from_time) -> candles, oldest first
+CandleFetcher = Callable[[int, Optional[datetime]], Awaitable[CandleFrame]]
+
+# OANDA returns at most 5000 candles per request
+MAX_CANDLES_PER_REQUEST = 5000
+
+
+@dataclass
+class _CandleSeries:
+    """Stored candles for a single key"""
+    completed: CandleFrame = field(default_factory=CandleFrame.empty)
+    current: CandleFrame = field(default_factory=CandleFrame.empty)  # in-progress bar, replaced on every refresh
+    depth: int = 0  # largest count backfilled so far
+
+
+class CandleStore:
+    """
+    In-memory store of completed candles keyed by (instrument, granularity, price component)
+
+    The first request for a key backfills `count` candles. Later requests only
+    ask OANDA for bars from the last completed candle onwards; completed bars are
+    appended and the in-progress bar is replaced.
+    """
+
+    def __init__(self, max_candles: int = MAX_CANDLES_PER_REQUEST):
+        """
+        Initialize candle store
+
+        Args:
+            max_candles: Completed candles kept per key
+        """
+        self.max_candles = max_candles
+        self._series: Dict[CandleKey, _CandleSeries] = {}
+        self._locks: Dict[CandleKey, asyncio.Lock] = {}
+
+        # Statistics
+        self.stats = {
+            "full_fetches": 0,
+            "delta_fetches": 0,
+            "candles_downloaded": 0,
+            "candles_served": 0
+        }
+
+    async def get_candles(
+        self,
+        client: OANDAClient,
+        instrument: str,
+        granularity: Granularity = Granularity.H1,
+        count: int = 500,
+        price_component: PriceComponent = PriceComponent.MID
+    ) -> CandleFrame:
+        """
+        Drop-in replacement for OANDAClient.get_candles backed by the store
+
+        Returns:
+            Up to `count` candles, oldest first; the last one may be incomplete
+        """
+        async def fetcher(fetch_count: int, from_time: Optional[datetime]) -> CandleFrame:
+            return await client.get_candles(
+                instrument=instrument,
+                granularity=granularity,
+                count=fetch_count,
+                price_component=price_component,
+                from_time=from_time
+            )
+
+        key = (instrument, granularity.value, price_component.value)
+        return await self.fetch(key, count, fetcher)
+
+    async def fetch(self, key: CandleKey, count: int, fetcher: CandleFetcher) -> CandleFrame:
+        """
+        Return the latest `count` candles for key, downloading only what is missing
+
+        Args:
+            key: (instrument, granularity, price component)
+            count: Number of candles wanted
+            fetcher: Coroutine downloading candles given (count, from_time)
+
+        Returns:
+            Up to `count` candles, oldest first; the last one may be incomplete
+        """
+        count = min(count, self.max_candles)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            series = self._series.get(key)
+
+            if series is None or count > series.depth or not len(series.completed):
+                series = await self._backfill(key, count, fetcher)
+            elif not await self._refresh(key, series, fetcher):
+                # Gap too large to bridge with one delta request
+                series = await self._backfill(key, max(count, series.depth), fetcher)
+
+            history = max(count - len(series.current), 0)
+            completed = series.completed[max(len(series.completed) - history, 0):]
+            candles = CandleFrame.concat([completed, series.current])
+
+            self.stats["candles_served"] += len(candles)
+            return candles
+
+    async def _backfill(self, key: CandleKey, count: int, fetcher: CandleFetcher) -> _CandleSeries:
+        """Download the full window for key and replace the stored series"""
+        candles = await fetcher(count, None)
+        self.stats["full_fetches"] += 1
+        self.stats["candles_downloaded"] += len(candles)
+
+        series = _CandleSeries(depth=count)
+        self._merge(series, candles)
+        self._series[key] = series
+
+        logger.debug(f"Candle store backfilled {key}: {len(series.completed)} completed candles")
+        return series
+
+    async def _refresh(self, key: CandleKey, series: _CandleSeries, fetcher: CandleFetcher) -> bool:
+        """
+        Download candles from the last completed bar onwards
+
+        Returns:
+            False if the delta hit the per-request limit and may have a gap
+        """
+        last_time = series.completed.times[-1]
+        candles = CandleFrame.from_candles(await fetcher(MAX_CANDLES_PER_REQUEST, CandleFrame.to_datetime(last_time)))
+        self.stats["delta_fetches"] += 1
+        self.stats["candles_downloaded"] += len(candles)
+
+        if len(candles) >= MAX_CANDLES_PER_REQUEST:
+            return False
+
+        self._merge(series, candles[candles.times > last_time])
+        return True
+
+    def _merge(self, series: _CandleSeries, candles: CandleFrame) -> None:
+        """Append completed candles and replace the in-progress bar"""
+        candles = CandleFrame.from_candles(candles)
+        series.current = candles[~candles.complete][-1:]
+        series.completed = CandleFrame.concat([series.completed, candles[candles.complete]])
+
+        keep = max(series.depth, 1)
+        if len(series.completed) > keep:
+            # Copy so the trimmed history can be released
+            series.completed = series.completed[-keep:].copy()
+
+    def invalidate(self, instrument: Optional[str] = None) -> None:
+        """Drop stored candles for an instrument, or everything if instrument is None"""
+        if instrument is None:
+            self._series.clear()
+            return
+
+        for key in [k for k in self._series if k[0] == instrument]:
+            del self._series[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        requests = self.stats["full_fetches"] + self.stats["delta_fetches"]
+        served = self.stats["candles_served"]
+        return {
+            **self.stats,
+            "series": len(self._series),
+            "stored_candles": sum(len(s.completed) for s in self._series.values()),
+            "requests": requests,
+            "download_ratio": round(self.stats["candles_downloaded"] / served, 4) if served else 0.0
+        }
+
+
+# Global candle store instance
+candle_store = CandleStore()
@@ -53,6 +53,9 @@ from app.core.test_runner import test_runner_router
 from app.services.cache_service import init_cache, cleanup_cache, cache_service
 from app.services.cache_warming import start_cache_warming, stop_cache_warming
 from app.services.async_http_client import init_http_clients, cleanup_http_clients
+from app.services.oanda_service import close_shared_signal_engine
+from oanda_api_client import init_oanda_clients, cleanup_oanda_clients
+from app.services.signal_writer import cleanup_signal_writer
 from app.services.async_file_service import file_service, init_file_service
 from app.services.async_task_scheduler import init_task_scheduler, cleanup_task_scheduler
 from app.services.async_logging_service import init_logging_service, cleanup_logging_service, LogCategory
@@ -2132,6 +2135,20 @@ async def startup_event() -> None:
     except Exception as e:
         logger.error(f"Failed to initialize async HTTP clients: {e}")
 
+    # Open the shared OANDA connection pool for the configured account
+    try:
+        oanda_success = await init_oanda_clients(
+            settings.oanda.oanda_api_key,
+            settings.oanda.oanda_account_id,
+            settings.oanda.oanda_environment
+        )
+        if oanda_success:
+            logger.info("Shared OANDA client initialized successfully")
+        else:
+            logger.warning("Shared OANDA client initialization failed")
+    except Exception as e:
+        logger.error(f"Failed to initialize shared OANDA client: {e}")
+
     # Initialize async file service
     try:
         file_success = await init_file_service(".")
@@ -2216,6 +2233,9 @@ async def shutdown_event() -> None:
     except Exception as e:
         logger.error(f"Error stopping SLA monitoring: {e}")
 
+    # Flush signals still buffered in the batched writer
+    await cleanup_signal_writer()
+
     # Stop cache warming service
     try:
         await stop_cache_warming()
@@ -2230,6 +2250,20 @@ async def shutdown_event() -> None:
     except Exception as e:
         logger.error(f"Error cleaning up cache system: {e}")
 
+    # Close the shared OANDA signal engine
+    try:
+        await close_shared_signal_engine()
+        logger.info("OANDA signal engine closed successfully")
+    except Exception as e:
+        logger.error(f"Error closing OANDA signal engine: {e}")
+
+    # Close the shared OANDA connection pools
+    try:
+        await cleanup_oanda_clients()
+        logger.info("Shared OANDA clients closed successfully")
+    except Exception as e:
+        logger.error(f"Error closing shared OANDA clients: {e}")
+
     # Cleanup async HTTP clients
     try:
         await cleanup_http_clients()
@@ -8,19 +8,33 @@ import asyncio
 import aiohttp
 import json
 import logging
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Union, Sequence
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, asdict
 from enum import Enum
 import os
+import random
+import time
 from decimal import Decimal
 import numpy as np
 import pandas as pd
 from typing import Tuple
 
+# Fast JSON decoding straight from response bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+def _json_loads(body: bytes) -> Any:
+    """Decode a JSON response body without building an intermediate str"""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+
 class OANDAEnvironment(Enum):
     """OANDA Environment Types"""
     PRACTICE = "practice"  # fxPractice
@@ -107,6 +121,155 @@ class OANDACandle:
             complete=bool(candle_data.get("complete", True))
         )
 
+class CandleFrame(Sequence):
+    """
+    Columnar candlestick data
+    
+    Prices live in one contiguous (4 x n) float64 block, so `opens`, `highs`,
+    `lows` and `closes` are zero-copy row views; `volumes` and `times` (UTC
+    epoch nanoseconds) are int64. Indexing with an int builds an OANDACandle on
+    demand, so a frame can be used wherever a List[OANDACandle] was expected;
+    slices and boolean masks return frames.
+    """
+    
+    __slots__ = ("prices", "volumes", "times", "complete")
+    
+    _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    
+    def __init__(self, prices: np.ndarray, volumes: np.ndarray, times: np.ndarray, complete: np.ndarray):
+        self.prices = prices      # rows: open, high, low, close
+        self.volumes = volumes
+        self.times = times
+        self.complete = complete
+    
+    @classmethod
+    def empty(cls) -> 'CandleFrame':
+        return cls(
+            np.empty((4, 0), dtype=np.float64), np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64), np.empty(0, dtype=bool)
+        )
+    
+    @classmethod
+    def from_oanda_response(cls, candles_data: List[Dict[str, Any]], price_component: str = "mid") -> 'CandleFrame':
+        """Parse the `candles` list of an OANDA response straight into columns"""
+        n = len(candles_data)
+        if not n:
+            return cls.empty()
+        
+        # One lookup of the price component per candle; numpy parses the price strings
+        components = [candle[price_component] for candle in candles_data]
+        prices = np.array(
+            [[c["o"] for c in components], [c["h"] for c in components],
+             [c["l"] for c in components], [c["c"] for c in components]],
+            dtype=np.float64
+        )
+        
+        volumes = np.fromiter((candle.get("volume", 0) for candle in candles_data), dtype=np.int64, count=n)
+        complete = np.fromiter((candle.get("complete", True) for candle in candles_data), dtype=bool, count=n)
+        times = cls.parse_times([candle["time"] for candle in candles_data])
+        
+        return cls(prices, volumes, times, complete)
+    
+    @classmethod
+    def from_candles(cls, candles: Sequence) -> 'CandleFrame':
+        """Build a frame from OANDACandle objects (returns frames unchanged)"""
+        if isinstance(candles, CandleFrame):
+            return candles
+        if not candles:
+            return cls.empty()
+        
+        prices = np.array([(c.open, c.high, c.low, c.close) for c in candles], dtype=np.float64).T.copy()
+        volumes = np.array([c.volume for c in candles], dtype=np.int64)
+        times = np.array([cls.timestamp_ns(c.time) for c in candles], dtype=np.int64)
+        complete = np.array([c.complete for c in candles], dtype=bool)
+        return cls(prices, volumes, times, complete)
+    
+    @staticmethod
+    def concat(frames: List['CandleFrame']) -> 'CandleFrame':
+        """Concatenate frames in order"""
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return CandleFrame.empty()
+        if len(frames) == 1:
+            return frames[0]
+        return CandleFrame(
+            np.concatenate([f.prices for f in frames], axis=1),
+            np.concatenate([f.volumes for f in frames]),
+            np.concatenate([f.times for f in frames]),
+            np.concatenate([f.complete for f in frames])
+        )
+    
+    @staticmethod
+    def parse_times(values: List[str]) -> np.ndarray:
+        """Parse RFC3339 UTC timestamps into epoch nanoseconds"""
+        return np.array([v.rstrip("Z") for v in values], dtype="datetime64[ns]").astype(np.int64)
+    
+    @classmethod
+    def timestamp_ns(cls, value: datetime) -> int:
+        """Epoch nanoseconds for a datetime (naive values are treated as UTC)"""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        delta = value - cls._EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+    
+    @classmethod
+    def to_datetime(cls, nanoseconds: int) -> datetime:
+        """Timezone-aware UTC datetime for epoch nanoseconds"""
+        return cls._EPOCH + timedelta(microseconds=int(nanoseconds) // 1000)
+    
+    @property
+    def opens(self) -> np.ndarray:
+        return self.prices[0]
+    
+    @property
+    def highs(self) -> np.ndarray:
+        return self.prices[1]
+    
+    @property
+    def lows(self) -> np.ndarray:
+        return self.prices[2]
+    
+    @property
+    def closes(self) -> np.ndarray:
+        return self.prices[3]
+    
+    def __len__(self) -> int:
+        return self.times.shape[0]
+    
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return OANDACandle(
+                time=self.to_datetime(self.times[index]),
+                open=float(self.prices[0, index]),
+                high=float(self.prices[1, index]),
+                low=float(self.prices[2, index]),
+                close=float(self.prices[3, index]),
+                volume=int(self.volumes[index]),
+                complete=bool(self.complete[index])
+            )
+        # Slices give views; masks and index arrays give copies
+        return CandleFrame(self.prices[:, index], self.volumes[index], self.times[index], self.complete[index])
+    
+    def __repr__(self) -> str:
+        return f"CandleFrame(len={len(self)})"
+    
+    def copy(self) -> 'CandleFrame':
+        """Frame with its own contiguous arrays"""
+        return CandleFrame(self.prices.copy(), self.volumes.copy(), self.times.copy(), self.complete.copy())
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """OHLCV DataFrame indexed by UTC time"""
+        return pd.DataFrame(
+            {
+                "open": self.opens,
+                "high": self.highs,
+                "low": self.lows,
+                "close": self.closes,
+                "volume": self.volumes
+            },
+            index=pd.DatetimeIndex(self.times.astype("datetime64[ns]"), name="time").tz_localize("UTC")
+        )
+
 @dataclass
 class OANDAInstrument:
     """OANDA Instrument Information"""
@@ -123,6 +286,150 @@ class OANDAInstrument:
     maximum_order_units: float
     margin_rate: float
 
+class TokenBucket:
+    """
+    Async token bucket rate limiter
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve their token immediately and then sleep until it is due,
+    so waiters are served in arrival order without holding a lock (the bucket
+    is safe to share across event loops). ``pause`` stops issuing tokens for a
+    while, which is how a 429 from one client backs off every client.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        
+        # Metrics
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.queue_depth = 0
+        self.peak_queue_depth = 0
+        self.pauses = 0
+    
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update"""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+    
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, waiting until they are available
+        
+        Args:
+            tokens: Number of tokens to take
+            
+        Returns:
+            Seconds spent waiting
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= tokens
+        
+        # A negative balance is a queue of reservations; ours is due once it is repaid
+        wait = max(0.0, self._updated_at - now) + max(0.0, -self._tokens) / self.rate
+        self.acquired += 1
+        if wait <= 0:
+            return 0.0
+        
+        self.throttled += 1
+        self.queue_depth += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Hand the reservation back so later waiters are not delayed by it
+            self._tokens += tokens
+            raise
+        finally:
+            self.queue_depth -= 1
+        
+        self.total_wait_time += wait
+        self.max_wait_time = max(self.max_wait_time, wait)
+        return wait
+    
+    def pause(self, seconds: float):
+        """Issue no tokens for ``seconds`` and drop any saved-up burst"""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+        self._updated_at = max(self._updated_at, now + seconds)
+        self.pauses += 1
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get rate limiter metrics"""
+        self._refill(time.monotonic())
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "available_tokens": max(0.0, self._tokens),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "average_wait_time": self.total_wait_time / max(1, self.throttled),
+            "max_wait_time": self.max_wait_time,
+            "total_wait_time": self.total_wait_time,
+            "pauses": self.pauses
+        }
+
+@dataclass
+class OANDAPoolConfig:
+    """Connection pool settings for OANDA clients, overridable via OANDA_POOL_* environment variables"""
+    limit: int = 20                  # Total connection pool size
+    limit_per_host: int = 10         # Connections per host
+    keepalive_timeout: float = 60.0  # Seconds an idle connection is kept open
+    dns_cache_ttl: int = 300         # Seconds a resolved host is cached
+    
+    @classmethod
+    def from_env(cls) -> 'OANDAPoolConfig':
+        """Build the pool configuration from the environment"""
+        defaults = cls()
+        return cls(
+            limit=int(os.getenv("OANDA_POOL_LIMIT", defaults.limit)),
+            limit_per_host=int(os.getenv("OANDA_POOL_LIMIT_PER_HOST", defaults.limit_per_host)),
+            keepalive_timeout=float(os.getenv("OANDA_POOL_KEEPALIVE_TIMEOUT", defaults.keepalive_timeout)),
+            dns_cache_ttl=int(os.getenv("OANDA_POOL_DNS_CACHE_TTL", defaults.dns_cache_ttl))
+        )
+
+class RateLimitedConnector(aiohttp.TCPConnector):
+    """TCPConnector that takes a token from a connection bucket before opening each new connection"""
+    
+    def __init__(self, connection_limiter: TokenBucket, **kwargs):
+        super().__init__(**kwargs)
+        self._connection_limiter = connection_limiter
+        self.connections_opened = 0
+    
+    async def _create_connection(self, req, traces, timeout):
+        await self._connection_limiter.acquire()
+        self.connections_opened += 1
+        return await super()._create_connection(req, traces, timeout)
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Get connection pool utilization"""
+        in_use = len(self._acquired)
+        idle = sum(len(conns) for conns in self._conns.values())
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "in_use": in_use,
+            "idle": idle,
+            "utilization": round(in_use / self.limit * 100, 2) if self.limit else 0.0,
+            "connections_opened": self.connections_opened
+        }
+
 class OANDAClient:
     """
     OANDA v20 REST API Client
@@ -139,7 +446,19 @@ class OANDAClient:
     RATE_LIMIT_REQUESTS_PER_SECOND = 120
     RATE_LIMIT_CONNECTIONS_PER_SECOND = 2
     
-    def __init__(self, api_key: str, account_id: str, environment: OANDAEnvironment = OANDAEnvironment.PRACTICE):
+    # Retries after HTTP 429 (jittered exponential backoff unless Retry-After says otherwise)
+    RATE_LIMIT_MAX_RETRIES = 4
+    RATE_LIMIT_BACKOFF_BASE = 0.5   # seconds
+    RATE_LIMIT_BACKOFF_MAX = 10.0   # seconds
+    
+    def __init__(
+        self,
+        api_key: str,
+        account_id: str,
+        environment: OANDAEnvironment = OANDAEnvironment.PRACTICE,
+        pool_config: Optional[OANDAPoolConfig] = None,
+        shared: bool = False
+    ):
         """
         Initialize OANDA Client
         
@@ -147,18 +466,23 @@ class OANDAClient:
             api_key: OANDA API access token
             account_id: OANDA account ID
             environment: PRACTICE or LIVE
+            pool_config: Connection pool settings (defaults to OANDAPoolConfig())
+            shared: Owned by the client registry; leaving the context manager keeps the session open
         """
         self.api_key = api_key
         self.account_id = account_id
         self.environment = environment
         self.base_url = self.ENDPOINTS[environment]
+        self.pool_config = pool_config or OANDAPoolConfig()
+        self.shared = shared
         
         # Session for connection pooling
         self.session: Optional[aiohttp.ClientSession] = None
+        self.requests_sent = 0
         
-        # Rate limiting
-        self._last_request_time = 0
-        self._request_count = 0
+        # Rate limiting is process-wide: every client draws from the same buckets
+        self._request_limiter = request_rate_limiter
+        self._connection_limiter = connection_rate_limiter
         
         logger.info(f"OANDA Client initialized for {environment.value} environment")
     
@@ -169,7 +493,9 @@ class OANDAClient:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        await self._close_session()
+        # Shared clients live until the registry closes them
+        if not self.shared:
+            await self._close_session()
     
     async def _create_session(self):
         """Create aiohttp session with proper headers"""
@@ -182,10 +508,13 @@ class OANDAClient:
         
         # Connection timeout and limits following OANDA recommendations
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        connector = aiohttp.TCPConnector(
-            limit=10,  # Total connection pool size
-            limit_per_host=5,  # Connections per host
-            keepalive_timeout=30,
+        connector = RateLimitedConnector(
+            self._connection_limiter,
+            limit=self.pool_config.limit,
+            limit_per_host=self.pool_config.limit_per_host,
+            keepalive_timeout=self.pool_config.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.pool_config.dns_cache_ttl,
             enable_cleanup_closed=True
         )
         
@@ -201,29 +530,43 @@ class OANDAClient:
             await self.session.close()
             self.session = None
     
+    def _abandon_session(self):
+        """Release a session whose event loop has stopped and can no longer await its close"""
+        if self.session:
+            if self.session.connector is not None:
+                self.session.connector._close()  # Synchronous part of close(): drops pooled connections
+            self.session = None
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Get connection pool utilization for this client"""
+        metrics = {"requests_sent": self.requests_sent, "session_open": bool(self.session and not self.session.closed)}
+        if self.session and isinstance(self.session.connector, RateLimitedConnector):
+            metrics.update(self.session.connector.get_pool_metrics())
+        return metrics
+    
     async def _rate_limit(self):
-        """Implement rate limiting as per OANDA guidelines"""
-        current_time = asyncio.get_event_loop().time()
-        
-        # Reset counter every second
-        if current_time - self._last_request_time >= 1.0:
-            self._request_count = 0
-            self._last_request_time = current_time
-        
-        # Check if we need to wait
-        if self._request_count >= self.RATE_LIMIT_REQUESTS_PER_SECOND:
-            wait_time = 1.0 - (current_time - self._last_request_time)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-                self._request_count = 0
-                self._last_request_time = asyncio.get_event_loop().time()
-        
-        self._request_count += 1
+        """Wait for a token from the process-wide request bucket"""
+        await self._request_limiter.acquire()
+    
+    def _rate_limit_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Seconds to back off after the ``attempt``-th 429 in a row"""
+        if retry_after:
+            try:
+                # Small jitter so clients released together do not collide again
+                return float(retry_after) + random.uniform(0, self.RATE_LIMIT_BACKOFF_BASE)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        ceiling = min(self.RATE_LIMIT_BACKOFF_MAX, self.RATE_LIMIT_BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
     
     async def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Make HTTP request to OANDA API with proper error handling
         
+        HTTP 429 responses are retried up to RATE_LIMIT_MAX_RETRIES times. The
+        backoff pauses the shared request bucket, so every client in the
+        process slows down together instead of each discovering the limit.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
@@ -239,41 +582,52 @@ class OANDAClient:
         if not self.session:
             await self._create_session()
         
-        # Apply rate limiting
-        await self._rate_limit()
-        
         url = f"{self.base_url}{endpoint}"
         
-        try:
-            async with self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data
-            ) as response:
-                
-                response_text = await response.text()
-                
-                # Log request for debugging
-                logger.debug(f"OANDA {method} {endpoint} -> {response.status}")
-                
-                if response.status == 200:
-                    return json.loads(response_text)
-                elif response.status == 401:
-                    raise OANDAAPIError("Invalid API key or unauthorized access", response.status, "UNAUTHORIZED")
-                elif response.status == 400:
-                    raise OANDAAPIError(f"Bad request: {response_text}", response.status, "BAD_REQUEST")
-                elif response.status == 404:
-                    raise OANDAAPIError(f"Not found: {endpoint}", response.status, "NOT_FOUND")
-                elif response.status == 429:
-                    raise OANDAAPIError("Rate limit exceeded", response.status, "RATE_LIMIT")
-                else:
-                    raise OANDAAPIError(f"API error: {response_text}", response.status, "API_ERROR")
+        for attempt in range(self.RATE_LIMIT_MAX_RETRIES + 1):
+            # Apply rate limiting
+            await self._rate_limit()
+            self.requests_sent += 1
+            
+            try:
+                async with self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=data
+                ) as response:
+                    
+                    # Raw bytes: large candle bodies are decoded once, never copied into a str
+                    body = await response.read()
                     
-        except aiohttp.ClientError as e:
-            raise OANDAAPIError(f"Connection error: {str(e)}", None, "CONNECTION_ERROR")
-        except json.JSONDecodeError as e:
-            raise OANDAAPIError(f"Invalid JSON response: {str(e)}", None, "JSON_ERROR")
+                    # Log request for debugging
+                    logger.debug(f"OANDA {method} {endpoint} -> {response.status}")
+                    
+                    if response.status == 200:
+                        return _json_loads(body)
+                    elif response.status == 401:
+                        raise OANDAAPIError("Invalid API key or unauthorized access", response.status, "UNAUTHORIZED")
+                    elif response.status == 400:
+                        raise OANDAAPIError(f"Bad request: {body.decode(errors='replace')}", response.status, "BAD_REQUEST")
+                    elif response.status == 404:
+                        raise OANDAAPIError(f"Not found: {endpoint}", response.status, "NOT_FOUND")
+                    elif response.status == 429:
+                        rate_limit_stats["rate_limited_responses"] += 1
+                        if attempt == self.RATE_LIMIT_MAX_RETRIES:
+                            raise OANDAAPIError("Rate limit exceeded", response.status, "RATE_LIMIT")
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        raise OANDAAPIError(f"API error: {body.decode(errors='replace')}", response.status, "API_ERROR")
+                        
+            except aiohttp.ClientError as e:
+                raise OANDAAPIError(f"Connection error: {str(e)}", None, "CONNECTION_ERROR")
+            except json.JSONDecodeError as e:
+                raise OANDAAPIError(f"Invalid JSON response: {str(e)}", None, "JSON_ERROR")
+            
+            delay = self._rate_limit_delay(attempt, retry_after)
+            rate_limit_stats["retries"] += 1
+            logger.warning(f"OANDA {method} {endpoint} rate limited, retrying in {delay:.2f}s (attempt {attempt + 1})")
+            self._request_limiter.pause(delay)
     
     async def get_account_info(self) -> Dict[str, Any]:
         """Get account information"""
@@ -358,7 +712,7 @@ class OANDAClient:
         price_component: PriceComponent = PriceComponent.MID,
         from_time: Optional[datetime] = None,
         to_time: Optional[datetime] = None
-    ) -> List[OANDACandle]:
+    ) -> CandleFrame:
         """
         Get candlestick data for instrument
         
@@ -367,11 +721,12 @@ class OANDAClient:
             granularity: Time granularity
             count: Number of candles (max 5000)
             price_component: Price component (bid/ask/mid)
-            from_time: Start time (optional)
+            from_time: Start time (optional); without to_time, returns up to
+                `count` candles starting at from_time
             to_time: End time (optional)
             
         Returns:
-            List of OANDACandle objects
+            CandleFrame (a sequence of OANDACandle with columnar arrays)
         """
         endpoint = f"/v3/instruments/{instrument}/candles"
         
@@ -382,24 +737,30 @@ class OANDAClient:
         
         # Use either count or time range, not both
         if from_time and to_time:
-            params["from"] = from_time.isoformat() + "Z"
-            params["to"] = to_time.isoformat() + "Z"
+            params["from"] = self._format_time(from_time)
+            params["to"] = self._format_time(to_time)
         else:
             params["count"] = min(count, 5000)  # OANDA limit
+            if from_time:
+                # Incremental fetch: count candles from from_time onwards
+                params["from"] = self._format_time(from_time)
         
         response = await self._make_request("GET", endpoint, params=params)
         
-        candles = []
         price_key = {
             PriceComponent.BID: "bid",
             PriceComponent.ASK: "ask", 
             PriceComponent.MID: "mid"
         }[price_component]
         
-        for candle_data in response.get("candles", []):
-            candles.append(OANDACandle.from_oanda_response(candle_data, price_key))
-        
-        return candles
+        return CandleFrame.from_oanda_response(response.get("candles", []), price_key)
+    
+    @staticmethod
+    def _format_time(value: datetime) -> str:
+        """Format datetime as RFC3339 UTC string (naive values are treated as UTC)"""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat() + "Z"
     
     def normalize_instrument(self, symbol: str) -> str:
         """
@@ -566,7 +927,7 @@ class OANDAClient:
                     continue
                 
                 # Extract close prices for technical analysis
-                close_prices = np.array([candle.close for candle in candles])
+                close_prices = candles.closes
                 
                 if len(close_prices) < 14:  # Minimum for RSI
                     logger.warning(f"Insufficient data for {normalized_instrument} {tf}")
@@ -606,10 +967,131 @@ class OANDAClient:
         logger.info(f"Retrieved instrument data for {normalized_instrument} across {len(result)} timeframes")
         return result
 
+# Process-wide rate limiters shared by every OANDAClient
+request_rate_limiter = TokenBucket(OANDAClient.RATE_LIMIT_REQUESTS_PER_SECOND)
+connection_rate_limiter = TokenBucket(OANDAClient.RATE_LIMIT_CONNECTIONS_PER_SECOND)
+rate_limit_stats = {"rate_limited_responses": 0, "retries": 0}
+
+def get_rate_limit_metrics() -> Dict[str, Any]:
+    """Get metrics for the shared OANDA rate limiters"""
+    return {
+        "requests": request_rate_limiter.get_metrics(),
+        "connections": connection_rate_limiter.get_metrics(),
+        **rate_limit_stats
+    }
+
+class OANDAClientRegistry:
+    """
+    Process-wide OANDA clients keyed by (environment, account)
+    
+    Every engine, service and generator talking to the same account shares
+    one client, so the process keeps one warm connection pool per account
+    instead of one per caller and does not repeat TLS handshakes.
+    """
+    
+    def __init__(self, pool_config: Optional[OANDAPoolConfig] = None):
+        self.pool_config = pool_config or OANDAPoolConfig.from_env()
+        self._clients: Dict[Tuple[str, str], OANDAClient] = {}
+    
+    async def get_client(self, api_key: str, account_id: str, environment: str = "practice") -> OANDAClient:
+        """
+        Get the shared client for an account, opening its session on first use
+        
+        Args:
+            api_key: OANDA API key
+            account_id: OANDA account ID
+            environment: "practice" or "live"
+            
+        Returns:
+            Shared OANDAClient with an open session
+        """
+        env = _parse_environment(environment)
+        key = (env.value, account_id)
+        client = self._clients.get(key)
+        loop = asyncio.get_running_loop()
+        
+        # aiohttp sessions are bound to the loop that created them, and carry the key in their headers
+        if (client is None or not client.session or client.session.closed
+                or client.session._loop is not loop or client.api_key != api_key):
+            if client is not None:
+                await self._retire(client)
+            client = OANDAClient(api_key, account_id, env, pool_config=self.pool_config, shared=True)
+            self._clients[key] = client
+            await client._create_session()
+            logger.info(f"Opened shared OANDA client for {env.value}/{account_id}")
+        
+        return client
+    
+    @staticmethod
+    async def _retire(client: OANDAClient):
+        """Close a replaced client on the loop that owns its session, or abandon it if that loop is gone"""
+        session = client.session
+        if not session or session.closed:
+            return
+        try:
+            if session._loop is asyncio.get_running_loop():
+                await client._close_session()
+            elif session._loop.is_running():
+                asyncio.run_coroutine_threadsafe(client._close_session(), session._loop)
+            else:
+                client._abandon_session()
+        except Exception as e:
+            logger.error(f"Error closing replaced OANDA client for {client.account_id}: {e}")
+    
+    def find_client(self, account_id: str, environment: str = "practice") -> Optional[OANDAClient]:
+        """Get an already opened shared client without creating one"""
+        return self._clients.get((_parse_environment(environment).value, account_id))
+    
+    async def close_all(self):
+        """Close every shared client"""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client._close_session()
+            except Exception as e:
+                logger.error(f"Error closing OANDA client for {client.account_id}: {e}")
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get pool utilization for every shared client"""
+        return {
+            "pool_config": asdict(self.pool_config),
+            "clients": {
+                f"{environment}:{account_id}": client.get_pool_metrics()
+                for (environment, account_id), client in self._clients.items()
+            }
+        }
+
+def _parse_environment(environment: str) -> OANDAEnvironment:
+    """Map an environment name to OANDAEnvironment ("demo" accounts trade on fxPractice)"""
+    return OANDAEnvironment.LIVE if environment.lower() == "live" else OANDAEnvironment.PRACTICE
+
+# Global client registry
+oanda_client_registry = OANDAClientRegistry()
+
+async def get_shared_oanda_client(api_key: str, account_id: str, environment: str = "practice") -> OANDAClient:
+    """Get the process-wide client for an account"""
+    return await oanda_client_registry.get_client(api_key, account_id, environment)
+
+async def init_oanda_clients(api_key: str, account_id: str, environment: str = "practice") -> bool:
+    """Open the shared client for the configured account at startup"""
+    try:
+        await oanda_client_registry.get_client(api_key, account_id, environment)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to initialize OANDA client: {e}")
+        return False
+
+async def cleanup_oanda_clients():
+    """Close all shared OANDA clients"""
+    await oanda_client_registry.close_all()
+    logger.info("Shared OANDA clients closed")
+
 # Factory function for easy client creation
 def create_oanda_client(api_key: str, account_id: str, environment: str = "practice") -> OANDAClient:
     """
-    Factory function to create OANDA client
+    Factory function to create a private OANDA client
+    
+    Prefer get_shared_oanda_client, which reuses the process-wide pool.
     
     Args:
         api_key: OANDA API key
@@ -619,5 +1101,4 @@ def create_oanda_client(api_key: str, account_id: str, environment: str = "pract
     Returns:
         Configured OANDAClient instance
     """
-    env = OANDAEnvironment.PRACTICE if environment.lower() == "practice" else OANDAEnvironment.LIVE
-    return OANDAClient(api_key, account_id, env)
+    return OANDAClient(api_key, account_id, _parse_environment(environment))
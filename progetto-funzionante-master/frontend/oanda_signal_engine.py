@@ -6,9 +6,11 @@ Completely rewritten following OANDA official documentation
 
 import asyncio
 import logging
+from collections import deque
+from functools import lru_cache
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, AsyncIterator, Sequence
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
@@ -23,9 +25,10 @@ except ImportError:
     QUANTISTES_AVAILABLE = False
 
 from oanda_api_client import (
-    OANDAClient, OANDAAPIError, OANDACandle, OANDAPrice,
-    Granularity, PriceComponent, create_oanda_client
+    OANDAClient, OANDAAPIError, OANDACandle, OANDAPrice, CandleFrame,
+    Granularity, PriceComponent, get_shared_oanda_client
 )
+from candle_store import CandleStore, candle_store
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -240,6 +243,419 @@ class TechnicalAnalyzer:
         
         return np.mean(true_range[-period:])
 
+    @staticmethod
+    def derive_signals(
+        current_price,
+        rsi,
+        macd_line,
+        macd_signal,
+        macd_histogram,
+        bb_upper,
+        bb_middle,
+        bb_lower,
+        bb_std,
+        ema_9,
+        ema_21,
+        ema_50,
+        sma_200,
+        atr,
+        atr_percentile,
+        volume_avg,
+        momentum
+    ) -> Dict[str, np.ndarray]:
+        """
+        Derive signals and the overall technical score from raw indicator values
+        
+        Works element-wise: every argument may be a scalar or an array with one
+        entry per instrument.
+        
+        Returns:
+            TechnicalAnalysis field name -> value(s)
+        """
+        values = {
+            name: np.asarray(value, dtype=float) for name, value in {
+                "rsi": rsi, "macd_line": macd_line, "macd_signal": macd_signal,
+                "macd_histogram": macd_histogram, "bb_upper": bb_upper, "bb_lower": bb_lower,
+                "bb_middle": bb_middle, "ema_9": ema_9, "ema_21": ema_21, "ema_50": ema_50,
+                "sma_200": sma_200, "atr": atr, "volume_avg": volume_avg, "momentum": momentum
+            }.items()
+        }
+        rsi, atr = values["rsi"], values["atr"]
+        macd_line, macd_histogram = values["macd_line"], values["macd_histogram"]
+        bb_upper, bb_lower = values["bb_upper"], values["bb_lower"]
+        ema_9, ema_21, ema_50 = values["ema_9"], values["ema_21"], values["ema_50"]
+        current_price = np.asarray(current_price, dtype=float)
+        atr_percentile = np.asarray(atr_percentile, dtype=float)
+        
+        # Determine signals
+        rsi_signal = np.where(rsi > 70, "overbought", np.where(rsi < 30, "oversold", "neutral"))
+        macd_trend = np.where(macd_line > values["macd_signal"], "bullish", "bearish")
+        bb_position = np.where(current_price > bb_upper, "above", np.where(current_price < bb_lower, "below", "middle"))
+        bb_squeeze = (bb_upper - bb_lower) < np.asarray(bb_std, dtype=float) * 1.5
+        
+        # MA trend
+        ma_trend = np.where(
+            (ema_9 > ema_21) & (ema_21 > ema_50), "bullish",
+            np.where((ema_9 < ema_21) & (ema_21 < ema_50), "bearish", "neutral")
+        )
+        
+        # Volatility level
+        volatility_level = np.where(
+            atr > atr_percentile * 1.5, "high",
+            np.where(atr < atr_percentile * 0.5, "low", "medium")
+        )
+        
+        # Calculate overall technical score
+        rsi_score = np.where((rsi >= 30) & (rsi <= 70), 0.7, 0.9)  # Oversold/overbought = potential reversal
+        macd_score = np.where(np.abs(macd_histogram) > np.abs(macd_line) * 0.1, 0.8, 0.5)
+        ma_score = np.where(ma_trend != "neutral", 0.8, 0.4)
+        bb_score = np.where(bb_position != "middle", 0.7, 0.5)
+        technical_score = (rsi_score + macd_score + ma_score + bb_score) / 4
+        
+        return {
+            **values,
+            "rsi_signal": rsi_signal,
+            "macd_trend": macd_trend,
+            "bb_position": bb_position,
+            "bb_squeeze": bb_squeeze,
+            "ma_trend": ma_trend,
+            "volatility_level": volatility_level,
+            "technical_score": technical_score
+        }
+    
+    @staticmethod
+    def build_analysis(**indicators) -> TechnicalAnalysis:
+        """Build a TechnicalAnalysis from the raw indicator values of one instrument"""
+        fields = TechnicalAnalyzer.derive_signals(**indicators)
+        return TechnicalAnalysis(**{name: value.item() for name, value in fields.items()})
+    
+    @staticmethod
+    def calculate_batch(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, volumes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized technical analysis for many instruments at once
+        
+        Produces the same values as OANDASignalEngine._calculate_technical_analysis,
+        for every row in a single pass.
+        
+        Args:
+            closes, highs, lows, volumes: (instruments x bars) matrices, oldest bar first
+            
+        Returns:
+            TechnicalAnalysis field name -> array with one entry per instrument
+        """
+        closes = np.asarray(closes, dtype=float)
+        highs = np.asarray(highs, dtype=float)
+        lows = np.asarray(lows, dtype=float)
+        volumes = np.asarray(volumes, dtype=float)
+        
+        n_bars = closes.shape[1]
+        if n_bars < 50:
+            raise ValueError("Insufficient data for technical analysis")
+        
+        # RSI(14)
+        deltas = np.diff(closes[:, -15:], axis=1)
+        avg_gain = np.where(deltas > 0, deltas, 0).mean(axis=1)
+        avg_loss = np.where(deltas < 0, -deltas, 0).mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+        
+        # MACD(12, 26, 9) - the signal line needs the whole MACD series
+        macd_series = closes @ _ewm_matrix(n_bars, 12).T - closes @ _ewm_matrix(n_bars, 26).T
+        macd_line = macd_series[:, -1]
+        macd_signal = macd_series @ _ewm_weights(n_bars, 9)
+        
+        # Bollinger Bands(20, 2)
+        bb_window = closes[:, -20:]
+        bb_middle = bb_window.mean(axis=1)
+        bb_std = bb_window.std(axis=1)
+        
+        # ATR(14)
+        true_range = np.maximum(
+            highs[:, 1:] - lows[:, 1:],
+            np.maximum(np.abs(highs[:, 1:] - closes[:, :-1]), np.abs(lows[:, 1:] - closes[:, :-1]))
+        )
+        
+        return TechnicalAnalyzer.derive_signals(
+            current_price=closes[:, -1],
+            rsi=rsi,
+            macd_line=macd_line,
+            macd_signal=macd_signal,
+            macd_histogram=macd_line - macd_signal,
+            bb_upper=bb_middle + bb_std * 2,
+            bb_middle=bb_middle,
+            bb_lower=bb_middle - bb_std * 2,
+            bb_std=bb_std,
+            ema_9=closes @ _ewm_weights(n_bars, 9),
+            ema_21=closes @ _ewm_weights(n_bars, 21),
+            ema_50=closes @ _ewm_weights(n_bars, 50),
+            sma_200=closes[:, -200:].mean(axis=1),
+            atr=true_range[:, -14:].mean(axis=1),
+            atr_percentile=np.percentile(closes[:, -50:] * 0.02, 70, axis=1),
+            volume_avg=volumes[:, -20:].mean(axis=1),
+            momentum=closes[:, -1] / closes[:, -5] - 1
+        )
+
+@lru_cache(maxsize=32)
+def _ewm_weights(n_bars: int, span: int) -> np.ndarray:
+    """Weights giving the last value of pandas ewm(span=span, adjust=True).mean()"""
+    weights = (1.0 - 2.0 / (span + 1.0)) ** np.arange(n_bars - 1, -1, -1)
+    return weights / weights.sum()
+
+@lru_cache(maxsize=32)
+def _ewm_matrix(n_bars: int, span: int) -> np.ndarray:
+    """Lower-triangular matrix W so that series @ W.T is the full adjusted EWM series"""
+    decay = 1.0 - 2.0 / (span + 1.0)
+    lags = np.arange(n_bars)[:, None] - np.arange(n_bars)[None, :]
+    weights = np.where(lags >= 0, decay ** np.maximum(lags, 0), 0.0)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+class _RollingWindow:
+    """Fixed-size window with O(1) mean and population std updates"""
+    
+    # Exact re-summation interval, bounds floating point drift of the running sums
+    RESUM_INTERVAL = 1024
+    
+    def __init__(self, size: int):
+        self.values: deque = deque(maxlen=size)
+        self._anchor = 0.0  # sums are kept relative to this to avoid cancellation
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._updates = 0
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def update(self, value: float) -> None:
+        """Append a value, evicting the oldest one when full"""
+        if not self.values:
+            self._anchor = value
+        if len(self.values) == self.values.maxlen:
+            oldest = self.values[0] - self._anchor
+            self._sum -= oldest
+            self._sumsq -= oldest * oldest
+        self.values.append(value)
+        delta = value - self._anchor
+        self._sum += delta
+        self._sumsq += delta * delta
+        
+        self._updates += 1
+        if self._updates % self.RESUM_INTERVAL == 0:
+            self._resum()
+    
+    def _resum(self) -> None:
+        """Recompute the running sums exactly around the current oldest value"""
+        self._anchor = self.values[0]
+        deltas = [v - self._anchor for v in self.values]
+        self._sum = sum(deltas)
+        self._sumsq = sum(d * d for d in deltas)
+    
+    def _moments(self, extra: Optional[float]) -> Tuple[int, float, float]:
+        """Count, sum and sum of squares (relative to anchor), optionally with a previewed value"""
+        count, total, total_sq = len(self.values), self._sum, self._sumsq
+        if extra is not None:
+            anchor = self._anchor if self.values else extra
+            if count == self.values.maxlen:
+                oldest = self.values[0] - anchor
+                total -= oldest
+                total_sq -= oldest * oldest
+                count -= 1
+            delta = extra - anchor
+            total += delta
+            total_sq += delta * delta
+            count += 1
+        return count, total, total_sq
+    
+    def size(self, extra: Optional[float] = None) -> int:
+        """Number of values, including a previewed value"""
+        if extra is None:
+            return len(self.values)
+        return min(len(self.values) + 1, self.values.maxlen)
+    
+    def mean(self, extra: Optional[float] = None) -> float:
+        """Window mean, optionally previewing one more value"""
+        count, total, _ = self._moments(extra)
+        if not count:
+            return 0.0
+        anchor = self._anchor if self.values else extra
+        return anchor + total / count
+    
+    def std(self, extra: Optional[float] = None) -> float:
+        """Window population standard deviation (like np.std)"""
+        count, total, total_sq = self._moments(extra)
+        if not count:
+            return 0.0
+        variance = total_sq / count - (total / count) ** 2
+        return max(variance, 0.0) ** 0.5
+
+class _EWMA:
+    """Exponentially weighted mean matching pandas ewm(span=span).mean() (adjust=True)"""
+    
+    def __init__(self, span: int):
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self._numerator = 0.0
+        self._denominator = 0.0
+    
+    def update(self, value: float) -> None:
+        """Fold in a value"""
+        self._numerator = value + self.decay * self._numerator
+        self._denominator = 1.0 + self.decay * self._denominator
+    
+    def value(self, extra: Optional[float] = None) -> float:
+        """Current mean, optionally previewing one more value"""
+        if extra is None:
+            return self._numerator / self._denominator if self._denominator else 0.0
+        return (extra + self.decay * self._numerator) / (1.0 + self.decay * self._denominator)
+
+class IncrementalIndicators:
+    """
+    Streaming indicator state for one (instrument, granularity)
+    
+    update() folds in a completed candle in O(1); snapshot() builds the same
+    TechnicalAnalysis as OANDASignalEngine._calculate_technical_analysis from
+    the state alone, optionally previewing the in-progress candle.
+    """
+    
+    MIN_BARS = 50
+    
+    def __init__(self):
+        self.bars = 0
+        self.last_time: Optional[datetime] = None
+        self._last_close: Optional[float] = None
+        self._close_total = 0.0  # EMA falls back to the plain mean before its span
+        
+        # RSI(14) - simple average of the last 14 gains/losses
+        self._gains = _RollingWindow(14)
+        self._losses = _RollingWindow(14)
+        
+        # MACD(12, 26, 9)
+        self._macd_fast = _EWMA(12)
+        self._macd_slow = _EWMA(26)
+        self._macd_signal = _EWMA(9)
+        
+        # Moving averages
+        self._emas = {9: _EWMA(9), 21: _EWMA(21), 50: _EWMA(50)}
+        self._sma_200 = _RollingWindow(200)
+        
+        # Bollinger(20, 2), ATR(14), volume average
+        self._bb_window = _RollingWindow(20)
+        self._true_range = _RollingWindow(14)
+        self._volumes = _RollingWindow(20)
+        
+        # Volatility percentile and momentum look at the last 50 closes
+        self._recent_closes: deque = deque(maxlen=50)
+    
+    def update(self, candle: OANDACandle) -> None:
+        """Fold a completed candle into the state"""
+        close = candle.close
+        
+        if self._last_close is not None:
+            delta = close - self._last_close
+            self._gains.update(delta if delta > 0 else 0.0)
+            self._losses.update(-delta if delta < 0 else 0.0)
+            self._true_range.update(self._true_range_of(candle, self._last_close))
+        
+        self._macd_fast.update(close)
+        self._macd_slow.update(close)
+        self._macd_signal.update(self._macd_fast.value() - self._macd_slow.value())
+        for ema in self._emas.values():
+            ema.update(close)
+        
+        self._sma_200.update(close)
+        self._bb_window.update(close)
+        self._volumes.update(float(candle.volume))
+        self._recent_closes.append(close)
+        
+        self._close_total += close
+        self._last_close = close
+        self.last_time = candle.time
+        self.bars += 1
+    
+    @staticmethod
+    def _true_range_of(candle: OANDACandle, previous_close: float) -> float:
+        return max(
+            candle.high - candle.low,
+            abs(candle.high - previous_close),
+            abs(candle.low - previous_close)
+        )
+    
+    def snapshot(self, current: Optional[OANDACandle] = None) -> TechnicalAnalysis:
+        """
+        Build a TechnicalAnalysis from the state
+        
+        Args:
+            current: In-progress candle to include without committing it
+        """
+        bars = self.bars + (1 if current is not None else 0)
+        if bars < self.MIN_BARS:
+            raise ValueError("Insufficient data for technical analysis")
+        
+        close = current.close if current is not None else self._last_close
+        extra = close if current is not None else None
+        
+        # RSI
+        gain = loss = None
+        if current is not None and self._last_close is not None:
+            delta = close - self._last_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        if self._gains.size(gain) < self._gains.values.maxlen:
+            rsi = 50.0
+        else:
+            avg_gain, avg_loss = self._gains.mean(gain), self._losses.mean(loss)
+            rsi = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+        
+        # MACD
+        if bars < 26:
+            macd_line = macd_signal = macd_histogram = 0.0
+        else:
+            macd_line = self._macd_fast.value(extra) - self._macd_slow.value(extra)
+            macd_signal = self._macd_signal.value(macd_line if current is not None else None)
+            macd_histogram = macd_line - macd_signal
+        
+        # Bollinger Bands
+        bb_std = self._bb_window.std(extra)
+        if bars < 20:
+            bb_upper, bb_middle, bb_lower = close * 1.01, close, close * 0.99
+        else:
+            bb_middle = self._bb_window.mean(extra)
+            bb_upper, bb_lower = bb_middle + bb_std * 2, bb_middle - bb_std * 2
+        
+        # Moving averages
+        mean_all = (self._close_total + (close if current is not None else 0.0)) / bars
+        ema_9, ema_21, ema_50 = (
+            self._emas[period].value(extra) if bars >= period else mean_all
+            for period in (9, 21, 50)
+        )
+        
+        # ATR
+        true_range = None
+        if current is not None and self._last_close is not None:
+            true_range = self._true_range_of(current, self._last_close)
+        atr = self._true_range.mean(true_range) if self._true_range.size(true_range) else 0.01
+        
+        recent = list(self._recent_closes)
+        if current is not None:
+            recent = (recent + [close])[-self._recent_closes.maxlen:]
+        
+        return TechnicalAnalyzer.build_analysis(
+            current_price=close,
+            rsi=rsi,
+            macd_line=macd_line,
+            macd_signal=macd_signal,
+            macd_histogram=macd_histogram,
+            bb_upper=bb_upper,
+            bb_middle=bb_middle,
+            bb_lower=bb_lower,
+            bb_std=bb_std,
+            ema_9=ema_9,
+            ema_21=ema_21,
+            ema_50=ema_50,
+            sma_200=self._sma_200.mean(extra),
+            atr=atr,
+            atr_percentile=np.percentile(np.array(recent) * 0.02, 70),
+            volume_avg=self._volumes.mean(float(current.volume) if current is not None else None),
+            momentum=recent[-1] / recent[-5] - 1 if len(recent) >= 5 else 0
+        )
+
 class MarketSessionDetector:
     """Detect current market session and characteristics"""
     
@@ -303,6 +719,12 @@ class OANDASignalEngine:
         # Initialize OANDA client
         self.oanda_client: Optional[OANDAClient] = None
         
+        # Completed candles are shared across engines; only new bars are downloaded
+        self.candle_store: CandleStore = candle_store
+        
+        # Streaming indicator state per (instrument, granularity)
+        self._indicator_states: Dict[Tuple[str, str], IncrementalIndicators] = {}
+        
         # AI configuration
         if self.gemini_api_key:
             genai.configure(api_key=self.gemini_api_key)
@@ -317,39 +739,61 @@ class OANDASignalEngine:
         self.max_risk_per_trade = 0.02    # 2% maximum risk per trade
         self.default_rrr = 2.0            # 1:2.0 risk/reward ratio (more achievable)
         
+        # Batch generation settings - in-flight limit stays below the shared client's per-host pool
+        self.batch_concurrency = 5
+        self.batch_instrument_timeout = 30.0  # seconds per instrument
+        
         logger.info(f"OANDA Signal Engine initialized for {environment} environment")
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.oanda_client = create_oanda_client(self.api_key, self.account_id, self.environment)
-        await self.oanda_client.__aenter__()
+        await self._ensure_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        # The client is shared process-wide; this only closes a private one
         if self.oanda_client:
             await self.oanda_client.__aexit__(exc_type, exc_val, exc_tb)
     
+    async def _ensure_client(self) -> OANDAClient:
+        """Attach the process-wide OANDA client for this account on first use"""
+        if not self.oanda_client:
+            self.oanda_client = await get_shared_oanda_client(self.api_key, self.account_id, self.environment)
+        return self.oanda_client
+    
     async def health_check(self) -> bool:
         """Check if engine is ready"""
         try:
             # Auto-initialize client if needed
-            if not self.oanda_client:
-                self.oanda_client = create_oanda_client(self.api_key, self.account_id, self.environment)
-                await self.oanda_client.__aenter__()
-            
-            return await self.oanda_client.health_check()
+            client = await self._ensure_client()
+            return await client.health_check()
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return False
     
-    async def _get_market_data(self, instrument: str, granularity: Granularity = Granularity.H1, count: int = 200) -> Tuple[List[OANDACandle], OANDAPrice]:
-        """Get market data for analysis"""
+    async def _get_market_data(
+        self,
+        instrument: str,
+        granularity: Granularity = Granularity.H1,
+        count: int = 200,
+        current_price: Optional[OANDAPrice] = None
+    ) -> Tuple[CandleFrame, OANDAPrice]:
+        """
+        Get market data for analysis
+        
+        Args:
+            instrument: Normalized instrument name
+            granularity: Candle granularity
+            count: Number of candles
+            current_price: Price already fetched by a batch prefetch; skips the /pricing call
+        """
         if not self.oanda_client:
             raise OANDAAPIError("OANDA client not initialized")
         
-        # Get historical candles
-        candles = await self.oanda_client.get_candles(
+        # Get historical candles (incremental via the candle store)
+        candles = await self.candle_store.get_candles(
+            self.oanda_client,
             instrument=instrument,
             granularity=granularity,
             count=count,
@@ -358,23 +802,13 @@ class OANDASignalEngine:
         
         # Get current price
         try:
-            current_prices = await self.oanda_client.get_current_prices([instrument])
-            if not current_prices:
-                raise OANDAAPIError(f"No current price available for {instrument}")
-            
-            # Debug: Log the pricing data
-            current_price = current_prices[0]
-            logger.info(f"🔍 OANDA Price Data for {instrument}: bid={current_price.bid}, ask={current_price.ask}, mid={current_price.mid}, spread={current_price.spread}")
-            
-            # Validate pricing data - more lenient validation
-            if current_price.bid <= 0.0 or current_price.ask <= 0.0 or (current_price.mid <= 0.0 and current_price.mid != 1.0):
-                logger.error(f"❌ Invalid price data received for {instrument}: bid={current_price.bid}, ask={current_price.ask}, mid={current_price.mid}")
-                raise OANDAAPIError(f"Invalid price data for {instrument} - possible API authentication issue")
-            
-            # Accept mid=1.0 as potentially valid for some instruments but log it
-            if current_price.mid == 1.0:
-                logger.warning(f"⚠️ Unusual mid price (1.0) for {instrument}, but proceeding with analysis")
+            if current_price is None:
+                current_prices = await self.oanda_client.get_current_prices([instrument])
+                if not current_prices:
+                    raise OANDAAPIError(f"No current price available for {instrument}")
+                current_price = current_prices[0]
             
+            self._validate_price(instrument, current_price)
             return candles, current_price
             
         except OANDAAPIError as e:
@@ -385,16 +819,56 @@ class OANDASignalEngine:
                 logger.error(f"❌ Current Account ID: {self.account_id}")
             raise
     
-    def _calculate_technical_analysis(self, candles: List[OANDACandle]) -> TechnicalAnalysis:
+    @staticmethod
+    def _validate_price(instrument: str, current_price: OANDAPrice) -> None:
+        """Validate pricing data before it is used for analysis"""
+        # Debug: Log the pricing data
+        logger.info(f"🔍 OANDA Price Data for {instrument}: bid={current_price.bid}, ask={current_price.ask}, mid={current_price.mid}, spread={current_price.spread}")
+        
+        # Validate pricing data - more lenient validation
+        if current_price.bid <= 0.0 or current_price.ask <= 0.0 or (current_price.mid <= 0.0 and current_price.mid != 1.0):
+            logger.error(f"❌ Invalid price data received for {instrument}: bid={current_price.bid}, ask={current_price.ask}, mid={current_price.mid}")
+            raise OANDAAPIError(f"Invalid price data for {instrument} - possible API authentication issue")
+        
+        # Accept mid=1.0 as potentially valid for some instruments but log it
+        if current_price.mid == 1.0:
+            logger.warning(f"⚠️ Unusual mid price (1.0) for {instrument}, but proceeding with analysis")
+    
+    async def _prefetch_prices(self, instruments: List[str]) -> Dict[str, OANDAPrice]:
+        """
+        Fetch current prices for a whole sweep with a single /pricing request
+        
+        Args:
+            instruments: Normalized instrument names
+            
+        Returns:
+            Mapping of instrument name to OANDAPrice; empty if the request fails,
+            in which case each instrument falls back to its own pricing call
+        """
+        unique_instruments = list(dict.fromkeys(instruments))
+        if not unique_instruments:
+            return {}
+        
+        try:
+            prices = await self.oanda_client.get_current_prices(unique_instruments)
+        except OANDAAPIError as e:
+            logger.warning(f"Batch price prefetch failed, falling back to per-instrument pricing: {e}")
+            return {}
+        
+        logger.info(f"Prefetched prices for {len(prices)}/{len(unique_instruments)} instruments in one request")
+        return {price.instrument: price for price in prices}
+    
+    def _calculate_technical_analysis(self, candles: Sequence[OANDACandle]) -> TechnicalAnalysis:
         """Calculate comprehensive technical analysis"""
         if len(candles) < 50:
             raise ValueError("Insufficient data for technical analysis")
         
-        # Convert to numpy arrays
-        closes = np.array([c.close for c in candles])
-        highs = np.array([c.high for c in candles])
-        lows = np.array([c.low for c in candles])
-        volumes = np.array([c.volume for c in candles])
+        # Columnar views (lists of OANDACandle are converted once)
+        frame = CandleFrame.from_candles(candles)
+        closes = frame.closes
+        highs = frame.highs
+        lows = frame.lows
+        volumes = frame.volumes
         
         # Calculate indicators
         rsi = TechnicalAnalyzer.calculate_rsi(closes)
@@ -408,83 +882,92 @@ class OANDASignalEngine:
         
         atr = TechnicalAnalyzer.calculate_atr(highs, lows, closes)
         
-        current_price = closes[-1]
-        
-        # Determine signals
-        rsi_signal = "overbought" if rsi > 70 else "oversold" if rsi < 30 else "neutral"
-        macd_trend = "bullish" if macd_line > macd_signal else "bearish"
-        bb_position = "above" if current_price > bb_upper else "below" if current_price < bb_lower else "middle"
-        bb_squeeze = (bb_upper - bb_lower) < np.std(closes[-20:]) * 1.5
-        
-        # MA trend
-        if ema_9 > ema_21 > ema_50:
-            ma_trend = "bullish"
-        elif ema_9 < ema_21 < ema_50:
-            ma_trend = "bearish"
-        else:
-            ma_trend = "neutral"
-        
-        # Volatility level
-        atr_percentile = np.percentile(closes[-50:] * 0.02, 70)  # Rough volatility measure
-        if atr > atr_percentile * 1.5:
-            volatility_level = "high"
-        elif atr < atr_percentile * 0.5:
-            volatility_level = "low"
-        else:
-            volatility_level = "medium"
-        
-        # Calculate overall technical score
-        score_components = []
-        
-        # RSI score
-        if 30 <= rsi <= 70:
-            score_components.append(0.7)
-        elif rsi < 30:
-            score_components.append(0.9)  # Oversold = potential buy
-        else:
-            score_components.append(0.9)  # Overbought = potential sell
-        
-        # MACD score
-        if abs(macd_histogram) > abs(macd_line) * 0.1:
-            score_components.append(0.8)
-        else:
-            score_components.append(0.5)
-        
-        # MA trend score
-        score_components.append(0.8 if ma_trend != "neutral" else 0.4)
-        
-        # Bollinger Bands score
-        if bb_position != "middle":
-            score_components.append(0.7)
-        else:
-            score_components.append(0.5)
-        
-        technical_score = np.mean(score_components)
-        
-        return TechnicalAnalysis(
+        return TechnicalAnalyzer.build_analysis(
+            current_price=closes[-1],
             rsi=rsi,
-            rsi_signal=rsi_signal,
             macd_line=macd_line,
             macd_signal=macd_signal,
             macd_histogram=macd_histogram,
-            macd_trend=macd_trend,
             bb_upper=bb_upper,
-            bb_lower=bb_lower,
             bb_middle=bb_middle,
-            bb_position=bb_position,
-            bb_squeeze=bb_squeeze,
+            bb_lower=bb_lower,
+            bb_std=np.std(closes[-20:]),
             ema_9=ema_9,
             ema_21=ema_21,
             ema_50=ema_50,
             sma_200=sma_200,
-            ma_trend=ma_trend,
             atr=atr,
-            volatility_level=volatility_level,
+            atr_percentile=np.percentile(closes[-50:] * 0.02, 70),  # Rough volatility measure
             volume_avg=np.mean(volumes[-20:]),
-            momentum=closes[-1] / closes[-5] - 1 if len(closes) >= 5 else 0,
-            technical_score=technical_score
+            momentum=closes[-1] / closes[-5] - 1 if len(closes) >= 5 else 0
         )
     
+    def _update_technical_analysis(self, instrument: str, granularity: Granularity, candles: Sequence[OANDACandle]) -> TechnicalAnalysis:
+        """
+        Calculate technical analysis from the streaming indicator state
+        
+        Only completed candles newer than the state's last bar are folded in;
+        the in-progress bar is previewed without being committed.
+        """
+        key = (instrument, granularity.value)
+        frame = CandleFrame.from_candles(candles)
+        completed = frame[frame.complete]
+        current = frame[-1] if len(frame) and not frame.complete[-1] else None
+        
+        state = self._indicator_states.get(key)
+        last_time = CandleFrame.timestamp_ns(state.last_time) if state and state.last_time else None
+        if (
+            last_time is None or not len(completed)
+            or not completed.times[0] <= last_time <= completed.times[-1]
+        ):
+            # No state yet, or the window no longer overlaps it - rebuild from the window
+            state = IncrementalIndicators()
+            self._indicator_states[key] = state
+            new_candles = completed
+        else:
+            new_candles = completed[completed.times > last_time]
+        
+        for candle in new_candles:
+            state.update(candle)
+        
+        return state.snapshot(current)
+    
+    def calculate_technical_analysis_batch(
+        self,
+        candles_by_instrument: Dict[str, Sequence[OANDACandle]],
+        bars: int = 200
+    ) -> Dict[str, TechnicalAnalysis]:
+        """
+        Calculate technical analysis for many instruments with the vectorized kernel
+        
+        Instruments are grouped by history length (capped at `bars`) so each group
+        runs as one (instruments x bars) matrix; instruments with fewer than 50
+        candles are skipped.
+        
+        Returns:
+            Mapping of instrument to TechnicalAnalysis
+        """
+        frames = {instrument: CandleFrame.from_candles(candles) for instrument, candles in candles_by_instrument.items()}
+        
+        groups: Dict[int, List[str]] = {}
+        for instrument, frame in frames.items():
+            if len(frame) >= 50:
+                groups.setdefault(min(len(frame), bars), []).append(instrument)
+        
+        results = {}
+        for n_bars, instruments in groups.items():
+            window = [frames[instrument][-n_bars:] for instrument in instruments]
+            fields = TechnicalAnalyzer.calculate_batch(
+                np.stack([f.closes for f in window]),
+                np.stack([f.highs for f in window]),
+                np.stack([f.lows for f in window]),
+                np.stack([f.volumes for f in window])
+            )
+            for row, instrument in enumerate(instruments):
+                results[instrument] = TechnicalAnalysis(**{name: values[row].item() for name, values in fields.items()})
+        
+        return results
+    
     def _analyze_market_context(self, current_price: OANDAPrice, technical: TechnicalAnalysis) -> MarketContext:
         """Analyze market context and session"""
         session, overlap = MarketSessionDetector.get_current_session(datetime.utcnow())
@@ -642,13 +1125,14 @@ class OANDASignalEngine:
             reasoning = f"Segnale basato su analisi tecnica: {signal_type.value}"
             return fallback_analysis, reasoning
     
-    async def generate_signal(self, instrument: str, timeframe: str = "H1") -> Optional[TradingSignal]:
+    async def generate_signal(self, instrument: str, timeframe: str = "H1", current_price: Optional[OANDAPrice] = None) -> Optional[TradingSignal]:
         """
         Generate trading signal for instrument
         
         Args:
             instrument: Instrument name (e.g., "EUR_USD")
             timeframe: Timeframe (H1, H4, D1)
+            current_price: Prefetched price for the instrument (optional)
             
         Returns:
             TradingSignal or None if generation fails
@@ -657,9 +1141,7 @@ class OANDASignalEngine:
             logger.info(f"Generating signal for {instrument} on {timeframe}")
             
             # Auto-initialize client if needed
-            if not self.oanda_client:
-                self.oanda_client = create_oanda_client(self.api_key, self.account_id, self.environment)
-                await self.oanda_client.__aenter__()
+            await self._ensure_client()
             
             # Normalize instrument name
             instrument = self.oanda_client.normalize_instrument(instrument)
@@ -671,14 +1153,14 @@ class OANDASignalEngine:
             elif timeframe == "D1":
                 granularity = Granularity.D
             
-            candles, current_price = await self._get_market_data(instrument, granularity)
+            candles, current_price = await self._get_market_data(instrument, granularity, current_price=current_price)
             
             if len(candles) < 50:
                 logger.warning(f"Insufficient data for {instrument} - only {len(candles)} candles")
                 return None
             
             # Perform technical analysis
-            technical = self._calculate_technical_analysis(candles)
+            technical = self._update_technical_analysis(instrument, granularity, candles)
             
             # Analyze market context
             market = self._analyze_market_context(current_price, technical)
@@ -771,7 +1253,72 @@ class OANDASignalEngine:
             logger.error(f"Signal generation failed for {instrument}: {e}")
             return None
     
-    async def generate_signals_batch(self, instruments: List[str], timeframe: str = "H1", min_confidence: float = 0.0) -> List[TradingSignal]:
+    async def iter_signals_batch(
+        self,
+        instruments: List[str],
+        timeframe: str = "H1",
+        max_concurrency: Optional[int] = None,
+        instrument_timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Optional[TradingSignal]]]:
+        """
+        Generate signals for multiple instruments concurrently
+        
+        At most ``max_concurrency`` instruments are analysed at the same time;
+        every request still goes through ``OANDAClient._rate_limit``. Results
+        are yielded in completion order, not input order. Current prices for
+        the whole sweep are fetched up front with one /pricing request.
+        
+        Args:
+            instruments: List of instrument names
+            timeframe: Timeframe (H1, H4, D1)
+            max_concurrency: In-flight instrument limit (defaults to batch_concurrency)
+            instrument_timeout: Seconds allowed per instrument, None or 0 disables it
+                (defaults to batch_instrument_timeout)
+            
+        Yields:
+            (instrument, TradingSignal or None) as each instrument finishes
+        """
+        client = await self._ensure_client()
+        
+        prices = await self._prefetch_prices([client.normalize_instrument(i) for i in instruments])
+        
+        limit = max(1, max_concurrency or self.batch_concurrency)
+        timeout = self.batch_instrument_timeout if instrument_timeout is None else instrument_timeout
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def _generate(instrument: str) -> Tuple[str, Optional[TradingSignal]]:
+            async with semaphore:
+                try:
+                    current_price = prices.get(client.normalize_instrument(instrument))
+                    signal = await asyncio.wait_for(
+                        self.generate_signal(instrument, timeframe, current_price=current_price),
+                        timeout or None
+                    )
+                    return instrument, signal
+                except asyncio.TimeoutError:
+                    logger.warning(f"Signal generation for {instrument} timed out after {timeout:.1f}s")
+                except Exception as e:
+                    logger.error(f"Failed to generate signal for {instrument}: {e}")
+                return instrument, None
+        
+        tasks = [asyncio.create_task(_generate(instrument)) for instrument in instruments]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Consumer stopped early or was cancelled - don't leave work running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def generate_signals_batch(
+        self,
+        instruments: List[str],
+        timeframe: str = "H1",
+        min_confidence: float = 0.0,
+        max_concurrency: Optional[int] = None,
+        instrument_timeout: Optional[float] = None
+    ) -> List[TradingSignal]:
         """
         Generate signals for multiple instruments
         
@@ -779,39 +1326,30 @@ class OANDASignalEngine:
             instruments: List of instrument names
             timeframe: Timeframe (H1, H4, D1)
             min_confidence: Minimum confidence threshold (0-100 scale)
+            max_concurrency: In-flight instrument limit (defaults to batch_concurrency)
+            instrument_timeout: Seconds allowed per instrument (defaults to batch_instrument_timeout)
             
         Returns:
-            List of TradingSignal objects that meet the confidence threshold
+            List of TradingSignal objects that meet the confidence threshold, in input order
         """
-        signals = []
-        
-        # Auto-initialize client if needed
-        if not self.oanda_client:
-            self.oanda_client = create_oanda_client(self.api_key, self.account_id, self.environment)
-            await self.oanda_client.__aenter__()
-        
         # Convert min_confidence from percentage (0-100) to decimal (0-1) if needed
         confidence_threshold = min_confidence / 100.0 if min_confidence > 1.0 else min_confidence
         
-        for instrument in instruments:
-            try:
-                signal = await self.generate_signal(instrument, timeframe)
-                if signal:
-                    # Apply confidence filtering
-                    if signal.confidence_score >= confidence_threshold:
-                        signals.append(signal)
-                        logger.info(f"Signal for {instrument} passed confidence filter: {signal.confidence_score:.1%} >= {confidence_threshold:.1%}")
-                    else:
-                        logger.info(f"Signal for {instrument} filtered out: {signal.confidence_score:.1%} < {confidence_threshold:.1%}")
-                    
-                # Small delay to respect rate limits
-                await asyncio.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Failed to generate signal for {instrument}: {e}")
+        results: Dict[str, TradingSignal] = {}
+        async for instrument, signal in self.iter_signals_batch(
+            instruments, timeframe, max_concurrency=max_concurrency, instrument_timeout=instrument_timeout
+        ):
+            if not signal:
                 continue
+            
+            # Apply confidence filtering
+            if signal.confidence_score >= confidence_threshold:
+                results[instrument] = signal
+                logger.info(f"Signal for {instrument} passed confidence filter: {signal.confidence_score:.1%} >= {confidence_threshold:.1%}")
+            else:
+                logger.info(f"Signal for {instrument} filtered out: {signal.confidence_score:.1%} < {confidence_threshold:.1%}")
         
-        return signals
+        return [results[instrument] for instrument in instruments if instrument in results]
 
 # Factory function
 async def create_signal_engine(api_key: str, account_id: str, environment: str = "practice", gemini_api_key: Optional[str] = None) -> OANDASignalEngine:
@@ -37,6 +37,7 @@ from .signal_intelligence.rolling_signal import get_rolling_generator, RollingSi
 from .regime_detection.policy import get_policy_manager
 from .risk_management.adaptive_sizing import get_risk_manager
 from .reporting.metrics_engine import get_metrics_engine
+from .storage.sqlite_pool import close_sqlite_stores, get_sqlite_metrics
 
 # Import sistema esistente per integration
 import sys
@@ -618,6 +619,9 @@ class QuantAdaptiveOrchestrator:
         """Cleanup delle risorse"""
         try:
             # Close any open connections, files, etc.
+            if self.outcome_tracker:
+                await self.outcome_tracker.close()  # Scrive le scritture write-behind in coda
+            await close_sqlite_stores()
             logger.info("🧹 Cleanup risorse completato")
         except Exception as e:
             logger.error(f"Errore nel cleanup risorse: {e}")
@@ -687,7 +691,8 @@ class QuantAdaptiveOrchestrator:
                 "regime_detection": self.health_status.regime_detection_health,
                 "risk_management": self.health_status.risk_management_health,
                 "reporting": self.health_status.reporting_health
-            }
+            },
+            "storage": get_sqlite_metrics()
         }
     
     async def pause_system(self):
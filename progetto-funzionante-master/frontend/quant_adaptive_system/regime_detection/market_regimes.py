@@ -28,9 +28,9 @@ from enum import Enum
 import numpy as np
 import pandas as pd
 import sqlite3
-import aiosqlite
 
 # Import modules del sistema quant
+from ..storage.sqlite_pool import SQLiteStore, get_sqlite_store
 from ..data_ingestion.market_context import MarketContext
 from ..data_ingestion.futures_volmap import VolumeProfile
 
@@ -88,6 +88,11 @@ class MarketRegimeDetector:
             "trend_strength_periods": 10
         }
         
+    @property
+    def store(self) -> SQLiteStore:
+        """Store condiviso del database delle detection di regime"""
+        return get_sqlite_store(self.db_path)
+    
     async def initialize(self):
         """Inizializza il detector"""
         try:
@@ -626,51 +631,45 @@ class MarketRegimeDetector:
     
     async def _create_database_tables(self):
         """Crea tabelle del database"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS regime_detections (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    regime_type TEXT NOT NULL,
-                    confidence REAL NOT NULL,
-                    detected_at TEXT NOT NULL,
-                    key_factors TEXT,
-                    market_conditions TEXT,
-                    volatility_score REAL,
-                    trend_strength REAL,
-                    mean_reversion_score REAL,
-                    gamma_impact_score REAL,
-                    volume_profile_score REAL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            await db.commit()
-    
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS regime_detections (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                regime_type TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                detected_at TEXT NOT NULL,
+                key_factors TEXT,
+                market_conditions TEXT,
+                volatility_score REAL,
+                trend_strength REAL,
+                mean_reversion_score REAL,
+                gamma_impact_score REAL,
+                volume_profile_score REAL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
     async def _store_regime_detection(self, regime_data: RegimeData):
         """Memorizza detection nel database"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO regime_detections
-                    (regime_type, confidence, detected_at, key_factors, market_conditions,
-                     volatility_score, trend_strength, mean_reversion_score, 
-                     gamma_impact_score, volume_profile_score)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    regime_data.regime_type.value,
-                    regime_data.confidence,
-                    regime_data.detected_at.isoformat(),
-                    json.dumps(regime_data.key_factors),
-                    json.dumps(regime_data.market_conditions),
-                    regime_data.volatility_score,
-                    regime_data.trend_strength,
-                    regime_data.mean_reversion_score,
-                    regime_data.gamma_impact_score,
-                    regime_data.volume_profile_score
-                ))
-                
-                await db.commit()
-                
+            await self.store.execute("""
+                INSERT INTO regime_detections
+                (regime_type, confidence, detected_at, key_factors, market_conditions,
+                 volatility_score, trend_strength, mean_reversion_score, 
+                 gamma_impact_score, volume_profile_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                regime_data.regime_type.value,
+                regime_data.confidence,
+                regime_data.detected_at.isoformat(),
+                json.dumps(regime_data.key_factors),
+                json.dumps(regime_data.market_conditions),
+                regime_data.volatility_score,
+                regime_data.trend_strength,
+                regime_data.mean_reversion_score,
+                regime_data.gamma_impact_score,
+                regime_data.volume_profile_score
+            ))
+            
         except Exception as e:
             logger.error(f"Errore nel salvataggio regime detection: {e}")
     
@@ -694,43 +693,40 @@ class MarketRegimeDetector:
     async def _load_historical_data(self):
         """Carica dati storici per pattern recognition"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT regime_type, confidence, detected_at, key_factors, 
-                           volatility_score, trend_strength, mean_reversion_score
-                    FROM regime_detections
-                    WHERE detected_at >= datetime('now', '-7 days')
-                    ORDER BY detected_at DESC
-                    LIMIT 100
-                """)
-                
-                results = await cursor.fetchall()
+            results = await self.store.fetchall("""
+                SELECT regime_type, confidence, detected_at, key_factors, 
+                       volatility_score, trend_strength, mean_reversion_score
+                FROM regime_detections
+                WHERE detected_at >= datetime('now', '-7 days')
+                ORDER BY detected_at DESC
+                LIMIT 100
+            """)
+            
+            for result in results:
+                regime_type, confidence, detected_at_str, key_factors_str, vol_score, trend_str, mr_score = result
                 
-                for result in results:
-                    regime_type, confidence, detected_at_str, key_factors_str, vol_score, trend_str, mr_score = result
+                try:
+                    detected_at = datetime.fromisoformat(detected_at_str)
+                    key_factors = json.loads(key_factors_str) if key_factors_str else []
                     
-                    try:
-                        detected_at = datetime.fromisoformat(detected_at_str)
-                        key_factors = json.loads(key_factors_str) if key_factors_str else []
-                        
-                        regime_data = RegimeData(
-                            regime_type=RegimeType(regime_type),
-                            confidence=confidence,
-                            detected_at=detected_at,
-                            key_factors=key_factors,
-                            market_conditions={},
-                            volatility_score=vol_score or 0,
-                            trend_strength=trend_str or 0,
-                            mean_reversion_score=mr_score or 0
-                        )
-                        
-                        self.historical_regimes.append(regime_data)
-                        
-                    except (ValueError, json.JSONDecodeError):
-                        continue
-                
-                logger.info(f"Caricati {len(self.historical_regimes)} regimi storici")
-                
+                    regime_data = RegimeData(
+                        regime_type=RegimeType(regime_type),
+                        confidence=confidence,
+                        detected_at=detected_at,
+                        key_factors=key_factors,
+                        market_conditions={},
+                        volatility_score=vol_score or 0,
+                        trend_strength=trend_str or 0,
+                        mean_reversion_score=mr_score or 0
+                    )
+                    
+                    self.historical_regimes.append(regime_data)
+                    
+                except (ValueError, json.JSONDecodeError):
+                    continue
+            
+            logger.info(f"Caricati {len(self.historical_regimes)} regimi storici")
+            
         except Exception as e:
             logger.error(f"Errore nel caricamento dati storici: {e}")
 
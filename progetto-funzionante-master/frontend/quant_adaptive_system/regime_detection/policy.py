@@ -26,9 +26,9 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 import sqlite3
-import aiosqlite
 
 # Import modules del sistema quant
+from ..storage.sqlite_pool import SQLiteStore, get_sqlite_store
 from ..data_ingestion.market_context import MarketContext, CBOEDataProvider
 from ..data_ingestion.futures_volmap import VolumeProfile, FuturesVolumeMapper
 from .market_regimes import MarketRegimeDetector, RegimeType, RegimeData
@@ -118,6 +118,11 @@ class PolicyManager:
         self.policy_performance = {}
         self.regime_transitions = []
         
+    @property
+    def store(self) -> SQLiteStore:
+        """Store condiviso del database delle policy"""
+        return get_sqlite_store(self.db_path)
+    
     async def initialize(self):
         """Inizializza il policy manager"""
         try:
@@ -200,35 +205,32 @@ class PolicyManager:
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days_back)
             
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT 
-                        policy_type,
-                        COUNT(*) as usage_count,
-                        AVG(performance_score) as avg_performance,
-                        AVG(win_rate) as avg_win_rate,
-                        AVG(avg_r_multiple) as avg_r_multiple,
-                        SUM(duration_minutes) as total_duration_minutes
-                    FROM policy_history
-                    WHERE started_at >= ?
-                    GROUP BY policy_type
-                    ORDER BY avg_performance DESC
-                """, (cutoff_date.isoformat(),))
-                
-                results = await cursor.fetchall()
-                
-                performance_summary = {}
-                for policy_type, count, perf, win_rate, r_mult, duration in results:
-                    performance_summary[policy_type] = {
-                        "usage_count": count,
-                        "avg_performance_score": round(perf or 0, 3),
-                        "avg_win_rate": round(win_rate or 0, 2),
-                        "avg_r_multiple": round(r_mult or 0, 3),
-                        "total_hours": round((duration or 0) / 60, 1)
-                    }
-                
-                return performance_summary
-                
+            results = await self.store.fetchall("""
+                SELECT 
+                    policy_type,
+                    COUNT(*) as usage_count,
+                    AVG(performance_score) as avg_performance,
+                    AVG(win_rate) as avg_win_rate,
+                    AVG(avg_r_multiple) as avg_r_multiple,
+                    SUM(duration_minutes) as total_duration_minutes
+                FROM policy_history
+                WHERE started_at >= ?
+                GROUP BY policy_type
+                ORDER BY avg_performance DESC
+            """, (cutoff_date.isoformat(),))
+            
+            performance_summary = {}
+            for policy_type, count, perf, win_rate, r_mult, duration in results:
+                performance_summary[policy_type] = {
+                    "usage_count": count,
+                    "avg_performance_score": round(perf or 0, 3),
+                    "avg_win_rate": round(win_rate or 0, 2),
+                    "avg_r_multiple": round(r_mult or 0, 3),
+                    "total_hours": round((duration or 0) / 60, 1)
+                }
+            
+            return performance_summary
+            
         except Exception as e:
             logger.error(f"Errore nel calcolo performance summary: {e}")
             return {}
@@ -390,36 +392,33 @@ class PolicyManager:
             # Get recent performance data
             policy_type = self.current_policy.policy_type.value
             
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT AVG(performance_score), AVG(win_rate), AVG(avg_r_multiple)
-                    FROM policy_history
-                    WHERE policy_type = ? 
-                    AND started_at >= datetime('now', '-7 days')
-                """, (policy_type,))
-                
-                result = await cursor.fetchone()
+            result = await self.store.fetchone("""
+                SELECT AVG(performance_score), AVG(win_rate), AVG(avg_r_multiple)
+                FROM policy_history
+                WHERE policy_type = ? 
+                AND started_at >= datetime('now', '-7 days')
+            """, (policy_type,))
+            
+            if result and result[0] is not None:
+                avg_perf, avg_win_rate, avg_r_mult = result
                 
-                if result and result[0] is not None:
-                    avg_perf, avg_win_rate, avg_r_mult = result
-                    
-                    # Adaptive adjustments - more forgiving
-                    if avg_perf < 0.2:  # Only adjust on very poor performance (was 0.3)
-                        self.current_policy.parameters.min_confidence += 0.02  # Smaller increase (was 0.05)
-                        self.current_policy.parameters.max_position_size *= 0.95  # Less penalty (was 0.9)
-                        
-                    elif avg_perf > 0.7:  # Good performance
-                        self.current_policy.parameters.max_position_size *= 1.05
-                        self.current_policy.parameters.max_concurrent_trades = min(
-                            self.current_policy.parameters.max_concurrent_trades + 1, 8
-                        )
-                    
-                    # Update policy state
-                    self.current_policy.performance_score = avg_perf
-                    self.current_policy.win_rate = avg_win_rate or 0
-                    self.current_policy.avg_r_multiple = avg_r_mult or 0
-                    self.current_policy.last_update = datetime.utcnow()
+                # Adaptive adjustments - more forgiving
+                if avg_perf < 0.2:  # Only adjust on very poor performance (was 0.3)
+                    self.current_policy.parameters.min_confidence += 0.02  # Smaller increase (was 0.05)
+                    self.current_policy.parameters.max_position_size *= 0.95  # Less penalty (was 0.9)
                     
+                elif avg_perf > 0.7:  # Good performance
+                    self.current_policy.parameters.max_position_size *= 1.05
+                    self.current_policy.parameters.max_concurrent_trades = min(
+                        self.current_policy.parameters.max_concurrent_trades + 1, 8
+                    )
+                
+                # Update policy state
+                self.current_policy.performance_score = avg_perf
+                self.current_policy.win_rate = avg_win_rate or 0
+                self.current_policy.avg_r_multiple = avg_r_mult or 0
+                self.current_policy.last_update = datetime.utcnow()
+                
         except Exception as e:
             logger.error(f"Errore nell'adattamento policy: {e}")
     
@@ -509,94 +508,85 @@ class PolicyManager:
     
     async def _create_database_tables(self):
         """Crea tabelle del database"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Policy history table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS policy_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    policy_type TEXT NOT NULL,
-                    started_at TEXT NOT NULL,
-                    ended_at TEXT,
-                    duration_minutes INTEGER,
-                    performance_score REAL,
-                    win_rate REAL,
-                    avg_r_multiple REAL,
-                    avg_holding_time REAL,
-                    usage_count INTEGER DEFAULT 0,
-                    regime_type TEXT,
-                    parameters_json TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Regime transitions table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS regime_transitions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    from_regime TEXT,
-                    to_regime TEXT,
-                    transition_time TEXT NOT NULL,
-                    confidence REAL,
-                    key_factors TEXT,
-                    policy_changed BOOLEAN DEFAULT 0,
-                    market_conditions TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            await db.commit()
-    
+        # Policy history table
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS policy_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                policy_type TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                ended_at TEXT,
+                duration_minutes INTEGER,
+                performance_score REAL,
+                win_rate REAL,
+                avg_r_multiple REAL,
+                avg_holding_time REAL,
+                usage_count INTEGER DEFAULT 0,
+                regime_type TEXT,
+                parameters_json TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Regime transitions table
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS regime_transitions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                from_regime TEXT,
+                to_regime TEXT,
+                transition_time TEXT NOT NULL,
+                confidence REAL,
+                key_factors TEXT,
+                policy_changed BOOLEAN DEFAULT 0,
+                market_conditions TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
     async def _load_policy_performance(self):
         """Carica performance storiche delle policy"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT 
-                        policy_type,
-                        AVG(performance_score) as avg_performance,
-                        AVG(win_rate) as avg_win_rate,
-                        AVG(avg_r_multiple) as avg_r_multiple,
-                        COUNT(*) as usage_count
-                    FROM policy_history
-                    WHERE started_at >= datetime('now', '-30 days')
-                    GROUP BY policy_type
-                """)
-                
-                results = await cursor.fetchall()
-                
-                for policy_type, avg_perf, avg_win, avg_r, count in results:
-                    self.policy_performance[policy_type] = {
-                        'avg_performance': avg_perf or 0,
-                        'avg_win_rate': avg_win or 0,
-                        'avg_r_multiple': avg_r or 0,
-                        'usage_count': count or 0
-                    }
-                
+            results = await self.store.fetchall("""
+                SELECT 
+                    policy_type,
+                    AVG(performance_score) as avg_performance,
+                    AVG(win_rate) as avg_win_rate,
+                    AVG(avg_r_multiple) as avg_r_multiple,
+                    COUNT(*) as usage_count
+                FROM policy_history
+                WHERE started_at >= datetime('now', '-30 days')
+                GROUP BY policy_type
+            """)
+            
+            for policy_type, avg_perf, avg_win, avg_r, count in results:
+                self.policy_performance[policy_type] = {
+                    'avg_performance': avg_perf or 0,
+                    'avg_win_rate': avg_win or 0,
+                    'avg_r_multiple': avg_r or 0,
+                    'usage_count': count or 0
+                }
+            
         except Exception as e:
             logger.error(f"Errore nel caricamento performance policy: {e}")
     
     async def _log_policy_activation(self, policy: PolicyState):
         """Logga attivazione di una nuova policy"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO policy_history
-                    (policy_type, started_at, regime_type, parameters_json)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    policy.policy_type.value,
-                    policy.active_since.isoformat(),
-                    self.current_regime.regime_type.value if self.current_regime else "UNKNOWN",
-                    json.dumps({
-                        "max_position_size": policy.parameters.max_position_size,
-                        "risk_reward_min": policy.parameters.risk_reward_min,
-                        "min_confidence": policy.parameters.min_confidence,
-                        "confluence_required": policy.parameters.confluence_required
-                    })
-                ))
-                
-                await db.commit()
-                
+            await self.store.execute("""
+                INSERT INTO policy_history
+                (policy_type, started_at, regime_type, parameters_json)
+                VALUES (?, ?, ?, ?)
+            """, (
+                policy.policy_type.value,
+                policy.active_since.isoformat(),
+                self.current_regime.regime_type.value if self.current_regime else "UNKNOWN",
+                json.dumps({
+                    "max_position_size": policy.parameters.max_position_size,
+                    "risk_reward_min": policy.parameters.risk_reward_min,
+                    "min_confidence": policy.parameters.min_confidence,
+                    "confluence_required": policy.parameters.confluence_required
+                })
+            ))
+            
         except Exception as e:
             logger.error(f"Errore nel log policy activation: {e}")
     
@@ -605,23 +595,20 @@ class PolicyManager:
         try:
             from_regime = self.current_regime.regime_type.value if self.current_regime else "NONE"
             
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO regime_transitions
-                    (from_regime, to_regime, transition_time, confidence, key_factors, policy_changed, market_conditions)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    from_regime,
-                    new_regime.regime_type.value,
-                    new_regime.detected_at.isoformat(),
-                    new_regime.confidence,
-                    json.dumps(new_regime.key_factors),
-                    policy_changed,
-                    json.dumps(new_regime.market_conditions)
-                ))
-                
-                await db.commit()
-                
+            await self.store.execute("""
+                INSERT INTO regime_transitions
+                (from_regime, to_regime, transition_time, confidence, key_factors, policy_changed, market_conditions)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                from_regime,
+                new_regime.regime_type.value,
+                new_regime.detected_at.isoformat(),
+                new_regime.confidence,
+                json.dumps(new_regime.key_factors),
+                policy_changed,
+                json.dumps(new_regime.market_conditions)
+            ))
+            
         except Exception as e:
             logger.error(f"Errore nel log regime transition: {e}")
     
@@ -634,25 +621,22 @@ class PolicyManager:
             duration = datetime.utcnow() - self.current_policy.active_since
             duration_minutes = int(duration.total_seconds() / 60)
             
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    UPDATE policy_history 
-                    SET ended_at = ?, duration_minutes = ?, performance_score = ?, 
-                        win_rate = ?, avg_r_multiple = ?, usage_count = ?
-                    WHERE policy_type = ? AND started_at = ? AND ended_at IS NULL
-                """, (
-                    datetime.utcnow().isoformat(),
-                    duration_minutes,
-                    self.current_policy.performance_score,
-                    self.current_policy.win_rate,
-                    self.current_policy.avg_r_multiple,
-                    self.current_policy.usage_count,
-                    self.current_policy.policy_type.value,
-                    self.current_policy.active_since.isoformat()
-                ))
-                
-                await db.commit()
-                
+            await self.store.execute("""
+                UPDATE policy_history 
+                SET ended_at = ?, duration_minutes = ?, performance_score = ?, 
+                    win_rate = ?, avg_r_multiple = ?, usage_count = ?
+                WHERE policy_type = ? AND started_at = ? AND ended_at IS NULL
+            """, (
+                datetime.utcnow().isoformat(),
+                duration_minutes,
+                self.current_policy.performance_score,
+                self.current_policy.win_rate,
+                self.current_policy.avg_r_multiple,
+                self.current_policy.usage_count,
+                self.current_policy.policy_type.value,
+                self.current_policy.active_since.isoformat()
+            ))
+            
         except Exception as e:
             logger.error(f"Errore nella finalizzazione policy: {e}")
 
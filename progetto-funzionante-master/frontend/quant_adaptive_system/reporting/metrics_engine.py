@@ -25,25 +25,29 @@ import asyncio
 import logging
 import json
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import List, Dict, Optional, Any, Tuple
 from enum import Enum
 import numpy as np
 import pandas as pd
 from pathlib import Path
 import sqlite3
-import aiosqlite
 import math
-from statistics import mean, stdev
 
 # Import modules del sistema quant
+from ..storage.sqlite_pool import SQLiteStore, get_sqlite_store
 from ..signal_intelligence.signal_outcomes import get_outcome_tracker
+from .performance_aggregator import PerformanceAccumulator, CLOSED_OUTCOMES
 from ..risk_management.adaptive_sizing import get_risk_manager
 from ..regime_detection.policy import get_policy_manager
 from ..data_ingestion.market_context import CBOEDataProvider
 
 logger = logging.getLogger(__name__)
 
+# Orizzonti di holding per il breakdown per timeframe: i segnali sono multi-timeframe
+# (M1-M30), quindi i trade vengono raggruppati per durata effettiva
+TIMEFRAME_BUCKETS = [(60, "<1H"), (240, "1-4H"), (1440, "4-24H"), (math.inf, ">24H")]
+
 class MetricCategory(Enum):
     """Categorie di metriche"""
     PERFORMANCE = "PERFORMANCE"
@@ -256,6 +260,11 @@ class MetricsEngine:
         self._cached_reports = {}
         self._cache_validity_minutes = 15
         
+    @property
+    def store(self) -> SQLiteStore:
+        """Store condiviso del database dei report"""
+        return get_sqlite_store(self.db_path)
+    
     async def initialize(self):
         """Inizializza il metrics engine"""
         try:
@@ -306,9 +315,8 @@ class MetricsEngine:
             timeframe_performance = {}
             
             if include_breakdowns:
-                regime_performance = await self._calculate_regime_breakdown(start_date, end_date)
-                instrument_performance = await self._calculate_instrument_breakdown(start_date, end_date)
-                timeframe_performance = await self._calculate_timeframe_breakdown(start_date, end_date)
+                regime_performance, instrument_performance, timeframe_performance = \
+                    await self._calculate_breakdowns(start_date, end_date)
             
             # Generate alerts and insights
             alerts = await self._generate_alerts(performance_metrics, risk_metrics)
@@ -348,178 +356,122 @@ class MetricsEngine:
             return self._get_empty_report(start_date if 'start_date' in locals() else datetime.utcnow())
     
     async def _calculate_performance_metrics(self, start_date: datetime, end_date: datetime) -> PerformanceMetrics:
-        """Calcola metriche di performance complete"""
+        """Calcola metriche di performance complete (dai rollup giornalieri)"""
         try:
-            # Get trade data
-            async with aiosqlite.connect(self.outcome_tracker.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT 
-                        s.signal_id,
-                        s.instrument,
-                        s.timestamp,
-                        o.outcome,
-                        o.r_multiple,
-                        o.holding_time_minutes,
-                        o.exit_price,
-                        s.entry_price,
-                        s.risk_reward_ratio
-                    FROM signal_snapshots s
-                    JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    WHERE s.timestamp BETWEEN ? AND ?
-                    AND o.r_multiple IS NOT NULL
-                    AND o.outcome IN ('TP_HIT', 'SL_HIT', 'MANUAL_EXIT', 'TIMEOUT')
-                    ORDER BY s.timestamp
-                """, (start_date.isoformat(), end_date.isoformat()))
-                
-                trades = await cursor.fetchall()
+            # Giorni interi dai rollup, solo i due giorni parziali agli estremi dai trade
+            await self.outcome_tracker.sync_pending()
+            stats = await self.outcome_tracker.rollups.window(start_date, end_date)
             
-            if not trades:
+            if not stats.trades:
                 return PerformanceMetrics()
             
-            # Extract data
-            r_multiples = [trade[4] for trade in trades]
-            holding_times = [trade[5] or 0 for trade in trades]
-            outcomes = [trade[3] for trade in trades]
-            
-            # Basic metrics
-            total_trades = len(trades)
-            winning_trades = len([r for r in r_multiples if r > 0])
-            losing_trades = total_trades - winning_trades
-            win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-            
-            # Returns
-            total_return = sum(r_multiples)
-            avg_trade_return = total_return / total_trades if total_trades > 0 else 0
-            
-            # Calculate annualized return (approximate)
-            days_period = (end_date - start_date).days
-            if days_period > 0:
-                annualized_return = (1 + total_return) ** (365 / days_period) - 1
-            else:
-                annualized_return = 0
-            
-            # Risk-adjusted metrics
-            if len(r_multiples) > 1:
-                returns_std = stdev(r_multiples)
-                sharpe_ratio = mean(r_multiples) / returns_std if returns_std > 0 else 0
-                
-                # Sortino ratio (downside deviation)
-                negative_returns = [r for r in r_multiples if r < 0]
-                if negative_returns:
-                    downside_std = stdev(negative_returns)
-                    sortino_ratio = mean(r_multiples) / downside_std if downside_std > 0 else 0
-                else:
-                    sortino_ratio = sharpe_ratio
-            else:
-                sharpe_ratio = 0
-                sortino_ratio = 0
-            
-            # Drawdown analysis
-            cumulative_returns = np.cumsum(r_multiples)
-            running_max = np.maximum.accumulate(cumulative_returns)
-            drawdowns = (cumulative_returns - running_max)
-            
-            max_drawdown = abs(min(drawdowns)) if len(drawdowns) > 0 else 0
-            current_drawdown = abs(drawdowns[-1]) if len(drawdowns) > 0 else 0
-            
-            # Calmar ratio
-            calmar_ratio = annualized_return / max_drawdown if max_drawdown > 0 else 0
-            
-            # Trade analysis
-            winning_returns = [r for r in r_multiples if r > 0]
-            losing_returns = [r for r in r_multiples if r < 0]
-            
-            avg_winning_trade = mean(winning_returns) if winning_returns else 0
-            avg_losing_trade = mean(losing_returns) if losing_returns else 0
-            largest_win = max(r_multiples) if r_multiples else 0
-            largest_loss = min(r_multiples) if r_multiples else 0
-            
-            # Profit factor
-            gross_profit = sum(winning_returns) if winning_returns else 0
-            gross_loss = abs(sum(losing_returns)) if losing_returns else 0.001  # Avoid division by zero
-            profit_factor = gross_profit / gross_loss
-            
-            # R-multiple analysis
-            avg_r_multiple = mean(r_multiples) if r_multiples else 0
-            r_multiple_std = stdev(r_multiples) if len(r_multiples) > 1 else 0
-            expectancy = avg_r_multiple * win_rate / 100 if win_rate > 0 else 0
-            
-            # Time analysis
-            avg_holding_time_hours = mean(holding_times) / 60 if holding_times else 0
-            trades_per_day = total_trades / max(1, days_period)
-            
-            # Consecutive analysis
-            consecutive_wins = self._calculate_max_consecutive(r_multiples, positive=True)
-            consecutive_losses = self._calculate_max_consecutive(r_multiples, positive=False)
-            
-            # Kelly criterion
-            if avg_losing_trade < 0 and winning_trades > 0 and losing_trades > 0:
-                win_prob = win_rate / 100
-                lose_prob = 1 - win_prob
-                avg_win_loss_ratio = abs(avg_winning_trade / avg_losing_trade)
-                kelly_criterion = (win_prob * avg_win_loss_ratio - lose_prob) / avg_win_loss_ratio
-                kelly_criterion = max(0, min(0.25, kelly_criterion))  # Cap at 25%
-            else:
-                kelly_criterion = 0
-            
-            # VaR calculation
-            if len(r_multiples) >= 20:  # Need sufficient data
-                var_95 = np.percentile(r_multiples, 5)  # 5th percentile
-                cvar_95 = mean([r for r in r_multiples if r <= var_95]) if var_95 < 0 else 0
-            else:
-                var_95 = 0
-                cvar_95 = 0
-            
-            return PerformanceMetrics(
-                total_trades=total_trades,
-                winning_trades=winning_trades,
-                losing_trades=losing_trades,
-                win_rate=round(win_rate, 2),
-                total_return=round(total_return, 4),
-                annualized_return=round(annualized_return, 4),
-                avg_trade_return=round(avg_trade_return, 4),
-                sharpe_ratio=round(sharpe_ratio, 3),
-                sortino_ratio=round(sortino_ratio, 3),
-                calmar_ratio=round(calmar_ratio, 3),
-                max_drawdown=round(max_drawdown, 4),
-                current_drawdown=round(current_drawdown, 4),
-                avg_winning_trade=round(avg_winning_trade, 4),
-                avg_losing_trade=round(avg_losing_trade, 4),
-                largest_win=round(largest_win, 4),
-                largest_loss=round(largest_loss, 4),
-                profit_factor=round(profit_factor, 3),
-                avg_r_multiple=round(avg_r_multiple, 4),
-                r_multiple_std=round(r_multiple_std, 4),
-                expectancy=round(expectancy, 4),
-                avg_holding_time_hours=round(avg_holding_time_hours, 2),
-                trades_per_day=round(trades_per_day, 2),
-                consecutive_wins=consecutive_wins,
-                consecutive_losses=consecutive_losses,
-                kelly_criterion=round(kelly_criterion, 4),
-                var_95=round(var_95, 4),
-                cvar_95=round(cvar_95, 4)
-            )
+            return self._performance_from_stats(stats, (end_date - start_date).days)
             
         except Exception as e:
             logger.error(f"Errore nel calcolo performance metrics: {e}")
             return PerformanceMetrics()
     
-    def _calculate_max_consecutive(self, returns: List[float], positive: bool = True) -> int:
-        """Calcola massime vittorie/perdite consecutive"""
-        if not returns:
-            return 0
+    def _performance_from_stats(self, stats: PerformanceAccumulator, days_period: int) -> PerformanceMetrics:
+        """Deriva le metriche di performance dallo stato aggregato dei trade chiusi"""
+        # Basic metrics
+        total_trades = stats.trades
+        winning_trades = stats.wins
+        losing_trades = total_trades - winning_trades
+        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+        
+        # Returns
+        total_return = stats.total_r
+        avg_trade_return = total_return / total_trades if total_trades > 0 else 0
+        
+        # Calculate annualized return (approximate)
+        if days_period > 0:
+            # Una perdita oltre il 100% annualizza a -100%
+            annualized_return = max(0.0, 1 + total_return) ** (365 / days_period) - 1
+        else:
+            annualized_return = 0
+        
+        # Risk-adjusted metrics
+        returns_std = stats.r_std()
+        sharpe_ratio = stats.mean_r / returns_std if returns_std > 0 else 0
+        
+        # Sortino ratio (downside deviation)
+        if stats.negatives:
+            downside_std = stats.downside_std()
+            sortino_ratio = stats.mean_r / downside_std if downside_std > 0 else 0
+        else:
+            sortino_ratio = sharpe_ratio
         
-        max_consecutive = 0
-        current_consecutive = 0
+        # Drawdown analysis
+        max_drawdown = stats.max_drawdown
+        current_drawdown = stats.current_drawdown
         
-        for r in returns:
-            if (positive and r > 0) or (not positive and r <= 0):
-                current_consecutive += 1
-                max_consecutive = max(max_consecutive, current_consecutive)
-            else:
-                current_consecutive = 0
+        # Calmar ratio
+        calmar_ratio = annualized_return / max_drawdown if max_drawdown > 0 else 0
+        
+        # Trade analysis
+        avg_winning_trade = stats.win_total / stats.wins if stats.wins else 0
+        avg_losing_trade = stats.negative_total / stats.negatives if stats.negatives else 0
+        
+        # Profit factor
+        gross_profit = stats.win_total
+        gross_loss = abs(stats.negative_total) if stats.negatives else 0.001  # Avoid division by zero
+        profit_factor = gross_profit / gross_loss
+        
+        # R-multiple analysis
+        avg_r_multiple = stats.mean_r
+        expectancy = avg_r_multiple * win_rate / 100 if win_rate > 0 else 0
+        
+        # Time analysis
+        avg_holding_time_hours = stats.holding_minutes / total_trades / 60
+        trades_per_day = total_trades / max(1, days_period)
+        
+        # Kelly criterion
+        if avg_losing_trade < 0 and winning_trades > 0 and losing_trades > 0:
+            win_prob = win_rate / 100
+            lose_prob = 1 - win_prob
+            avg_win_loss_ratio = abs(avg_winning_trade / avg_losing_trade)
+            kelly_criterion = (win_prob * avg_win_loss_ratio - lose_prob) / avg_win_loss_ratio
+            kelly_criterion = max(0, min(0.25, kelly_criterion))  # Cap at 25%
+        else:
+            kelly_criterion = 0
+        
+        # VaR calculation (quantile sketch, errore entro SKETCH_BUCKET_R)
+        if total_trades >= 20:  # Need sufficient data
+            var_95 = stats.quantile(0.05)  # 5th percentile
+            cvar_95 = stats.tail_mean(0.05) if var_95 < 0 else 0
+        else:
+            var_95 = 0
+            cvar_95 = 0
         
-        return max_consecutive
+        return PerformanceMetrics(
+            total_trades=total_trades,
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            win_rate=round(win_rate, 2),
+            total_return=round(total_return, 4),
+            annualized_return=round(annualized_return, 4),
+            avg_trade_return=round(avg_trade_return, 4),
+            sharpe_ratio=round(sharpe_ratio, 3),
+            sortino_ratio=round(sortino_ratio, 3),
+            calmar_ratio=round(calmar_ratio, 3),
+            max_drawdown=round(max_drawdown, 4),
+            current_drawdown=round(current_drawdown, 4),
+            avg_winning_trade=round(avg_winning_trade, 4),
+            avg_losing_trade=round(avg_losing_trade, 4),
+            largest_win=round(stats.max_r, 4),
+            largest_loss=round(stats.min_r, 4),
+            profit_factor=round(profit_factor, 3),
+            avg_r_multiple=round(avg_r_multiple, 4),
+            r_multiple_std=round(returns_std, 4),
+            expectancy=round(expectancy, 4),
+            avg_holding_time_hours=round(avg_holding_time_hours, 2),
+            trades_per_day=round(trades_per_day, 2),
+            consecutive_wins=stats.max_win_streak,
+            consecutive_losses=stats.max_loss_streak,
+            kelly_criterion=round(kelly_criterion, 4),
+            var_95=round(var_95, 4),
+            cvar_95=round(cvar_95, 4)
+        )
     
     async def _calculate_risk_metrics(self, start_date: datetime, end_date: datetime) -> RiskMetrics:
         """Calcola metriche di rischio"""
@@ -573,38 +525,192 @@ class MetricsEngine:
             logger.error(f"Errore nel calcolo operational metrics: {e}")
             return OperationalMetrics()
     
-    async def _calculate_regime_breakdown(self, start_date: datetime, end_date: datetime) -> List[RegimePerformance]:
-        """Calcola breakdown performance per regime"""
+    async def _calculate_breakdowns(self, start_date: datetime, end_date: datetime) -> Tuple[
+            List[RegimePerformance], Dict[str, PerformanceMetrics], Dict[str, PerformanceMetrics]]:
+        """
+        Breakdown per regime, strumento e timeframe da un'unica lettura dei trade
+        e un'unica riduzione raggruppata (costo indipendente dal numero di gruppi)
+        """
         try:
-            regime_performance = await self.outcome_tracker.get_regime_performance()
-            
-            breakdown = []
-            for regime, stats in regime_performance.items():
-                breakdown.append(RegimePerformance(
+            trades = await self._fetch_closed_trades(start_date, end_date)
+            if trades.empty:
+                return [], {}, {}
+            
+            holding = trades["holding_time_minutes"].fillna(0)
+            regimes = trades["market_regime"]
+            breakdowns = self._grouped_performance(trades, {
+                "regime": regimes.where(regimes != ""),
+                "instrument": trades["instrument"],
+                "timeframe": pd.cut(
+                    holding,
+                    bins=[-math.inf] + [limit for limit, _ in TIMEFRAME_BUCKETS],
+                    labels=[label for _, label in TIMEFRAME_BUCKETS],
+                    right=False
+                ).astype(object)
+            }, (end_date - start_date).days)
+            
+            regime_performance = sorted((
+                RegimePerformance(
                     regime_name=regime,
-                    trades_count=stats.get("total_signals", 0),
-                    win_rate=stats.get("win_rate", 0),
-                    avg_return=stats.get("avg_r_multiple", 0),
-                    total_return=stats.get("avg_r_multiple", 0) * stats.get("total_signals", 0),
-                    sharpe_ratio=0.0,  # Would be calculated
-                    max_drawdown=0.0   # Would be calculated
-                ))
+                    trades_count=metrics.total_trades,
+                    win_rate=metrics.win_rate,
+                    avg_return=metrics.avg_trade_return,
+                    total_return=metrics.total_return,
+                    sharpe_ratio=metrics.sharpe_ratio,
+                    max_drawdown=metrics.max_drawdown,
+                    best_trade=metrics.largest_win,
+                    worst_trade=metrics.largest_loss
+                )
+                for regime, metrics in breakdowns.get("regime", {}).items()
+            ), key=lambda regime: regime.avg_return, reverse=True)
             
-            return breakdown
+            return regime_performance, breakdowns.get("instrument", {}), breakdowns.get("timeframe", {})
             
         except Exception as e:
-            logger.error(f"Errore nel calcolo regime breakdown: {e}")
-            return []
-    
-    async def _calculate_instrument_breakdown(self, start_date: datetime, end_date: datetime) -> Dict[str, PerformanceMetrics]:
-        """Calcola breakdown per strumento"""
-        # Simplified implementation - would calculate per-instrument metrics
-        return {}
-    
-    async def _calculate_timeframe_breakdown(self, start_date: datetime, end_date: datetime) -> Dict[str, PerformanceMetrics]:
-        """Calcola breakdown per timeframe"""
-        # Simplified implementation - would calculate per-timeframe metrics
-        return {}
+            logger.error(f"Errore nel calcolo dei breakdown: {e}")
+            return [], {}, {}
+    
+    async def _fetch_closed_trades(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Trade chiusi della finestra, nell'ordine dei segnali"""
+        await self.outcome_tracker.sync_pending()
+        rows, columns = await self.outcome_tracker.store.fetch_with_columns(f"""
+            SELECT 
+                s.instrument,
+                s.market_regime,
+                o.r_multiple,
+                o.holding_time_minutes
+            FROM signal_snapshots s
+            JOIN signal_outcomes o ON s.signal_id = o.signal_id
+            WHERE s.timestamp BETWEEN ? AND ?
+            AND o.r_multiple IS NOT NULL
+            AND o.outcome IN ({", ".join("?" * len(CLOSED_OUTCOMES))})
+            ORDER BY s.timestamp, s.signal_id
+        """, (start_date.isoformat(), end_date.isoformat(), *CLOSED_OUTCOMES))
+        return pd.DataFrame(rows, columns=columns)
+    
+    def _grouped_performance(self, trades: pd.DataFrame, dimensions: Dict[str, pd.Series],
+                             days_period: int) -> Dict[str, Dict[str, PerformanceMetrics]]:
+        """
+        PerformanceMetrics per ogni gruppo di ogni dimensione con una sola groupby.
+        
+        Le dimensioni vengono impilate in un unico frame (dimension, group, trade)
+        nell'ordine dei segnali; drawdown e serie usano cumsum/cummax e run-length
+        raggruppati, VaR/CVaR il quantile esatto di ogni gruppo. Stesse formule di
+        _performance_from_stats. I trade con chiave nulla sono esclusi dalla dimensione.
+        """
+        keys = ["dimension", "group"]
+        stacked = pd.concat([
+            pd.DataFrame({
+                "dimension": name,
+                "group": groups.to_numpy(),
+                "order": np.arange(len(trades)),
+                "r": trades["r_multiple"].astype(float).to_numpy(),
+                "holding": trades["holding_time_minutes"].fillna(0).astype(float).to_numpy()
+            })
+            for name, groups in dimensions.items()
+        ], ignore_index=True)
+        stacked = stacked[stacked["group"].notna()]
+        if stacked.empty:
+            return {}
+        stacked = stacked.sort_values(["dimension", "group", "order"], kind="stable").reset_index(drop=True)
+        
+        r = stacked["r"]
+        stacked["win"] = r > 0
+        stacked["positive"] = r.where(r > 0)
+        stacked["negative"] = r.where(r < 0)
+        stacked["cumulative"] = stacked.groupby(keys, sort=False)["r"].cumsum()
+        stacked["drawdown"] = stacked["cumulative"] - stacked.groupby(keys, sort=False)["cumulative"].cummax()
+        
+        # VaR/CVaR: quantile al 5% di ogni gruppo e media dei trade sotto soglia
+        grouped = stacked.groupby(keys, sort=False)
+        var_95 = grouped["r"].quantile(0.05).rename("var_95")
+        threshold = stacked[keys].join(var_95, on=keys)["var_95"]
+        stacked["tail"] = r.where(r <= threshold)
+        
+        # Serie: un nuovo run inizia quando cambia gruppo o segno del trade
+        boundary = stacked[keys + ["win"]].ne(stacked[keys + ["win"]].shift()).any(axis=1)
+        runs = stacked.assign(run=boundary.cumsum()).groupby(["run"] + keys + ["win"], sort=False).size()
+        streaks = runs.groupby(level=keys + ["win"], sort=False).max().unstack("win", fill_value=0)
+        
+        grouped = stacked.groupby(keys, sort=False)
+        stats = grouped.agg(
+            total_trades=("r", "size"),
+            winning_trades=("win", "sum"),
+            total_return=("r", "sum"),
+            avg_r_multiple=("r", "mean"),
+            r_multiple_std=("r", "std"),
+            avg_winning_trade=("positive", "mean"),
+            avg_losing_trade=("negative", "mean"),
+            gross_profit=("positive", "sum"),
+            gross_loss=("negative", "sum"),
+            negatives=("negative", "count"),
+            downside_std=("negative", "std"),
+            largest_win=("r", "max"),
+            largest_loss=("r", "min"),
+            max_drawdown=("drawdown", "min"),
+            current_drawdown=("drawdown", "last"),
+            avg_holding=("holding", "mean"),
+            cvar_95=("tail", "mean")
+        ).join(var_95)
+        stats["consecutive_wins"] = streaks.get(True, 0)
+        stats["consecutive_losses"] = streaks.get(False, 0)
+        stats = stats.fillna({
+            "r_multiple_std": 0, "downside_std": 0, "avg_winning_trade": 0, "avg_losing_trade": 0,
+            "consecutive_wins": 0, "consecutive_losses": 0
+        })
+        
+        # Metriche derivate, vettoriali su tutti i gruppi
+        total = stats["total_trades"]
+        stats["losing_trades"] = total - stats["winning_trades"]
+        stats["win_rate"] = stats["winning_trades"] / total * 100
+        stats["avg_trade_return"] = stats["total_return"] / total
+        if days_period > 0:
+            stats["annualized_return"] = (1 + stats["total_return"]).clip(lower=0) ** (365 / days_period) - 1
+        else:
+            stats["annualized_return"] = 0.0
+        std = stats["r_multiple_std"]
+        stats["sharpe_ratio"] = np.where(std > 0, stats["avg_r_multiple"] / std.where(std > 0, 1), 0)
+        downside = stats["downside_std"]
+        stats["sortino_ratio"] = np.where(
+            stats["negatives"] > 0,
+            np.where(downside > 0, stats["avg_r_multiple"] / downside.where(downside > 0, 1), 0),
+            stats["sharpe_ratio"]
+        )
+        stats["max_drawdown"] = stats["max_drawdown"].abs()
+        stats["current_drawdown"] = stats["current_drawdown"].abs()
+        drawdown = stats["max_drawdown"]
+        stats["calmar_ratio"] = np.where(drawdown > 0, stats["annualized_return"] / drawdown.where(drawdown > 0, 1), 0)
+        stats["profit_factor"] = stats["gross_profit"] / np.where(stats["negatives"] > 0, stats["gross_loss"].abs(), 0.001)
+        stats["expectancy"] = stats["avg_r_multiple"] * stats["win_rate"] / 100
+        stats["avg_holding_time_hours"] = stats["avg_holding"] / 60
+        stats["trades_per_day"] = total / max(1, days_period)
+        
+        win_prob = stats["win_rate"] / 100
+        win_loss_ratio = (stats["avg_winning_trade"] / stats["avg_losing_trade"].where(stats["avg_losing_trade"] < 0)).abs()
+        kelly = ((win_prob * win_loss_ratio - (1 - win_prob)) / win_loss_ratio).clip(0, 0.25)
+        kelly_valid = (stats["avg_losing_trade"] < 0) & (stats["winning_trades"] > 0) & (stats["losing_trades"] > 0)
+        stats["kelly_criterion"] = kelly.where(kelly_valid, 0)
+        
+        enough_data = total >= 20  # Need sufficient data
+        stats["var_95"] = stats["var_95"].where(enough_data, 0)
+        stats["cvar_95"] = stats["cvar_95"].where(enough_data & (stats["var_95"] < 0), 0)
+        
+        decimals = {
+            "win_rate": 2, "sharpe_ratio": 3, "sortino_ratio": 3, "calmar_ratio": 3,
+            "profit_factor": 3, "avg_holding_time_hours": 2, "trades_per_day": 2
+        }
+        metric_fields = [f.name for f in fields(PerformanceMetrics) if f.name in stats.columns]
+        breakdowns: Dict[str, Dict[str, PerformanceMetrics]] = {}
+        for (dimension, group), row in stats[metric_fields].iterrows():
+            values = {}
+            for name in metric_fields:
+                if name in ("total_trades", "winning_trades", "losing_trades",
+                            "consecutive_wins", "consecutive_losses"):
+                    values[name] = int(row[name])
+                else:
+                    values[name] = round(float(row[name]), decimals.get(name, 4))
+            breakdowns.setdefault(dimension, {})[str(group)] = PerformanceMetrics(**values)
+        return breakdowns
     
     async def _generate_alerts(self, performance: PerformanceMetrics, risk: RiskMetrics) -> List[Dict[str, Any]]:
         """Genera alerts basati su soglie"""
@@ -741,70 +847,67 @@ class MetricsEngine:
     
     async def _create_database_tables(self):
         """Crea tabelle del database"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS comprehensive_reports (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    report_id TEXT UNIQUE NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    period_start TEXT NOT NULL,
-                    period_end TEXT NOT NULL,
-                    report_data TEXT NOT NULL,
-                    calculation_time_ms REAL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS metric_alerts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    alert_level TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    action_required BOOLEAN DEFAULT 0,
-                    resolved BOOLEAN DEFAULT 0,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            await db.commit()
-    
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS comprehensive_reports (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                report_id TEXT UNIQUE NOT NULL,
+                timestamp TEXT NOT NULL,
+                period_start TEXT NOT NULL,
+                period_end TEXT NOT NULL,
+                report_data TEXT NOT NULL,
+                calculation_time_ms REAL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS metric_alerts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                alert_level TEXT NOT NULL,
+                category TEXT NOT NULL,
+                title TEXT NOT NULL,
+                message TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                action_required BOOLEAN DEFAULT 0,
+                resolved BOOLEAN DEFAULT 0,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
     async def _store_report(self, report: ComprehensiveReport):
         """Memorizza report nel database"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO comprehensive_reports
-                    (report_id, timestamp, period_start, period_end, report_data, calculation_time_ms)
+            statements = [("""
+                INSERT OR REPLACE INTO comprehensive_reports
+                (report_id, timestamp, period_start, period_end, report_data, calculation_time_ms)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                report.report_id,
+                report.timestamp.isoformat(),
+                report.period_start.isoformat(),
+                report.period_end.isoformat(),
+                json.dumps(asdict(report), default=str),
+                report.calculation_time_ms
+            ))]
+            
+            # Store alerts
+            for alert in report.alerts:
+                statements.append(("""
+                    INSERT INTO metric_alerts
+                    (alert_level, category, title, message, timestamp, action_required)
                     VALUES (?, ?, ?, ?, ?, ?)
                 """, (
-                    report.report_id,
-                    report.timestamp.isoformat(),
-                    report.period_start.isoformat(),
-                    report.period_end.isoformat(),
-                    json.dumps(asdict(report), default=str),
-                    report.calculation_time_ms
-                ))
-                
-                # Store alerts
-                for alert in report.alerts:
-                    await db.execute("""
-                        INSERT INTO metric_alerts
-                        (alert_level, category, title, message, timestamp, action_required)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        alert["level"],
-                        alert["category"],
-                        alert["title"],
-                        alert["message"],
-                        alert["timestamp"],
-                        alert["action_required"]
-                    ))
-                
-                await db.commit()
-                
+                    alert["level"],
+                    alert["category"],
+                    alert["title"],
+                    alert["message"],
+                    alert["timestamp"],
+                    alert["action_required"]
+                )))
+            
+            # Report e alert nello stesso job atomico
+            await self.store.write(statements)
+            
         except Exception as e:
             logger.error(f"Errore nel salvataggio report: {e}")
     
@@ -0,0 +1,463 @@
+"""
+Incremental Performance Aggregator
+
+Aggregazione incrementale delle performance dei segnali per il reporting:
+invece di rileggere ogni trade della finestra a ogni report, lo stato
+aggregato (momenti, equity curve, serie, distribuzione degli R) viene
+aggiornato trade per trade e salvato in rollup giornalieri.
+
+Features:
+- PerformanceAccumulator: stato aggiornabile per trade e fondibile tra bucket
+  consecutivi (momenti di Welford/Chan, drawdown, serie vinte/perse)
+- Quantile sketch a bucket fissi sugli R-multiple per VaR/CVaR
+- Rollup giornalieri per strumento e di portafoglio su signal_outcomes.db
+- Finestre 30/90/365 giorni = fusione dei giorni interi + scansione dei soli
+  due giorni parziali agli estremi
+"""
+
+import logging
+import json
+import math
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field, fields, asdict
+from typing import List, Dict, Optional, Any, Tuple, Iterable
+from pathlib import Path
+
+from ..storage.sqlite_pool import SQLiteStore, get_sqlite_store
+
+logger = logging.getLogger(__name__)
+
+# Outcome che chiudono un trade (con r_multiple) ai fini delle metriche
+CLOSED_OUTCOMES = ("TP_HIT", "SL_HIT", "MANUAL_EXIT", "TIMEOUT")
+
+# Chiave dei rollup aggregati su tutti gli strumenti
+PORTFOLIO = "PORTFOLIO"
+
+# Ampiezza dei bucket dello sketch (in R): errore massimo sui quantili
+SKETCH_BUCKET_R = 0.01
+
+@dataclass
+class PerformanceAccumulator:
+    """
+    Stato aggregato di una sequenza di segnali, nell'ordine dei timestamp.
+
+    add_signal/add_trade lo aggiornano in O(1); merge accoda un bucket successivo
+    (es. il giorno dopo) ottenendo lo stesso stato della sequenza concatenata.
+    """
+    # Segnali registrati (anche ancora aperti)
+    signals: int = 0
+
+    # Trade chiusi: momenti degli R-multiple (Welford)
+    trades: int = 0
+    total_r: float = 0.0
+    mean_r: float = 0.0
+    m2_r: float = 0.0
+    max_r: Optional[float] = None
+    min_r: Optional[float] = None
+
+    # Vincenti (r > 0) e negativi (r < 0), con momenti per il Sortino
+    wins: int = 0
+    win_total: float = 0.0
+    negatives: int = 0
+    negative_total: float = 0.0
+    negative_mean: float = 0.0
+    negative_m2: float = 0.0
+
+    # Esiti per tipo di uscita (TP_HIT/MANUAL_EXIT vincenti, SL_HIT/MANUAL_EXIT perdenti)
+    exit_wins: int = 0
+    exit_losses: int = 0
+
+    # Tempi ed escursioni
+    holding_minutes: float = 0.0
+    mae_total: float = 0.0
+    mfe_total: float = 0.0
+
+    # Equity curve (somma cumulata degli R dal primo trade del bucket)
+    peak: Optional[float] = None
+    trough: Optional[float] = None
+    max_drawdown: float = 0.0
+
+    # Serie: vittoria r > 0, perdita r <= 0 (testa, coda e massimo del bucket)
+    head_wins: int = 0
+    head_losses: int = 0
+    tail_wins: int = 0
+    tail_losses: int = 0
+    max_win_streak: int = 0
+    max_loss_streak: int = 0
+
+    # Quantile sketch: bucket floor(r / SKETCH_BUCKET_R) -> [count, somma degli r]
+    sketch: Dict[int, List[float]] = field(default_factory=dict)
+
+    def add_signal(self):
+        """Conta un segnale registrato"""
+        self.signals += 1
+
+    def add_trade(self, r_multiple: float, outcome: str = "",
+                  holding_minutes: Optional[float] = None,
+                  mae: Optional[float] = None, mfe: Optional[float] = None):
+        """Aggiorna lo stato con un trade chiuso (da chiamare nell'ordine dei segnali)"""
+        r = float(r_multiple)
+        self.trades += 1
+        self.total_r += r
+        delta = r - self.mean_r
+        self.mean_r += delta / self.trades
+        self.m2_r += delta * (r - self.mean_r)
+        self.max_r = r if self.max_r is None else max(self.max_r, r)
+        self.min_r = r if self.min_r is None else min(self.min_r, r)
+
+        if r > 0:
+            self.wins += 1
+            self.win_total += r
+        elif r < 0:
+            self.negatives += 1
+            self.negative_total += r
+            delta = r - self.negative_mean
+            self.negative_mean += delta / self.negatives
+            self.negative_m2 += delta * (r - self.negative_mean)
+
+        if outcome in ("TP_HIT", "MANUAL_EXIT") and r > 0:
+            self.exit_wins += 1
+        if outcome in ("SL_HIT", "MANUAL_EXIT") and r <= 0:
+            self.exit_losses += 1
+
+        self.holding_minutes += holding_minutes or 0
+        self.mae_total += mae or 0
+        self.mfe_total += mfe or 0
+
+        # Drawdown rispetto al massimo dell'equity curve
+        cumulative = self.total_r
+        self.peak = cumulative if self.peak is None else max(self.peak, cumulative)
+        self.trough = cumulative if self.trough is None else min(self.trough, cumulative)
+        self.max_drawdown = max(self.max_drawdown, self.peak - cumulative)
+
+        # Serie consecutive
+        if r > 0:
+            if self.head_wins == self.trades - 1:
+                self.head_wins = self.trades
+            self.tail_wins += 1
+            self.tail_losses = 0
+            self.max_win_streak = max(self.max_win_streak, self.tail_wins)
+        else:
+            if self.head_losses == self.trades - 1:
+                self.head_losses = self.trades
+            self.tail_losses += 1
+            self.tail_wins = 0
+            self.max_loss_streak = max(self.max_loss_streak, self.tail_losses)
+
+        bucket = self.sketch.setdefault(math.floor(r / SKETCH_BUCKET_R), [0, 0.0])
+        bucket[0] += 1
+        bucket[1] += r
+
+    def merge(self, other: "PerformanceAccumulator") -> "PerformanceAccumulator":
+        """Accoda il bucket successivo other a questo (in place) e restituisce self"""
+        if not other.trades:
+            self.signals += other.signals
+            return self
+        if not self.trades:
+            signals = self.signals + other.signals
+            self.__dict__.update(PerformanceAccumulator.from_dict(other.to_dict()).__dict__)
+            self.signals = signals
+            return self
+
+        trades = self.trades + other.trades
+
+        # Momenti (Chan et al.)
+        delta = other.mean_r - self.mean_r
+        self.m2_r += other.m2_r + delta * delta * self.trades * other.trades / trades
+        self.mean_r += delta * other.trades / trades
+        if other.negatives:
+            negatives = self.negatives + other.negatives
+            delta = other.negative_mean - self.negative_mean
+            self.negative_m2 += other.negative_m2 + delta * delta * self.negatives * other.negatives / negatives
+            self.negative_mean += delta * other.negatives / negatives
+
+        # Equity curve: other parte dal totale cumulato di questo bucket
+        offset = self.total_r
+        self.max_drawdown = max(self.max_drawdown, other.max_drawdown, self.peak - (offset + other.trough))
+        self.peak = max(self.peak, offset + other.peak)
+        self.trough = min(self.trough, offset + other.trough)
+
+        # Serie a cavallo tra i due bucket
+        self.max_win_streak = max(self.max_win_streak, other.max_win_streak, self.tail_wins + other.head_wins)
+        self.max_loss_streak = max(self.max_loss_streak, other.max_loss_streak, self.tail_losses + other.head_losses)
+        if self.head_wins == self.trades:
+            self.head_wins += other.head_wins
+        if self.head_losses == self.trades:
+            self.head_losses += other.head_losses
+        self.tail_wins = other.tail_wins + (self.tail_wins if other.tail_wins == other.trades else 0)
+        self.tail_losses = other.tail_losses + (self.tail_losses if other.tail_losses == other.trades else 0)
+
+        for key, (count, total) in other.sketch.items():
+            bucket = self.sketch.setdefault(key, [0, 0.0])
+            bucket[0] += count
+            bucket[1] += total
+
+        self.signals += other.signals
+        self.trades = trades
+        self.total_r += other.total_r
+        self.max_r = max(self.max_r, other.max_r)
+        self.min_r = min(self.min_r, other.min_r)
+        self.wins += other.wins
+        self.win_total += other.win_total
+        self.negatives += other.negatives
+        self.negative_total += other.negative_total
+        self.exit_wins += other.exit_wins
+        self.exit_losses += other.exit_losses
+        self.holding_minutes += other.holding_minutes
+        self.mae_total += other.mae_total
+        self.mfe_total += other.mfe_total
+        return self
+
+    @property
+    def current_drawdown(self) -> float:
+        """Distanza dell'ultimo punto dell'equity curve dal suo massimo"""
+        return self.peak - self.total_r if self.trades else 0.0
+
+    def r_std(self) -> float:
+        """Deviazione standard campionaria degli R-multiple"""
+        return math.sqrt(self.m2_r / (self.trades - 1)) if self.trades > 1 else 0.0
+
+    def downside_std(self) -> float:
+        """Deviazione standard campionaria degli R negativi"""
+        return math.sqrt(self.negative_m2 / (self.negatives - 1)) if self.negatives > 1 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Quantile approssimato dallo sketch, interpolato come np.percentile tra le
+        statistiche d'ordine attorno al rango q * (n - 1). Ogni statistica d'ordine
+        è stimata con la media del suo bucket: errore massimo SKETCH_BUCKET_R.
+        """
+        if not self.trades:
+            return 0.0
+        rank = q * (self.trades - 1)
+        lower = math.floor(rank)
+        fraction = rank - lower
+        values = []
+        seen = 0
+        for key in sorted(self.sketch):
+            count, total = self.sketch[key]
+            seen += count
+            while len(values) < 2 and seen > lower + len(values):
+                values.append(total / count)
+            if len(values) == 2:
+                break
+        if len(values) < 2:
+            return values[0]
+        return values[0] + fraction * (values[1] - values[0])
+
+    def tail_mean(self, q: float) -> float:
+        """
+        Media degli R fino al quantile q (CVaR): le statistiche d'ordine fino al rango
+        floor(q * (n - 1)), con l'ultimo bucket preso in parte alla sua media.
+        """
+        if not self.trades:
+            return 0.0
+        needed = math.floor(q * (self.trades - 1)) + 1
+        taken = 0
+        total = 0.0
+        for key in sorted(self.sketch):
+            count, bucket_total = self.sketch[key]
+            take = min(count, needed - taken)
+            total += bucket_total / count * take
+            taken += take
+            if taken == needed:
+                break
+        return total / taken
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Stato serializzabile (chiavi dello sketch come stringhe, come in JSON)"""
+        data = asdict(self)
+        data["sketch"] = {str(key): list(value) for key, value in self.sketch.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PerformanceAccumulator":
+        """Ricostruisce lo stato da to_dict() o da una riga di rollup"""
+        values = dict(data)
+        values["sketch"] = {int(key): list(value) for key, value in (values.get("sketch") or {}).items()}
+        return cls(**values)
+
+# Colonne dei rollup giornalieri: un campo dell'accumulator per colonna
+ROLLUP_COLUMNS: Dict[str, str] = {
+    f.name: ("INTEGER" if f.type in (int, "int") else "REAL")
+    for f in fields(PerformanceAccumulator) if f.name != "sketch"
+}
+
+_ROLLUP_TABLE_SQL = f"""
+    CREATE TABLE IF NOT EXISTS performance_daily (
+        day TEXT NOT NULL,
+        instrument TEXT NOT NULL,
+        {", ".join(f"{name} {sql_type}" for name, sql_type in ROLLUP_COLUMNS.items())},
+        sketch TEXT NOT NULL,
+        updated_at TEXT,
+        PRIMARY KEY (day, instrument)
+    )
+"""
+
+_ROLLUP_INSERT_SQL = f"""
+    INSERT OR REPLACE INTO performance_daily
+    (day, instrument, {", ".join(ROLLUP_COLUMNS)}, sketch, updated_at)
+    VALUES ({", ".join(["?"] * (len(ROLLUP_COLUMNS) + 4))})
+"""
+
+_TRADES_SQL = """
+    SELECT s.instrument, o.outcome, o.r_multiple, o.holding_time_minutes, o.mae, o.mfe
+    FROM signal_snapshots s
+    LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
+    WHERE s.timestamp >= ? AND s.timestamp {upper} ?{instrument_filter}
+    ORDER BY s.timestamp, s.signal_id
+"""
+
+def _day_start(day: datetime) -> datetime:
+    return datetime(day.year, day.month, day.day)
+
+class PerformanceRollups:
+    """
+    Rollup giornalieri delle performance su signal_outcomes.db.
+
+    Una riga per (giorno del segnale, strumento) più una riga PORTFOLIO per giorno.
+    Il tracker rinfresca i giorni toccati da ogni flush; i report fondono le righe.
+    """
+
+    def __init__(self, db_path: str = "data/signal_outcomes.db"):
+        self.db_path = Path(db_path)
+        self.metrics = {
+            "refreshes": 0,
+            "days_refreshed": 0,
+            "rollup_rows_read": 0,
+            "partial_days_scanned": 0
+        }
+
+    @property
+    def store(self) -> SQLiteStore:
+        """Store del database degli outcome, dove vivono anche i rollup"""
+        return get_sqlite_store(self.db_path)
+
+    @staticmethod
+    def schema_statements() -> List[Tuple[str, tuple]]:
+        """Statement di creazione della tabella dei rollup"""
+        return [(_ROLLUP_TABLE_SQL, ())]
+
+    async def fold_range(self, start: str, stop: str, instrument: Optional[str] = None,
+                         inclusive: bool = False) -> Dict[str, PerformanceAccumulator]:
+        """
+        Scansiona i segnali con timestamp in [start, stop) (o [start, stop] se inclusive)
+        e restituisce un accumulator per strumento più quello PORTFOLIO.
+        """
+        sql = _TRADES_SQL.format(
+            upper="<=" if inclusive else "<",
+            instrument_filter=" AND s.instrument = ?" if instrument else ""
+        )
+        params = [start, stop] + ([instrument] if instrument else [])
+        rows = await self.store.fetchall(sql, params)
+
+        accumulators = {PORTFOLIO: PerformanceAccumulator()}
+        for row_instrument, outcome, r_multiple, holding, mae, mfe in rows:
+            targets = (accumulators[PORTFOLIO],
+                       accumulators.setdefault(row_instrument, PerformanceAccumulator()))
+            for accumulator in targets:
+                accumulator.add_signal()
+                if outcome in CLOSED_OUTCOMES and r_multiple is not None:
+                    accumulator.add_trade(r_multiple, outcome, holding, mae, mfe)
+        return accumulators
+
+    async def refresh(self, days: Iterable[str]):
+        """
+        Ricalcola i rollup dei giorni indicati (YYYY-MM-DD) dai trade del giorno.
+
+        Gli outcome arrivano in ordine di chiusura e possono essere corretti, mentre
+        drawdown e serie dipendono dall'ordine dei segnali: il giorno toccato viene
+        quindi ripiegato per intero, e tutte le righe scritte in un unico job.
+        """
+        days = sorted(set(days))
+        if not days:
+            return
+        await self.store.write(await self._refresh_statements(days))
+        self.metrics["refreshes"] += 1
+        self.metrics["days_refreshed"] += len(days)
+
+    async def rebuild(self):
+        """Ricostruisce tutti i rollup dai segnali esistenti (dopo la migrazione)"""
+        rows = await self.store.fetchall(
+            "SELECT DISTINCT substr(timestamp, 1, 10) FROM signal_snapshots"
+        )
+        statements = [("DELETE FROM performance_daily", ())]
+        statements.extend(await self._refresh_statements(sorted(row[0] for row in rows)))
+        await self.store.write(statements)
+        logger.info(f"Rollup di performance ricostruiti per {len(rows)} giorni")
+
+    async def _refresh_statements(self, days: List[str]) -> List[Tuple[str, tuple]]:
+        updated_at = datetime.now().isoformat()
+        statements = []
+        for day in days:
+            next_day = (datetime.fromisoformat(day) + timedelta(days=1)).date().isoformat()
+            accumulators = await self.fold_range(day, next_day)
+            statements.append(("DELETE FROM performance_daily WHERE day = ?", (day,)))
+            if accumulators[PORTFOLIO].signals:
+                statements.extend(
+                    (_ROLLUP_INSERT_SQL, self._row_params(day, instrument, accumulator, updated_at))
+                    for instrument, accumulator in accumulators.items()
+                )
+        return statements
+
+    async def window(self, start: datetime, end: Optional[datetime] = None,
+                     instrument: Optional[str] = None) -> PerformanceAccumulator:
+        """
+        Aggregato dei segnali con timestamp in [start, end] (end=None: fino a oggi).
+
+        I giorni interi vengono dai rollup; solo i giorni parziali agli estremi
+        vengono scansionati, e i pezzi sono fusi nell'ordine temporale.
+        """
+        key = instrument or PORTFOLIO
+        first_full = _day_start(start)
+        if first_full < start:
+            first_full += timedelta(days=1)
+        last_start = _day_start(end) if end is not None else None
+
+        # Finestra interamente dentro un giorno: nessun rollup utilizzabile
+        if last_start is not None and last_start < first_full:
+            self.metrics["partial_days_scanned"] += 1
+            accumulators = await self.fold_range(start.isoformat(), end.isoformat(), instrument, inclusive=True)
+            return accumulators.get(key, PerformanceAccumulator())
+
+        result = PerformanceAccumulator()
+        if start < first_full:
+            self.metrics["partial_days_scanned"] += 1
+            head = await self.fold_range(start.isoformat(), first_full.isoformat(), instrument)
+            result.merge(head.get(key, PerformanceAccumulator()))
+
+        params = [key, first_full.date().isoformat()]
+        upper = ""
+        if last_start is not None:
+            upper = " AND day < ?"
+            params.append(last_start.date().isoformat())
+        rows, columns = await self.store.fetch_with_columns(f"""
+            SELECT {", ".join(ROLLUP_COLUMNS)}, sketch
+            FROM performance_daily
+            WHERE instrument = ? AND day >= ?{upper}
+            ORDER BY day
+        """, params)
+        for row in rows:
+            data = dict(zip(columns, row))
+            data["sketch"] = json.loads(data["sketch"])
+            result.merge(PerformanceAccumulator.from_dict(data))
+        self.metrics["rollup_rows_read"] += len(rows)
+
+        if last_start is not None:
+            self.metrics["partial_days_scanned"] += 1
+            tail = await self.fold_range(last_start.isoformat(), end.isoformat(), instrument, inclusive=True)
+            result.merge(tail.get(key, PerformanceAccumulator()))
+
+        return result
+
+    @staticmethod
+    def _row_params(day: str, instrument: str, accumulator: PerformanceAccumulator,
+                    updated_at: str) -> Tuple:
+        data = accumulator.to_dict()
+        return (
+            day,
+            instrument,
+            *(data[name] for name in ROLLUP_COLUMNS),
+            json.dumps(data["sketch"]),
+            updated_at
+        )
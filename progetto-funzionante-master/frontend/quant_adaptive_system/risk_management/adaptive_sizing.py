@@ -29,10 +29,10 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 import sqlite3
-import aiosqlite
 import math
 
 # Import modules del sistema quant
+from ..storage.sqlite_pool import SQLiteStore, get_sqlite_store
 from ..regime_detection.policy import PolicyParameters, get_current_policy_parameters
 from ..signal_intelligence.signal_outcomes import get_outcome_tracker, SignalOutcome
 
@@ -145,6 +145,11 @@ class AdaptiveRiskManager:
         self._cache_timestamp = None
         self._cache_validity_minutes = 5
         
+    @property
+    def store(self) -> SQLiteStore:
+        """Store condiviso del database di risk management"""
+        return get_sqlite_store(self.db_path)
+    
     async def initialize(self):
         """Inizializza il risk manager"""
         try:
@@ -353,22 +358,24 @@ class AdaptiveRiskManager:
         try:
             tracker = await get_outcome_tracker()
             
-            # Get historical performance data
-            async with aiosqlite.connect(tracker.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT o.r_multiple, o.outcome
-                    FROM signal_snapshots s
-                    JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    WHERE s.instrument LIKE ? 
-                    AND JSON_EXTRACT(s.market_context, '$.market_regime') = ?
-                    AND s.timestamp >= datetime('now', '-{} days')
-                    AND o.r_multiple IS NOT NULL
-                    ORDER BY s.timestamp DESC
-                """.format(self.risk_params["kelly_lookback_days"]), 
-                (f"%{instrument}%" if instrument != "PORTFOLIO" else "%", regime_type))
-                
-                results = await cursor.fetchall()
-            
+            # Get historical performance data (indici su instrument/market_regime/timestamp)
+            if instrument == "PORTFOLIO":
+                instrument_filter, params = "", (regime_type,)
+            else:
+                instrument_filter, params = "AND s.instrument = ?", (regime_type, instrument)
+            
+            await tracker.sync_pending()
+            results = await tracker.store.fetchall("""
+                SELECT o.r_multiple, o.outcome
+                FROM signal_snapshots s
+                JOIN signal_outcomes o ON s.signal_id = o.signal_id
+                WHERE s.market_regime = ?
+                {}
+                AND s.timestamp >= datetime('now', '-{} days')
+                AND o.r_multiple IS NOT NULL
+                ORDER BY s.timestamp DESC
+            """.format(instrument_filter, self.risk_params["kelly_lookback_days"]), params)
+
             if len(results) < self.risk_params["min_trades_for_kelly"]:
                 return 0.01  # Conservative default
             
@@ -411,30 +418,28 @@ class AdaptiveRiskManager:
             # Per ora uso proxy basato su regime corrente
             
             tracker = await get_outcome_tracker()
-            async with aiosqlite.connect(tracker.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT AVG(ABS(o.r_multiple)) as avg_volatility
-                    FROM signal_snapshots s
-                    JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    WHERE s.instrument = ?
-                    AND s.timestamp >= datetime('now', '-{} days')
-                    AND o.r_multiple IS NOT NULL
-                """.format(self.risk_params["volatility_lookback_days"]), (instrument,))
-                
-                result = await cursor.fetchone()
+            await tracker.sync_pending()
+            result = await tracker.store.fetchone("""
+                SELECT AVG(ABS(o.r_multiple)) as avg_volatility
+                FROM signal_snapshots s
+                JOIN signal_outcomes o ON s.signal_id = o.signal_id
+                WHERE s.instrument = ?
+                AND s.timestamp >= datetime('now', '-{} days')
+                AND o.r_multiple IS NOT NULL
+            """.format(self.risk_params["volatility_lookback_days"]), (instrument,))
+            
+            if result and result[0]:
+                instrument_vol = result[0]
                 
-                if result and result[0]:
-                    instrument_vol = result[0]
-                    
-                    # Scale relative to target volatility
-                    vol_ratio = self.risk_params["volatility_target"] / max(0.01, instrument_vol)
-                    
-                    # Apply scaling factor with bounds
-                    adjustment = vol_ratio ** (1 / self.risk_params["volatility_scaling_factor"])
-                    return max(0.3, min(2.0, adjustment))
-                
-                return 1.0  # Neutral if no data
+                # Scale relative to target volatility
+                vol_ratio = self.risk_params["volatility_target"] / max(0.01, instrument_vol)
                 
+                # Apply scaling factor with bounds
+                adjustment = vol_ratio ** (1 / self.risk_params["volatility_scaling_factor"])
+                return max(0.3, min(2.0, adjustment))
+            
+            return 1.0  # Neutral if no data
+            
         except Exception as e:
             logger.error(f"Errore nel calcolo volatility adjustment: {e}")
             return 1.0
@@ -609,54 +614,49 @@ class AdaptiveRiskManager:
     
     async def _create_database_tables(self):
         """Crea tabelle del database"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS position_calculations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    signal_id TEXT NOT NULL,
-                    instrument TEXT NOT NULL,
-                    recommended_size REAL NOT NULL,
-                    kelly_fraction REAL,
-                    adjustments_json TEXT,
-                    risk_level TEXT,
-                    calculation_timestamp TEXT,
-                    calculation_reason TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS position_outcomes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    signal_id TEXT NOT NULL,
-                    outcome TEXT NOT NULL,
-                    pnl REAL NOT NULL,
-                    outcome_timestamp TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS circuit_breaker_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_type TEXT NOT NULL,
-                    trigger_value REAL,
-                    cooling_off_until TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            await db.commit()
-    
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS position_calculations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                signal_id TEXT NOT NULL,
+                instrument TEXT NOT NULL,
+                recommended_size REAL NOT NULL,
+                kelly_fraction REAL,
+                adjustments_json TEXT,
+                risk_level TEXT,
+                calculation_timestamp TEXT,
+                calculation_reason TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS position_outcomes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                signal_id TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                pnl REAL NOT NULL,
+                outcome_timestamp TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        await self.store.execute("""
+            CREATE TABLE IF NOT EXISTS circuit_breaker_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_type TEXT NOT NULL,
+                trigger_value REAL,
+                cooling_off_until TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
     async def _store_position_outcome(self, signal_id: str, outcome: SignalOutcome, pnl: float):
         """Memorizza outcome nel database"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT INTO position_outcomes (signal_id, outcome, pnl, outcome_timestamp)
-                VALUES (?, ?, ?, ?)
-            """, (signal_id, outcome.value, pnl, datetime.utcnow().isoformat()))
-            await db.commit()
-    
+        await self.store.execute("""
+            INSERT INTO position_outcomes (signal_id, outcome, pnl, outcome_timestamp)
+            VALUES (?, ?, ?, ?)
+        """, (signal_id, outcome.value, pnl, datetime.utcnow().isoformat()))
+
     # Placeholder implementations for remaining methods
     async def _load_current_positions(self):
         """Carica posizioni correnti"""
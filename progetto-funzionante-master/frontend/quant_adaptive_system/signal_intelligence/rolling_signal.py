@@ -121,10 +121,9 @@ class RollingSignalGenerator:
                 logger.error("Please set OANDA_API_KEY and OANDA_ACCOUNT_ID")
                 raise ValueError("Missing OANDA credentials")
             
-            # Inizializza OANDA client with proper credentials
-            from oanda_api_client import create_oanda_client
-            self.oanda_client = create_oanda_client(api_key, account_id, environment)
-            await self.oanda_client.__aenter__()
+            # Client condiviso a livello di processo (un solo pool di connessioni per account)
+            from oanda_api_client import get_shared_oanda_client
+            self.oanda_client = await get_shared_oanda_client(api_key, account_id, environment)
             
             # Inizializza signal engine with credentials
             self.signal_engine = OANDASignalEngine(api_key, account_id, environment, gemini_api_key)
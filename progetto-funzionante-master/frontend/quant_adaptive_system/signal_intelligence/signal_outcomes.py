@@ -16,16 +16,19 @@ Features:
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Set
 from pathlib import Path
 import pandas as pd
 import numpy as np
 from enum import Enum
 import sqlite3
 import aiofiles
-import aiosqlite
+
+from ..storage.sqlite_pool import SQLiteStore, get_sqlite_store
+from ..reporting.performance_aggregator import PerformanceRollups
 
 logger = logging.getLogger(__name__)
 
@@ -172,12 +175,71 @@ class SignalOutcomeRecord:
     tracked_since: datetime = None
     last_update: datetime = None
 
+# Versione dello schema di signal_outcomes.db (PRAGMA user_version)
+SCHEMA_VERSION = 3
+
+# Feature "calde" di signal_snapshots: colonne tipizzate e indicizzabili, con la
+# colonna JSON da cui derivano. I blob JSON restano come cold storage completo.
+TECHNICAL_FEATURE_COLUMNS = [
+    "mtf_rsi_1m", "mtf_rsi_5m", "mtf_rsi_15m", "mtf_rsi_30m",
+    "atr_1m", "atr_5m", "atr_15m", "atr_30m",
+    "confluence_score", "signal_strength"
+]
+SNAPSHOT_FEATURE_COLUMNS: Dict[str, Tuple[str, str]] = {
+    **{name: ("REAL", "technical_features") for name in TECHNICAL_FEATURE_COLUMNS},
+    "market_regime": ("TEXT", "market_context")
+}
+
+_SNAPSHOT_INDEXES = [
+    # Kelly per strumento/regime e volatilità per strumento
+    "CREATE INDEX IF NOT EXISTS idx_snapshots_instrument_regime_ts ON signal_snapshots (instrument, market_regime, timestamp)",
+    # Kelly di portafoglio e performance per regime
+    "CREATE INDEX IF NOT EXISTS idx_snapshots_regime_ts ON signal_snapshots (market_regime, timestamp)",
+    # Finestre temporali (feature importance, metriche, insights)
+    "CREATE INDEX IF NOT EXISTS idx_snapshots_ts ON signal_snapshots (timestamp)"
+]
+
+_SNAPSHOT_INSERT_SQL = f"""
+    INSERT OR REPLACE INTO signal_snapshots 
+    (signal_id, timestamp, instrument, signal_type, entry_price, 
+     stop_loss, take_profit, current_price, risk_reward_ratio,
+     confidence_score, ai_reasoning, technical_features, 
+     volume_features, market_context, source,
+     {", ".join(SNAPSHOT_FEATURE_COLUMNS)})
+    VALUES ({", ".join(["?"] * (15 + len(SNAPSHOT_FEATURE_COLUMNS)))})
+"""
+
+_OUTCOME_INSERT_SQL = """
+    INSERT OR REPLACE INTO signal_outcomes
+    (signal_id, outcome, tracked_since)
+    VALUES (?, ?, ?)
+"""
+
+_OUTCOME_UPDATE_SQL = """
+    UPDATE signal_outcomes SET
+        outcome = ?,
+        exit_timestamp = ?,
+        exit_price = ?,
+        r_multiple = ?,
+        mae = ?,
+        mfe = ?,
+        holding_time_minutes = ?,
+        exit_reason = ?,
+        last_update = ?
+    WHERE signal_id = ?
+"""
+
 class SignalOutcomeTracker:
     """
-    Sistema di tracking degli outcome dei segnali con learning automatico
+    Sistema di tracking degli outcome dei segnali con learning automatico.
+    
+    Le scritture di track_signal e update_signal_outcome sono write-behind:
+    restano in una coda in memoria e vengono scritte in un'unica transazione
+    per flush. Le letture del tracker vedono sempre le scritture in coda.
     """
     
-    def __init__(self, db_path: str = "data/signal_outcomes.db"):
+    def __init__(self, db_path: str = "data/signal_outcomes.db",
+                 flush_interval: float = 1.0, max_pending: int = 500):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -189,10 +251,46 @@ class SignalOutcomeTracker:
         self._cached_metrics = {}
         self._cache_timestamp = None
         
+        # Write-behind queue: snapshot e outcome vengono coalescenti per signal_id
+        # e scritti in una transazione ogni flush_interval secondi (finestra di
+        # perdita massima in caso di crash) o appena la coda raggiunge max_pending
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending_snapshots: Dict[str, Tuple[SignalSnapshot, Tuple]] = {}
+        self._pending_outcome_inserts: Dict[str, Tuple] = {}
+        self._pending_outcome_updates: Dict[str, Tuple] = {}
+        self._oldest_pending_at: Optional[float] = None
+        # Snapshot del flush in corso: non più in coda ma non ancora committati,
+        # restano visibili alle letture finché write_many non va a buon fine
+        self._inflight_snapshots: Dict[str, Tuple[SignalSnapshot, Tuple]] = {}
+        
+        # Rollup giornalieri delle performance: giorni dei segnali toccati dalle
+        # scritture in coda e giorni già scritti ma con rollup ancora da ricalcolare
+        self.rollups = PerformanceRollups(self.db_path)
+        self._pending_rollup_days: Set[str] = set()
+        self._stale_rollup_days: Set[str] = set()
+        self._learning_update_due = False
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._pending_event: Optional[asyncio.Event] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self.write_metrics = {
+            "flushes": 0,
+            "rows_flushed": 0,
+            "failed_flushes": 0,
+            "peak_pending": 0,
+            "max_pending_age_seconds": 0.0
+        }
+    
+    @property
+    def store(self) -> SQLiteStore:
+        """Store condiviso del database degli outcome (usato anche da risk e reporting)"""
+        return get_sqlite_store(self.db_path)
+        
     async def initialize(self):
         """Inizializza il database e le tabelle"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
+        await self.store.write([
+            ("""
                 CREATE TABLE IF NOT EXISTS signal_snapshots (
                     signal_id TEXT PRIMARY KEY,
                     timestamp TEXT NOT NULL,
@@ -211,9 +309,8 @@ class SignalOutcomeTracker:
                     source TEXT DEFAULT 'ROLLING_GENERATOR',
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
-            """)
-            
-            await db.execute("""
+            """, ()),
+            ("""
                 CREATE TABLE IF NOT EXISTS signal_outcomes (
                     signal_id TEXT PRIMARY KEY,
                     outcome TEXT NOT NULL,
@@ -228,18 +325,16 @@ class SignalOutcomeTracker:
                     last_update TEXT DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (signal_id) REFERENCES signal_snapshots (signal_id)
                 )
-            """)
-            
-            await db.execute("""
+            """, ()),
+            ("""
                 CREATE TABLE IF NOT EXISTS feature_importance (
                     feature_name TEXT PRIMARY KEY,
                     importance_score REAL NOT NULL,
                     update_count INTEGER DEFAULT 1,
                     last_updated TEXT DEFAULT CURRENT_TIMESTAMP
                 )
-            """)
-            
-            await db.execute("""
+            """, ()),
+            ("""
                 CREATE TABLE IF NOT EXISTS learning_metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp TEXT NOT NULL,
@@ -251,55 +346,248 @@ class SignalOutcomeTracker:
                     regime_performance TEXT,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
-            """)
-            
-            await db.commit()
+            """, ())
+        ])
+        
+        await self._migrate_schema()
             
         logger.info("SignalOutcomeTracker inizializzato correttamente")
     
+    async def _migrate_schema(self):
+        """
+        Porta signal_outcomes.db all'ultima versione dello schema. I passi sono
+        idempotenti e user_version viene scritto per ultimo, dopo la ricostruzione
+        dei rollup: una migrazione interrotta riparte al prossimo avvio.
+        
+        v2: feature calde di signal_snapshots come colonne tipizzate (backfill dai
+            blob JSON) e indici per strumento/regime/timestamp.
+        v3: rollup giornalieri delle performance, ricostruiti dai segnali esistenti.
+        """
+        version = (await self.store.fetchone("PRAGMA user_version"))[0]
+        if version >= SCHEMA_VERSION:
+            return
+        
+        statements = []
+        if version < 2:
+            existing = {row[1] for row in await self.store.fetchall("PRAGMA table_info(signal_snapshots)")}
+            statements.extend(
+                (f"ALTER TABLE signal_snapshots ADD COLUMN {name} {sql_type}", ())
+                for name, (sql_type, _) in SNAPSHOT_FEATURE_COLUMNS.items()
+                if name not in existing
+            )
+            
+            # Backfill delle righe esistenti; i blob JSON non validi restano NULL
+            assignments = ", ".join(
+                f"{name} = CASE WHEN json_valid({source}) THEN NULLIF(json_extract({source}, '$.{name}'), '') END"
+                for name, (_, source) in SNAPSHOT_FEATURE_COLUMNS.items()
+            )
+            statements.append((f"UPDATE signal_snapshots SET {assignments}", ()))
+            statements.extend((sql, ()) for sql in _SNAPSHOT_INDEXES)
+        if version < 3:
+            statements.extend(self.rollups.schema_statements())
+        
+        await self.store.write(statements)
+        if version < 3:
+            await self.rollups.rebuild()
+        await self.store.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        logger.info(f"Schema signal_outcomes migrato da v{version} a v{SCHEMA_VERSION}")
+    
+    # ------------------------------------------------------------------
+    # Write-behind queue
+    # ------------------------------------------------------------------
+    
+    def _snapshot_params(self, snapshot: SignalSnapshot) -> Tuple:
+        """Parametri della riga signal_snapshots per uno snapshot"""
+        return (
+            snapshot.signal_id,
+            snapshot.timestamp.isoformat(),
+            snapshot.instrument,
+            snapshot.signal_type.value,
+            snapshot.entry_price,
+            snapshot.stop_loss,
+            snapshot.take_profit,
+            snapshot.current_price,
+            snapshot.risk_reward_ratio,
+            snapshot.confidence_score,
+            snapshot.ai_reasoning,
+            json.dumps(asdict(snapshot.technical_features)),
+            json.dumps(asdict(snapshot.volume_features)),
+            json.dumps(asdict(snapshot.market_context)),
+            snapshot.source,
+            *(getattr(snapshot.technical_features, name) for name in TECHNICAL_FEATURE_COLUMNS),
+            snapshot.market_context.market_regime or None
+        )
+    
+    def pending_writes(self) -> int:
+        """Numero di scritture in coda non ancora sul database"""
+        return (len(self._pending_snapshots) + len(self._pending_outcome_inserts) +
+                len(self._pending_outcome_updates))
+    
+    def _schedule_flush(self):
+        """Avvia il flusher se necessario e lo sveglia (subito se la coda è piena)"""
+        loop = asyncio.get_running_loop()
+        if (self._flusher_task is None or self._flusher_task.done() or
+                self._flusher_task.get_loop() is not loop):
+            self._flush_lock = asyncio.Lock()
+            self._pending_event = asyncio.Event()
+            self._flush_requested = asyncio.Event()
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+        
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = time.monotonic()
+        self.write_metrics["peak_pending"] = max(self.write_metrics["peak_pending"], self.pending_writes())
+        self._pending_event.set()
+        if self.pending_writes() >= self.max_pending:
+            self._flush_requested.set()
+    
+    async def _flush_loop(self):
+        """Flusha la coda ogni flush_interval (o prima, quando raggiunge max_pending)"""
+        while True:
+            await self._pending_event.wait()
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._pending_event.clear()
+            self._flush_requested.clear()
+            
+            try:
+                await self.flush()
+            except Exception:
+                continue  # Già loggato e rimesso in coda, si riprova al prossimo giro
+            
+            if self._learning_update_due:
+                self._learning_update_due = False
+                await self._trigger_learning_update()
+    
+    async def flush(self) -> int:
+        """
+        Scrive in un'unica transazione snapshot, outcome iniziali e update in coda.
+        Restituisce il numero di righe scritte.
+        """
+        if not (self.pending_writes() or self._stale_rollup_days):
+            return 0
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        
+        async with self._flush_lock:
+            snapshots = self._pending_snapshots
+            inserts = self._pending_outcome_inserts
+            updates = self._pending_outcome_updates
+            oldest_pending_at = self._oldest_pending_at
+            rollup_days = self._pending_rollup_days
+            if not (snapshots or inserts or updates):
+                await self._refresh_rollups()
+                return 0
+            self._pending_snapshots, self._pending_outcome_inserts, self._pending_outcome_updates = {}, {}, {}
+            self._pending_rollup_days = set()
+            self._oldest_pending_at = None
+            self._inflight_snapshots = snapshots
+            
+            # L'ordine conta: gli update si applicano alle righe inserite nello stesso flush
+            statements = []
+            if snapshots:
+                statements.append((_SNAPSHOT_INSERT_SQL, [params for _, params in snapshots.values()]))
+            if inserts:
+                statements.append((_OUTCOME_INSERT_SQL, list(inserts.values())))
+            if updates:
+                statements.append((_OUTCOME_UPDATE_SQL, list(updates.values())))
+            
+            rows = len(snapshots) + len(inserts) + len(updates)
+            try:
+                await self.store.write_many(statements)
+            except Exception as e:
+                # Rimette in coda senza sovrascrivere scritture più recenti
+                for pending, failed in ((self._pending_snapshots, snapshots),
+                                        (self._pending_outcome_inserts, inserts),
+                                        (self._pending_outcome_updates, updates)):
+                    for signal_id, item in failed.items():
+                        pending.setdefault(signal_id, item)
+                self._pending_rollup_days |= rollup_days
+                self._oldest_pending_at = oldest_pending_at
+                if self._pending_event is not None:
+                    self._pending_event.set()
+                self.write_metrics["failed_flushes"] += 1
+                logger.error(f"Errore nel flush di {rows} scritture del tracker: {e}")
+                raise
+            finally:
+                self._inflight_snapshots = {}
+            
+            self.write_metrics["flushes"] += 1
+            self.write_metrics["rows_flushed"] += rows
+            if oldest_pending_at is not None:
+                self.write_metrics["max_pending_age_seconds"] = max(
+                    self.write_metrics["max_pending_age_seconds"], time.monotonic() - oldest_pending_at
+                )
+            self._cache_timestamp = None  # Le metriche in cache non includono le nuove righe
+            
+            self._stale_rollup_days |= rollup_days
+            await self._refresh_rollups()
+            return rows
+    
+    async def _refresh_rollups(self):
+        """
+        Ricalcola i rollup dei giorni scritti (chiamato sotto _flush_lock). Se fallisce
+        i giorni restano da ricalcolare al prossimo flush; le scritture sono già salve.
+        """
+        if not self._stale_rollup_days:
+            return
+        days = set(self._stale_rollup_days)
+        try:
+            await self.rollups.refresh(days)
+            self._stale_rollup_days -= days
+        except Exception as e:
+            logger.error(f"Errore nel ricalcolo dei rollup di performance per {sorted(days)}: {e}")
+    
+    async def close(self):
+        """Ferma il flusher e scrive tutto ciò che è in coda (da chiamare allo shutdown)"""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+        self._flusher_task = None
+        await self.flush()
+    
+    async def sync_pending(self):
+        """
+        Read-your-writes per le letture aggregate: porta sul database le scritture
+        in coda. Se il flush fallisce la lettura procede sui dati già persistiti.
+        """
+        try:
+            await self.flush()
+        except Exception:
+            pass  # Già loggato, le scritture restano in coda
+    
+    def get_write_metrics(self) -> Dict[str, Any]:
+        """Metriche della coda write-behind"""
+        return {
+            **self.write_metrics,
+            "pending": self.pending_writes(),
+            "stale_rollup_days": len(self._stale_rollup_days),
+            "flush_interval": self.flush_interval,
+            "max_pending": self.max_pending
+        }
+    
     async def track_signal(self, snapshot: SignalSnapshot) -> bool:
         """
-        Registra un nuovo segnale per il tracking
+        Registra un nuovo segnale per il tracking (write-behind: scritto al prossimo flush)
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO signal_snapshots 
-                    (signal_id, timestamp, instrument, signal_type, entry_price, 
-                     stop_loss, take_profit, current_price, risk_reward_ratio,
-                     confidence_score, ai_reasoning, technical_features, 
-                     volume_features, market_context, source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    snapshot.signal_id,
-                    snapshot.timestamp.isoformat(),
-                    snapshot.instrument,
-                    snapshot.signal_type.value,
-                    snapshot.entry_price,
-                    snapshot.stop_loss,
-                    snapshot.take_profit,
-                    snapshot.current_price,
-                    snapshot.risk_reward_ratio,
-                    snapshot.confidence_score,
-                    snapshot.ai_reasoning,
-                    json.dumps(asdict(snapshot.technical_features)),
-                    json.dumps(asdict(snapshot.volume_features)),
-                    json.dumps(asdict(snapshot.market_context)),
-                    snapshot.source
-                ))
-                
-                # Inizializza outcome record
-                await db.execute("""
-                    INSERT OR REPLACE INTO signal_outcomes
-                    (signal_id, outcome, tracked_since)
-                    VALUES (?, ?, ?)
-                """, (
-                    snapshot.signal_id,
-                    SignalOutcome.PENDING.value,
-                    datetime.now().isoformat()
-                ))
-                
-                await db.commit()
+            tracked_since = datetime.now().isoformat()
+            params = self._snapshot_params(snapshot)
+            
+            # Un nuovo tracking sostituisce snapshot e outcome precedenti, come INSERT OR REPLACE
+            self._pending_outcome_updates.pop(snapshot.signal_id, None)
+            self._pending_snapshots[snapshot.signal_id] = (snapshot, params)
+            self._pending_rollup_days.add(params[1][:10])
+            self._pending_outcome_inserts[snapshot.signal_id] = (
+                snapshot.signal_id,
+                SignalOutcome.PENDING.value,
+                tracked_since
+            )
+            self._schedule_flush()
                 
             logger.info(f"Segnale {snapshot.signal_id} registrato per tracking")
             return True
@@ -312,86 +600,81 @@ class SignalOutcomeTracker:
                                   exit_price: Optional[float] = None,
                                   exit_reason: str = "") -> bool:
         """
-        Aggiorna l'outcome di un segnale e calcola le metriche
+        Aggiorna l'outcome di un segnale e calcola le metriche (write-behind)
         """
         try:
-            # Recupera dati originali del segnale
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
+            # Recupera dati originali del segnale (prima dalla coda e dal flush in corso,
+            # poi dal database)
+            queued = self._pending_snapshots.get(signal_id) or self._inflight_snapshots.get(signal_id)
+            if queued:
+                pending, params = queued
+                signal_data = (pending.entry_price, pending.stop_loss, pending.take_profit,
+                               pending.signal_type.value, params[1])
+            else:
+                signal_data = await self.store.fetchone("""
                     SELECT entry_price, stop_loss, take_profit, signal_type, timestamp
                     FROM signal_snapshots WHERE signal_id = ?
                 """, (signal_id,))
-                
-                signal_data = await cursor.fetchone()
-                if not signal_data:
-                    logger.error(f"Segnale {signal_id} non trovato")
-                    return False
-                
-                entry_price, stop_loss, take_profit, signal_type, timestamp_str = signal_data
-                
-                # Calcola metriche se abbiamo exit_price
-                r_multiple = None
-                mae = None
-                mfe = None
-                holding_time_minutes = None
-                
-                if exit_price is not None:
-                    # Calcola R-multiple
-                    risk = abs(entry_price - stop_loss)
-                    if risk > 0:
-                        if signal_type == "BUY":
-                            r_multiple = (exit_price - entry_price) / risk
-                        else:  # SELL
-                            r_multiple = (entry_price - exit_price) / risk
-                    
-                    # Per semplicità, MAE e MFE vengono calcolate qui
-                    # In un sistema completo, dovresti tracciare i prezzi in tempo reale
+            
+            if not signal_data:
+                logger.error(f"Segnale {signal_id} non trovato")
+                return False
+            
+            entry_price, stop_loss, take_profit, signal_type, timestamp_str = signal_data
+            
+            # Calcola metriche se abbiamo exit_price
+            r_multiple = None
+            mae = None
+            mfe = None
+            holding_time_minutes = None
+            
+            if exit_price is not None:
+                # Calcola R-multiple
+                risk = abs(entry_price - stop_loss)
+                if risk > 0:
                     if signal_type == "BUY":
-                        mae = min(0, exit_price - entry_price) / risk if risk > 0 else 0
-                        mfe = max(0, exit_price - entry_price) / risk if risk > 0 else 0
-                    else:
-                        mae = min(0, entry_price - exit_price) / risk if risk > 0 else 0
-                        mfe = max(0, entry_price - exit_price) / risk if risk > 0 else 0
-                    
-                    # Calcola holding time
-                    signal_timestamp = datetime.fromisoformat(timestamp_str)
-                    holding_time_minutes = int((datetime.now() - signal_timestamp).total_seconds() / 60)
-                
-                # Aggiorna outcome record
-                await db.execute("""
-                    UPDATE signal_outcomes SET
-                        outcome = ?,
-                        exit_timestamp = ?,
-                        exit_price = ?,
-                        r_multiple = ?,
-                        mae = ?,
-                        mfe = ?,
-                        holding_time_minutes = ?,
-                        exit_reason = ?,
-                        last_update = ?
-                    WHERE signal_id = ?
-                """, (
-                    outcome.value,
-                    datetime.now().isoformat() if exit_price is not None else None,
-                    exit_price,
-                    r_multiple,
-                    mae,
-                    mfe,
-                    holding_time_minutes,
-                    exit_reason,
-                    datetime.now().isoformat(),
-                    signal_id
-                ))
-                
-                await db.commit()
+                        r_multiple = (exit_price - entry_price) / risk
+                    else:  # SELL
+                        r_multiple = (entry_price - exit_price) / risk
+                
+                # Per semplicità, MAE e MFE vengono calcolate qui
+                # In un sistema completo, dovresti tracciare i prezzi in tempo reale
+                if signal_type == "BUY":
+                    mae = min(0, exit_price - entry_price) / risk if risk > 0 else 0
+                    mfe = max(0, exit_price - entry_price) / risk if risk > 0 else 0
+                else:
+                    mae = min(0, entry_price - exit_price) / risk if risk > 0 else 0
+                    mfe = max(0, entry_price - exit_price) / risk if risk > 0 else 0
                 
-            logger.info(f"Outcome aggiornato per segnale {signal_id}: {outcome.value}")
+                # Calcola holding time
+                signal_timestamp = datetime.fromisoformat(timestamp_str)
+                holding_time_minutes = int((datetime.now() - signal_timestamp).total_seconds() / 60)
             
-            # Se il segnale è completato, triggera learning update
+            # Aggiorna outcome record (coalescente: l'ultimo update per segnale vince)
+            self._pending_outcome_updates[signal_id] = (
+                outcome.value,
+                datetime.now().isoformat() if exit_price is not None else None,
+                exit_price,
+                r_multiple,
+                mae,
+                mfe,
+                holding_time_minutes,
+                exit_reason,
+                datetime.now().isoformat(),
+                signal_id
+            )
+            
+            # Il rollup del giorno del segnale va ricalcolato dopo il flush
+            self._pending_rollup_days.add(timestamp_str[:10])
+            
+            # Se il segnale è completato, il learning update gira dopo il flush
             if outcome in [SignalOutcome.TP_HIT, SignalOutcome.SL_HIT, 
                           SignalOutcome.TIMEOUT, SignalOutcome.MANUAL_EXIT]:
-                await self._trigger_learning_update()
+                self._learning_update_due = True
             
+            self._schedule_flush()
+            
+            logger.info(f"Outcome aggiornato per segnale {signal_id}: {outcome.value}")
             return True
             
         except Exception as e:
@@ -412,75 +695,40 @@ class SignalOutcomeTracker:
                 cache_key in self._cached_metrics):
                 return self._cached_metrics[cache_key]
             
+            await self.sync_pending()
+            
+            # Giorni interi dai rollup, solo il giorno parziale iniziale dai trade
             cutoff_date = datetime.now() - timedelta(days=days_back)
+            stats = await self.rollups.window(cutoff_date, instrument=instrument)
             
-            async with aiosqlite.connect(self.db_path) as db:
-                # Query base
-                where_clause = "WHERE s.timestamp >= ?"
-                params = [cutoff_date.isoformat()]
-                
-                if instrument:
-                    where_clause += " AND s.instrument = ?"
-                    params.append(instrument)
-                
-                cursor = await db.execute(f"""
-                    SELECT 
-                        COUNT(*) as total_signals,
-                        COUNT(CASE WHEN o.outcome IN ('TP_HIT', 'MANUAL_EXIT') AND o.r_multiple > 0 THEN 1 END) as wins,
-                        COUNT(CASE WHEN o.outcome IN ('SL_HIT', 'MANUAL_EXIT') AND o.r_multiple <= 0 THEN 1 END) as losses,
-                        AVG(CASE WHEN o.r_multiple IS NOT NULL THEN o.r_multiple END) as avg_r_multiple,
-                        AVG(CASE WHEN o.holding_time_minutes IS NOT NULL THEN o.holding_time_minutes END) as avg_holding_time,
-                        MAX(o.r_multiple) as best_trade,
-                        MIN(o.r_multiple) as worst_trade,
-                        AVG(o.mae) as avg_mae,
-                        AVG(o.mfe) as avg_mfe
-                    FROM signal_snapshots s
-                    LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    {where_clause}
-                """, params)
-                
-                result = await cursor.fetchone()
+            total_signals = stats.signals
+            wins = stats.exit_wins
+            trades = max(stats.trades, 1)
+            avg_r_multiple = stats.mean_r
+            
+            metrics = {
+                "total_signals": total_signals,
+                "wins": wins,
+                "losses": stats.exit_losses,
+                "win_rate": (wins / total_signals * 100) if total_signals > 0 else 0,
+                "avg_r_multiple": round(avg_r_multiple, 3),
+                "avg_holding_time_hours": round(stats.holding_minutes / trades / 60, 2),
+                "best_trade": round(stats.max_r or 0, 3),
+                "worst_trade": round(stats.min_r or 0, 3),
+                "avg_mae": round(stats.mae_total / trades, 3),
+                "avg_mfe": round(stats.mfe_total / trades, 3),
+                "expectancy": round(avg_r_multiple * (wins / max(total_signals, 1)), 3),
+                "profit_factor": 0
+            }
+            if stats.negative_total < 0:
+                metrics["profit_factor"] = round(stats.win_total / abs(stats.negative_total), 3)
+            
+            # Cache result
+            self._cached_metrics[cache_key] = metrics
+            self._cache_timestamp = datetime.now()
+            
+            return metrics
                 
-                if result:
-                    total_signals, wins, losses, avg_r_multiple, avg_holding_time, best_trade, worst_trade, avg_mae, avg_mfe = result
-                    
-                    metrics = {
-                        "total_signals": total_signals or 0,
-                        "wins": wins or 0,
-                        "losses": losses or 0,
-                        "win_rate": (wins / total_signals * 100) if total_signals > 0 else 0,
-                        "avg_r_multiple": round(avg_r_multiple or 0, 3),
-                        "avg_holding_time_hours": round((avg_holding_time or 0) / 60, 2),
-                        "best_trade": round(best_trade or 0, 3),
-                        "worst_trade": round(worst_trade or 0, 3),
-                        "avg_mae": round(avg_mae or 0, 3),
-                        "avg_mfe": round(avg_mfe or 0, 3),
-                        "expectancy": round((avg_r_multiple or 0) * ((wins or 0) / max(total_signals, 1)), 3),
-                        "profit_factor": 0  # Calcolato separatamente
-                    }
-                    
-                    # Calcola profit factor
-                    cursor = await db.execute(f"""
-                        SELECT 
-                            SUM(CASE WHEN o.r_multiple > 0 THEN o.r_multiple ELSE 0 END) as total_profit,
-                            SUM(CASE WHEN o.r_multiple < 0 THEN ABS(o.r_multiple) ELSE 0 END) as total_loss
-                        FROM signal_snapshots s
-                        LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                        {where_clause}
-                    """, params)
-                    
-                    profit_loss = await cursor.fetchone()
-                    if profit_loss and profit_loss[1] and profit_loss[1] > 0:
-                        metrics["profit_factor"] = round(profit_loss[0] / profit_loss[1], 3)
-                    
-                    # Cache result
-                    self._cached_metrics[cache_key] = metrics
-                    self._cache_timestamp = datetime.now()
-                    
-                    return metrics
-                else:
-                    return {"error": "No data found"}
-                    
         except Exception as e:
             logger.error(f"Errore nel calcolo metriche: {e}")
             return {"error": str(e)}
@@ -490,35 +738,34 @@ class SignalOutcomeTracker:
         Analizza performance per regime di mercato
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
-                    SELECT 
-                        JSON_EXTRACT(s.market_context, '$.market_regime') as regime,
-                        COUNT(*) as total_signals,
-                        AVG(CASE WHEN o.r_multiple IS NOT NULL THEN o.r_multiple END) as avg_r_multiple,
-                        COUNT(CASE WHEN o.outcome = 'TP_HIT' THEN 1 END) * 100.0 / COUNT(*) as win_rate
-                    FROM signal_snapshots s
-                    LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    WHERE s.timestamp >= datetime('now', '-30 days')
-                    AND JSON_EXTRACT(s.market_context, '$.market_regime') IS NOT NULL
-                    GROUP BY regime
-                    ORDER BY avg_r_multiple DESC
-                """)
-                
-                results = await cursor.fetchall()
-                
-                regime_performance = {}
-                for regime, total, avg_r, win_rate in results:
-                    if regime:
-                        regime_performance[regime] = {
-                            "total_signals": total,
-                            "avg_r_multiple": round(avg_r or 0, 3),
-                            "win_rate": round(win_rate or 0, 2),
-                            "expectancy": round((avg_r or 0) * (win_rate or 0) / 100, 3)
-                        }
-                
-                return regime_performance
-                
+            await self.sync_pending()
+            
+            results = await self.store.fetchall("""
+                SELECT 
+                    s.market_regime as regime,
+                    COUNT(*) as total_signals,
+                    AVG(CASE WHEN o.r_multiple IS NOT NULL THEN o.r_multiple END) as avg_r_multiple,
+                    COUNT(CASE WHEN o.outcome = 'TP_HIT' THEN 1 END) * 100.0 / COUNT(*) as win_rate
+                FROM signal_snapshots s
+                LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
+                WHERE s.timestamp >= datetime('now', '-30 days')
+                AND s.market_regime IS NOT NULL
+                GROUP BY regime
+                ORDER BY avg_r_multiple DESC
+            """)
+            
+            regime_performance = {}
+            for regime, total, avg_r, win_rate in results:
+                if regime:
+                    regime_performance[regime] = {
+                        "total_signals": total,
+                        "avg_r_multiple": round(avg_r or 0, 3),
+                        "win_rate": round(win_rate or 0, 2),
+                        "expectancy": round((avg_r or 0) * (win_rate or 0) / 100, 3)
+                    }
+            
+            return regime_performance
+            
         except Exception as e:
             logger.error(f"Errore nell'analisi performance per regime: {e}")
             return {}
@@ -535,23 +782,20 @@ class SignalOutcomeTracker:
             metrics = await self.get_performance_metrics(days_back=7)
             regime_perf = await self.get_regime_performance()
             
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO learning_metrics
-                    (timestamp, total_signals, win_rate, avg_r_multiple, 
-                     avg_holding_time, regime_performance)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    datetime.now().isoformat(),
-                    metrics.get("total_signals", 0),
-                    metrics.get("win_rate", 0),
-                    metrics.get("avg_r_multiple", 0),
-                    int(metrics.get("avg_holding_time_hours", 0) * 60),
-                    json.dumps(regime_perf)
-                ))
-                
-                await db.commit()
-                
+            await self.store.execute("""
+                INSERT INTO learning_metrics
+                (timestamp, total_signals, win_rate, avg_r_multiple, 
+                 avg_holding_time, regime_performance)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                datetime.now().isoformat(),
+                metrics.get("total_signals", 0),
+                metrics.get("win_rate", 0),
+                metrics.get("avg_r_multiple", 0),
+                int(metrics.get("avg_holding_time_hours", 0) * 60),
+                json.dumps(regime_perf)
+            ))
+            
         except Exception as e:
             logger.error(f"Errore nell'aggiornamento learning: {e}")
     
@@ -560,77 +804,40 @@ class SignalOutcomeTracker:
         Aggiorna importance delle feature basandosi sui risultati recenti
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # Recupera dati per analisi feature importance
-                cursor = await db.execute("""
-                    SELECT s.technical_features, o.r_multiple, o.outcome
-                    FROM signal_snapshots s
-                    JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    WHERE s.timestamp >= datetime('now', '-7 days')
-                    AND o.r_multiple IS NOT NULL
-                    AND o.outcome IN ('TP_HIT', 'SL_HIT', 'MANUAL_EXIT')
-                """)
-                
-                results = await cursor.fetchall()
-                
-                if len(results) < 10:  # Minimum data per analisi significativa
-                    return
-                
-                # Prepara dati per analisi
-                features_data = []
-                outcomes = []
-                
-                for features_json, r_multiple, outcome in results:
-                    try:
-                        features = json.loads(features_json)
-                        
-                        # Converti features in array numerico
-                        feature_vector = [
-                            features.get("mtf_rsi_1m", 0),
-                            features.get("mtf_rsi_5m", 0),
-                            features.get("mtf_rsi_15m", 0),
-                            features.get("mtf_rsi_30m", 0),
-                            features.get("atr_1m", 0),
-                            features.get("atr_5m", 0),
-                            features.get("atr_15m", 0),
-                            features.get("atr_30m", 0),
-                            features.get("confluence_score", 0),
-                            features.get("signal_strength", 0)
-                        ]
-                        
-                        features_data.append(feature_vector)
-                        outcomes.append(r_multiple)
-                        
-                    except json.JSONDecodeError:
-                        continue
-                
-                if len(features_data) >= 10:
-                    # Calcola correlation-based importance
-                    feature_names = [
-                        "mtf_rsi_1m", "mtf_rsi_5m", "mtf_rsi_15m", "mtf_rsi_30m",
-                        "atr_1m", "atr_5m", "atr_15m", "atr_30m",
-                        "confluence_score", "signal_strength"
-                    ]
-                    
-                    features_df = pd.DataFrame(features_data, columns=feature_names)
-                    outcomes_series = pd.Series(outcomes)
-                    
-                    # Calcola correlazione tra features e outcome
-                    correlations = features_df.corrwith(outcomes_series).abs()
-                    
-                    # Aggiorna database feature importance
-                    for feature_name, importance in correlations.items():
-                        if not np.isnan(importance):
-                            await db.execute("""
-                                INSERT OR REPLACE INTO feature_importance
-                                (feature_name, importance_score, update_count, last_updated)
-                                VALUES (?, ?, COALESCE((SELECT update_count FROM feature_importance WHERE feature_name = ?) + 1, 1), ?)
-                            """, (feature_name, float(importance), feature_name, datetime.now().isoformat()))
-                    
-                    await db.commit()
-                    
-                    logger.info(f"Feature importance aggiornata per {len(feature_names)} features")
-                
+            # Recupera dati per analisi feature importance (colonne tipizzate, niente JSON)
+            columns = ", ".join(f"COALESCE(s.{name}, 0)" for name in TECHNICAL_FEATURE_COLUMNS)
+            results = await self.store.fetchall(f"""
+                SELECT {columns}, o.r_multiple
+                FROM signal_snapshots s
+                JOIN signal_outcomes o ON s.signal_id = o.signal_id
+                WHERE s.timestamp >= datetime('now', '-7 days')
+                AND o.r_multiple IS NOT NULL
+                AND o.outcome IN ('TP_HIT', 'SL_HIT', 'MANUAL_EXIT')
+            """)
+            
+            if len(results) >= 10:  # Minimum data per analisi significativa
+                # Calcola correlation-based importance
+                data = pd.DataFrame(results, columns=TECHNICAL_FEATURE_COLUMNS + ["r_multiple"])
+                features_df = data[TECHNICAL_FEATURE_COLUMNS]
+                outcomes_series = data["r_multiple"]
+                
+                # Calcola correlazione tra features e outcome
+                correlations = features_df.corrwith(outcomes_series).abs()
+                
+                # Aggiorna database feature importance (un solo job per tutte le feature)
+                updated_at = datetime.now().isoformat()
+                await self.store.executemany("""
+                    INSERT OR REPLACE INTO feature_importance
+                    (feature_name, importance_score, update_count, last_updated)
+                    VALUES (?, ?, COALESCE((SELECT update_count FROM feature_importance WHERE feature_name = ?) + 1, 1), ?)
+                """, [
+                    (feature_name, float(importance), feature_name, updated_at)
+                    for feature_name, importance in correlations.items()
+                    if not np.isnan(importance)
+                ])
+                
+                logger.info(f"Feature importance aggiornata per {len(TECHNICAL_FEATURE_COLUMNS)} features")
+            
         except Exception as e:
             logger.error(f"Errore nell'aggiornamento feature importance: {e}")
     
@@ -644,51 +851,49 @@ class SignalOutcomeTracker:
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            async with aiosqlite.connect(self.db_path) as db:
-                # Export signals con outcomes
-                cursor = await db.execute("""
-                    SELECT 
-                        s.*,
-                        o.outcome,
-                        o.exit_timestamp,
-                        o.exit_price,
-                        o.r_multiple,
-                        o.mae,
-                        o.mfe,
-                        o.holding_time_minutes,
-                        o.exit_reason
-                    FROM signal_snapshots s
-                    LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    ORDER BY s.timestamp DESC
-                """)
-                
-                results = await cursor.fetchall()
-                columns = [description[0] for description in cursor.description]
-                
-                df = pd.DataFrame(results, columns=columns)
-                
-                # Export CSV principale
-                csv_file = export_dir / f"signal_analysis_{timestamp}.csv"
-                df.to_csv(csv_file, index=False)
-                
-                # Export metriche summary
-                metrics = await self.get_performance_metrics(days_back=30)
-                regime_perf = await self.get_regime_performance()
-                
-                summary_data = {
-                    "export_timestamp": datetime.now().isoformat(),
-                    "performance_metrics": metrics,
-                    "regime_performance": regime_perf,
-                    "total_records": len(df)
-                }
-                
-                summary_file = export_dir / f"performance_summary_{timestamp}.json"
-                async with aiofiles.open(summary_file, 'w') as f:
-                    await f.write(json.dumps(summary_data, indent=2))
-                
-                logger.info(f"Dati esportati: {csv_file}, {summary_file}")
-                return True
-                
+            await self.sync_pending()
+            
+            # Export signals con outcomes
+            results, columns = await self.store.fetch_with_columns("""
+                SELECT 
+                    s.*,
+                    o.outcome,
+                    o.exit_timestamp,
+                    o.exit_price,
+                    o.r_multiple,
+                    o.mae,
+                    o.mfe,
+                    o.holding_time_minutes,
+                    o.exit_reason
+                FROM signal_snapshots s
+                LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
+                ORDER BY s.timestamp DESC
+            """)
+            
+            df = pd.DataFrame(results, columns=columns)
+            
+            # Export CSV principale
+            csv_file = export_dir / f"signal_analysis_{timestamp}.csv"
+            df.to_csv(csv_file, index=False)
+            
+            # Export metriche summary
+            metrics = await self.get_performance_metrics(days_back=30)
+            regime_perf = await self.get_regime_performance()
+            
+            summary_data = {
+                "export_timestamp": datetime.now().isoformat(),
+                "performance_metrics": metrics,
+                "regime_performance": regime_perf,
+                "total_records": len(df)
+            }
+            
+            summary_file = export_dir / f"performance_summary_{timestamp}.json"
+            async with aiofiles.open(summary_file, 'w') as f:
+                await f.write(json.dumps(summary_data, indent=2))
+            
+            logger.info(f"Dati esportati: {csv_file}, {summary_file}")
+            return True
+            
         except Exception as e:
             logger.error(f"Errore nell'export dati: {e}")
             return False
@@ -698,72 +903,67 @@ class SignalOutcomeTracker:
         Genera insights dal sistema di learning
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # Top performing features
-                cursor = await db.execute("""
-                    SELECT feature_name, importance_score, update_count
-                    FROM feature_importance
-                    ORDER BY importance_score DESC
-                    LIMIT 10
-                """)
-                
-                top_features = await cursor.fetchall()
-                
-                # Learning trend
-                cursor = await db.execute("""
-                    SELECT timestamp, win_rate, avg_r_multiple
-                    FROM learning_metrics
-                    ORDER BY timestamp DESC
-                    LIMIT 30
-                """)
-                
-                learning_trend = await cursor.fetchall()
-                
-                # Performance by timeframe
-                cursor = await db.execute("""
-                    SELECT 
-                        CASE 
-                            WHEN JSON_EXTRACT(technical_features, '$.confluence_score') > 0.7 THEN 'HIGH_CONFLUENCE'
-                            WHEN JSON_EXTRACT(technical_features, '$.confluence_score') > 0.5 THEN 'MEDIUM_CONFLUENCE'
-                            ELSE 'LOW_CONFLUENCE'
-                        END as confluence_level,
-                        AVG(o.r_multiple) as avg_r_multiple,
-                        COUNT(*) as count
-                    FROM signal_snapshots s
-                    JOIN signal_outcomes o ON s.signal_id = o.signal_id
-                    WHERE s.timestamp >= datetime('now', '-30 days')
-                    AND o.r_multiple IS NOT NULL
-                    GROUP BY confluence_level
-                """)
-                
-                confluence_perf = await cursor.fetchall()
-                
-                insights = {
-                    "top_features": [
-                        {"feature": feat, "importance": round(imp, 3), "updates": cnt}
-                        for feat, imp, cnt in top_features
-                    ],
-                    "learning_trend": [
-                        {
-                            "timestamp": ts,
-                            "win_rate": round(wr or 0, 2),
-                            "avg_r_multiple": round(ar or 0, 3)
-                        }
-                        for ts, wr, ar in learning_trend
-                    ],
-                    "confluence_performance": [
-                        {
-                            "level": level,
-                            "avg_r_multiple": round(ar or 0, 3),
-                            "count": cnt
-                        }
-                        for level, ar, cnt in confluence_perf
-                    ],
-                    "generated_at": datetime.now().isoformat()
-                }
-                
-                return insights
-                
+            await self.sync_pending()
+            
+            # Top performing features
+            top_features = await self.store.fetchall("""
+                SELECT feature_name, importance_score, update_count
+                FROM feature_importance
+                ORDER BY importance_score DESC
+                LIMIT 10
+            """)
+            
+            # Learning trend
+            learning_trend = await self.store.fetchall("""
+                SELECT timestamp, win_rate, avg_r_multiple
+                FROM learning_metrics
+                ORDER BY timestamp DESC
+                LIMIT 30
+            """)
+            
+            # Performance by timeframe
+            confluence_perf = await self.store.fetchall("""
+                SELECT 
+                    CASE 
+                        WHEN s.confluence_score > 0.7 THEN 'HIGH_CONFLUENCE'
+                        WHEN s.confluence_score > 0.5 THEN 'MEDIUM_CONFLUENCE'
+                        ELSE 'LOW_CONFLUENCE'
+                    END as confluence_level,
+                    AVG(o.r_multiple) as avg_r_multiple,
+                    COUNT(*) as count
+                FROM signal_snapshots s
+                JOIN signal_outcomes o ON s.signal_id = o.signal_id
+                WHERE s.timestamp >= datetime('now', '-30 days')
+                AND o.r_multiple IS NOT NULL
+                GROUP BY confluence_level
+            """)
+            
+            insights = {
+                "top_features": [
+                    {"feature": feat, "importance": round(imp, 3), "updates": cnt}
+                    for feat, imp, cnt in top_features
+                ],
+                "learning_trend": [
+                    {
+                        "timestamp": ts,
+                        "win_rate": round(wr or 0, 2),
+                        "avg_r_multiple": round(ar or 0, 3)
+                    }
+                    for ts, wr, ar in learning_trend
+                ],
+                "confluence_performance": [
+                    {
+                        "level": level,
+                        "avg_r_multiple": round(ar or 0, 3),
+                        "count": cnt
+                    }
+                    for level, ar, cnt in confluence_perf
+                ],
+                "generated_at": datetime.now().isoformat()
+            }
+            
+            return insights
+            
         except Exception as e:
             logger.error(f"Errore nel recupero learning insights: {e}")
             return {"error": str(e)}
@@ -0,0 +1,439 @@
+"""
+Pooled SQLite Access Layer
+
+Livello di accesso condiviso ai database SQLite del sistema quant adaptive.
+Sostituisce il pattern ``aiosqlite.connect(db_path)`` per singola operazione
+(una connessione e un thread nuovi ad ogni query) con connessioni persistenti
+per file.
+
+Features:
+- Connessioni long-lived in WAL mode con pragma ottimizzati
+  (synchronous=NORMAL, mmap_size, cache_size, temp_store)
+- Pool di connessioni di sola lettura, concorrenti grazie al WAL
+- Un unico writer task per file: le scritture vengono serializzate e
+  raggruppate in una sola transazione (group commit)
+- Prepared statement cache per connessione (riutilizzata perché le
+  connessioni non vengono più chiuse ad ogni operazione)
+- Istogrammi di latenza per store, separati per letture e scritture
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+# Pragma applicati a ogni connessione (lettura e scrittura)
+DEFAULT_PRAGMAS: Dict[str, Union[int, str]] = {
+    "synchronous": "NORMAL",        # Sicuro in WAL, fsync solo al checkpoint
+    "mmap_size": 256 * 1024 * 1024,  # 256MB di file mappati in memoria
+    "cache_size": -16000,           # ~16MB di page cache per connessione
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000
+}
+
+# Statement: (sql, parametri, executemany)
+_Statement = Tuple[str, Any, bool]
+# Job del writer: statement da eseguire atomicamente, future del risultato, istante di accodamento
+_WriteJob = Tuple[List[_Statement], asyncio.Future, float]
+
+
+class LatencyHistogram:
+    """
+    Istogramma di latenza a bucket fissi (in millisecondi)
+    """
+
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float):
+        """Registra una durata in secondi"""
+        ms = seconds * 1000
+        index = len(self.BUCKETS_MS)
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, pct: float) -> float:
+        """Stima del percentile come limite superiore del bucket che lo contiene"""
+        if not self.count:
+            return 0.0
+        rank = self.count * pct / 100
+        seen = 0
+        for bound, count in zip(self.BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return round(self.max_ms, 3)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Restituisce conteggi per bucket e statistiche riassuntive"""
+        buckets = {f"<={bound}ms": count for bound, count in zip(self.BUCKETS_MS, self.counts)}
+        buckets["+inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets
+        }
+
+
+@dataclass
+class SQLiteStoreMetrics:
+    """Metriche operative di uno store"""
+    reads: int = 0
+    writes: int = 0
+    failed_writes: int = 0
+    write_batches: int = 0
+    statements_written: int = 0
+    peak_queue_depth: int = 0
+    reader_waits: int = 0
+
+
+class SQLiteStore:
+    """
+    Accesso pooled a un singolo file SQLite:
+    - ``readers`` connessioni aiosqlite persistenti in sola lettura
+    - una connessione di scrittura su un thread dedicato, alimentata da un
+      writer task che raggruppa fino a ``max_batch_size`` job per commit
+    - ogni job gira in un SAVEPOINT, quindi un job fallito non annulla gli
+      altri job dello stesso commit
+    - le future dei job si risolvono solo dopo il COMMIT, quindi una lettura
+      successiva vede sempre la scrittura
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        readers: int = 4,
+        max_batch_size: int = 64,
+        max_pending: int = 1000,
+        cached_statements: int = 256,
+        pragmas: Optional[Dict[str, Union[int, str]]] = None
+    ):
+        self.db_path = Path(db_path)
+        self.name = self.db_path.stem
+        self.readers = max(1, readers)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_pending = max(self.max_batch_size, max_pending)
+        self.cached_statements = cached_statements
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+        self._reader_pool: Optional[asyncio.Queue] = None
+        self._reader_connections: List[aiosqlite.Connection] = []
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_connection: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.metrics = SQLiteStoreMetrics()
+        self.latency = {"read": LatencyHistogram(), "write": LatencyHistogram()}
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer_task is not None
+
+    def is_bound_to(self, loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+        """True se lo store non è ancora aperto o è aperto su ``loop``"""
+        return self._loop is None or (self._loop is loop and not self._loop.is_closed())
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def open(self):
+        """Apre la connessione di scrittura, il pool di lettura e il writer task"""
+        if self.is_open:
+            return
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+
+        async with self._open_lock:
+            if self.is_open:
+                return
+
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._loop = asyncio.get_running_loop()
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"sqlite-writer-{self.name}")
+            await self._loop.run_in_executor(self._executor, self._open_writer_connection)
+
+            self._reader_pool = asyncio.Queue()
+            for _ in range(self.readers):
+                conn = await aiosqlite.connect(self.db_path, cached_statements=self.cached_statements)
+                for pragma, value in self.pragmas.items():
+                    await conn.execute(f"PRAGMA {pragma}={value}")
+                await conn.execute("PRAGMA query_only=ON")
+                self._reader_connections.append(conn)
+                self._reader_pool.put_nowait(conn)
+
+            self._write_queue = asyncio.Queue(maxsize=self.max_pending)
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+            logger.info(f"SQLite store {self.name} aperto ({self.readers} reader, WAL)")
+
+    def _open_writer_connection(self):
+        """Eseguito sul thread del writer: crea la connessione e attiva il WAL"""
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        for pragma, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {pragma}={value}")
+        self._writer_connection = conn
+
+    async def close(self):
+        """Completa le scritture in coda e chiude tutte le connessioni"""
+        if not self.is_open:
+            return
+
+        await self._write_queue.put(None)
+        await self._writer_task
+        self._writer_task = None
+
+        for conn in self._reader_connections:
+            await conn.close()
+        self._reader_connections = []
+        self._reader_pool = None
+
+        await self._loop.run_in_executor(self._executor, self._close_writer_connection)
+        self._executor.shutdown(wait=False)
+        self._executor = None
+        self._loop = None
+
+        logger.info(f"SQLite store {self.name} chiuso")
+
+    def _close_writer_connection(self):
+        if self._writer_connection is not None:
+            self._writer_connection.close()
+            self._writer_connection = None
+
+    def abandon(self):
+        """
+        Rilascia le risorse di uno store il cui event loop non è più attivo
+        (le connessioni non possono essere chiuse con await dal loop originale)
+        """
+        for conn in self._reader_connections:
+            conn.stop()  # Sincrono, disponibile da aiosqlite 0.22
+        self._reader_connections = []
+        if self._executor is not None:
+            self._executor.submit(self._close_writer_connection)
+            self._executor.shutdown(wait=False)
+        self._writer_task = None
+        self._executor = None
+        self._loop = None
+
+    # ------------------------------------------------------------------
+    # Letture
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Presta una connessione di lettura del pool"""
+        await self.open()
+        if self._reader_pool.empty():
+            self.metrics.reader_waits += 1
+        conn = await self._reader_pool.get()
+        start = time.perf_counter()
+        try:
+            yield conn
+        finally:
+            self._reader_pool.put_nowait(conn)
+            self.metrics.reads += 1
+            self.latency["read"].record(time.perf_counter() - start)
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple]:
+        """Esegue una query e restituisce tutte le righe"""
+        async with self.reader() as conn:
+            return list(await conn.execute_fetchall(sql, params))
+
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[Tuple]:
+        """Esegue una query e restituisce la prima riga (o None)"""
+        async with self.reader() as conn:
+            async with conn.execute(sql, params) as cursor:
+                return await cursor.fetchone()
+
+    async def fetch_with_columns(self, sql: str, params: Sequence[Any] = ()) -> Tuple[List[Tuple], List[str]]:
+        """Esegue una query e restituisce righe e nomi delle colonne"""
+        async with self.reader() as conn:
+            async with conn.execute(sql, params) as cursor:
+                rows = await cursor.fetchall()
+                return list(rows), [description[0] for description in cursor.description]
+
+    # ------------------------------------------------------------------
+    # Scritture
+    # ------------------------------------------------------------------
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> Optional[int]:
+        """Accoda una singola scrittura e restituisce il lastrowid dopo il commit"""
+        return await self._submit([(sql, params, False)])
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> Optional[int]:
+        """Accoda lo stesso statement per più set di parametri, in un unico job"""
+        return await self._submit([(sql, list(seq_of_params), True)])
+
+    async def write(self, statements: Iterable[Tuple[str, Sequence[Any]]]) -> Optional[int]:
+        """Accoda più statement da applicare atomicamente (tutti o nessuno)"""
+        return await self._submit([(sql, params, False) for sql, params in statements])
+
+    async def write_many(self, statements: Iterable[Tuple[str, Iterable[Sequence[Any]]]]) -> Optional[int]:
+        """Come ``write``, ma ogni statement viene eseguito con executemany sui suoi parametri"""
+        return await self._submit([(sql, list(seq_of_params), True) for sql, seq_of_params in statements])
+
+    async def _submit(self, statements: List[_Statement]) -> Optional[int]:
+        await self.open()
+        future = self._loop.create_future()
+        await self._write_queue.put((statements, future, time.perf_counter()))
+        self.metrics.peak_queue_depth = max(self.metrics.peak_queue_depth, self._write_queue.qsize())
+        return await future
+
+    async def _writer_loop(self):
+        """Unico consumer della coda: raggruppa i job disponibili in un commit"""
+        stopping = False
+        while not stopping:
+            job = await self._write_queue.get()
+            if job is None:
+                break
+
+            batch = [job]
+            while len(batch) < self.max_batch_size:
+                try:
+                    job = self._write_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+
+            try:
+                results = await self._loop.run_in_executor(
+                    self._executor, self._commit_batch, [statements for statements, _, _ in batch]
+                )
+            except Exception as e:
+                logger.error(f"Errore nel commit su {self.name}: {e}")
+                results = [(None, e)] * len(batch)
+
+            self.metrics.write_batches += 1
+            now = time.perf_counter()
+            for (statements, future, enqueued_at), (lastrowid, error) in zip(batch, results):
+                self.metrics.writes += 1
+                self.metrics.statements_written += len(statements)
+                self.latency["write"].record(now - enqueued_at)
+                if future.done():
+                    continue
+                if error is not None:
+                    self.metrics.failed_writes += 1
+                    future.set_exception(error)
+                else:
+                    future.set_result(lastrowid)
+
+    def _commit_batch(self, jobs: List[List[_Statement]]) -> List[Tuple[Optional[int], Optional[Exception]]]:
+        """Eseguito sul thread del writer: un BEGIN, un SAVEPOINT per job, un COMMIT"""
+        conn = self._writer_connection
+        results = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statements in jobs:
+                conn.execute("SAVEPOINT job")
+                try:
+                    lastrowid = None
+                    for sql, params, many in statements:
+                        cursor = conn.executemany(sql, params) if many else conn.execute(sql, params)
+                        lastrowid = cursor.lastrowid
+                    conn.execute("RELEASE job")
+                    results.append((lastrowid, None))
+                except sqlite3.Error as e:
+                    conn.execute("ROLLBACK TO job")
+                    conn.execute("RELEASE job")
+                    results.append((None, e))
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return results
+
+    # ------------------------------------------------------------------
+    # Metriche
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Metriche dello store con istogrammi di latenza per letture e scritture"""
+        return {
+            "path": str(self.db_path),
+            "open": self.is_open,
+            "readers": self.readers,
+            "queue_depth": self._write_queue.qsize() if self._write_queue is not None else 0,
+            **self.metrics.__dict__,
+            "avg_batch_size": round(self.metrics.writes / self.metrics.write_batches, 2)
+            if self.metrics.write_batches else 0.0,
+            "latency": {kind: histogram.snapshot() for kind, histogram in self.latency.items()}
+        }
+
+
+# Registry globale: uno store per file di database
+_stores: Dict[str, SQLiteStore] = {}
+
+
+def get_sqlite_store(db_path: Union[str, Path]) -> SQLiteStore:
+    """
+    Restituisce lo store condiviso per ``db_path``. Componenti diversi che
+    usano lo stesso file condividono connessioni e writer. Uno store aperto
+    su un event loop non più attivo viene sostituito.
+    """
+    key = str(Path(db_path).resolve())
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    store = _stores.get(key)
+    if store is not None and loop is not None and not store.is_bound_to(loop):
+        store.abandon()
+        store = None
+    if store is None:
+        store = SQLiteStore(db_path)
+        _stores[key] = store
+    return store
+
+
+async def close_sqlite_stores():
+    """Chiude tutti gli store aperti (da chiamare allo shutdown)"""
+    stores = list(_stores.values())
+    _stores.clear()
+    for store in stores:
+        try:
+            await store.close()
+        except Exception as e:
+            logger.error(f"Errore nella chiusura dello store {store.name}: {e}")
+
+
+def get_sqlite_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metriche di tutti gli store, per nome del database"""
+    return {store.name: store.get_metrics() for store in _stores.values()}
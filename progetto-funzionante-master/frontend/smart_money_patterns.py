@@ -0,0 +1,148 @@
+"""
+Smart Money Pattern Detection
+Vectorized swing points, fair value gaps, order blocks and liquidity zones for
+OHLCV bars, used by AdvancedSignalAnalyzer.
+
+Every detector returns a boolean mask aligned with the input bars, so callers
+only build result objects for the few matches they keep.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Bars compared on each side of a candidate swing point
+SWING_WINDOW = 5
+
+# Order blocks: history used for the move threshold and bars checked for consolidation
+ORDER_BLOCK_LOOKBACK = 20
+ORDER_BLOCK_LOOKAHEAD = 10
+
+# Liquidity zones: bars averaged for the volume baseline
+LIQUIDITY_LOOKBACK = 10
+
+
+def _as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def swing_points(values, point_type: str = "high", window: int = SWING_WINDOW) -> np.ndarray:
+    """
+    Mark bars that are the extreme of the 2 * window + 1 bars centred on them
+
+    Args:
+        values: Highs for swing highs, lows for swing lows
+        point_type: "high" or "low"
+        window: Bars on each side of the candidate
+
+    Returns:
+        Boolean mask; the first and last `window` bars are never swing points
+    """
+    values = _as_array(values)
+    mask = np.zeros(len(values), dtype=bool)
+    span = 2 * window + 1
+    if len(values) < span:
+        return mask
+
+    windows = sliding_window_view(values, span)
+    extreme = windows.max(axis=1) if point_type == "high" else windows.min(axis=1)
+    mask[window:len(values) - window] = values[window:len(values) - window] == extreme
+    return mask
+
+
+def fair_value_gaps(highs, lows) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mark the middle bar of three-bar fair value gaps
+
+    A bullish gap leaves the previous high below the next low; a bearish gap
+    leaves the previous low above the next high. Bullish takes precedence.
+
+    Returns:
+        (bullish, bearish) boolean masks
+    """
+    highs = _as_array(highs)
+    lows = _as_array(lows)
+    bullish = np.zeros(len(highs), dtype=bool)
+    bearish = np.zeros(len(highs), dtype=bool)
+    if len(highs) < 3:
+        return bullish, bearish
+
+    bullish[1:-1] = highs[:-2] < lows[2:]
+    bearish[1:-1] = ~bullish[1:-1] & (lows[:-2] > highs[2:])
+    return bullish, bearish
+
+
+def order_blocks(
+    opens,
+    highs,
+    lows,
+    closes,
+    lookback: int = ORDER_BLOCK_LOOKBACK,
+    lookahead: int = ORDER_BLOCK_LOOKAHEAD
+) -> np.ndarray:
+    """
+    Mark bullish order blocks: a strong up candle followed by consolidation
+
+    The candle body must exceed twice the standard deviation of the previous
+    `lookback` closes, and the range of the next `lookahead` bars must be under
+    half the candle's own range.
+
+    Returns:
+        Boolean mask; bars without a full lookback and lookahead are never marked
+    """
+    opens, highs, lows, closes = (_as_array(a) for a in (opens, highs, lows, closes))
+    n = len(closes)
+    mask = np.zeros(n, dtype=bool)
+    if n < lookback + lookahead + 1:
+        return mask
+
+    # Candidates are bars lookback .. n - lookahead - 1
+    candidates = slice(lookback, n - lookahead)
+    prev_std = sliding_window_view(closes, lookback).std(axis=1, ddof=1)[:n - lookback - lookahead]
+    next_high = sliding_window_view(highs, lookahead).max(axis=1)[lookback + 1:]
+    next_low = sliding_window_view(lows, lookahead).min(axis=1)[lookback + 1:]
+
+    body = closes[candidates] - opens[candidates]
+    strong_move = (body > 0) & (body > prev_std * 2)
+    consolidation = (next_high - next_low) < (highs[candidates] - lows[candidates]) * 0.5
+
+    mask[candidates] = strong_move & consolidation
+    return mask
+
+
+def liquidity_zones(
+    opens,
+    highs,
+    lows,
+    closes,
+    volumes,
+    lookback: int = LIQUIDITY_LOOKBACK
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mark high-volume rejection candles
+
+    Volume must exceed 1.5x the mean of the previous `lookback` bars and the
+    body must be under 30% of the candle range.
+
+    Returns:
+        (mask, relative_volume); relative volume is NaN where the mask cannot apply
+    """
+    opens, highs, lows, closes, volumes = (_as_array(a) for a in (opens, highs, lows, closes, volumes))
+    n = len(closes)
+    mask = np.zeros(n, dtype=bool)
+    relative_volume = np.full(n, np.nan)
+    if n < 2 * lookback + 1:
+        return mask, relative_volume
+
+    # Candidates are bars lookback .. n - lookback - 1, matching the original scan
+    candidates = slice(lookback, n - lookback)
+    prev_mean = sliding_window_view(volumes, lookback).mean(axis=1)[:n - 2 * lookback]
+
+    high_volume = volumes[candidates] > prev_mean * 1.5
+    rejection = np.abs(closes[candidates] - opens[candidates]) < (highs[candidates] - lows[candidates]) * 0.3
+
+    mask[candidates] = high_volume & rejection
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_volume[candidates] = volumes[candidates] / prev_mean
+    return mask, relative_volume
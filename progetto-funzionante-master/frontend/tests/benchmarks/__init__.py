@@ -0,0 +1 @@
+# Benchmarks comparing hot paths against their previous implementation
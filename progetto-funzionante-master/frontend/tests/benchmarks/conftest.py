@@ -0,0 +1,30 @@
+"""
+Shared fixtures for benchmarks.
+"""
+
+import gc
+import time
+import pytest
+
+
+@pytest.fixture
+def best_time():
+    """
+    Time a callable as the best mean seconds per call over a few repeats.
+
+    The garbage collector is off while timing, since a collection over the rest of
+    the session's heap would dominate short measurements.
+    """
+    def measure(run, rounds: int = 1, repeats: int = 5) -> float:
+        timings = []
+        gc.disable()
+        try:
+            for _ in range(repeats):
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    run()
+                timings.append((time.perf_counter() - start) / rounds)
+        finally:
+            gc.enable()
+        return min(timings)
+    return measure
@@ -0,0 +1,31 @@
+"""
+Benchmark for the vectorized multi-instrument indicator kernel.
+"""
+
+import pytest
+
+from oanda_signal_engine import OANDASignalEngine
+from tests.factories.candle_factory import CandleFactory
+
+
+class TestBatchIndicatorsBenchmark:
+    """Benchmark of the batch kernel against the per-instrument path."""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("instruments", [50, 200])
+    def test_batch_is_faster_than_per_instrument(self, best_time, instruments):
+        """One vectorized pass beats analysing each instrument on its own."""
+        engine = OANDASignalEngine("test-key", "test-account")
+        universe = CandleFactory.create_random_universe(instruments)
+        engine.calculate_technical_analysis_batch(universe)  # Warm the weight caches
+
+        def per_instrument():
+            for candles in universe.values():
+                engine._calculate_technical_analysis(candles)
+
+        per_instrument_time = best_time(per_instrument, repeats=3)
+        batch_time = best_time(lambda: engine.calculate_technical_analysis_batch(universe), repeats=3)
+
+        print(f"\n{instruments} instruments x 200 bars: per-instrument {per_instrument_time * 1e3:.1f}ms, "
+              f"batch {batch_time * 1e3:.1f}ms ({per_instrument_time / batch_time:.1f}x)")
+        assert batch_time < per_instrument_time
@@ -0,0 +1,28 @@
+"""
+Benchmark for the cache value codec.
+"""
+
+import json
+import pytest
+
+from app.services.cache_codec import CacheCodec
+from tests.factories.signal_factory import SignalFactory
+
+
+class TestCacheCodecBenchmark:
+    """Benchmark against the previous json.dumps(default=str) format."""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("count", [10, 50, 100])
+    def test_signal_payload_round_trip_speed(self, best_time, count):
+        """Round-tripping cache_signals payloads is no more than 3x slower than legacy JSON."""
+        codec = CacheCodec()
+        payload = {"data": [SignalFactory.create_cached_signal_dict(i) for i in range(count)],
+                   "cached_at": "2024-01-01T10:00:00"}
+        rounds = 200
+
+        legacy_time = best_time(lambda: json.loads(json.dumps(payload, default=str)), rounds)
+        codec_time = best_time(lambda: codec.decode(codec.encode(payload)), rounds)
+
+        print(f"\n{count} signals: json {legacy_time * 1e6:.0f}us, codec {codec_time * 1e6:.0f}us")
+        assert codec_time < legacy_time * 3
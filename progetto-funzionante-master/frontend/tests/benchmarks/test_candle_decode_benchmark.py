@@ -0,0 +1,36 @@
+"""
+Benchmark for decoding OANDA /candles bodies into a CandleFrame.
+"""
+
+import json
+import pytest
+
+import oanda_api_client
+from oanda_api_client import CandleFrame
+from tests.factories.candle_factory import CandleFactory
+
+
+class TestCandleDecodeBenchmark:
+    """Benchmark of the bytes decoder against text + json.loads."""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("count", [500, 5000])
+    def test_bytes_decode_is_faster_than_text_decode(self, best_time, count):
+        """Decoding from bytes with orjson beats decoding the text with json.loads."""
+        if not oanda_api_client.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        body = CandleFactory.create_candles_body(count)
+        rounds = 20
+
+        def legacy(raw):
+            return CandleFrame.from_oanda_response(json.loads(raw.decode("utf-8"))["candles"])
+
+        def fast(raw):
+            return CandleFrame.from_oanda_response(oanda_api_client._json_loads(raw)["candles"])
+
+        legacy_time = best_time(lambda: legacy(body), rounds)
+        fast_time = best_time(lambda: fast(body), rounds)
+
+        print(f"\n{count} candles ({len(body) // 1024} KiB): "
+              f"text+json {legacy_time * 1e3:.2f}ms, bytes {fast_time * 1e3:.2f}ms")
+        assert fast_time < legacy_time
@@ -0,0 +1,26 @@
+"""
+Benchmark for the grouped MetricsEngine breakdowns.
+"""
+
+import pytest
+
+from quant_adaptive_system.reporting.metrics_engine import MetricsEngine
+from tests.factories.trade_factory import TradeFactory
+
+
+class TestGroupedBreakdownsBenchmark:
+    """Benchmark of the grouped breakdown pass as the instrument count grows."""
+
+    @pytest.mark.slow
+    def test_breakdown_cost_is_flat_in_instrument_count(self, best_time, tmp_path):
+        """The grouped pass costs about the same for 10 or 200 instruments."""
+        engine = MetricsEngine(str(tmp_path / "metrics_engine.db"))
+        timings = {}
+        for count in (10, 200):
+            trades = TradeFactory.create_trades_frame(20000, [f"PAIR_{i}" for i in range(count)])
+            dimensions = {"instrument": trades["instrument"], "regime": trades["market_regime"]}
+            timings[count] = best_time(lambda: engine._grouped_performance(trades, dimensions, 365), repeats=3)
+
+        print(f"\ngrouped breakdown over 20000 trades: 10 instruments {timings[10] * 1e3:.1f}ms, "
+              f"200 instruments {timings[200] * 1e3:.1f}ms")
+        assert timings[200] < timings[10] * 3
@@ -0,0 +1,59 @@
+"""
+Benchmark for report windows over the daily performance rollups.
+"""
+
+import random
+import time
+import pytest
+from datetime import datetime, timedelta
+
+from quant_adaptive_system.storage.sqlite_pool import close_sqlite_stores
+from quant_adaptive_system.signal_intelligence import signal_outcomes
+from quant_adaptive_system.reporting.performance_aggregator import PORTFOLIO
+from tests.factories.signal_snapshot_factory import SignalSnapshotFactory
+
+pytestmark = pytest.mark.usefixtures("isolated_registry")
+
+
+class TestDailyRollupsBenchmark:
+    """Benchmark of rollup windows against rescanning every trade."""
+
+    @pytest.mark.slow
+    async def test_yearly_report_latency(self, tracker):
+        """A 365-day window merges daily buckets instead of rescanning every trade."""
+        now = datetime.now().replace(hour=12)
+        per_day = 20
+        try:
+            await tracker.initialize()
+            rng = random.Random(11)
+            snapshots, outcomes = [], []
+            for day in range(365):
+                for i in range(per_day):
+                    signal_id = f"SIG-{day}-{i}"
+                    snapshot = SignalSnapshotFactory.create_snapshot(signal_id, now - timedelta(days=day, minutes=i))
+                    params = tracker._snapshot_params(snapshot)
+                    r = rng.choice([-1.0, 2.0, 0.4])
+                    snapshots.append(params)
+                    outcomes.append((signal_id, "TP_HIT" if r > 0 else "SL_HIT", r))
+            await tracker.store.write_many([
+                (signal_outcomes._SNAPSHOT_INSERT_SQL, snapshots),
+                ("INSERT INTO signal_outcomes (signal_id, outcome, r_multiple, holding_time_minutes) VALUES (?, ?, ?, 60)", outcomes)
+            ])
+            await tracker.rollups.rebuild()
+
+            start = now - timedelta(days=365)
+            begin = time.perf_counter()
+            rescanned = (await tracker.rollups.fold_range(start.isoformat(), now.isoformat(), inclusive=True))[PORTFOLIO]
+            rescan_time = time.perf_counter() - begin
+
+            begin = time.perf_counter()
+            rolled_up = await tracker.rollups.window(start, now)
+            rollup_time = time.perf_counter() - begin
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        print(f"\n365-day window over {len(outcomes)} trades: full rescan {rescan_time * 1e3:.1f}ms, "
+              f"daily rollups {rollup_time * 1e3:.1f}ms")
+        assert rolled_up.trades == rescanned.trades == len(outcomes)
+        assert rollup_time < rescan_time
@@ -0,0 +1,49 @@
+"""
+Benchmark for the SignalOutcomeTracker write-behind queue.
+"""
+
+import time
+import pytest
+from datetime import datetime
+
+from quant_adaptive_system.storage.sqlite_pool import close_sqlite_stores
+from quant_adaptive_system.signal_intelligence import signal_outcomes
+from quant_adaptive_system.signal_intelligence.signal_outcomes import SignalOutcomeTracker
+from tests.factories.signal_snapshot_factory import SignalSnapshotFactory
+
+pytestmark = pytest.mark.usefixtures("isolated_registry")
+
+
+class TestOutcomeWriteBehindBenchmark:
+    """Benchmark of the write-behind queue against a commit per signal."""
+
+    @pytest.mark.slow
+    async def test_rolling_sweep_latency(self, tmp_path):
+        """Tracking a sweep no longer waits on a commit per signal."""
+        signals = 200
+        tracker = SignalOutcomeTracker(str(tmp_path / "signal_outcomes.db"), flush_interval=60)
+        try:
+            await tracker.initialize()
+
+            start = time.perf_counter()
+            for i in range(signals):
+                snapshot = SignalSnapshotFactory.create_snapshot(f"OLD-{i}")
+                # Previous behaviour: both rows written and committed before returning
+                await tracker.store.write([
+                    (signal_outcomes._SNAPSHOT_INSERT_SQL, tracker._snapshot_params(snapshot)),
+                    (signal_outcomes._OUTCOME_INSERT_SQL, (snapshot.signal_id, "PENDING", datetime.now().isoformat()))
+                ])
+            commit_per_signal = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(signals):
+                await tracker.track_signal(SignalSnapshotFactory.create_snapshot(f"NEW-{i}"))
+            await tracker.flush()
+            write_behind = time.perf_counter() - start
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        print(f"\n{signals} signals: commit per signal {commit_per_signal * 1e3:.1f}ms, "
+              f"write-behind incl. flush {write_behind * 1e3:.1f}ms")
+        assert write_behind < commit_per_signal
@@ -0,0 +1,41 @@
+"""
+Benchmark for the vectorized smart-money pattern detectors.
+"""
+
+import pytest
+
+from advanced_signal_analyzer import AdvancedSignalAnalyzer
+from tests.factories.candle_factory import CandleFactory
+from tests.references.smart_money import (
+    reference_swing_points, reference_liquidity_zones, reference_order_blocks, reference_fair_value_gaps
+)
+
+
+class TestSmartMoneyBenchmark:
+    """Benchmark of the vectorized detectors against the original loops."""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("count", [500, 5000])
+    def test_vectorized_is_faster_than_loops(self, best_time, count):
+        """Swing points, FVGs, order blocks and liquidity zones together beat the per-row loops."""
+        analyzer = AdvancedSignalAnalyzer("test-key")
+        df = CandleFactory.create_random_bars(count)
+
+        def vectorized():
+            analyzer._find_swing_points(df["high"], "high")
+            analyzer._identify_fair_value_gaps(df)
+            analyzer._identify_order_blocks(df)
+            analyzer._identify_liquidity_zones(None, df)
+
+        def loops():
+            reference_swing_points(df["high"], "high")
+            reference_fair_value_gaps(df)
+            reference_order_blocks(df)
+            reference_liquidity_zones(df)
+
+        loop_time = best_time(loops, repeats=1)
+        vectorized_time = best_time(vectorized)
+
+        print(f"\n{count} bars: loop {loop_time * 1e3:.1f}ms, vectorized {vectorized_time * 1e3:.2f}ms "
+              f"({loop_time / vectorized_time:.0f}x)")
+        assert vectorized_time < loop_time
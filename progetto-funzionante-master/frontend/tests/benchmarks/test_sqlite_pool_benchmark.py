@@ -0,0 +1,56 @@
+"""
+Benchmark for the pooled SQLite access layer of the quant adaptive system.
+"""
+
+import time
+import pytest
+
+import aiosqlite
+
+from quant_adaptive_system.storage.sqlite_pool import LatencyHistogram, get_sqlite_store, close_sqlite_stores
+
+CREATE_TABLE = "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)"
+
+
+class TestSQLiteStoreBenchmark:
+    """Benchmark of the pooled store against a connection per operation."""
+
+    @pytest.mark.slow
+    async def test_pooled_latency_vs_connection_per_operation(self, tmp_path, isolated_registry):
+        """Per-store histograms show the gain over opening a connection per operation."""
+        operations = 200
+        legacy_path = tmp_path / "legacy.db"
+        legacy = LatencyHistogram()
+
+        async with aiosqlite.connect(legacy_path) as db:
+            await db.execute(CREATE_TABLE)
+            await db.commit()
+        for i in range(operations):
+            start = time.perf_counter()
+            async with aiosqlite.connect(legacy_path) as db:
+                await db.execute("INSERT INTO items (name) VALUES (?)", (f"item-{i}",))
+                await db.commit()
+            async with aiosqlite.connect(legacy_path) as db:
+                cursor = await db.execute("SELECT name FROM items WHERE id = ?", (i + 1,))
+                await cursor.fetchone()
+            legacy.record(time.perf_counter() - start)
+
+        store = get_sqlite_store(tmp_path / "pooled.db")
+        pooled = LatencyHistogram()
+        try:
+            await store.execute(CREATE_TABLE)
+            for i in range(operations):
+                start = time.perf_counter()
+                await store.execute("INSERT INTO items (name) VALUES (?)", (f"item-{i}",))
+                await store.fetchone("SELECT name FROM items WHERE id = ?", (i + 1,))
+                pooled.record(time.perf_counter() - start)
+            store_metrics = store.get_metrics()
+        finally:
+            await close_sqlite_stores()
+
+        legacy_stats, pooled_stats = legacy.snapshot(), pooled.snapshot()
+        print(f"\nwrite+read x{operations}: connect-per-op avg {legacy_stats['avg_ms']}ms "
+              f"p95 {legacy_stats['p95_ms']}ms, pooled avg {pooled_stats['avg_ms']}ms p95 {pooled_stats['p95_ms']}ms")
+        print(f"pooled store read {store_metrics['latency']['read']['p50_ms']}ms p50, "
+              f"write {store_metrics['latency']['write']['p50_ms']}ms p50")
+        assert pooled_stats["avg_ms"] < legacy_stats["avg_ms"]
@@ -0,0 +1,26 @@
+"""
+Benchmark for the vectorized volume profile builder.
+"""
+
+import pytest
+
+from volume_profile import build_volume_profile
+from tests.factories.candle_factory import CandleFactory
+from tests.references.volume_profile import reference_profile
+
+
+class TestVolumeProfileBenchmark:
+    """Benchmark of build_volume_profile against the original loop."""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("count", [100, 500])
+    def test_vectorized_is_faster_than_loop(self, best_time, count):
+        """The vectorized builder beats the per-level, per-row loop (50 levels)."""
+        df = CandleFactory.create_random_bars(count)
+
+        loop_time = best_time(lambda: reference_profile(df), repeats=3)
+        vectorized_time = best_time(lambda: build_volume_profile(df["low"], df["high"], df["volume"]))
+
+        print(f"\n{count} bars: loop {loop_time * 1e3:.1f}ms, vectorized {vectorized_time * 1e3:.2f}ms "
+              f"({loop_time / vectorized_time:.0f}x)")
+        assert vectorized_time < loop_time
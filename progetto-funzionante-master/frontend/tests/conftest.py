@@ -0,0 +1,23 @@
+"""
+Shared fixtures for unit tests and benchmarks.
+"""
+
+import pytest
+
+from quant_adaptive_system.storage import sqlite_pool
+from quant_adaptive_system.signal_intelligence import signal_outcomes
+from quant_adaptive_system.signal_intelligence.signal_outcomes import SignalOutcomeTracker
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    """Empty SQLite store registry, so stores never leak between tests."""
+    monkeypatch.setattr(sqlite_pool, "_stores", {})
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    """SignalOutcomeTracker on a temporary database, installed as the process-wide tracker."""
+    tracker = SignalOutcomeTracker(str(tmp_path / "signal_outcomes.db"), flush_interval=60)
+    monkeypatch.setattr(signal_outcomes, "_tracker_instance", tracker)
+    return tracker
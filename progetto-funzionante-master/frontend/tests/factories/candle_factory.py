@@ -0,0 +1,120 @@
+"""
+Factory classes for creating test candle data.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+from datetime import datetime, timedelta, timezone
+
+from oanda_api_client import OANDACandle
+
+
+class CandleFactory:
+    """Factory for creating OANDA candle payloads and candle series."""
+
+    @staticmethod
+    def create_candles_body(count: int, instrument: str = "EUR_USD",
+                            granularity: str = "H1") -> bytes:
+        """
+        Create a compact /candles response body as OANDA sends it.
+
+        Args:
+            count: Number of hourly candles in the body
+            instrument: Instrument name in the envelope
+            granularity: Granularity name in the envelope
+
+        Returns:
+            UTF-8 encoded JSON body
+        """
+        start = datetime(2024, 1, 1)
+        candles = [
+            {
+                "complete": True,
+                "volume": 100 + i,
+                "time": (start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+                "mid": {"o": f"{1.1 + i / 1e5:.5f}", "h": f"{1.2 + i / 1e5:.5f}",
+                        "l": f"{1.0 + i / 1e5:.5f}", "c": f"{1.15 + i / 1e5:.5f}"}
+            }
+            for i in range(count)
+        ]
+        return json.dumps({"instrument": instrument, "granularity": granularity, "candles": candles},
+                          separators=(",", ":")).encode()
+
+    @staticmethod
+    def create_random_candles(count: int, seed: int = 7, start_price: float = 1.1, volatility: float = 0.001,
+                              interval: timedelta = timedelta(hours=1),
+                              last_complete: bool = True) -> List[OANDACandle]:
+        """
+        Create a seeded random-walk candle series.
+
+        Args:
+            count: Number of candles
+            seed: Random seed; the same seed always gives the same series
+            start_price: Price the walk starts from
+            volatility: Standard deviation of the per-bar log return
+            interval: Time between consecutive candles
+            last_complete: Whether the last candle is complete
+
+        Returns:
+            List of OANDACandle instances, oldest first
+        """
+        rng = np.random.default_rng(seed)
+        closes = start_price * np.exp(np.cumsum(rng.normal(0, volatility, count)))
+        spreads = np.abs(rng.normal(0, volatility / 2, count)) * closes
+        volumes = rng.integers(50, 500, count)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return [
+            OANDACandle(
+                time=start + i * interval, open=float(close), high=float(close + spread),
+                low=float(close - spread), close=float(close), volume=int(volume),
+                complete=last_complete or i < count - 1
+            )
+            for i, (close, spread, volume) in enumerate(zip(closes, spreads, volumes))
+        ]
+
+    @staticmethod
+    def create_random_universe(instruments: int, count: int = 200) -> Dict[str, List[OANDACandle]]:
+        """
+        Create random-walk series for several instruments at mixed price levels.
+
+        Args:
+            instruments: Number of instruments, named SYM_0, SYM_1, ...
+            count: Number of hourly candles per instrument
+
+        Returns:
+            Candles by instrument name
+        """
+        # Price levels from FX-like to index-like, so batch kernels see mixed scales
+        return {
+            f"SYM_{i}": CandleFactory.create_random_candles(count, seed=i, start_price=10.0 ** (i % 4),
+                                                            volatility=0.002)
+            for i in range(instruments)
+        }
+
+    @staticmethod
+    def create_random_bars(count: int, seed: int = 5) -> pd.DataFrame:
+        """
+        Create a seeded random-walk OHLCV frame of one-minute bars.
+
+        About 5% of the bars carry a volume spike, so volume-driven patterns show up.
+
+        Args:
+            count: Number of bars
+            seed: Random seed; the same seed always gives the same frame
+
+        Returns:
+            DataFrame with open, high, low, close and volume columns and a UTC DatetimeIndex
+        """
+        rng = np.random.default_rng(seed)
+        closes = 1.1 + np.cumsum(rng.normal(0, 0.0008, count))
+        opens = np.concatenate([[closes[0]], closes[:-1]]) + rng.normal(0, 0.0002, count)
+        highs = np.maximum(opens, closes) + np.abs(rng.normal(0, 0.0006, count))
+        lows = np.minimum(opens, closes) - np.abs(rng.normal(0, 0.0006, count))
+        volumes = rng.integers(10, 1000, count)
+        volumes[rng.random(count) < 0.05] *= 5
+        return pd.DataFrame(
+            {"open": opens, "high": highs, "low": lows, "close": closes, "volume": volumes},
+            index=pd.date_range("2024-01-01", periods=count, freq="min", tz="UTC")
+        )
@@ -242,6 +242,29 @@ class SignalFactory:
 
         return signals
 
+    @staticmethod
+    def create_cached_signal_dict(signal_id: int) -> Dict[str, Any]:
+        """
+        Create a deterministic cached signal shaped like SignalService._signal_to_dict.
+
+        Args:
+            signal_id: Signal ID; the entry price also varies with it
+
+        Returns:
+            Cached signal dictionary with JSON-native values
+        """
+        return {
+            "id": signal_id, "symbol": "EUR_USD", "signal_type": "BUY", "entry_price": 1.08123 + signal_id * 1e-5,
+            "stop_loss": 1.07823, "take_profit": 1.08723, "reliability": 78.5, "status": "ACTIVE",
+            "ai_analysis": "Bullish structure on M15 with liquidity sweep below the Asian low " * 3,
+            "confidence_score": 0.82, "risk_level": "MEDIUM", "is_public": True, "is_active": True,
+            "created_at": "2024-01-01T10:00:00", "expires_at": "2024-01-02T10:00:00",
+            "source": "ADVANCED_ANALYZER", "timeframe": "M15", "risk_reward_ratio": 2.0,
+            "position_size_suggestion": 0.5, "spread": 0.6, "volatility": 0.0012,
+            "technical_score": 71.0, "rsi": 58.2, "macd_signal": "bullish",
+            "market_session": "London", "creator_id": None
+        }
+
     @staticmethod
     def create_signal_instance(db_session, creator_id: int, overrides: Optional[Dict[str, Any]] = None) -> Signal:
         """
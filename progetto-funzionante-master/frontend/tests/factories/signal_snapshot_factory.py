@@ -0,0 +1,42 @@
+"""
+Factory classes for creating quant adaptive system signal snapshots.
+"""
+
+from typing import Optional
+from datetime import datetime
+
+from quant_adaptive_system.signal_intelligence.signal_outcomes import (
+    SignalSnapshot, SignalType, TechnicalFeatures, VolumeProfileFeatures, MarketContextFeatures
+)
+
+
+class SignalSnapshotFactory:
+    """Factory for creating SignalSnapshot instances."""
+
+    @staticmethod
+    def create_snapshot(signal_id: str, timestamp: Optional[datetime] = None, instrument: str = "EUR_USD",
+                        regime: str = "NORMAL", entry_price: float = 1.1,
+                        technical_features: Optional[TechnicalFeatures] = None) -> SignalSnapshot:
+        """
+        Create a BUY snapshot with a 1:2 risk/reward around entry_price.
+
+        Args:
+            signal_id: Signal identifier
+            timestamp: Signal time (now if None)
+            instrument: Traded instrument
+            regime: Market regime of the market context
+            entry_price: Entry price; stop loss and take profit are 0.01 and 0.02 away
+            technical_features: Technical features (defaults if None)
+
+        Returns:
+            SignalSnapshot instance
+        """
+        return SignalSnapshot(
+            signal_id=signal_id, timestamp=timestamp or datetime.now(), instrument=instrument,
+            signal_type=SignalType.BUY, entry_price=entry_price, stop_loss=entry_price - 0.01,
+            take_profit=entry_price + 0.02, current_price=entry_price, risk_reward_ratio=2.0,
+            position_size_suggested=0.01, atr_stop_multiplier=1.5,
+            technical_features=technical_features or TechnicalFeatures(),
+            volume_features=VolumeProfileFeatures(), market_context=MarketContextFeatures(market_regime=regime),
+            ai_reasoning="", confidence_score=0.8, key_factors=[]
+        )
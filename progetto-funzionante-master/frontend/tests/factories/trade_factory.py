@@ -0,0 +1,33 @@
+"""
+Factory classes for creating closed-trade test data for the reporting layer.
+"""
+
+import random
+from typing import List
+
+import pandas as pd
+
+
+class TradeFactory:
+    """Factory for creating closed-trade frames as MetricsEngine loads them."""
+
+    @staticmethod
+    def create_trades_frame(count: int, instruments: List[str], seed: int = 5) -> pd.DataFrame:
+        """
+        Create a seeded frame of closed trades spread over instruments and regimes.
+
+        Args:
+            count: Number of trades
+            instruments: Instruments to draw from
+            seed: Random seed; the same seed always gives the same frame
+
+        Returns:
+            DataFrame with instrument, market_regime, r_multiple and holding_time_minutes columns
+        """
+        rng = random.Random(seed)
+        return pd.DataFrame({
+            "instrument": [rng.choice(instruments) for _ in range(count)],
+            "market_regime": [rng.choice(["NORMAL", "HIGH_0DTE", ""]) for _ in range(count)],
+            "r_multiple": [round(rng.uniform(-1.2, 2.5), 3) for _ in range(count)],
+            "holding_time_minutes": [rng.choice([None, 20, 90, 600, 2000]) for _ in range(count)]
+        })
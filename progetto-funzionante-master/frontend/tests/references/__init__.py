@@ -0,0 +1 @@
+# Original implementations kept as references for equivalence tests and benchmarks
@@ -0,0 +1,66 @@
+"""
+Reference smart-money pattern loops from AdvancedSignalAnalyzer.
+"""
+
+
+def reference_swing_points(series, point_type="high", window=5):
+    swing_points = []
+    for i in range(window, len(series) - window):
+        window_values = series.iloc[i - window:i + window + 1]
+        extreme = window_values.max() if point_type == "high" else window_values.min()
+        if series.iloc[i] == extreme:
+            swing_points.append((series.index[i], series.iloc[i]))
+    return swing_points[-10:]
+
+
+def reference_liquidity_zones(m5_data):
+    zones = []
+    for i in range(10, len(m5_data) - 10):
+        current_candle = m5_data.iloc[i]
+        prev_candles = m5_data.iloc[i - 10:i]
+        if (current_candle['volume'] > prev_candles['volume'].mean() * 1.5 and
+                abs(current_candle['close'] - current_candle['open']) <
+                (current_candle['high'] - current_candle['low']) * 0.3):
+            zones.append({
+                "price": current_candle['high'] if current_candle['close'] < current_candle['open'] else current_candle['low'],
+                "type": "liquidity_grab" if current_candle['close'] < current_candle['open'] else "liquidity_build",
+                "strength": min(100, (current_candle['volume'] / prev_candles['volume'].mean()) * 20),
+                "time": current_candle.name.isoformat()
+            })
+    return zones[-5:]
+
+
+def reference_order_blocks(m5_data):
+    order_blocks = []
+    for i in range(20, len(m5_data) - 10):
+        current_candle = m5_data.iloc[i]
+        prev_candles = m5_data.iloc[i - 20:i]
+        next_candles = m5_data.iloc[i + 1:i + 11]
+        strong_move = (current_candle['close'] > current_candle['open'] and
+                       (current_candle['close'] - current_candle['open']) > prev_candles['close'].std() * 2)
+        consolidation = (next_candles['high'].max() - next_candles['low'].min()) < \
+            (current_candle['high'] - current_candle['low']) * 0.5
+        if strong_move and consolidation:
+            order_blocks.append({
+                "high": current_candle['high'],
+                "low": current_candle['low'],
+                "type": "bullish_order_block",
+                "strength": 80.0,
+                "time": current_candle.name.isoformat()
+            })
+    return order_blocks[-3:]
+
+
+def reference_fair_value_gaps(m1_data):
+    fvgs = []
+    for i in range(1, len(m1_data) - 1):
+        prev_candle = m1_data.iloc[i - 1]
+        current_candle = m1_data.iloc[i]
+        next_candle = m1_data.iloc[i + 1]
+        if prev_candle['high'] < next_candle['low']:
+            fvgs.append({"gap_high": next_candle['low'], "gap_low": prev_candle['high'],
+                         "type": "bullish_fvg", "strength": 75.0, "time": current_candle.name.isoformat()})
+        elif prev_candle['low'] > next_candle['high']:
+            fvgs.append({"gap_high": prev_candle['low'], "gap_low": next_candle['high'],
+                         "type": "bearish_fvg", "strength": 75.0, "time": current_candle.name.isoformat()})
+    return fvgs[-10:]
@@ -0,0 +1,29 @@
+"""
+Reference volume profile loop from AdvancedSignalAnalyzer.
+"""
+
+import numpy as np
+
+
+def reference_profile(df, bins=50):
+    """The original per-level, per-row loop from AdvancedSignalAnalyzer."""
+    price_levels = np.linspace(df['low'].min(), df['high'].max(), bins)
+    volume_by_price = {}
+    for level in price_levels:
+        volume_at_level = 0
+        for idx in df.index:
+            if df.loc[idx, 'low'] <= level <= df.loc[idx, 'high']:
+                volume_at_level += df.loc[idx, 'volume']
+        volume_by_price[level] = volume_at_level
+
+    poc = max(volume_by_price.keys(), key=lambda k: volume_by_price[k])
+    sorted_levels = sorted(volume_by_price.items(), key=lambda x: x[1], reverse=True)
+    total_volume = sum(volume_by_price.values())
+    value_area_volume = 0
+    value_area_levels = []
+    for price, volume in sorted_levels:
+        value_area_levels.append(price)
+        value_area_volume += volume
+        if value_area_volume >= total_volume * 0.7:
+            break
+    return volume_by_price, poc, min(value_area_levels), max(value_area_levels)
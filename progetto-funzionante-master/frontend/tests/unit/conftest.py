@@ -0,0 +1,41 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import asyncio
+import pytest
+import fakeredis
+
+from app.services.cache_service import CacheService, CacheConfig
+
+
+@pytest.fixture
+def redis_server():
+    """In-memory Redis server shared by the CacheService 'workers' of a test."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def connected_cache(redis_server):
+    """
+    Factory for CacheService instances wired to redis_server, as separate workers would be.
+
+    Pass listen=False to leave the invalidation listener off, so no pub/sub traffic
+    reaches the Redis client.
+    """
+    def connect(listen: bool = True) -> CacheService:
+        service = CacheService(CacheConfig(redis_url="redis://fake"))
+        service.redis = fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=False)
+        service._connection_healthy = True
+        if listen:
+            service._start_invalidation_listener()
+        return service
+    return connect
+
+
+@pytest.fixture
+def settle():
+    """Coroutine function giving the invalidation listeners time to receive published messages."""
+    async def wait():
+        await asyncio.sleep(0.2)
+    return wait
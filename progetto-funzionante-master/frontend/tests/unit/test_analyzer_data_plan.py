@@ -0,0 +1,87 @@
+"""
+Unit tests for the AdvancedSignalAnalyzer per-analysis data plan.
+"""
+
+import asyncio
+import pytest
+from collections import Counter
+from datetime import timedelta
+
+from advanced_signal_analyzer import AdvancedSignalAnalyzer, TimeFrame
+from candle_store import candle_store
+from oanda_api_client import CandleFrame
+from tests.factories.candle_factory import CandleFactory
+
+
+def _frame(count, seed):
+    return CandleFrame.from_candles(CandleFactory.create_random_candles(
+        count, seed=seed, interval=timedelta(minutes=1), last_complete=False
+    ))
+
+
+class TestAnalyzerDataPlan:
+    """Test cases for fetching each timeframe once per analysis."""
+
+    @pytest.fixture
+    def analyzer(self, monkeypatch):
+        candle_store.invalidate()
+        analyzer = AdvancedSignalAnalyzer("test-key")
+        analyzer.fetches = []
+        analyzer.in_flight = 0
+        analyzer.max_in_flight = 0
+
+        async def fake_fetch(oanda_instrument, timeframe, count, from_time=None):
+            analyzer.fetches.append((timeframe, count))
+            analyzer.in_flight += 1
+            analyzer.max_in_flight = max(analyzer.max_in_flight, analyzer.in_flight)
+            await asyncio.sleep(0.01)
+            analyzer.in_flight -= 1
+            return _frame(count, seed=len(timeframe.value))
+
+        monkeypatch.setattr(analyzer, "_fetch_oanda_candles", fake_fetch)
+        yield analyzer
+        candle_store.invalidate()
+
+    @pytest.mark.unit
+    def test_plan_takes_deepest_count_per_timeframe(self, analyzer):
+        """The plan is the union of all stages at the maximum count."""
+        plan = analyzer._build_data_plan()
+
+        assert plan == {TimeFrame.M1: 200, TimeFrame.M5: 200, TimeFrame.M15: 200,
+                        TimeFrame.M30: 200, TimeFrame.H1: 100}
+        assert analyzer._build_data_plan(["smart_money"]) == {TimeFrame.M1: 200, TimeFrame.M5: 100}
+
+    @pytest.mark.unit
+    async def test_stages_share_one_download_per_timeframe(self, analyzer):
+        """All stages run off a single concurrent fetch of the plan."""
+        market_data = await analyzer._fetch_market_data("EURUSD", analyzer._build_data_plan())
+
+        mtf_analysis = await analyzer._analyze_multi_timeframe("EURUSD", market_data)
+        await analyzer._analyze_volume_profile("EURUSD", market_data)
+        smart_money = await analyzer._detect_smart_money_activity("EURUSD", mtf_analysis, market_data)
+
+        counts = Counter(timeframe for timeframe, _ in analyzer.fetches)
+        assert set(counts.values()) == {1}
+        assert len(counts) == 5
+        assert analyzer.max_in_flight == 5
+        assert len(mtf_analysis.timeframes) == 4
+        assert "order_blocks" in smart_money
+
+    @pytest.mark.unit
+    async def test_stage_frames_are_trimmed_copies(self, analyzer):
+        """Stages get their own window and cannot see each other's indicator columns."""
+        market_data = await analyzer._fetch_market_data("EURUSD", analyzer._build_data_plan())
+
+        await analyzer._analyze_multi_timeframe("EURUSD", market_data)
+        smart_money_data = await analyzer._get_stage_data("EURUSD", "smart_money", market_data)
+
+        assert len(smart_money_data[TimeFrame.M5]) == 100
+        assert smart_money_data[TimeFrame.M5].index[-1] == market_data[TimeFrame.M5].index[-1]
+        assert "sma_20" not in market_data[TimeFrame.M5].columns
+
+    @pytest.mark.unit
+    async def test_stage_without_shared_data_fetches_its_own(self, analyzer):
+        """Calling a stage directly still works and fetches only what it needs."""
+        await analyzer._detect_smart_money_activity("EURUSD", await analyzer._analyze_multi_timeframe("EURUSD"))
+
+        assert Counter(timeframe for timeframe, _ in analyzer.fetches)[TimeFrame.H1] == 0
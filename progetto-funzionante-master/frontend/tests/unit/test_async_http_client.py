@@ -0,0 +1,100 @@
+"""
+Unit tests for pooled HTTP client connection metrics.
+"""
+
+import asyncio
+import pytest
+
+from app.services import async_http_client
+from app.services.async_http_client import (
+    AsyncHttpClient, get_all_http_client_metrics, get_oanda_analyzer_client
+)
+
+
+async def _keep_alive_server():
+    """Minimal HTTP/1.1 server answering every request on the same connection."""
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                body = b'{"candles": []}'
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", connections
+
+
+class TestAsyncHttpClientConnections:
+    """Test cases for connection reuse and handshake metrics."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self, monkeypatch):
+        monkeypatch.setattr(async_http_client, "http_clients", {})
+
+    @pytest.mark.unit
+    async def test_keep_alive_reuses_one_connection(self):
+        """Sequential requests through the pooled client open a single connection."""
+        server, url, connections = await _keep_alive_server()
+        client = AsyncHttpClient(base_url=url)
+        try:
+            for _ in range(5):
+                response = await client.client.get("/candles")
+                assert response.status_code == 200
+
+            metrics = client.get_metrics()["connections"]
+            assert len(connections) == 1
+            assert metrics["transport_requests"] == 5
+            assert metrics["connections_opened"] == 1
+            assert metrics["tls_handshakes"] == 0
+            assert metrics["connection_reuse_rate"] == 80.0
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+    @pytest.mark.unit
+    async def test_trace_events_update_counters(self):
+        """TLS handshakes and HTTP/2 requests are counted from trace events."""
+        client = AsyncHttpClient()
+        try:
+            for event in ("connection.connect_tcp.complete", "connection.start_tls.complete",
+                          "http2.send_request_headers.started", "http2.send_request_headers.started"):
+                await client._trace(event, {})
+
+            assert client.metrics.connections_opened == 1
+            assert client.metrics.tls_handshakes == 1
+            assert client.metrics.http2_requests == 2
+            assert client.metrics.connection_reuse_rate == 50.0
+        finally:
+            await client.close()
+
+    @pytest.mark.unit
+    async def test_analyzer_client_is_shared_and_aggregated(self):
+        """The analyzer client is a registry singleton and shows up in the totals."""
+        client = get_oanda_analyzer_client()
+        try:
+            assert get_oanda_analyzer_client() is client
+            await client._trace("connection.connect_tcp.complete", {})
+            await client._trace("http11.send_request_headers.started", {})
+
+            metrics = get_all_http_client_metrics()
+
+            assert metrics["connections_opened"] == 1
+            assert metrics["transport_requests"] == 1
+            assert "oanda_analyzer" in metrics["clients"]
+        finally:
+            await client.close()
@@ -0,0 +1,52 @@
+"""
+Unit tests for the vectorized multi-instrument indicator kernel.
+"""
+
+import numpy as np
+import pytest
+from dataclasses import asdict
+
+from oanda_signal_engine import OANDASignalEngine, TechnicalAnalyzer
+from tests.factories.candle_factory import CandleFactory
+
+
+class TestBatchIndicators:
+    """Test cases for TechnicalAnalyzer.calculate_batch."""
+
+    @pytest.fixture
+    def engine(self):
+        return OANDASignalEngine("test-key", "test-account")
+
+    @pytest.mark.unit
+    def test_batch_matches_per_instrument_path(self, engine):
+        """Every TechnicalAnalysis field equals the scalar calculation."""
+        universe = CandleFactory.create_random_universe(25)
+
+        batch = engine.calculate_technical_analysis_batch(universe)
+
+        for instrument, candles in universe.items():
+            expected = asdict(engine._calculate_technical_analysis(candles))
+            for name, value in asdict(batch[instrument]).items():
+                if isinstance(value, float):
+                    assert value == pytest.approx(expected[name], rel=1e-9, abs=1e-12), (instrument, name)
+                else:
+                    assert value == expected[name], (instrument, name)
+
+    @pytest.mark.unit
+    def test_mixed_history_lengths_are_grouped(self, engine):
+        """Instruments with shorter history are not truncated into other rows."""
+        universe = {"LONG": CandleFactory.create_random_candles(200, seed=1),
+                    "SHORT": CandleFactory.create_random_candles(80, seed=2),
+                    "TINY": CandleFactory.create_random_candles(30, seed=3)}
+
+        batch = engine.calculate_technical_analysis_batch(universe)
+
+        assert set(batch) == {"LONG", "SHORT"}
+        assert batch["LONG"].sma_200 == pytest.approx(engine._calculate_technical_analysis(universe["LONG"]).sma_200)
+        assert batch["SHORT"].ema_50 == pytest.approx(engine._calculate_technical_analysis(universe["SHORT"]).ema_50)
+
+    @pytest.mark.unit
+    def test_kernel_rejects_short_history(self):
+        """Fewer than 50 bars raises like the scalar path."""
+        with pytest.raises(ValueError):
+            TechnicalAnalyzer.calculate_batch(*(np.ones((3, 40)) for _ in range(4)))
@@ -0,0 +1,171 @@
+"""
+Unit tests for single-flight loading, stale-while-revalidate and early refresh.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from models import Signal, SignalTypeEnum, SignalStatusEnum
+from app.services import signal_service as signal_service_module
+from app.services.cache_service import CacheService, CacheConfig, ENVELOPE_MARKER, cache_result
+from app.services.signal_service import SignalService
+
+
+class SlowLoader:
+    """Loader that counts calls and yields to the event loop like a DB query."""
+
+    def __init__(self, value="fresh", delay=0.05):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+@pytest.fixture
+def cache():
+    return CacheService(CacheConfig(redis_url="redis://unused"))
+
+
+def _envelope(value, expires_in, delta=0.01):
+    return {ENVELOPE_MARKER: 1, "value": value, "expires": time.time() + expires_in, "delta": delta}
+
+
+class TestGetOrLoad:
+    """Test cases for CacheService.get_or_load."""
+
+    @pytest.mark.unit
+    async def test_concurrent_misses_share_one_load(self, cache):
+        """Fifty concurrent misses on one key run the loader once."""
+        loader = SlowLoader()
+
+        results = await asyncio.gather(*(cache.get_or_load("hot", loader, ttl=60) for _ in range(50)))
+
+        assert results == ["fresh"] * 50
+        assert loader.calls == 1
+        assert cache.get_metrics().coalesced_loads == 49
+        assert await cache.get_or_load("hot", loader, ttl=60) == "fresh"
+        assert loader.calls == 1
+
+    @pytest.mark.unit
+    async def test_loader_errors_reach_every_waiter(self, cache):
+        """A failing load raises for all coalesced callers and is retried next time."""
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("database down")
+
+        results = await asyncio.gather(*(cache.get_or_load("key", failing) for _ in range(3)),
+                                       return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await cache.get_or_load("key", SlowLoader("recovered", 0)) == "recovered"
+
+    @pytest.mark.unit
+    async def test_cancelled_caller_does_not_cancel_shared_load(self, cache):
+        """Cancelling one waiter leaves the load running for the others."""
+        loader = SlowLoader(delay=0.05)
+        first = asyncio.create_task(cache.get_or_load("key", loader, ttl=60))
+        second = asyncio.create_task(cache.get_or_load("key", loader, ttl=60))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+
+        assert await second == "fresh"
+        assert loader.calls == 1
+
+    @pytest.mark.unit
+    async def test_stale_value_served_while_refreshing(self, cache):
+        """Within the stale window the old value is returned and one refresh runs."""
+        await cache.set("key", _envelope("stale", expires_in=-1), ttl=60)
+        loader = SlowLoader()
+
+        results = await asyncio.gather(*(cache.get_or_load("key", loader, ttl=60, stale_ttl=30) for _ in range(10)))
+        await asyncio.sleep(0.1)
+
+        assert results == ["stale"] * 10
+        assert loader.calls == 1
+        assert cache.get_metrics().stale_served == 10
+        assert await cache.get_or_load("key", loader, ttl=60, stale_ttl=30) == "fresh"
+
+    @pytest.mark.unit
+    async def test_early_refresh_near_expiry(self, cache):
+        """A slow-to-compute value about to expire is refreshed early in the background."""
+        await cache.set("key", _envelope("current", expires_in=1, delta=1000), ttl=60)
+        loader = SlowLoader(delay=0)
+
+        assert await cache.get_or_load("key", loader, ttl=60, early_refresh_beta=1.0) == "current"
+        await asyncio.sleep(0.01)
+
+        assert loader.calls == 1
+        assert cache.get_metrics().early_refreshes == 1
+
+    @pytest.mark.unit
+    async def test_no_early_refresh_when_disabled_or_far_from_expiry(self, cache):
+        """Beta 0, or a fresh entry with a cheap load, never refreshes early."""
+        await cache.set("a", _envelope("a", expires_in=1, delta=1000), ttl=60)
+        await cache.set("b", _envelope("b", expires_in=600, delta=0.001), ttl=600)
+        loader = SlowLoader(delay=0)
+
+        await cache.get_or_load("a", loader, ttl=60)
+        await cache.get_or_load("b", loader, ttl=600, early_refresh_beta=1.0)
+        await asyncio.sleep(0.01)
+
+        assert loader.calls == 0
+
+    @pytest.mark.unit
+    async def test_cache_result_decorator_coalesces(self, cache):
+        """The decorator runs the wrapped coroutine once for concurrent identical calls."""
+        calls = []
+
+        @cache_result(cache, "square", ttl=60)
+        async def square(x):
+            calls.append(x)
+            await asyncio.sleep(0.02)
+            return x * x
+
+        results = await asyncio.gather(*(square(7) for _ in range(20)), square(3))
+
+        assert results == [49] * 20 + [9]
+        assert sorted(calls) == [3, 7]
+
+
+class TestSignalServiceCoalescing:
+    """Test cases for coalesced signal reads."""
+
+    @pytest.fixture
+    def repository(self, monkeypatch):
+        repository = MagicMock()
+        repository.get_latest_signals.return_value = [
+            Signal(id=i, symbol="EUR_USD", signal_type=SignalTypeEnum.BUY, entry_price=1.1,
+                   status=SignalStatusEnum.ACTIVE, reliability=80.0)
+            for i in range(3)
+        ]
+        monkeypatch.setattr(signal_service_module, "SignalRepository", lambda db: repository)
+        return repository
+
+    @pytest.fixture
+    def service(self, cache, repository, monkeypatch):
+        monkeypatch.setattr(signal_service_module, "cache_service", cache)
+        return SignalService(MagicMock(), session_factory=MagicMock())
+
+    @pytest.mark.unit
+    async def test_latest_signals_hit_database_once(self, service, repository):
+        """Concurrent requests for latest signals share a single query."""
+        results = await asyncio.gather(*(service.get_latest_signals(3) for _ in range(25)))
+
+        assert repository.get_latest_signals.call_count == 1
+        assert all([s.id for s in signals] == [0, 1, 2] for signals in results)
+
+    @pytest.mark.unit
+    async def test_loads_use_their_own_session(self, service):
+        """Cache loads, which may finish after the request, never touch the request session."""
+        await service.get_latest_signals(3)
+
+        service.session_factory.assert_called_once()
+        service.session_factory.return_value.close.assert_called_once()
+        assert service.db.method_calls == []
@@ -0,0 +1,154 @@
+"""
+Unit tests for cache value codecs and the raw-bytes CacheService round trip.
+"""
+
+import json
+import pickle
+import pytest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import fakeredis
+
+from app.services.cache_codec import (
+    CacheCodec, CodecError, CODEC_JSON, CODEC_MSGPACK, CODEC_PICKLE,
+    COMPRESSION_LZ4, COMPRESSION_NONE, COMPRESSION_ZLIB, LZ4_AVAILABLE
+)
+from app.services.cache_service import CacheService, CacheConfig
+from models import SignalTypeEnum
+from tests.factories.signal_factory import SignalFactory
+
+
+class TestCacheCodec:
+    """Test cases for CacheCodec encoding."""
+
+    @pytest.mark.unit
+    def test_round_trip_preserves_types(self):
+        """Values JSON would stringify come back with their original type."""
+        codec = CacheCodec()
+        value = {
+            "when": datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc), "day": date(2024, 1, 1),
+            "price": Decimal("1.08125"), "pair": ("EUR", "USD"), "tags": {"fx"},
+            "raw": b"\x00\x01", "nested": [{"n": None, "f": 1.5, "ok": True}], 3: "int key"
+        }
+
+        encoded = codec.encode(value)
+
+        assert encoded[0] == CODEC_MSGPACK
+        assert codec.decode(encoded) == value
+
+    @pytest.mark.unit
+    def test_unsupported_types_fall_back_to_pickle(self):
+        """Enums and other non-builtin types are pickled rather than converted."""
+        codec = CacheCodec()
+
+        encoded = codec.encode({"type": SignalTypeEnum.BUY})
+
+        assert encoded[0] & 0x07 == CODEC_PICKLE
+        assert codec.decode(encoded)["type"] is SignalTypeEnum.BUY
+
+    @pytest.mark.unit
+    def test_large_values_are_compressed(self):
+        """Payloads over the threshold are compressed and flagged in the header."""
+        codec = CacheCodec(compression_threshold=1024)
+        signals = [SignalFactory.create_cached_signal_dict(i) for i in range(50)]
+
+        small, large = codec.encode([SignalFactory.create_cached_signal_dict(0)]), codec.encode(signals)
+
+        assert small[0] >> 3 == COMPRESSION_NONE
+        assert large[0] >> 3 == COMPRESSION_ZLIB
+        assert codec.decode(large) == signals
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not LZ4_AVAILABLE, reason="lz4 not installed")
+    def test_lz4_compression(self):
+        """lz4 can be selected instead of zlib."""
+        codec = CacheCodec(compression="lz4", compression_threshold=0)
+        signals = [SignalFactory.create_cached_signal_dict(i) for i in range(10)]
+
+        encoded = codec.encode(signals)
+
+        assert encoded[0] >> 3 == COMPRESSION_LZ4
+        assert codec.decode(encoded) == signals
+
+    @pytest.mark.unit
+    def test_decoders_read_each_others_headers(self):
+        """The header, not the configured codec, decides how a value is read."""
+        value = {"a": [1, 2, 3]}
+        json_codec = CacheCodec(codec="json", compression="none")
+
+        encoded = json_codec.encode(value)
+
+        assert encoded[0] == CODEC_JSON
+        assert CacheCodec().decode(encoded) == value
+
+    @pytest.mark.unit
+    def test_legacy_entries_still_decode(self):
+        """Entries written by the old JSON / latin1-pickle format are readable."""
+        codec = CacheCodec()
+        legacy_json = json.dumps([SignalFactory.create_cached_signal_dict(1)], default=str).encode()
+        legacy_pickle = pickle.dumps({"k": {1, 2}}).decode("latin1").encode("utf-8")
+
+        assert codec.decode(legacy_json) == [SignalFactory.create_cached_signal_dict(1)]
+        assert codec.decode(legacy_pickle) == {"k": {1, 2}}
+        assert codec.decode(b"42") == 42
+
+    @pytest.mark.unit
+    def test_corrupt_values_raise_codec_error(self):
+        """Truncated or unknown payloads raise CodecError."""
+        codec = CacheCodec()
+        encoded = codec.encode([SignalFactory.create_cached_signal_dict(i) for i in range(50)])
+
+        for data in (b"", encoded[:20], b"\x07abc", b"\xff\xfe"):
+            with pytest.raises(CodecError):
+                codec.decode(data)
+
+
+class TestCacheServiceCodec:
+    """Test cases for CacheService storing codec bytes in Redis."""
+
+    @pytest.mark.unit
+    async def test_values_stored_as_binary(self):
+        """Redis holds header-tagged bytes and a second worker decodes them."""
+        server = fakeredis.FakeServer()
+        writer, reader = CacheService(CacheConfig()), CacheService(CacheConfig())
+        for service in (writer, reader):
+            service.redis = fakeredis.FakeAsyncRedis(server=server, decode_responses=False)
+            service._connection_healthy = True
+        value = {
+            "created": datetime(2024, 1, 1),
+            "signals": [SignalFactory.create_cached_signal_dict(i) for i in range(20)]
+        }
+
+        await writer.set("signals", value, ttl=60)
+        raw = await writer.redis.get("signals")
+
+        assert raw[0] >> 3 == COMPRESSION_ZLIB
+        assert await reader.get("signals") == value
+
+    @pytest.mark.unit
+    async def test_undecodable_entry_is_a_miss(self):
+        """A corrupt Redis value is treated as a miss rather than an error."""
+        service = CacheService(CacheConfig())
+        service.redis = fakeredis.FakeAsyncRedis(decode_responses=False)
+        service._connection_healthy = True
+        await service.redis.set("broken", b"\x01\xc1")
+
+        assert await service.get("broken", default="default") == "default"
+
+
+class TestCachePayloadSize:
+    """Payload size against the previous json.dumps(default=str) format."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("count", [10, 50, 100])
+    def test_signal_payload_is_under_half_the_json_size(self, count):
+        """cache_signals payloads encode to less than half the legacy JSON."""
+        codec = CacheCodec()
+        payload = {"data": [SignalFactory.create_cached_signal_dict(i) for i in range(count)],
+                   "cached_at": "2024-01-01T10:00:00"}
+
+        encoded = codec.encode(payload)
+
+        assert len(encoded) < len(json.dumps(payload, default=str).encode()) / 2
+        assert codec.decode(encoded) == payload
@@ -0,0 +1,199 @@
+"""
+Unit tests for pipelined multi-key CacheService operations.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services import signal_service as signal_service_module
+from app.services.cache_service import CacheService, CacheConfig
+from app.services.signal_service import SignalService
+from models import Signal, SignalTypeEnum, SignalStatusEnum
+
+
+class RoundTripCounter:
+    """Counts pipelines and single commands sent to a FakeAsyncRedis."""
+
+    def __init__(self, client, monkeypatch):
+        self.round_trips = 0
+        pipeline, execute_command = client.pipeline, client.execute_command
+
+        def counting_pipeline(*args, **kwargs):
+            self.round_trips += 1
+            return pipeline(*args, **kwargs)
+
+        async def counting_execute_command(*args, **kwargs):
+            self.round_trips += 1
+            return await execute_command(*args, **kwargs)
+
+        monkeypatch.setattr(client, "pipeline", counting_pipeline)
+        monkeypatch.setattr(client, "execute_command", counting_execute_command)
+
+
+class TestMultiKeyOperations:
+    """Test cases for get_many / set_many / delete_many."""
+
+    @pytest.mark.unit
+    async def test_set_many_and_get_many_use_one_round_trip_each(self, connected_cache, monkeypatch):
+        """Writing and reading N keys costs one pipeline each, regardless of N."""
+        writer, reader = connected_cache(listen=False), connected_cache(listen=False)
+        counter = RoundTripCounter(reader.redis, monkeypatch)
+        values = {f"key:{i}": {"i": i} for i in range(20)}
+
+        assert await writer.set_many(values, ttl=60)
+        result = await reader.get_many(list(values) + ["absent"], default="none")
+
+        assert counter.round_trips == 1
+        assert result == {**values, "absent": "none"}
+        assert list(result) == list(values) + ["absent"]
+        assert 0 < await writer.redis.ttl("key:0") <= 60
+
+    @pytest.mark.unit
+    async def test_get_many_reads_l1_hits_locally(self, connected_cache, monkeypatch):
+        """Keys held in L1 are not requested from Redis."""
+        service = connected_cache(listen=False)
+        await service.set_many({"a": 1, "b": 2}, ttl=60)
+        await connected_cache(listen=False).set("c", 3, ttl=60)
+        sent = []
+        pipeline = service.redis.pipeline
+
+        def recording_pipeline(*args, **kwargs):
+            pipe = pipeline(*args, **kwargs)
+            get = pipe.get
+            pipe.get = lambda key: sent.append(key) or get(key)
+            return pipe
+
+        monkeypatch.setattr(service.redis, "pipeline", recording_pipeline)
+
+        assert await service.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": 3}
+        assert sent == ["c"]
+        assert service.get_metrics().l1_hits == 2
+        assert await service.get_many(["c"]) == {"c": 3}
+        assert sent == ["c"]
+
+    @pytest.mark.unit
+    async def test_delete_many_removes_from_both_tiers(self, connected_cache, monkeypatch):
+        """delete_many clears Redis and L1 in one round-trip and counts stored keys."""
+        service = connected_cache(listen=False)
+        await service.set_many({"a": 1, "b": 2, "c": 3}, ttl=60)
+        counter = RoundTripCounter(service.redis, monkeypatch)
+
+        assert await service.delete_many(["a", "b", "missing"]) == 2
+        assert counter.round_trips == 1
+        assert await service.get_many(["a", "b", "c"]) == {"a": None, "b": None, "c": 3}
+
+    @pytest.mark.unit
+    async def test_multi_key_operations_fall_back_to_l1(self):
+        """Without Redis the operations work against L1 alone."""
+        service = CacheService(CacheConfig(redis_url="redis://unused"))
+
+        await service.set_many({"a": 1, "b": 2}, ttl=60)
+
+        assert await service.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": None}
+        assert await service.delete_many(["a"]) == 1
+        assert await service.get_many(["a"]) == {"a": None}
+
+    @pytest.mark.unit
+    async def test_set_many_publishes_one_invalidation(self, connected_cache, settle):
+        """Other workers drop every written key from one pub/sub message."""
+        writer, other = connected_cache(listen=False), connected_cache()
+        await settle()
+        await other.set_many({"a": "old", "b": "old"}, ttl=60)
+        await settle()
+
+        await writer.set_many({"a": "new", "b": "new"}, ttl=60)
+        await settle()
+
+        assert writer.get_metrics().invalidations_published == 1
+        assert await other.get_many(["a", "b"]) == {"a": "new", "b": "new"}
+        await other.disconnect()
+
+
+class TestMultiSymbolSignals:
+    """Test cases for SignalService.get_signals_for_symbols."""
+
+    @pytest.fixture
+    def cache(self, connected_cache):
+        return connected_cache(listen=False)
+
+    @pytest.fixture
+    def repository(self, monkeypatch):
+        def signals(symbol, limit):
+            return [
+                Signal(id=i, symbol=symbol, signal_type=SignalTypeEnum.BUY, entry_price=1.1,
+                       status=SignalStatusEnum.ACTIVE, reliability=80.0)
+                for i in range(limit)
+            ]
+
+        repository = MagicMock()
+        repository.get_signals_by_symbol.side_effect = signals
+        repository.get_signals_by_symbols.side_effect = lambda symbols, limit: {
+            symbol: signals(symbol, limit) for symbol in symbols
+        }
+        monkeypatch.setattr(signal_service_module, "SignalRepository", lambda db: repository)
+        return repository
+
+    @pytest.fixture
+    def service(self, cache, repository, monkeypatch):
+        monkeypatch.setattr(signal_service_module, "cache_service", cache)
+        return SignalService(MagicMock(), session_factory=MagicMock())
+
+    @pytest.mark.unit
+    async def test_symbols_share_cache_round_trips(self, service, cache, repository, monkeypatch):
+        """A dashboard over N symbols costs one cache read, one query and one cache write."""
+        symbols = ["EURUSD", "GBPUSD", "USDJPY", "GOLD"]
+        counter = RoundTripCounter(cache.redis, monkeypatch)
+
+        first = await service.get_signals_for_symbols(symbols, limit=2)
+        second = await service.get_signals_for_symbols(symbols, limit=2)
+
+        # Plus one read of the signals tag generation, which is then kept in-process
+        assert counter.round_trips == 3
+        repository.get_signals_by_symbols.assert_called_once_with(symbols, 2)
+        repository.get_signals_by_symbol.assert_not_called()
+        assert list(first) == symbols
+        assert all([s.symbol for s in second[symbol]] == [symbol] * 2 for symbol in symbols)
+
+    @pytest.mark.unit
+    async def test_only_missed_symbols_are_loaded(self, service, repository):
+        """Cached symbols are skipped, and the load runs on its own session."""
+        await service.get_signals_for_symbols(["EURUSD"], limit=2)
+
+        result = await service.get_signals_for_symbols(["EURUSD", "GBPUSD"], limit=2)
+
+        assert repository.get_signals_by_symbols.call_args.args == (["GBPUSD"], 2)
+        assert [s.symbol for s in result["GBPUSD"]] == ["GBPUSD"] * 2
+        assert service.session_factory.return_value.close.call_count == 2
+        assert service.db.method_calls == []
+
+    @pytest.mark.unit
+    async def test_entries_shared_with_single_symbol_reads(self, service, repository):
+        """Entries written per symbol are reused by the multi-symbol read."""
+        await service.get_signals_by_symbol("EURUSD", 2)
+
+        await service.get_signals_for_symbols(["EURUSD"], limit=2)
+
+        assert repository.get_signals_by_symbol.call_count == 1
+        repository.get_signals_by_symbols.assert_not_called()
+
+
+class TestCacheWarmerBatching:
+    """Test cases for warming through set_many."""
+
+    @pytest.mark.unit
+    async def test_market_data_warmup_writes_once(self, monkeypatch):
+        """Warming symbols x timeframes issues a single set_many."""
+        from app.utils import cache_utils
+
+        cache = CacheService(CacheConfig(redis_url="redis://unused"))
+        monkeypatch.setattr(cache, "cache_market_data_many", AsyncMock(return_value=True))
+        monkeypatch.setattr(cache_utils, "cache_service", cache)
+
+        async def provider(symbol, timeframe):
+            return {"symbol": symbol, "timeframe": timeframe}
+
+        await cache_utils.CacheWarmer.warm_market_data(["EURUSD", "GBPUSD"], ["M1", "H1"], provider)
+
+        cache.cache_market_data_many.assert_awaited_once()
+        written = cache.cache_market_data_many.await_args.args[0]
+        assert set(written) == {("EURUSD", "M1"), ("EURUSD", "H1"), ("GBPUSD", "M1"), ("GBPUSD", "H1")}
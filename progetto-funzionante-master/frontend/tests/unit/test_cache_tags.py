@@ -0,0 +1,168 @@
+"""
+Unit tests for tag/generation based cache invalidation.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from app.services import signal_service as signal_service_module
+from app.services.cache_service import CacheService, CacheConfig, SIGNALS_TAG
+from app.services.signal_service import SignalService
+from models import Signal, SignalTypeEnum, SignalStatusEnum
+
+
+class TestTagInvalidation:
+    """Test cases for invalidate_tag."""
+
+    @pytest.fixture
+    def service(self, connected_cache):
+        return connected_cache(listen=False)
+
+    @pytest.mark.unit
+    async def test_invalidate_tag_is_one_incr_without_scan(self, service, monkeypatch):
+        """Invalidating a tag never walks the keyspace and hides every tagged entry."""
+        for i in range(50):
+            await service.set(f"app:signals:q{i}", i, ttl=60, tags=[SIGNALS_TAG])
+        await service.set("app:users:1", "untouched", ttl=60)
+
+        def no_scan(*args, **kwargs):
+            raise AssertionError("invalidate_tag must not SCAN")
+
+        monkeypatch.setattr(service.redis, "scan_iter", no_scan)
+
+        version = await service.invalidate_tag(SIGNALS_TAG)
+
+        assert version == 1
+        assert await service.redis.get(service._tag_key(SIGNALS_TAG)) == b"1"
+        assert await service.get("app:signals:q0", tags=[SIGNALS_TAG]) is None
+        assert await service.get("app:users:1") == "untouched"
+
+    @pytest.mark.unit
+    async def test_other_workers_see_new_generation(self, connected_cache, settle):
+        """A bump on one worker hides the entry from another worker's L1 too."""
+        worker_a, worker_b = connected_cache(), connected_cache()
+        try:
+            await settle()
+            await worker_a.set("app:signals:latest", "old", ttl=60, tags=[SIGNALS_TAG])
+            assert await worker_b.get("app:signals:latest", tags=[SIGNALS_TAG]) == "old"
+
+            await worker_a.invalidate_tag(SIGNALS_TAG)
+            await settle()
+
+            assert await worker_b.get("app:signals:latest", tags=[SIGNALS_TAG]) is None
+            await worker_b.set("app:signals:latest", "new", ttl=60, tags=[SIGNALS_TAG])
+            assert await worker_a.get("app:signals:latest", tags=[SIGNALS_TAG]) == "new"
+        finally:
+            await worker_a.disconnect()
+            await worker_b.disconnect()
+
+    @pytest.mark.unit
+    async def test_fallback_tier_uses_the_same_tags(self):
+        """Without Redis, tags version the L1 keys the same way."""
+        service = CacheService(CacheConfig(redis_url="redis://unused"))
+        await service.set("app:signals:latest", "old", ttl=60, tags=[SIGNALS_TAG])
+
+        await service.invalidate_tag(SIGNALS_TAG)
+
+        assert await service.get("app:signals:latest", tags=[SIGNALS_TAG]) is None
+
+    @pytest.mark.unit
+    async def test_any_tag_of_an_entry_invalidates_it(self, service):
+        """Per-symbol and namespace-wide market data invalidation both apply."""
+        await service.cache_market_data("EUR_USD", "H1", {"bid": 1.1})
+        await service.cache_market_data("GBP_USD", "H1", {"bid": 1.3})
+
+        await service.invalidate_market_data_cache("EUR_USD")
+
+        assert await service.get_cached_market_data("EUR_USD", "H1") is None
+        assert await service.get_cached_market_data("GBP_USD", "H1") == {"bid": 1.3}
+
+        await service.invalidate_market_data_cache()
+
+        assert await service.get_cached_market_data("GBP_USD", "H1") is None
+
+    @pytest.mark.unit
+    async def test_timeframe_invalidation_does_not_scan(self, service, monkeypatch):
+        """Invalidating one timeframe across symbols is a tag bump too."""
+        await service.cache_market_data_many({
+            ("EUR_USD", "H1"): {"bid": 1.1},
+            ("GBP_USD", "H1"): {"bid": 1.3},
+            ("EUR_USD", "M5"): {"bid": 1.2}
+        })
+
+        def no_scan(*args, **kwargs):
+            raise AssertionError("invalidate_market_data_cache must not SCAN")
+
+        monkeypatch.setattr(service.redis, "scan_iter", no_scan)
+
+        assert await service.invalidate_market_data_cache(timeframe="H1")
+
+        assert await service.get_cached_market_data("EUR_USD", "H1") is None
+        assert await service.get_cached_market_data("GBP_USD", "H1") is None
+        assert await service.get_cached_market_data("EUR_USD", "M5") == {"bid": 1.2}
+
+    @pytest.mark.unit
+    async def test_load_racing_an_invalidation_is_not_served(self, service):
+        """A get_or_load that started before invalidation stores under the old generation."""
+        release = asyncio.Event()
+
+        async def slow_loader():
+            await release.wait()
+            return "computed before invalidation"
+
+        load = asyncio.create_task(service.get_or_load("app:signals:top", slow_loader, ttl=60, tags=[SIGNALS_TAG]))
+        await asyncio.sleep(0.01)
+        await service.invalidate_tag(SIGNALS_TAG)
+        release.set()
+        await load
+
+        assert await service.get("app:signals:top", tags=[SIGNALS_TAG]) is None
+
+    @pytest.mark.unit
+    async def test_tag_generations_are_cached_locally(self, service, monkeypatch):
+        """Tagged reads only fetch the generation from Redis once."""
+        mget_calls = []
+        mget = service.redis.mget
+
+        async def counting_mget(*args, **kwargs):
+            mget_calls.append(args)
+            return await mget(*args, **kwargs)
+
+        monkeypatch.setattr(service.redis, "mget", counting_mget)
+
+        for _ in range(5):
+            await service.get_cached_signals("latest_10")
+
+        assert len(mget_calls) == 1
+
+
+class TestSignalServiceInvalidation:
+    """Test cases for invalidation on signal writes."""
+
+    @pytest.mark.unit
+    async def test_create_signal_invalidates_synchronously(self, connected_cache, monkeypatch):
+        """Cached signal lists are hidden as soon as create_signal returns."""
+        cache = connected_cache()
+        monkeypatch.setattr(signal_service_module, "cache_service", cache)
+        repository = MagicMock()
+        repository.get_latest_signals.return_value = [
+            Signal(id=1, symbol="EUR_USD", signal_type=SignalTypeEnum.BUY, entry_price=1.1,
+                   status=SignalStatusEnum.ACTIVE, reliability=80.0)
+        ]
+        repository.create.return_value = MagicMock()
+        monkeypatch.setattr(signal_service_module, "SignalRepository", lambda db: repository)
+        service = SignalService(MagicMock(), session_factory=MagicMock())
+        try:
+            await service.get_latest_signals(10)
+            await service.get_latest_signals(10)
+            assert repository.get_latest_signals.call_count == 1
+
+            service.create_signal(MagicMock(dict=lambda: {"expires_at": None}), creator_id=1)
+            await service.get_latest_signals(10)
+
+            assert repository.get_latest_signals.call_count == 2
+            await asyncio.sleep(0.05)
+            assert await cache.redis.get(cache._tag_key(SIGNALS_TAG)) == b"1"
+        finally:
+            await cache.disconnect()
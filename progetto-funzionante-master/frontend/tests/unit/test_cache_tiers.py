@@ -0,0 +1,159 @@
+"""
+Unit tests for the CacheService L1 tier and cross-worker invalidation.
+"""
+
+import pytest
+
+from app.services.cache_service import CacheService, CacheConfig
+from app.services.l1_cache import L1Cache, MISSING
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestL1Cache:
+    """Test cases for the bounded L1 cache."""
+
+    @pytest.mark.unit
+    def test_entries_expire_at_their_ttl(self):
+        """Values are served until their own TTL and then miss."""
+        clock = FakeClock()
+        cache = L1Cache(clock=clock)
+        cache.set("short", 1, ttl=5)
+        cache.set("long", 2, ttl=60)
+
+        clock.now += 10
+
+        assert cache.get("short") is MISSING
+        assert cache.get("long") == 2
+        assert cache.stats.expirations == 1
+
+    @pytest.mark.unit
+    def test_byte_bound_evicts_least_recently_used(self):
+        """Exceeding max_bytes evicts the least recently used entries first."""
+        cache = L1Cache(max_bytes=300)
+        for key in ("a", "b", "c"):
+            cache.set(key, key, size=100)
+        cache.get("a")
+
+        cache.set("d", "d", size=100)
+
+        assert cache.keys() == ["c", "a", "d"]
+        assert cache.bytes_used == 300
+        assert cache.stats.evictions == 1
+
+    @pytest.mark.unit
+    def test_oversized_values_are_not_stored(self):
+        """A value larger than the whole cache is skipped instead of flushing it."""
+        cache = L1Cache(max_bytes=100)
+        cache.set("small", 1, size=50)
+
+        assert cache.set("huge", 2, size=500) is False
+        assert cache.get("small") == 1
+
+    @pytest.mark.unit
+    def test_none_is_cacheable(self):
+        """A stored None is a hit, distinct from MISSING."""
+        cache = L1Cache()
+        cache.set("empty", None, size=1)
+
+        assert cache.get("empty") is None
+        assert cache.get("absent") is MISSING
+
+
+class TestCacheServiceTiers:
+    """Test cases for CacheService with the L1 tier."""
+
+    @pytest.mark.unit
+    async def test_fallback_respects_ttl(self):
+        """Without Redis, L1 expires entries at the TTL passed to set."""
+        service = CacheService(CacheConfig(redis_url="redis://unused"))
+        clock = FakeClock()
+        service._l1 = L1Cache(clock=clock)
+
+        await service.set("key", {"v": 1}, ttl=30)
+        assert await service.get("key") == {"v": 1}
+
+        clock.now += 31
+
+        assert await service.get("key") is None
+
+    @pytest.mark.unit
+    async def test_l1_hit_skips_redis(self, connected_cache):
+        """A repeated get is answered by L1 and counted per tier."""
+        service = connected_cache()
+        try:
+            await service.set("key", [1, 2, 3], ttl=60)
+            service._l1.clear()
+
+            assert await service.get("key") == [1, 2, 3]
+            assert await service.get("key") == [1, 2, 3]
+
+            metrics = service.get_metrics()
+            assert (metrics.redis_hits, metrics.redis_misses) == (1, 0)
+            assert (metrics.l1_hits, metrics.l1_misses) == (1, 1)
+        finally:
+            await service.disconnect()
+
+    @pytest.mark.unit
+    async def test_l1_expiry_follows_redis_ttl(self, connected_cache):
+        """Entries loaded from Redis keep Redis' remaining TTL, capped by l1_max_ttl."""
+        service = connected_cache()
+        try:
+            await service.redis.setex("short", 20, "1")
+            await service.redis.set("forever", "2")
+
+            await service.get("short")
+            await service.get("forever")
+
+            assert 19 <= service._l1.remaining_ttl("short") <= 20
+            assert service._l1.remaining_ttl("forever") == pytest.approx(service.config.l1_max_ttl, abs=1)
+        finally:
+            await service.disconnect()
+
+    @pytest.mark.unit
+    async def test_writes_invalidate_other_workers(self, connected_cache, settle):
+        """A set or delete on one worker drops the stale L1 copy on another."""
+        worker_a, worker_b = connected_cache(), connected_cache()
+        try:
+            await settle()
+            await worker_a.set("signals", ["old"], ttl=60)
+            assert await worker_b.get("signals") == ["old"]
+
+            await worker_a.set("signals", ["new"], ttl=60)
+            await settle()
+            assert await worker_b.get("signals") == ["new"]
+            assert worker_a.get_metrics().invalidations_received == 0
+
+            await worker_a.delete("signals")
+            await settle()
+            assert await worker_b.get("signals") is None
+        finally:
+            await worker_a.disconnect()
+            await worker_b.disconnect()
+
+    @pytest.mark.unit
+    async def test_pattern_invalidation_reaches_other_workers(self, connected_cache, settle):
+        """invalidate_pattern clears glob matches from every worker's L1."""
+        worker_a, worker_b = connected_cache(), connected_cache()
+        try:
+            await settle()
+            await worker_a.set("app:market_data:EUR_USD:H1", 1, ttl=60)
+            await worker_a.set("app:market_data:GBP_USD:H1", 2, ttl=60)
+            await settle()
+            await worker_b.get("app:market_data:EUR_USD:H1")
+            await worker_b.get("app:market_data:GBP_USD:H1")
+
+            await worker_a.invalidate_pattern("app:market_data:*EUR_USD*H1*")
+            await settle()
+
+            assert "app:market_data:EUR_USD:H1" not in worker_b._l1
+            assert "app:market_data:GBP_USD:H1" in worker_b._l1
+        finally:
+            await worker_a.disconnect()
+            await worker_b.disconnect()
@@ -0,0 +1,139 @@
+"""
+Unit tests for the columnar CandleFrame.
+"""
+
+import asyncio
+import json
+import numpy as np
+import pytest
+from datetime import datetime, timezone
+
+import oanda_api_client
+from oanda_api_client import CandleFrame, OANDACandle, OANDAClient, TokenBucket
+from tests.factories.candle_factory import CandleFactory
+
+
+def _response(n, complete_last=False):
+    return [
+        {
+            "time": f"2024-01-01T{i:02d}:00:00.000000000Z",
+            "mid": {"o": f"{1.1 + i / 1000:.5f}", "h": f"{1.2 + i / 1000:.5f}",
+                    "l": f"{1.0 + i / 1000:.5f}", "c": f"{1.15 + i / 1000:.5f}"},
+            "volume": 100 + i,
+            "complete": complete_last or i < n - 1
+        }
+        for i in range(n)
+    ]
+
+
+class TestCandleFrame:
+    """Test cases for CandleFrame parsing and compatibility."""
+
+    @pytest.mark.unit
+    def test_parses_response_into_columns(self):
+        """Prices, volumes, times and completeness land in typed arrays."""
+        frame = CandleFrame.from_oanda_response(_response(5))
+
+        assert len(frame) == 5
+        assert frame.closes.dtype == np.float64
+        assert frame.volumes.dtype == np.int64
+        assert frame.closes[2] == pytest.approx(1.152)
+        assert frame.volumes.tolist() == [100, 101, 102, 103, 104]
+        assert frame.complete.tolist() == [True, True, True, True, False]
+
+    @pytest.mark.unit
+    def test_price_columns_are_zero_copy_views(self):
+        """Column accessors share memory with the price block and are contiguous."""
+        frame = CandleFrame.from_oanda_response(_response(10))
+
+        for column in (frame.opens, frame.highs, frame.lows, frame.closes):
+            assert np.shares_memory(column, frame.prices)
+            assert column.flags["C_CONTIGUOUS"]
+        assert np.shares_memory(frame[-5:].closes, frame.prices)
+
+    @pytest.mark.unit
+    def test_row_access_matches_oanda_candle(self):
+        """Integer indexing builds the same OANDACandle as the per-candle parser."""
+        response = _response(3)
+        frame = CandleFrame.from_oanda_response(response)
+
+        for i, candle_data in enumerate(response):
+            assert frame[i] == OANDACandle.from_oanda_response(candle_data)
+        assert frame[-1].time == datetime(2024, 1, 1, 2, tzinfo=timezone.utc)
+        assert [c.close for c in frame] == pytest.approx(frame.closes.tolist())
+
+    @pytest.mark.unit
+    def test_masks_and_concat(self):
+        """Boolean masks select rows and concat restores order."""
+        frame = CandleFrame.from_oanda_response(_response(6))
+
+        completed = frame[frame.complete]
+        current = frame[~frame.complete]
+        joined = CandleFrame.concat([completed, current])
+
+        assert len(completed) == 5 and len(current) == 1
+        assert joined.times.tolist() == frame.times.tolist()
+
+    @pytest.mark.unit
+    def test_from_candles_round_trip(self):
+        """Lists of OANDACandle convert to an equivalent frame."""
+        frame = CandleFrame.from_oanda_response(_response(4))
+
+        rebuilt = CandleFrame.from_candles(list(frame))
+
+        assert np.array_equal(rebuilt.prices, frame.prices)
+        assert np.array_equal(rebuilt.times, frame.times)
+        assert CandleFrame.from_candles(frame) is frame
+
+    @pytest.mark.unit
+    def test_to_dataframe(self):
+        """The DataFrame is indexed by UTC time with OHLCV columns."""
+        df = CandleFrame.from_oanda_response(_response(3)).to_dataframe()
+
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert str(df.index.tz) == "UTC"
+        assert df["close"].iloc[0] == pytest.approx(1.15)
+
+
+class TestCandleDecoding:
+    """Test cases for decoding candle responses from raw bytes."""
+
+    @pytest.mark.unit
+    async def test_get_candles_decodes_response_bytes(self, monkeypatch):
+        """The client decodes the body bytes directly into a CandleFrame."""
+        monkeypatch.setattr(oanda_api_client, "request_rate_limiter", TokenBucket(1000))
+        body = CandleFactory.create_candles_body(50)
+
+        async def handle(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                         b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        client = OANDAClient("test-key", "test-account")
+        client.base_url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        try:
+            async with client:
+                frame = await client.get_candles("EUR_USD", count=50)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        expected = CandleFrame.from_oanda_response(json.loads(body)["candles"])
+        assert np.array_equal(frame.prices, expected.prices)
+        assert np.array_equal(frame.times, expected.times)
+        assert frame.volumes.tolist() == list(range(100, 150))
+
+    @pytest.mark.unit
+    def test_fast_decoder_matches_json(self):
+        """The bytes decoder yields the same frame as text + json.loads."""
+        body = CandleFactory.create_candles_body(500)
+
+        fast = CandleFrame.from_oanda_response(oanda_api_client._json_loads(body)["candles"])
+        legacy = CandleFrame.from_oanda_response(json.loads(body.decode())["candles"])
+
+        assert np.array_equal(fast.prices, legacy.prices)
+        assert np.array_equal(fast.times, legacy.times)
+        assert np.array_equal(fast.complete, legacy.complete)
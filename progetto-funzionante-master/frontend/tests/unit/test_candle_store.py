@@ -0,0 +1,106 @@
+"""
+Unit tests for the incremental CandleStore.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from candle_store import CandleStore
+from oanda_api_client import OANDACandle
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+KEY = ("EUR_USD", "H1", "M")
+
+
+def _candle(i, complete=True, close=None):
+    price = 1.1 + i * 0.0001 if close is None else close
+    return OANDACandle(
+        time=START + timedelta(hours=i), open=price, high=price, low=price,
+        close=price, volume=100, complete=complete
+    )
+
+
+class FakeMarket:
+    """Serves candles 0..now-1 as complete and `now` as the in-progress bar."""
+
+    def __init__(self, now):
+        self.now = now
+        self.calls = []
+
+    async def fetch(self, count, from_time):
+        self.calls.append((count, from_time))
+        bars = [_candle(i) for i in range(self.now)] + [_candle(self.now, complete=False)]
+        if from_time is not None:
+            bars = [c for c in bars if c.time >= from_time]
+            return bars[:count]
+        return bars[-count:]
+
+
+class TestCandleStore:
+    """Test cases for CandleStore delta fetching."""
+
+    @pytest.mark.unit
+    async def test_first_call_backfills_full_window(self):
+        """An empty store downloads the full count once."""
+        store = CandleStore()
+        market = FakeMarket(now=300)
+
+        candles = await store.fetch(KEY, 200, market.fetch)
+
+        assert len(candles) == 200
+        assert market.calls == [(200, None)]
+        assert not candles[-1].complete
+
+    @pytest.mark.unit
+    async def test_second_call_only_fetches_new_bars(self):
+        """Later calls request candles from the last completed bar onwards."""
+        store = CandleStore()
+        market = FakeMarket(now=300)
+        await store.fetch(KEY, 200, market.fetch)
+
+        market.now = 302
+        candles = await store.fetch(KEY, 200, market.fetch)
+
+        count, from_time = market.calls[-1]
+        assert from_time == START + timedelta(hours=299)
+        assert len(candles) == 200
+        assert [c.time for c in candles] == [START + timedelta(hours=i) for i in range(103, 303)]
+        assert store.get_stats()["delta_fetches"] == 1
+
+    @pytest.mark.unit
+    async def test_in_progress_bar_is_replaced(self):
+        """The incomplete bar is refreshed rather than stored as history."""
+        store = CandleStore()
+        market = FakeMarket(now=100)
+        await store.fetch(KEY, 50, market.fetch)
+
+        async def updated(count, from_time):
+            return [_candle(99), _candle(100, complete=False, close=2.0)]
+
+        candles = await store.fetch(KEY, 50, updated)
+
+        assert candles[-1].close == 2.0
+        assert sum(1 for c in candles if not c.complete) == 1
+
+    @pytest.mark.unit
+    async def test_larger_count_triggers_backfill(self):
+        """Asking for more history than stored re-downloads the deeper window."""
+        store = CandleStore()
+        market = FakeMarket(now=300)
+        await store.fetch(KEY, 50, market.fetch)
+
+        candles = await store.fetch(KEY, 200, market.fetch)
+
+        assert market.calls[-1] == (200, None)
+        assert len(candles) == 200
+
+    @pytest.mark.unit
+    async def test_download_ratio_drops_in_steady_state(self):
+        """Back-to-back analyses download a tiny fraction of the candles served."""
+        store = CandleStore()
+        market = FakeMarket(now=300)
+        for _ in range(20):
+            await store.fetch(KEY, 200, market.fetch)
+            market.now += 1
+
+        assert store.get_stats()["download_ratio"] < 0.1
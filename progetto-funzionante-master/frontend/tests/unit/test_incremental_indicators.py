@@ -0,0 +1,89 @@
+"""
+Unit tests for the streaming IncrementalIndicators state.
+"""
+
+import numpy as np
+import pytest
+from dataclasses import asdict
+
+from oanda_api_client import Granularity
+from oanda_signal_engine import IncrementalIndicators, OANDASignalEngine
+from tests.factories.candle_factory import CandleFactory
+
+
+def _assert_same(streamed, batch):
+    for name, expected in asdict(batch).items():
+        actual = getattr(streamed, name)
+        if isinstance(expected, (float, np.floating)):
+            assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12), name
+        else:
+            assert actual == expected, name
+
+
+class TestIncrementalIndicators:
+    """Test cases for streaming indicator snapshots."""
+
+    @pytest.fixture
+    def engine(self):
+        return OANDASignalEngine("test-key", "test-account")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n", [50, 120, 260])
+    def test_snapshot_matches_full_recompute(self, engine, n):
+        """Streaming updates reproduce the batch calculation on the same history."""
+        candles = CandleFactory.create_random_candles(n)
+        state = IncrementalIndicators()
+        for candle in candles:
+            state.update(candle)
+
+        _assert_same(state.snapshot(), engine._calculate_technical_analysis(candles))
+
+    @pytest.mark.unit
+    def test_snapshot_previews_in_progress_bar(self, engine):
+        """The in-progress bar is included in the snapshot but not committed."""
+        candles = CandleFactory.create_random_candles(120, last_complete=False)
+        state = IncrementalIndicators()
+        for candle in candles[:-1]:
+            state.update(candle)
+
+        _assert_same(state.snapshot(candles[-1]), engine._calculate_technical_analysis(candles))
+        assert state.bars == 119
+        assert state.last_time == candles[-2].time
+
+    @pytest.mark.unit
+    def test_snapshot_requires_minimum_bars(self):
+        """Fewer than 50 bars raises like the batch path."""
+        state = IncrementalIndicators()
+        for candle in CandleFactory.create_random_candles(30):
+            state.update(candle)
+
+        with pytest.raises(ValueError):
+            state.snapshot()
+
+    @pytest.mark.unit
+    def test_engine_only_folds_in_new_bars(self, engine):
+        """Repeated analyses reuse the per-instrument state."""
+        candles = CandleFactory.create_random_candles(201, last_complete=False)
+        engine._update_technical_analysis("EUR_USD", Granularity.H1, candles)
+        state = engine._indicator_states[("EUR_USD", "H1")]
+        bars_before = state.bars
+
+        more = CandleFactory.create_random_candles(203, last_complete=False)
+        engine._update_technical_analysis("EUR_USD", Granularity.H1, more[2:])
+
+        assert engine._indicator_states[("EUR_USD", "H1")] is state
+        assert state.bars == bars_before + 2
+
+    @pytest.mark.unit
+    def test_long_stream_stays_accurate(self, engine):
+        """Running sums do not drift over thousands of updates."""
+        candles = CandleFactory.create_random_candles(5000)
+        state = IncrementalIndicators()
+        for candle in candles:
+            state.update(candle)
+
+        streamed = state.snapshot()
+        batch = engine._calculate_technical_analysis(candles)
+        assert streamed.bb_upper == pytest.approx(batch.bb_upper, rel=1e-9)
+        assert streamed.atr == pytest.approx(batch.atr, rel=1e-9)
+        assert streamed.rsi == pytest.approx(batch.rsi, rel=1e-9)
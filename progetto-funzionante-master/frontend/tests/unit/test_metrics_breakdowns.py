@@ -0,0 +1,110 @@
+"""
+Unit tests for the grouped MetricsEngine breakdowns.
+"""
+
+import pytest
+import pandas as pd
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+from quant_adaptive_system.storage.sqlite_pool import close_sqlite_stores
+from quant_adaptive_system.signal_intelligence.signal_outcomes import SignalOutcome
+from quant_adaptive_system.reporting.performance_aggregator import PerformanceAccumulator, SKETCH_BUCKET_R
+from quant_adaptive_system.reporting.metrics_engine import MetricsEngine, TIMEFRAME_BUCKETS
+from tests.factories.signal_snapshot_factory import SignalSnapshotFactory
+from tests.factories.trade_factory import TradeFactory
+
+pytestmark = pytest.mark.usefixtures("isolated_registry")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return MetricsEngine(str(tmp_path / "metrics_engine.db"))
+
+
+class TestGroupedBreakdowns:
+    """Test cases for the grouped performance breakdowns."""
+
+    @pytest.mark.unit
+    def test_groups_match_per_group_aggregate(self, engine):
+        """Each group gets the metrics the portfolio path computes for its trades alone."""
+        trades = TradeFactory.create_trades_frame(400, ["EUR_USD", "GBP_USD", "USD_JPY"])
+        # Gruppi piccoli: meno di 20 trade (niente VaR) e un solo trade negativo
+        trades.loc[len(trades)] = ["XAU_USD", "NORMAL", -0.5, 30]
+        trades.loc[len(trades)] = ["XAU_USD", "NORMAL", 1.5, 30]
+
+        breakdowns = engine._grouped_performance(trades, {"instrument": trades["instrument"]}, 30)
+
+        assert set(breakdowns["instrument"]) == {"EUR_USD", "GBP_USD", "USD_JPY", "XAU_USD"}
+        for instrument, metrics in breakdowns["instrument"].items():
+            stats = PerformanceAccumulator()
+            for row in trades[trades["instrument"] == instrument].itertuples():
+                holding = None if pd.isna(row.holding_time_minutes) else row.holding_time_minutes
+                stats.add_trade(row.r_multiple, holding_minutes=holding)
+            expected = asdict(engine._performance_from_stats(stats, 30))
+            actual = asdict(metrics)
+
+            for name in ("var_95", "cvar_95"):
+                assert actual.pop(name) == pytest.approx(expected.pop(name), abs=SKETCH_BUCKET_R)
+            assert actual == pytest.approx(expected, rel=1e-9, abs=2e-3), instrument
+
+    @pytest.mark.unit
+    def test_streaks_do_not_cross_groups(self, engine):
+        """Runs are counted within a group even when groups are interleaved."""
+        trades = pd.DataFrame({
+            "instrument": ["A", "B", "A", "B", "A", "B", "A"],
+            "market_regime": ["NORMAL"] * 7,
+            "r_multiple": [1.0, 1.0, 1.0, -1.0, -1.0, 1.0, -1.0],
+            "holding_time_minutes": [10] * 7
+        })
+
+        breakdowns = engine._grouped_performance(trades, {"instrument": trades["instrument"]}, 30)
+
+        a, b = breakdowns["instrument"]["A"], breakdowns["instrument"]["B"]
+        assert (a.consecutive_wins, a.consecutive_losses) == (2, 2)
+        assert (b.consecutive_wins, b.consecutive_losses) == (1, 1)
+        assert a.max_drawdown == pytest.approx(2.0)
+        assert b.current_drawdown == 0
+
+    @pytest.mark.unit
+    async def test_report_breakdowns_use_one_trade_fetch(self, engine, tracker, monkeypatch):
+        """Regime, instrument and timeframe breakdowns come from a single query."""
+        engine.outcome_tracker = tracker
+        now = datetime.utcnow()
+        queries = []
+        try:
+            await tracker.initialize()
+            for i in range(30):
+                signal_id = f"SIG-{i}"
+                regime = "NORMAL" if i % 3 else "HIGH_0DTE"
+                snapshot = SignalSnapshotFactory.create_snapshot(
+                    signal_id, now - timedelta(hours=i * 5), f"PAIR_{i % 4}", regime
+                )
+                await tracker.track_signal(snapshot)
+                exit_price = 1.12 if i % 2 else 1.09
+                outcome = SignalOutcome.TP_HIT if exit_price > 1.1 else SignalOutcome.SL_HIT
+                await tracker.update_signal_outcome(signal_id, outcome, exit_price=exit_price)
+            await tracker.flush()
+
+            store = tracker.store
+            for method in ("fetchall", "fetchone", "fetch_with_columns"):
+                original = getattr(store, method)
+
+                async def recording(sql, params=(), original=original):
+                    queries.append(sql)
+                    return await original(sql, params)
+
+                monkeypatch.setattr(store, method, recording)
+            regimes, instruments, timeframes = await engine._calculate_breakdowns(now - timedelta(days=30), now)
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert len(queries) == 1
+        assert set(instruments) == {"PAIR_0", "PAIR_1", "PAIR_2", "PAIR_3"}
+        assert sum(m.total_trades for m in instruments.values()) == 30
+        assert set(timeframes) <= {label for _, label in TIMEFRAME_BUCKETS}
+        assert sum(m.total_trades for m in timeframes.values()) == 30
+        assert {regime.regime_name for regime in regimes} == {"NORMAL", "HIGH_0DTE"}
+        assert all(regime.max_drawdown > 0 and regime.sharpe_ratio != 0 for regime in regimes)
+        assert [regime.avg_return for regime in regimes] == sorted((r.avg_return for r in regimes), reverse=True)
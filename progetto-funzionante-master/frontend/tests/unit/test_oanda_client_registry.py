@@ -0,0 +1,151 @@
+"""
+Unit tests for the process-wide OANDA client registry.
+"""
+
+import asyncio
+import pytest
+
+import oanda_api_client
+from oanda_api_client import OANDAClientRegistry, OANDAPoolConfig, OANDAEnvironment, TokenBucket
+from oanda_signal_engine import OANDASignalEngine
+
+
+async def _slow_server(delay):
+    """Keep-alive HTTP server answering every request after ``delay`` seconds."""
+    async def handle(reader, writer):
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(delay)
+                body = b'{"account": {"id": "test-account"}}'
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+class TestOANDAClientRegistry:
+    """Test cases for OANDAClientRegistry."""
+
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        registry = OANDAClientRegistry(OANDAPoolConfig(limit=8, limit_per_host=4))
+        monkeypatch.setattr(oanda_api_client, "oanda_client_registry", registry)
+        monkeypatch.setattr(oanda_api_client, "connection_rate_limiter", TokenBucket(1000))
+        return registry
+
+    @pytest.mark.unit
+    async def test_one_client_per_environment_and_account(self, registry):
+        """Callers for the same account share a client; other accounts get their own."""
+        try:
+            first = await registry.get_client("key", "001", "practice")
+            again = await registry.get_client("key", "001", "demo")
+            other = await registry.get_client("key", "002", "practice")
+            live = await registry.get_client("key", "001", "live")
+
+            assert first is again
+            assert first is not other and first is not live
+            assert first.environment is OANDAEnvironment.PRACTICE
+            assert registry.find_client("001", "practice") is first
+            assert set(registry.get_metrics()["clients"]) == {"practice:001", "practice:002", "live:001"}
+        finally:
+            await registry.close_all()
+
+    @pytest.mark.unit
+    async def test_rotated_key_replaces_and_closes_the_client(self, registry):
+        """A new API key gets a new client; the old one's session is closed."""
+        try:
+            old = await registry.get_client("old-key", "001")
+            old_session = old.session
+            new = await registry.get_client("new-key", "001")
+
+            assert new is not old
+            assert new.api_key == "new-key"
+            assert old_session.closed
+            assert registry.find_client("001") is new
+        finally:
+            await registry.close_all()
+
+    @pytest.mark.unit
+    def test_client_from_a_finished_loop_is_abandoned(self, monkeypatch):
+        """A client whose loop is gone is replaced and its connector released."""
+        registry = OANDAClientRegistry()
+        monkeypatch.setattr(oanda_api_client, "connection_rate_limiter", TokenBucket(1000))
+
+        async def open_client(close=False):
+            client = await registry.get_client("key", "001")
+            session = client.session
+            if close:
+                await registry.close_all()
+            return client, session
+
+        old, old_session = asyncio.run(open_client())
+        new, _ = asyncio.run(open_client(close=True))
+
+        assert new is not old
+        assert old.session is None
+        assert old_session.closed
+
+    @pytest.mark.unit
+    async def test_engines_share_the_pool_and_leave_it_open(self, registry):
+        """Engines reuse the account's client, and closing an engine keeps it open."""
+        try:
+            async with OANDASignalEngine("key", "001") as first:
+                pass
+            second = OANDASignalEngine("key", "001")
+            client = await second._ensure_client()
+
+            assert first.oanda_client is client
+            assert not client.session.closed
+        finally:
+            await registry.close_all()
+
+        assert client.session is None
+
+    @pytest.mark.unit
+    async def test_pool_metrics_track_utilization(self, registry):
+        """In-use and idle connections are reported per client."""
+        server, url = await _slow_server(0.1)
+        try:
+            client = await registry.get_client("key", "001")
+            client.base_url = url
+
+            requests = [asyncio.create_task(client.get_account_info()) for _ in range(6)]
+            await asyncio.sleep(0.05)
+            busy = registry.get_metrics()["clients"]["practice:001"]
+            await asyncio.gather(*requests)
+            await client.get_account_info()
+            idle = registry.get_metrics()["clients"]["practice:001"]
+        finally:
+            await registry.close_all()
+            server.close()
+            await server.wait_closed()
+
+        assert busy["in_use"] == 4
+        assert busy["utilization"] == 50.0
+        assert idle["in_use"] == 0
+        assert idle["idle"] == 4
+        # Seven requests over four kept-alive connections
+        assert idle["connections_opened"] == 4
+        assert idle["requests_sent"] == 7
+
+    @pytest.mark.unit
+    def test_pool_config_from_environment(self, monkeypatch):
+        """Pool settings can be tuned without code changes."""
+        monkeypatch.setenv("OANDA_POOL_LIMIT", "50")
+        monkeypatch.setenv("OANDA_POOL_DNS_CACHE_TTL", "60")
+
+        config = OANDAPoolConfig.from_env()
+
+        assert config.limit == 50
+        assert config.dns_cache_ttl == 60
+        assert config.limit_per_host == OANDAPoolConfig().limit_per_host
@@ -0,0 +1,165 @@
+"""
+Unit tests for the shared OANDA token bucket and 429 handling.
+"""
+
+import asyncio
+import time
+import pytest
+
+import oanda_api_client
+from oanda_api_client import OANDAAPIError, OANDAClient, TokenBucket
+
+
+async def _oanda_server(statuses, retry_after=None):
+    """Keep-alive HTTP server replying with ``statuses`` in order, then 200."""
+    requests = []
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                requests.append(time.monotonic())
+                status = statuses.pop(0) if statuses else 200
+                body = b'{"account": {"id": "test-account"}}' if status == 200 else b'{"errorMessage": "slow down"}'
+                headers = f"Retry-After: {retry_after}\r\n" if status == 429 and retry_after is not None else ""
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n{headers}"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", requests
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    @pytest.mark.unit
+    async def test_burst_then_steady_rate(self):
+        """Capacity is served at once; the rest follows at the refill rate."""
+        bucket = TokenBucket(rate=50, capacity=5)
+        start = time.monotonic()
+
+        await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+
+        elapsed = time.monotonic() - start
+        assert 0.18 <= elapsed < 0.4
+        metrics = bucket.get_metrics()
+        assert metrics["throttled"] == 10
+        assert metrics["peak_queue_depth"] == 10
+        assert metrics["queue_depth"] == 0
+        assert metrics["max_wait_time"] == pytest.approx(0.2, abs=0.02)
+
+    @pytest.mark.unit
+    async def test_waiters_are_served_in_arrival_order(self):
+        """Reservations are due in the order they were made."""
+        bucket = TokenBucket(rate=100, capacity=1)
+        order = []
+
+        async def take(i):
+            await bucket.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(take(i) for i in range(6)))
+
+        assert order == list(range(6))
+
+    @pytest.mark.unit
+    async def test_pause_blocks_and_drops_burst(self):
+        """A pause holds back new tokens even when the bucket was full."""
+        bucket = TokenBucket(rate=1000, capacity=100)
+        bucket.pause(0.1)
+
+        assert await bucket.acquire() == pytest.approx(0.1, abs=0.02)
+
+    @pytest.mark.unit
+    async def test_cancelled_waiter_returns_its_token(self):
+        """A cancelled reservation does not delay later callers."""
+        bucket = TokenBucket(rate=10, capacity=1)
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert await bucket.acquire() < 0.1
+
+
+class TestClientRateLimiting:
+    """Test cases for OANDAClient rate limiting."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_limiters(self, monkeypatch):
+        monkeypatch.setattr(oanda_api_client, "request_rate_limiter", TokenBucket(120))
+        monkeypatch.setattr(oanda_api_client, "connection_rate_limiter", TokenBucket(2))
+        monkeypatch.setattr(oanda_api_client, "rate_limit_stats", {"rate_limited_responses": 0, "retries": 0})
+        monkeypatch.setattr(OANDAClient, "RATE_LIMIT_BACKOFF_BASE", 0.02)
+
+    def _client(self, base_url):
+        client = OANDAClient("test-key", "test-account")
+        client.base_url = base_url
+        return client
+
+    @pytest.mark.unit
+    async def test_clients_share_one_bucket(self):
+        """Every client in the process draws from the same limiters."""
+        first, second = OANDAClient("a", "1"), OANDAClient("b", "2")
+
+        assert first._request_limiter is second._request_limiter is oanda_api_client.request_rate_limiter
+        assert first._connection_limiter is oanda_api_client.connection_rate_limiter
+
+    @pytest.mark.unit
+    async def test_429_is_retried_after_retry_after(self):
+        """Rate-limited requests are retried once Retry-After has elapsed."""
+        server, url, requests = await _oanda_server([429, 429], retry_after="0.1")
+        try:
+            async with self._client(url) as client:
+                account = await client.get_account_info()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert account == {"id": "test-account"}
+        assert len(requests) == 3
+        assert requests[1] - requests[0] >= 0.1
+        metrics = oanda_api_client.get_rate_limit_metrics()
+        assert metrics["rate_limited_responses"] == 2
+        assert metrics["retries"] == 2
+        assert metrics["requests"]["pauses"] == 2
+        # Keep-alive: three requests, one new connection
+        assert metrics["connections"]["acquired"] == 1
+
+    @pytest.mark.unit
+    async def test_429_gives_up_after_max_retries(self, monkeypatch):
+        """Persistent 429s surface as RATE_LIMIT errors after backing off."""
+        monkeypatch.setattr(OANDAClient, "RATE_LIMIT_MAX_RETRIES", 2)
+        server, url, requests = await _oanda_server([429] * 5)
+        try:
+            async with self._client(url) as client:
+                with pytest.raises(OANDAAPIError) as error:
+                    await client.get_account_info()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert error.value.error_code == "RATE_LIMIT"
+        assert len(requests) == 3
+        assert oanda_api_client.rate_limit_stats == {"rate_limited_responses": 3, "retries": 2}
+
+    @pytest.mark.unit
+    def test_backoff_is_jittered_and_capped(self):
+        """Without Retry-After the delay grows exponentially with jitter, up to the cap."""
+        client = OANDAClient("test-key", "test-account")
+
+        delays = [client._rate_limit_delay(attempt, None) for attempt in range(12)]
+
+        assert 0.01 <= delays[0] <= 0.02
+        assert all(d <= OANDAClient.RATE_LIMIT_BACKOFF_MAX for d in delays)
+        assert client._rate_limit_delay(0, "1.5") >= 1.5
@@ -0,0 +1,115 @@
+"""
+Unit tests for the async OANDAService signal generation path.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services import oanda_service as oanda_service_module
+from app.services import signal_writer as signal_writer_module
+from app.services.cache_service import CacheService, CacheConfig, SIGNALS_TAG
+from app.services.oanda_service import OANDAService
+from app.services.signal_writer import SignalWriter
+from models import Base
+from oanda_signal_engine import OANDASignalEngine, SignalType, RiskLevel
+
+MAJOR_SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "GOLD", "AUDUSD"]
+
+
+def _trading_signal(instrument):
+    return SimpleNamespace(
+        instrument=instrument, signal_type=SignalType.BUY, confidence_score=0.8,
+        entry_price=1.1, stop_loss=1.09, take_profit=1.12, risk_level=RiskLevel.MEDIUM,
+        risk_reward_ratio=2.0, position_size=0.01, ai_analysis="", timeframe="H1"
+    )
+
+
+def _make_engine(delay):
+    """Build an engine whose generate_signal takes ``delay`` seconds per symbol."""
+    engine = OANDASignalEngine("test-key", "test-account")
+    engine.oanda_client = MagicMock()
+    engine.oanda_client.normalize_instrument.side_effect = lambda symbol: symbol
+    engine.oanda_client.get_current_prices = AsyncMock(return_value=[])
+
+    async def fake_generate_signal(instrument, timeframe="H1", current_price=None):
+        await asyncio.sleep(delay)
+        return _trading_signal(instrument)
+
+    engine.generate_signal = fake_generate_signal
+    return engine
+
+
+@pytest.fixture
+def db_engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def service(db_engine, monkeypatch):
+    """OANDAService on a shared fake engine, an in-memory cache and an in-memory database."""
+    writer = SignalWriter(session_factory=sessionmaker(autocommit=False, autoflush=False, bind=db_engine))
+    monkeypatch.setattr(oanda_service_module, "_shared_engine", _make_engine(0.2))
+    monkeypatch.setattr(oanda_service_module, "signal_writer", writer)
+    monkeypatch.setattr(signal_writer_module, "cache_service", CacheService(CacheConfig(redis_url="redis://unused")))
+    return OANDAService(MagicMock())
+
+
+class TestAsyncSignalGeneration:
+    """Test cases for async OANDAService generation."""
+
+    @pytest.mark.unit
+    async def test_major_symbols_take_about_one_symbol(self, service):
+        """The 5-symbol sweep runs concurrently instead of one symbol after another."""
+        try:
+            start = time.perf_counter()
+            await service.generate_signal("EURUSD", user_id=1)
+            single = time.perf_counter() - start
+
+            start = time.perf_counter()
+            signals = await service.batch_generate_signals(MAJOR_SYMBOLS, user_id=1)
+            batch = time.perf_counter() - start
+        finally:
+            await oanda_service_module.signal_writer.stop()
+
+        assert list(signals) == MAJOR_SYMBOLS
+        assert all(signal.symbol == symbol for symbol, signal in signals.items())
+        assert batch < single * 2
+
+    @pytest.mark.unit
+    async def test_db_writes_run_on_writer_thread(self, service, db_engine):
+        """Inserts happen off the event loop thread, and invalidate cached signal lists."""
+        threads = []
+
+        @event.listens_for(db_engine, "before_cursor_execute")
+        def record_thread(conn, cursor, statement, parameters, context, executemany):
+            threads.append(threading.current_thread().name)
+
+        try:
+            signals = await service.batch_generate_signals(["EURUSD", "GBPUSD"], user_id=1)
+        finally:
+            await oanda_service_module.signal_writer.stop()
+
+        assert all(signal.id for signal in signals.values())
+        assert threads and all(name.startswith("signal-writer") for name in threads)
+        assert signal_writer_module.cache_service._tag_versions[SIGNALS_TAG][0] == 1
+
+    @pytest.mark.unit
+    async def test_engine_is_shared_across_services(self, monkeypatch):
+        """Request-scoped services reuse one engine created from settings."""
+        monkeypatch.setattr(oanda_service_module, "_shared_engine", None)
+        factory = AsyncMock(side_effect=lambda *args: _make_engine(0))
+        monkeypatch.setattr(oanda_service_module, "create_signal_engine", factory)
+
+        engines = await asyncio.gather(*(OANDAService(MagicMock()).get_signal_engine() for _ in range(5)))
+
+        assert factory.await_count == 1
+        assert all(engine is engines[0] for engine in engines)
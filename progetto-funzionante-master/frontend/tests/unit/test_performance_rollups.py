@@ -0,0 +1,263 @@
+"""
+Unit tests for the incremental performance aggregator and its daily rollups.
+"""
+
+import random
+import sqlite3
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from statistics import mean, stdev
+
+from quant_adaptive_system.storage.sqlite_pool import close_sqlite_stores
+from quant_adaptive_system.signal_intelligence.signal_outcomes import SignalOutcomeTracker, SignalOutcome
+from quant_adaptive_system.reporting.performance_aggregator import (
+    PerformanceAccumulator, PORTFOLIO, SKETCH_BUCKET_R
+)
+from quant_adaptive_system.reporting.metrics_engine import MetricsEngine
+from tests.factories.signal_snapshot_factory import SignalSnapshotFactory
+
+pytestmark = pytest.mark.usefixtures("isolated_registry")
+
+
+def _fold(r_multiples):
+    accumulator = PerformanceAccumulator()
+    for r in r_multiples:
+        accumulator.add_signal()
+        accumulator.add_trade(r, "TP_HIT" if r > 0 else "SL_HIT")
+    return accumulator
+
+
+def _max_consecutive(r_multiples, positive):
+    best = current = 0
+    for r in r_multiples:
+        current = current + 1 if (r > 0) == positive else 0
+        best = max(best, current)
+    return best
+
+
+def _assert_same_state(actual, expected):
+    actual, expected = actual.to_dict(), expected.to_dict()
+    assert actual.pop("sketch").keys() == expected.pop("sketch").keys()
+    assert actual == pytest.approx(expected)
+
+
+async def _record_days(tracker, now, days=10, per_day=6):
+    """Signals spread over several days and two instruments, closed in reverse order."""
+    rng = random.Random(7)
+    signals = []
+    for day in range(days):
+        for i in range(per_day):
+            timestamp = now - timedelta(days=day, hours=i * 3 + 1)
+            instrument = "EUR_USD" if i % 2 else "GBP_USD"
+            signal_id = f"SIG-{day}-{i}"
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot(signal_id, timestamp, instrument))
+            signals.append(signal_id)
+    # Alcuni restano aperti; gli altri chiudono in ordine diverso da quello dei segnali
+    for signal_id in reversed(signals[3:]):
+        exit_price = rng.choice([1.09, 1.09, 1.12, 1.115, 1.095])
+        outcome = SignalOutcome.TP_HIT if exit_price > 1.1 else SignalOutcome.SL_HIT
+        await tracker.update_signal_outcome(signal_id, outcome, exit_price=exit_price)
+    await tracker.flush()
+
+
+class TestPerformanceAccumulator:
+    """Test cases for PerformanceAccumulator."""
+
+    @pytest.mark.unit
+    def test_merged_buckets_equal_sequential_fold(self):
+        """Merging consecutive buckets gives the state of the concatenated trades."""
+        rng = random.Random(1)
+        r_multiples = [rng.choice([-1.0, -1.0, 2.0, 0.5, -0.3, 1.5]) for _ in range(300)]
+        cuts = sorted(rng.sample(range(1, 300), 12)) + [300, 300]
+
+        merged, previous = PerformanceAccumulator(), 0
+        for cut in cuts:
+            merged.merge(_fold(r_multiples[previous:cut]))
+            previous = cut
+
+        _assert_same_state(merged, _fold(r_multiples))
+
+    @pytest.mark.unit
+    def test_streaks_span_bucket_boundaries(self):
+        """Runs that continue across several buckets are counted once."""
+        buckets = [[1.0, -1.0, -1.0], [-1.0], [-1.0, 2.0], [2.0], [2.0, 2.0]]
+        merged = PerformanceAccumulator()
+        for bucket in buckets:
+            merged.merge(_fold(bucket))
+
+        assert merged.max_loss_streak == 4
+        assert merged.max_win_streak == 4
+        assert (merged.head_wins, merged.tail_wins) == (1, 4)
+
+    @pytest.mark.unit
+    def test_metrics_match_trade_level_formulas(self, tmp_path):
+        """Metrics derived from the aggregate match the trade-list computation."""
+        rng = random.Random(3)
+        r_multiples = [round(rng.uniform(-1.2, 2.5), 3) for _ in range(120)]
+        metrics = MetricsEngine(str(tmp_path / "metrics.db"))._performance_from_stats(_fold(r_multiples), 30)
+
+        cumulative = np.cumsum(r_multiples)
+        drawdowns = cumulative - np.maximum.accumulate(cumulative)
+        negatives = [r for r in r_multiples if r < 0]
+        var_95 = np.percentile(r_multiples, 5)
+
+        assert metrics.total_trades == 120
+        assert metrics.total_return == pytest.approx(sum(r_multiples), abs=1e-4)
+        assert metrics.sharpe_ratio == pytest.approx(mean(r_multiples) / stdev(r_multiples), abs=1e-3)
+        assert metrics.sortino_ratio == pytest.approx(mean(r_multiples) / stdev(negatives), abs=1e-3)
+        assert metrics.r_multiple_std == pytest.approx(stdev(r_multiples), abs=1e-4)
+        assert metrics.max_drawdown == pytest.approx(abs(min(drawdowns)), abs=1e-4)
+        assert metrics.current_drawdown == pytest.approx(abs(drawdowns[-1]), abs=1e-4)
+        assert metrics.consecutive_wins == _max_consecutive(r_multiples, positive=True)
+        assert metrics.consecutive_losses == _max_consecutive(r_multiples, positive=False)
+        assert metrics.largest_loss == min(r_multiples)
+        assert metrics.var_95 == pytest.approx(var_95, abs=SKETCH_BUCKET_R)
+        assert metrics.cvar_95 == pytest.approx(mean(r for r in r_multiples if r <= var_95), abs=SKETCH_BUCKET_R)
+
+
+class TestDailyRollups:
+    """Test cases for the daily rollups maintained by the tracker."""
+
+    @pytest.mark.unit
+    async def test_windows_merge_rollups_like_a_full_rescan(self, tracker):
+        """A window from rollups plus partial edge days equals scanning every trade."""
+        now = datetime.now()
+        try:
+            await tracker.initialize()
+            await _record_days(tracker, now)
+            days = await tracker.store.fetchone(
+                "SELECT COUNT(DISTINCT day), COUNT(*) FROM performance_daily"
+            )
+
+            for start, end, instrument in [
+                (now - timedelta(days=7), now, None),
+                (now - timedelta(days=30), now, "EUR_USD"),
+                (now - timedelta(days=3, hours=5), now - timedelta(days=1, hours=2), None),
+                (now - timedelta(hours=10), now, "GBP_USD")
+            ]:
+                rolled_up = await tracker.rollups.window(start, end, instrument)
+                rescanned = await tracker.rollups.fold_range(start.isoformat(), end.isoformat(), instrument, inclusive=True)
+                _assert_same_state(rolled_up, rescanned.get(instrument or PORTFOLIO, PerformanceAccumulator()))
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        # Un giorno ha righe PORTFOLIO + 2 strumenti
+        assert days[1] == days[0] * 3
+        assert tracker.rollups.metrics["rollup_rows_read"] > 0
+
+    @pytest.mark.unit
+    async def test_tracker_metrics_come_from_rollups(self, tracker):
+        """get_performance_metrics reports the same figures as the SQL aggregates it replaces."""
+        now = datetime.now()
+        try:
+            await tracker.initialize()
+            await _record_days(tracker, now)
+            metrics = await tracker.get_performance_metrics(days_back=5, instrument="EUR_USD")
+            expected = await tracker.store.fetchone("""
+                SELECT COUNT(*),
+                       COUNT(CASE WHEN o.outcome IN ('TP_HIT', 'MANUAL_EXIT') AND o.r_multiple > 0 THEN 1 END),
+                       COUNT(CASE WHEN o.outcome IN ('SL_HIT', 'MANUAL_EXIT') AND o.r_multiple <= 0 THEN 1 END),
+                       AVG(o.r_multiple), MAX(o.r_multiple), AVG(o.mfe)
+                FROM signal_snapshots s LEFT JOIN signal_outcomes o ON s.signal_id = o.signal_id
+                WHERE s.timestamp >= ? AND s.instrument = 'EUR_USD'
+            """, ((now - timedelta(days=5)).isoformat(),))
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        total, wins, losses, avg_r, best, avg_mfe = expected
+        assert (metrics["total_signals"], metrics["wins"], metrics["losses"]) == (total, wins, losses)
+        assert metrics["avg_r_multiple"] == round(avg_r, 3)
+        assert metrics["best_trade"] == round(best, 3)
+        assert metrics["avg_mfe"] == round(avg_mfe, 3)
+
+    @pytest.mark.unit
+    async def test_outcome_updates_refresh_their_day(self, tracker):
+        """Closing a signal rewrites the rollup of the day the signal was generated."""
+        timestamp = datetime.now() - timedelta(days=2)
+        day = timestamp.date().isoformat()
+        try:
+            await tracker.initialize()
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1", timestamp))
+            await tracker.flush()
+            before = await tracker.store.fetchone(
+                "SELECT signals, trades FROM performance_daily WHERE day = ? AND instrument = ?", (day, PORTFOLIO)
+            )
+            await tracker.update_signal_outcome("SIG-1", SignalOutcome.TP_HIT, exit_price=1.12)
+            await tracker.flush()
+            after = await tracker.store.fetchone(
+                "SELECT signals, trades, total_r FROM performance_daily WHERE day = ? AND instrument = ?", (day, PORTFOLIO)
+            )
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert before == (1, 0)
+        assert after[:2] == (1, 1)
+        assert after[2] == pytest.approx(2.0)
+
+    @pytest.mark.unit
+    async def test_failed_refresh_is_retried(self, tracker, monkeypatch):
+        """Rollups that could not be refreshed are caught up by the next flush."""
+        try:
+            await tracker.initialize()
+            refresh = tracker.rollups.refresh
+
+            async def failing_refresh(days):
+                raise sqlite3.OperationalError("database is locked")
+
+            monkeypatch.setattr(tracker.rollups, "refresh", failing_refresh)
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1", datetime.now()))
+            assert await tracker.flush() == 2
+            assert tracker.get_write_metrics()["stale_rollup_days"] == 1
+
+            monkeypatch.setattr(tracker.rollups, "refresh", refresh)
+            await tracker.sync_pending()
+            rows = await tracker.store.fetchone("SELECT COUNT(*) FROM performance_daily")
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert tracker.get_write_metrics()["stale_rollup_days"] == 0
+        assert rows == (2,)
+
+    @pytest.mark.unit
+    async def test_migration_builds_rollups_for_existing_signals(self, tracker):
+        """Upgrading a v2 database backfills rollups from the stored trades."""
+        now = datetime.now()
+        try:
+            await tracker.initialize()
+            await _record_days(tracker, now, days=3)
+            expected = await tracker.rollups.window(now - timedelta(days=5), now)
+            await tracker.store.write([
+                ("DROP TABLE performance_daily", ()),
+                ("PRAGMA user_version = 2", ())
+            ])
+
+            upgraded = SignalOutcomeTracker(str(tracker.db_path))
+            await upgraded.initialize()
+            rebuilt = await upgraded.rollups.window(now - timedelta(days=5), now)
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        _assert_same_state(rebuilt, expected)
+
+    @pytest.mark.unit
+    async def test_yearly_window_matches_full_rescan(self, tracker):
+        """A 365-day window merged from daily buckets equals rescanning every trade."""
+        now = datetime.now()
+        try:
+            await tracker.initialize()
+            await _record_days(tracker, now, days=365, per_day=2)
+            start = now - timedelta(days=365)
+            rescanned = (await tracker.rollups.fold_range(start.isoformat(), now.isoformat(), inclusive=True))[PORTFOLIO]
+            rolled_up = await tracker.rollups.window(start, now)
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert rolled_up.trades == rescanned.trades > 700
+        _assert_same_state(rolled_up, rescanned)
@@ -0,0 +1,117 @@
+"""
+Unit tests for OANDASignalEngine concurrent batch generation.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from oanda_api_client import OANDAAPIError, OANDAPrice
+from oanda_signal_engine import OANDASignalEngine
+
+
+def _price(instrument):
+    return OANDAPrice(instrument=instrument, time=datetime.utcnow(), bid=1.1, ask=1.1002, spread=0.0002)
+
+
+def _make_engine(delays, confidence=0.8):
+    """Build an engine whose generate_signal sleeps for a per-instrument delay."""
+    engine = OANDASignalEngine("test-key", "test-account")
+    engine.oanda_client = MagicMock()
+    engine.oanda_client.normalize_instrument.side_effect = lambda symbol: symbol
+    engine.oanda_client.get_current_prices = AsyncMock(
+        side_effect=lambda instruments: [_price(i) for i in instruments]
+    )
+
+    state = {"in_flight": 0, "peak": 0, "prices": {}}
+
+    async def fake_generate_signal(instrument, timeframe="H1", current_price=None):
+        state["prices"][instrument] = current_price
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(delays[instrument])
+        finally:
+            state["in_flight"] -= 1
+        return SimpleNamespace(instrument=instrument, confidence_score=confidence)
+
+    engine.generate_signal = fake_generate_signal
+    return engine, state
+
+
+class TestSignalEngineBatch:
+    """Test cases for bounded-concurrency batch generation."""
+
+    @pytest.mark.unit
+    async def test_batch_respects_concurrency_limit(self):
+        """No more than max_concurrency instruments run at once."""
+        delays = {f"SYM_{i}": 0.01 for i in range(12)}
+        engine, state = _make_engine(delays)
+
+        signals = await engine.generate_signals_batch(list(delays), max_concurrency=3)
+
+        assert len(signals) == 12
+        assert state["peak"] == 3
+
+    @pytest.mark.unit
+    async def test_iter_yields_in_completion_order(self):
+        """Fast instruments are yielded before slow ones."""
+        delays = {"SLOW": 0.05, "FAST": 0.0, "MID": 0.02}
+        engine, _ = _make_engine(delays)
+
+        order = [instrument async for instrument, _ in engine.iter_signals_batch(list(delays), max_concurrency=3)]
+
+        assert order == ["FAST", "MID", "SLOW"]
+
+    @pytest.mark.unit
+    async def test_batch_returns_input_order(self):
+        """The list API keeps the caller's instrument order."""
+        delays = {"SLOW": 0.03, "FAST": 0.0}
+        engine, _ = _make_engine(delays)
+
+        signals = await engine.generate_signals_batch(["SLOW", "FAST"])
+
+        assert [s.instrument for s in signals] == ["SLOW", "FAST"]
+
+    @pytest.mark.unit
+    async def test_instrument_timeout_drops_slow_instrument(self):
+        """An instrument exceeding its timeout yields None without blocking the rest."""
+        delays = {"HANG": 5.0, "OK": 0.0}
+        engine, _ = _make_engine(delays)
+
+        results = dict([item async for item in engine.iter_signals_batch(list(delays), instrument_timeout=0.05)])
+
+        assert results["HANG"] is None
+        assert results["OK"] is not None
+
+    @pytest.mark.unit
+    async def test_confidence_filter_accepts_percentage(self):
+        """min_confidence on the 0-100 scale is normalised before filtering."""
+        engine, _ = _make_engine({"EUR_USD": 0.0}, confidence=0.4)
+
+        assert await engine.generate_signals_batch(["EUR_USD"], min_confidence=50) == []
+        assert len(await engine.generate_signals_batch(["EUR_USD"], min_confidence=30)) == 1
+
+    @pytest.mark.unit
+    async def test_prices_prefetched_in_one_request(self):
+        """The sweep issues a single /pricing call and hands each price to its instrument."""
+        delays = {"EUR_USD": 0.0, "GBP_USD": 0.0, "XAU_USD": 0.0}
+        engine, state = _make_engine(delays)
+
+        await engine.generate_signals_batch(list(delays) + ["EUR_USD"])
+
+        engine.oanda_client.get_current_prices.assert_awaited_once_with(["EUR_USD", "GBP_USD", "XAU_USD"])
+        assert {i: p.instrument for i, p in state["prices"].items()} == {i: i for i in delays}
+
+    @pytest.mark.unit
+    async def test_prefetch_failure_falls_back_to_per_instrument_pricing(self):
+        """A failed prefetch leaves current_price unset so each instrument fetches its own."""
+        engine, state = _make_engine({"EUR_USD": 0.0})
+        engine.oanda_client.get_current_prices = AsyncMock(side_effect=OANDAAPIError("boom"))
+
+        signals = await engine.generate_signals_batch(["EUR_USD"])
+
+        assert len(signals) == 1
+        assert state["prices"]["EUR_USD"] is None
@@ -0,0 +1,249 @@
+"""
+Unit tests for the SignalOutcomeTracker write-behind queue.
+"""
+
+import asyncio
+import sqlite3
+import pytest
+from datetime import datetime
+
+from quant_adaptive_system.storage.sqlite_pool import close_sqlite_stores
+from quant_adaptive_system.signal_intelligence import signal_outcomes
+from quant_adaptive_system.signal_intelligence.signal_outcomes import SignalOutcomeTracker, SignalOutcome
+from tests.factories.signal_snapshot_factory import SignalSnapshotFactory
+
+pytestmark = pytest.mark.usefixtures("isolated_registry")
+
+
+def _outcomes(db_path):
+    """Read outcome rows straight from the file, bypassing the tracker."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return dict(conn.execute("SELECT signal_id, outcome FROM signal_outcomes").fetchall())
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def make_tracker(tmp_path):
+    def make(**kwargs):
+        return SignalOutcomeTracker(str(tmp_path / "signal_outcomes.db"), **kwargs)
+    return make
+
+
+class TestOutcomeWriteBehind:
+    """Test cases for the tracker write-behind queue."""
+
+    @pytest.mark.unit
+    async def test_sweep_is_one_transaction(self, make_tracker):
+        """Snapshots and outcome updates queued in one interval share a commit."""
+        tracker = make_tracker(flush_interval=60)
+        try:
+            await tracker.initialize()
+            batches_before = tracker.store.metrics.write_batches
+            for i in range(50):
+                assert await tracker.track_signal(SignalSnapshotFactory.create_snapshot(f"SIG-{i}"))
+            for i in range(0, 50, 2):
+                assert await tracker.update_signal_outcome(f"SIG-{i}", SignalOutcome.SL_HIT, exit_price=1.09)
+
+            rows = await tracker.flush()
+            batches = tracker.store.metrics.write_batches - batches_before
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        outcomes = _outcomes(tracker.db_path)
+        assert rows == 125
+        assert batches == 2  # Queued writes, then the refresh of the day's rollups
+        assert len(outcomes) == 50
+        assert list(outcomes.values()).count("SL_HIT") == 25
+
+    @pytest.mark.unit
+    async def test_updates_for_a_signal_are_coalesced(self, make_tracker):
+        """Only the latest pending update per signal is written."""
+        tracker = make_tracker(flush_interval=60)
+        try:
+            await tracker.initialize()
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1"))
+            await tracker.update_signal_outcome("SIG-1", SignalOutcome.PENDING)
+            await tracker.update_signal_outcome("SIG-1", SignalOutcome.TP_HIT, exit_price=1.12)
+
+            assert tracker.pending_writes() == 3
+            rows = await tracker.flush()
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert rows == 3
+        assert _outcomes(tracker.db_path) == {"SIG-1": "TP_HIT"}
+
+    @pytest.mark.unit
+    async def test_reads_see_pending_writes(self, make_tracker):
+        """Updates and metrics work on signals that have not been flushed yet."""
+        tracker = make_tracker(flush_interval=60)
+        try:
+            await tracker.initialize()
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1"))
+
+            assert await tracker.update_signal_outcome("SIG-1", SignalOutcome.TP_HIT, exit_price=1.12)
+            assert not await tracker.update_signal_outcome("UNKNOWN", SignalOutcome.TP_HIT, exit_price=1.0)
+            metrics = await tracker.get_performance_metrics(days_back=1)
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert metrics["total_signals"] == 1
+        assert metrics["wins"] == 1
+        assert metrics["avg_r_multiple"] == pytest.approx(2.0)
+
+    @pytest.mark.unit
+    async def test_reads_see_writes_of_a_flush_in_flight(self, make_tracker, monkeypatch):
+        """A signal being committed by a flush can still be updated."""
+        tracker = make_tracker(flush_interval=60)
+        try:
+            await tracker.initialize()
+            store = tracker.store
+            write_many = store.write_many
+            writing, release = asyncio.Event(), asyncio.Event()
+
+            async def slow_write_many(statements):
+                writing.set()
+                await release.wait()
+                return await write_many(statements)
+
+            monkeypatch.setattr(store, "write_many", slow_write_many)
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1"))
+            flush = asyncio.create_task(tracker.flush())
+            await writing.wait()
+
+            assert tracker.pending_writes() == 0
+            assert await tracker.update_signal_outcome("SIG-1", SignalOutcome.TP_HIT, exit_price=1.12)
+            release.set()
+            await flush
+            monkeypatch.setattr(store, "write_many", write_many)
+            await tracker.flush()
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert _outcomes(tracker.db_path) == {"SIG-1": "TP_HIT"}
+
+    @pytest.mark.unit
+    async def test_loss_window_is_bounded_by_flush_interval(self, make_tracker):
+        """Queued writes reach the database within flush_interval without an explicit flush."""
+        tracker = make_tracker(flush_interval=0.05)
+        try:
+            await tracker.initialize()
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1"))
+            assert _outcomes(tracker.db_path) == {}
+
+            await asyncio.sleep(0.2)
+            outcomes = _outcomes(tracker.db_path)
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert outcomes == {"SIG-1": "PENDING"}
+        assert tracker.get_write_metrics()["max_pending_age_seconds"] < 0.2
+
+    @pytest.mark.unit
+    async def test_full_queue_flushes_early(self, make_tracker):
+        """Reaching max_pending flushes without waiting for the interval."""
+        tracker = make_tracker(flush_interval=60, max_pending=10)
+        try:
+            await tracker.initialize()
+            for i in range(5):
+                await tracker.track_signal(SignalSnapshotFactory.create_snapshot(f"SIG-{i}"))
+            await asyncio.sleep(0.05)
+            outcomes = _outcomes(tracker.db_path)
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert len(outcomes) == 5
+
+    @pytest.mark.unit
+    async def test_close_flushes_pending_writes(self, make_tracker):
+        """Shutdown writes everything still in the queue."""
+        tracker = make_tracker(flush_interval=60)
+        await tracker.initialize()
+        await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1"))
+
+        await tracker.close()
+        await close_sqlite_stores()
+
+        assert _outcomes(tracker.db_path) == {"SIG-1": "PENDING"}
+        assert tracker.pending_writes() == 0
+
+    @pytest.mark.unit
+    async def test_failed_flush_keeps_writes_queued(self, make_tracker, monkeypatch):
+        """A rejected flush is retried without losing or overwriting queued writes."""
+        tracker = make_tracker(flush_interval=60)
+        try:
+            await tracker.initialize()
+            store = tracker.store
+            write_many = store.write_many
+            await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1"))
+
+            async def failing_write_many(statements):
+                raise sqlite3.OperationalError("database is locked")
+
+            monkeypatch.setattr(store, "write_many", failing_write_many)
+            with pytest.raises(sqlite3.OperationalError):
+                await tracker.flush()
+            await tracker.update_signal_outcome("SIG-1", SignalOutcome.TP_HIT, exit_price=1.12)
+
+            monkeypatch.setattr(store, "write_many", write_many)
+            rows = await tracker.flush()
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert rows == 3
+        assert tracker.get_write_metrics()["failed_flushes"] == 1
+        assert _outcomes(tracker.db_path) == {"SIG-1": "TP_HIT"}
+
+    @pytest.mark.unit
+    async def test_learning_update_runs_once_per_flush(self, make_tracker, monkeypatch):
+        """Several completed outcomes in one interval trigger one learning update."""
+        tracker = make_tracker(flush_interval=0.05)
+        calls = []
+
+        async def record_learning_update():
+            calls.append(tracker.pending_writes())
+
+        monkeypatch.setattr(tracker, "_trigger_learning_update", record_learning_update)
+        try:
+            await tracker.initialize()
+            for i in range(3):
+                await tracker.track_signal(SignalSnapshotFactory.create_snapshot(f"SIG-{i}"))
+                await tracker.update_signal_outcome(f"SIG-{i}", SignalOutcome.TP_HIT, exit_price=1.12)
+            await asyncio.sleep(0.2)
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert calls == [0]
+
+    @pytest.mark.unit
+    async def test_sweep_next_to_direct_writes_is_fully_written(self, make_tracker):
+        """Queued snapshots land next to rows committed directly, none lost or duplicated."""
+        signals = 200
+        tracker = make_tracker(flush_interval=60)
+        try:
+            await tracker.initialize()
+            for i in range(signals):
+                snapshot = SignalSnapshotFactory.create_snapshot(f"OLD-{i}")
+                # Previous behaviour: both rows written and committed before returning
+                await tracker.store.write([
+                    (signal_outcomes._SNAPSHOT_INSERT_SQL, tracker._snapshot_params(snapshot)),
+                    (signal_outcomes._OUTCOME_INSERT_SQL, (snapshot.signal_id, "PENDING", datetime.now().isoformat()))
+                ])
+            for i in range(signals):
+                await tracker.track_signal(SignalSnapshotFactory.create_snapshot(f"NEW-{i}"))
+            await tracker.flush()
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert len(_outcomes(tracker.db_path)) == signals * 2
@@ -103,6 +103,28 @@ class TestSignalRepository:
         for signal in result.items:
             assert signal.symbol == symbol
 
+    @pytest.mark.unit
+    def test_get_signals_by_symbols(self, signal_repository_fixture, user_fixture):
+        """Test get signals for several symbols in one query, limited per symbol."""
+        # Arrange
+        SignalFactory.create_signals_for_symbols(
+            signal_repository_fixture.db, user_fixture.id,
+            ["EUR_USD", "EUR_USD", "EUR_USD", "GBP_USD", "USD_JPY"]
+        )
+
+        # Act
+        result = signal_repository_fixture.get_signals_by_symbols(["EUR_USD", "GBP_USD", "XAU_USD"], limit=2)
+
+        # Assert
+        assert list(result) == ["EUR_USD", "GBP_USD", "XAU_USD"]
+        assert len(result["EUR_USD"]) == 2
+        assert len(result["GBP_USD"]) == 1
+        assert result["XAU_USD"] == []
+        for symbol, signals in result.items():
+            for signal in signals:
+                assert signal.symbol == symbol
+                assert signal.is_active is True
+
     @pytest.mark.unit
     def test_get_signals_by_user(self, signal_repository_fixture, user_fixture):
         """Test get signals created by specific user."""
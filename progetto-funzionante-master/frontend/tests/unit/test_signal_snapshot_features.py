@@ -0,0 +1,165 @@
+"""
+Unit tests for the typed feature columns of signal_snapshots.
+"""
+
+import json
+import sqlite3
+import pytest
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+from quant_adaptive_system.storage.sqlite_pool import close_sqlite_stores
+from quant_adaptive_system.signal_intelligence import signal_outcomes
+from quant_adaptive_system.signal_intelligence.signal_outcomes import (
+    SignalOutcomeTracker, SignalOutcome, SCHEMA_VERSION, TechnicalFeatures
+)
+from quant_adaptive_system.risk_management.adaptive_sizing import AdaptiveRiskManager
+from tests.factories.signal_snapshot_factory import SignalSnapshotFactory
+
+pytestmark = pytest.mark.usefixtures("isolated_registry")
+
+V1_SNAPSHOTS = """
+    CREATE TABLE signal_snapshots (
+        signal_id TEXT PRIMARY KEY, timestamp TEXT NOT NULL, instrument TEXT NOT NULL,
+        signal_type TEXT NOT NULL, entry_price REAL NOT NULL, stop_loss REAL NOT NULL,
+        take_profit REAL NOT NULL, current_price REAL NOT NULL, risk_reward_ratio REAL NOT NULL,
+        confidence_score REAL NOT NULL, ai_reasoning TEXT, technical_features TEXT,
+        volume_features TEXT, market_context TEXT, source TEXT DEFAULT 'ROLLING_GENERATOR',
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+def _snapshot(signal_id, instrument="EUR_USD", regime="NORMAL", rsi=50.0):
+    """Snapshot from an hour ago whose hot technical features derive from rsi."""
+    return SignalSnapshotFactory.create_snapshot(
+        signal_id, datetime.now() - timedelta(hours=1), instrument, regime,
+        technical_features=TechnicalFeatures(mtf_rsi_1m=rsi, atr_5m=0.001, confluence_score=rsi / 100)
+    )
+
+
+def _query_plan(db_path, sql, params):
+    conn = sqlite3.connect(db_path)
+    try:
+        return " | ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+    finally:
+        conn.close()
+
+
+async def _record_trades(tracker, trades):
+    """Track signals and close them with the given (instrument, regime, exit_price) tuples."""
+    for i, (instrument, regime, exit_price) in enumerate(trades):
+        signal_id = f"SIG-{i}"
+        await tracker.track_signal(_snapshot(signal_id, instrument, regime, rsi=40 + i))
+        outcome = SignalOutcome.TP_HIT if exit_price > 1.1 else SignalOutcome.SL_HIT
+        await tracker.update_signal_outcome(signal_id, outcome, exit_price=exit_price)
+    await tracker.flush()
+
+
+class TestSnapshotFeatureColumns:
+    """Test cases for the signal_snapshots v2 schema."""
+
+    @pytest.mark.unit
+    async def test_migrates_v1_database_and_keeps_json(self, tmp_path):
+        """Existing rows are backfilled from their JSON; malformed JSON stays NULL."""
+        db_path = tmp_path / "signal_outcomes.db"
+        snapshot = _snapshot("OLD-1", rsi=62.5)
+        conn = sqlite3.connect(db_path)
+        conn.execute(V1_SNAPSHOTS)
+        conn.executemany(
+            "INSERT INTO signal_snapshots VALUES (?, ?, 'EUR_USD', 'BUY', 1.1, 1.09, 1.12, 1.1, 2, 0.8, '', ?, '{}', ?, 'TEST', NULL)",
+            [
+                ("OLD-1", snapshot.timestamp.isoformat(), json.dumps(asdict(snapshot.technical_features)),
+                 json.dumps(asdict(snapshot.market_context))),
+                ("OLD-2", snapshot.timestamp.isoformat(), "not json", "not json")
+            ]
+        )
+        conn.commit()
+        conn.close()
+
+        tracker = SignalOutcomeTracker(str(db_path))
+        try:
+            await tracker.initialize()
+            await tracker.initialize()  # Idempotent
+        finally:
+            await close_sqlite_stores()
+
+        conn = sqlite3.connect(db_path)
+        rows = dict(
+            (row[0], row[1:])
+            for row in conn.execute("SELECT signal_id, mtf_rsi_1m, market_regime, technical_features FROM signal_snapshots")
+        )
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(signal_snapshots)")}
+        conn.close()
+
+        assert version == SCHEMA_VERSION
+        assert rows["OLD-1"][:2] == (62.5, "NORMAL")
+        assert json.loads(rows["OLD-1"][2])["mtf_rsi_1m"] == 62.5
+        assert rows["OLD-2"][:2] == (None, None)
+        assert {"idx_snapshots_instrument_regime_ts", "idx_snapshots_regime_ts", "idx_snapshots_ts"} <= indexes
+
+    @pytest.mark.unit
+    async def test_new_snapshots_fill_typed_columns(self, tracker):
+        """track_signal writes hot features to their columns alongside the JSON."""
+        try:
+            await tracker.initialize()
+            await tracker.track_signal(_snapshot("SIG-1", "GBP_USD", "HIGH_0DTE", rsi=71.0))
+            await tracker.flush()
+            row = await tracker.store.fetchone(
+                "SELECT instrument, market_regime, mtf_rsi_1m, atr_5m, confluence_score FROM signal_snapshots"
+            )
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert row == ("GBP_USD", "HIGH_0DTE", 71.0, 0.001, 0.71)
+
+    @pytest.mark.unit
+    async def test_kelly_queries_are_index_driven(self, tracker, tmp_path, monkeypatch):
+        """Kelly filters on typed columns through an index, by exact instrument."""
+        queries = []
+        # 9 EUR_USD trades are below min_trades_for_kelly; a substring match would add EUR_USD_M
+        trades = [("EUR_USD", "NORMAL", 1.12 if i % 3 else 1.09) for i in range(9)]
+        trades += [("EUR_USD_M", "NORMAL", 1.09)] * 5 + [("EUR_USD", "HIGH_0DTE", 1.09)] * 5
+        risk_manager = AdaptiveRiskManager(str(tmp_path / "risk.db"))
+        try:
+            await tracker.initialize()
+            await _record_trades(tracker, trades)
+
+            fetchall = tracker.store.fetchall
+
+            async def recording_fetchall(sql, params=()):
+                queries.append((sql, params))
+                return await fetchall(sql, params)
+
+            monkeypatch.setattr(tracker.store, "fetchall", recording_fetchall)
+            kelly = await risk_manager._calculate_kelly_criterion("EUR_USD", "NORMAL")
+            portfolio_kelly = await risk_manager._calculate_kelly_criterion("PORTFOLIO", "NORMAL")
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert kelly == 0.01  # Conservative default: not enough exact-instrument trades
+        # NORMAL only: 6 wins of 2R, 8 losses of 1R -> (2 * 6/14 - 8/14) / 2, capped at 10%
+        assert portfolio_kelly == pytest.approx(0.1)
+        for sql, params in queries:
+            plan = _query_plan(tracker.db_path, sql, params)
+            assert "USING INDEX idx_snapshots" in plan
+            assert "JSON_EXTRACT" not in sql.upper() and "LIKE" not in sql.upper()
+
+    @pytest.mark.unit
+    async def test_feature_importance_reads_typed_columns(self, tracker):
+        """Feature importance is computed from columns and stored per feature."""
+        trades = [("EUR_USD", "NORMAL", 1.12 if i % 2 else 1.09) for i in range(12)]
+        try:
+            await tracker.initialize()
+            await _record_trades(tracker, trades)
+            await tracker._update_feature_importance()
+            features = dict(await tracker.store.fetchall("SELECT feature_name, importance_score FROM feature_importance"))
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert {"mtf_rsi_1m", "confluence_score"} <= set(features) <= set(signal_outcomes.TECHNICAL_FEATURE_COLUMNS)
+        assert features["mtf_rsi_1m"] == pytest.approx(features["confluence_score"])
@@ -0,0 +1,170 @@
+"""
+Unit tests for the batched signal writer.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services import signal_writer as signal_writer_module
+from app.services.cache_service import CacheService, CacheConfig, SIGNALS_TAG
+from app.services.signal_writer import SignalWriter
+from models import Base, Signal, SignalTypeEnum
+
+
+class StatementLog:
+    """Records INSERT statements and commits issued on an engine."""
+
+    def __init__(self, engine):
+        self.inserts = []
+        self.commits = 0
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                self.inserts.append(statement)
+
+        @event.listens_for(engine, "commit")
+        def record_commit(conn):
+            self.commits += 1
+
+
+def _session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine), engine
+
+
+def _row(symbol, entry_price=1.1):
+    return {
+        "symbol": symbol,
+        "signal_type": SignalTypeEnum.BUY,
+        "entry_price": entry_price,
+        "reliability": 80.0,
+        "creator_id": 1,
+        "created_at": datetime.utcnow()
+    }
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = CacheService(CacheConfig(redis_url="redis://unused"))
+    monkeypatch.setattr(signal_writer_module, "cache_service", cache)
+    return cache
+
+
+class TestSignalWriter:
+    """Test cases for SignalWriter."""
+
+    @pytest.mark.unit
+    async def test_sweep_of_fifty_is_one_transaction(self, cache):
+        """50 rows submitted together cost one INSERT and one commit."""
+        session_factory, engine = _session_factory()
+        log = StatementLog(engine)
+        writer = SignalWriter(session_factory=session_factory)
+        try:
+            signals = await writer.submit_many([_row(f"SYM{i}", entry_price=i) for i in range(50)])
+        finally:
+            await writer.stop()
+
+        assert len(log.inserts) == 1
+        assert log.commits == 1
+        assert [s.symbol for s in signals] == [f"SYM{i}" for i in range(50)]
+        assert [s.entry_price for s in signals] == list(range(50))
+        assert len({s.id for s in signals}) == 50
+        assert cache._tag_versions[SIGNALS_TAG][0] == 1
+
+        session = session_factory()
+        assert session.query(Signal).count() == 50
+        session.close()
+
+    @pytest.mark.unit
+    async def test_concurrent_submitters_share_a_batch(self, cache):
+        """Rows from separate callers within the flush interval go out together."""
+        session_factory, engine = _session_factory()
+        log = StatementLog(engine)
+        writer = SignalWriter(session_factory=session_factory, flush_interval=0.1)
+        try:
+            results = await asyncio.gather(*(writer.submit(_row(f"SYM{i}")) for i in range(10)))
+        finally:
+            await writer.stop()
+
+        assert all(signal is not None for signal in results)
+        assert len(log.inserts) == 1
+        assert writer.get_metrics()["time_flushes"] == 1
+
+    @pytest.mark.unit
+    async def test_size_trigger_splits_batches(self, cache):
+        """Batches never exceed max_batch_size."""
+        session_factory, engine = _session_factory()
+        log = StatementLog(engine)
+        writer = SignalWriter(session_factory=session_factory, max_batch_size=20, max_pending=20)
+        try:
+            signals = await writer.submit_many([_row(f"SYM{i}") for i in range(50)])
+        finally:
+            await writer.stop()
+
+        metrics = writer.get_metrics()
+        assert len(signals) == 50
+        assert len(log.inserts) == 3
+        assert metrics["size_flushes"] == 2
+        assert metrics["batches_flushed"] == 3
+        assert metrics["peak_queue_depth"] <= 20
+
+    @pytest.mark.unit
+    async def test_back_pressure_when_buffer_is_full(self, cache, monkeypatch):
+        """Submitters wait for room instead of growing the buffer without bound."""
+        session_factory, _ = _session_factory()
+        writer = SignalWriter(session_factory=session_factory, max_batch_size=5, max_pending=5)
+        release = asyncio.Event()
+        flush = writer._flush
+
+        async def slow_flush(batch):
+            await release.wait()
+            await flush(batch)
+
+        monkeypatch.setattr(writer, "_flush", slow_flush)
+
+        submit = asyncio.create_task(writer.submit_many([_row(f"SYM{i}") for i in range(20)]))
+        await asyncio.sleep(0.1)
+
+        # One batch held by the stalled flush, a full buffer, and the submitter blocked
+        assert writer._queue.qsize() == 5
+        assert not submit.done()
+
+        release.set()
+        signals = await submit
+        await writer.stop()
+        assert len(signals) == 20
+
+    @pytest.mark.unit
+    async def test_rejected_batch_falls_back_to_rows(self, cache):
+        """A bad row is reported as None without losing the rest of the batch."""
+        session_factory, _ = _session_factory()
+        writer = SignalWriter(session_factory=session_factory)
+        rows = [_row("EURUSD"), _row("BROKEN", entry_price=None), _row("GBPUSD")]
+        try:
+            signals = await writer.submit_many(rows)
+        finally:
+            await writer.stop()
+
+        assert [s.symbol if s else None for s in signals] == ["EURUSD", None, "GBPUSD"]
+        metrics = writer.get_metrics()
+        assert metrics["fallback_batches"] == 1
+        assert metrics["rows_written"] == 2
+        assert metrics["rows_failed"] == 1
+
+    @pytest.mark.unit
+    async def test_stop_flushes_buffered_rows(self, cache):
+        """Stopping the writer stores rows that are still waiting for the timer."""
+        session_factory, _ = _session_factory()
+        writer = SignalWriter(session_factory=session_factory, flush_interval=60)
+        submit = asyncio.create_task(writer.submit_many([_row("EURUSD"), _row("GBPUSD")]))
+        await asyncio.sleep(0.05)
+
+        await writer.stop()
+
+        assert [s.symbol for s in await submit] == ["EURUSD", "GBPUSD"]
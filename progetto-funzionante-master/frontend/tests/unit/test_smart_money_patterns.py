@@ -0,0 +1,85 @@
+"""
+Unit tests for the vectorized smart-money pattern detectors.
+"""
+
+import numpy as np
+import pytest
+
+from advanced_signal_analyzer import AdvancedSignalAnalyzer
+from smart_money_patterns import swing_points, fair_value_gaps, order_blocks, liquidity_zones
+from tests.factories.candle_factory import CandleFactory
+from tests.references.smart_money import (
+    reference_swing_points, reference_liquidity_zones, reference_order_blocks, reference_fair_value_gaps
+)
+
+
+def _consolidating_bars():
+    """Bars with a strong up candle followed by a tight range, guaranteeing an order block."""
+    df = CandleFactory.create_random_bars(60, seed=11)
+    df.iloc[30, df.columns.get_loc("open")] = 1.0
+    df.iloc[30, df.columns.get_loc("close")] = 1.2
+    df.iloc[30, df.columns.get_loc("low")] = 0.99
+    df.iloc[30, df.columns.get_loc("high")] = 1.21
+    for column in ("open", "high", "low", "close"):
+        df.iloc[31:41, df.columns.get_loc(column)] = 1.15
+    return df
+
+
+class TestSmartMoneyPatterns:
+    """Test cases for the vectorized detectors against the original loops."""
+
+    @pytest.fixture
+    def analyzer(self):
+        return AdvancedSignalAnalyzer("test-key")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_swing_points_match_reference(self, analyzer, seed):
+        """Swing highs and lows equal the per-row window scan."""
+        df = CandleFactory.create_random_bars(400, seed)
+
+        for column, point_type in (("high", "high"), ("low", "low")):
+            assert analyzer._find_swing_points(df[column], point_type) == \
+                reference_swing_points(df[column], point_type)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_liquidity_zones_match_reference(self, analyzer, seed):
+        """Liquidity zones equal the per-row scan, including strength."""
+        df = CandleFactory.create_random_bars(400, seed)
+
+        zones = analyzer._identify_liquidity_zones(None, df)
+
+        expected = reference_liquidity_zones(df)
+
+        assert zones
+        assert [z["time"] for z in zones] == [z["time"] for z in expected]
+        for zone, reference in zip(zones, expected):
+            assert zone["type"] == reference["type"]
+            assert zone["price"] == reference["price"]
+            assert zone["strength"] == pytest.approx(reference["strength"], rel=1e-12)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_fair_value_gaps_match_reference(self, analyzer, seed):
+        """Fair value gaps equal the three-bar scan."""
+        df = CandleFactory.create_random_bars(400, seed)
+
+        assert analyzer._identify_fair_value_gaps(df) == reference_fair_value_gaps(df)
+
+    @pytest.mark.unit
+    def test_order_blocks_match_reference(self, analyzer):
+        """Order blocks equal the per-row scan on random and constructed bars."""
+        for df in (CandleFactory.create_random_bars(400, 1), _consolidating_bars()):
+            assert analyzer._identify_order_blocks(df) == reference_order_blocks(df)
+        assert analyzer._identify_order_blocks(_consolidating_bars())
+
+    @pytest.mark.unit
+    def test_short_inputs_return_empty_masks(self):
+        """Inputs shorter than a detector's window produce no matches."""
+        values = np.linspace(1.0, 1.1, 8)
+
+        assert not swing_points(values).any()
+        assert not order_blocks(values, values, values, values).any()
+        assert not liquidity_zones(values, values, values, values, values)[0].any()
+        assert not any(mask.any() for mask in fair_value_gaps(values[:2], values[:2]))
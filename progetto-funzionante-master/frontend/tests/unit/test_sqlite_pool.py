@@ -0,0 +1,168 @@
+"""
+Unit tests for the pooled SQLite access layer of the quant adaptive system.
+"""
+
+import asyncio
+import sqlite3
+import pytest
+
+from quant_adaptive_system.storage import sqlite_pool
+from quant_adaptive_system.storage.sqlite_pool import LatencyHistogram, SQLiteStore, get_sqlite_store, close_sqlite_stores
+from quant_adaptive_system.signal_intelligence.signal_outcomes import SignalOutcomeTracker, SignalOutcome
+from tests.factories.signal_snapshot_factory import SignalSnapshotFactory
+
+CREATE_TABLE = "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteStore(tmp_path / "items.db")
+
+
+class TestSQLiteStore:
+    """Test cases for SQLiteStore."""
+
+    @pytest.mark.unit
+    async def test_connections_use_wal_and_tuned_pragmas(self, store):
+        """Every pooled connection runs in WAL mode with the configured pragmas."""
+        try:
+            async with store.reader() as conn:
+                journal_mode = (await conn.execute_fetchall("PRAGMA journal_mode"))[0][0]
+                synchronous = (await conn.execute_fetchall("PRAGMA synchronous"))[0][0]
+                mmap_size = (await conn.execute_fetchall("PRAGMA mmap_size"))[0][0]
+                query_only = (await conn.execute_fetchall("PRAGMA query_only"))[0][0]
+        finally:
+            await store.close()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert mmap_size == sqlite_pool.DEFAULT_PRAGMAS["mmap_size"]
+        assert query_only == 1
+
+    @pytest.mark.unit
+    async def test_concurrent_writes_are_group_committed(self, store):
+        """Writes queued together share a transaction but keep their own results."""
+        try:
+            await store.execute(CREATE_TABLE)
+            ids = await asyncio.gather(*(
+                store.execute("INSERT INTO items (name) VALUES (?)", (f"item-{i}",)) for i in range(50)
+            ))
+            count = await store.fetchone("SELECT COUNT(*) FROM items")
+        finally:
+            await store.close()
+
+        metrics = store.get_metrics()
+        assert count == (50,)
+        assert sorted(ids) == list(range(1, 51))
+        assert metrics["writes"] == 51
+        assert metrics["write_batches"] < 10
+        assert metrics["latency"]["write"]["count"] == 51
+
+    @pytest.mark.unit
+    async def test_failed_job_does_not_roll_back_its_batch(self, store):
+        """A rejected job raises for its caller only; the rest of the commit survives."""
+        try:
+            await store.execute(CREATE_TABLE)
+            results = await asyncio.gather(
+                store.execute("INSERT INTO items (name) VALUES (?)", ("a",)),
+                store.execute("INSERT INTO items (name) VALUES (?)", ("a",)),
+                store.execute("INSERT INTO items (name) VALUES (?)", ("b",)),
+                return_exceptions=True
+            )
+            names = await store.fetchall("SELECT name FROM items ORDER BY name")
+        finally:
+            await store.close()
+
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        assert names == [("a",), ("b",)]
+        assert store.metrics.failed_writes == 1
+
+    @pytest.mark.unit
+    async def test_multi_statement_write_is_atomic(self, store):
+        """Statements passed to write() are applied together or not at all."""
+        try:
+            await store.execute(CREATE_TABLE)
+            with pytest.raises(sqlite3.IntegrityError):
+                await store.write([
+                    ("INSERT INTO items (name) VALUES (?)", ("x",)),
+                    ("INSERT INTO items (name) VALUES (?)", ("x",))
+                ])
+            count = await store.fetchone("SELECT COUNT(*) FROM items")
+        finally:
+            await store.close()
+
+        assert count == (0,)
+
+    @pytest.mark.unit
+    async def test_registry_shares_one_store_per_file(self, tmp_path, isolated_registry):
+        """Components using the same file share connections and writer."""
+        tracker = SignalOutcomeTracker(str(tmp_path / "signal_outcomes.db"))
+        try:
+            assert get_sqlite_store(tracker.db_path) is tracker.store
+            assert get_sqlite_store(tmp_path / "other.db") is not tracker.store
+        finally:
+            await close_sqlite_stores()
+
+    @pytest.mark.unit
+    def test_store_from_a_finished_loop_is_replaced(self, tmp_path, isolated_registry):
+        """A store opened on a loop that is gone is abandoned and its connections are released."""
+        db_path = tmp_path / "items.db"
+
+        async def write_and_read(name, close=False):
+            store = get_sqlite_store(db_path)
+            try:
+                await store.execute(CREATE_TABLE)
+                await store.execute("INSERT INTO items (name) VALUES (?)", (name,))
+                return store, await store.fetchall("SELECT name FROM items ORDER BY name")
+            finally:
+                if close:
+                    await close_sqlite_stores()
+
+        first, _ = asyncio.run(write_and_read("a"))
+        readers = list(first._reader_connections)
+        second, names = asyncio.run(write_and_read("b", close=True))
+
+        for conn in readers:
+            conn._thread.join(timeout=5)
+        assert second is not first
+        assert names == [("a",), ("b",)]
+        assert not first.is_open
+        assert not any(conn._thread.is_alive() for conn in readers)
+
+    @pytest.mark.unit
+    def test_histogram_percentiles(self):
+        """Percentiles are reported as the upper bound of their bucket."""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(0.0004)
+        for _ in range(10):
+            histogram.record(0.02)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["p50_ms"] == 0.5
+        assert snapshot["p99_ms"] == 25
+        assert snapshot["buckets"]["<=0.5ms"] == 90
+
+
+class TestOutcomeTrackerOnStore:
+    """Test cases for SignalOutcomeTracker on the pooled store."""
+
+    @pytest.mark.unit
+    async def test_track_update_and_report(self, tmp_path, isolated_registry):
+        """Tracking, outcome updates and metrics go through the shared store."""
+        tracker = SignalOutcomeTracker(str(tmp_path / "signal_outcomes.db"))
+        try:
+            await tracker.initialize()
+            assert await tracker.track_signal(SignalSnapshotFactory.create_snapshot("SIG-1"))
+            assert await tracker.update_signal_outcome("SIG-1", SignalOutcome.TP_HIT, exit_price=1.12)
+            metrics = await tracker.get_performance_metrics(days_back=1)
+            store_metrics = tracker.store.get_metrics()
+        finally:
+            await tracker.close()
+            await close_sqlite_stores()
+
+        assert metrics["total_signals"] == 1
+        assert metrics["wins"] == 1
+        assert metrics["avg_r_multiple"] == pytest.approx(2.0)
+        assert store_metrics["latency"]["read"]["count"] >= 2
+        assert store_metrics["latency"]["write"]["count"] >= 2
@@ -0,0 +1,50 @@
+"""
+Unit tests for the vectorized volume profile builder.
+"""
+
+import pytest
+
+from volume_profile import build_volume_profile
+from tests.factories.candle_factory import CandleFactory
+from tests.references.volume_profile import reference_profile
+
+
+class TestVolumeProfile:
+    """Test cases for build_volume_profile."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_touch_matches_reference_loop(self, seed):
+        """Touch distribution reproduces the original POC, value area and histogram."""
+        df = CandleFactory.create_random_bars(100, seed)
+
+        profile = build_volume_profile(df["low"], df["high"], df["volume"])
+        volume_by_price, poc, val, vah = reference_profile(df)
+
+        assert profile.volume_by_price == pytest.approx(volume_by_price)
+        assert (profile.poc, profile.val, profile.vah) == (poc, val, vah)
+
+    @pytest.mark.unit
+    def test_uniform_distribution_conserves_volume(self):
+        """Uniform distribution spreads each bar's volume without creating any."""
+        df = CandleFactory.create_random_bars(500)
+
+        profile = build_volume_profile(df["low"], df["high"], df["volume"], bins=80, distribution="uniform")
+
+        assert len(profile.levels) == 80
+        assert profile.volumes.sum() == pytest.approx(df["volume"].sum())
+        assert profile.val <= profile.poc <= profile.vah
+
+    @pytest.mark.unit
+    def test_narrow_bar_goes_to_nearest_level(self):
+        """A bar between two levels still contributes under uniform distribution."""
+        # Levels are 1.00, 1.03, 1.06; the second bar sits between the first two
+        profile = build_volume_profile([1.0, 1.005], [1.06, 1.012], [9, 5], bins=3, distribution="uniform")
+
+        assert profile.volumes.tolist() == pytest.approx([8.0, 3.0, 3.0])
+
+    @pytest.mark.unit
+    def test_unknown_distribution_rejected(self):
+        """Invalid distribution names raise ValueError."""
+        with pytest.raises(ValueError):
+            build_volume_profile([1.0], [1.1], [1], distribution="weighted")